@@ -25,6 +25,7 @@ if DESK_SRC_CORE_DIR not in sys.path:
 
 from core.logger import log_crawl_event
 from firestore_client import FirestoreClient
+from url_canonical import strip_tracking_params
 
 # Import dependencies directly
 import requests
@@ -40,27 +41,9 @@ def normalize_url(url: str) -> str:
     if not url:
         return ""
 
-    # 1. 공백 제거
-    url = url.strip()
-
-    # 2. UTM/추적 파라미터만 선택적으로 제거 (필수 파라미터는 유지)
-    if '?' in url:
-        from urllib.parse import urlparse, parse_qs, urlencode
-        parsed = urlparse(url)
-        params = parse_qs(parsed.query)
-
-        # 제거할 추적 파라미터 목록
-        tracking_params = {'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-                          'fbclid', 'gclid', 'ref', 'source', 'mc_cid', 'mc_eid'}
-
-        # 추적 파라미터만 제거, 나머지는 유지
-        filtered_params = {k: v[0] for k, v in params.items() if k.lower() not in tracking_params}
-
-        if filtered_params:
-            new_query = urlencode(filtered_params)
-            url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}?{new_query}"
-        else:
-            url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    # 1-2. 공백 + UTM/추적 파라미터만 제거 (필수 파라미터는 유지, 목록은 desk url_canonical과 공유)
+    #      가져올 URL이므로 호스트/스킴은 그대로 - 중복 판정 키는 url_canonical.canonical_key
+    url = strip_tracking_params(url)
 
     # 3. 끝 슬래시 제거 (선택적)
     if url.endswith('/'):
@@ -204,20 +187,25 @@ def collect_links(progress_callback=None) -> dict:
             
             skipped_history = 0
             skipped_cache = 0
+            filter_new = 0
             added_count = 0
             
             for link in links:
-                # 1. 히스토리 체크 (이미 처리된 것 제외: ACCEPTED, REJECTED 등)
-                is_in_history = db.check_history(link)
-                if is_in_history:
-                    skipped_history += 1
-                    continue
-                
-                # 2. 캐시 체크
-                cached = load_from_cache(link)
-                if cached and cached.get('text'):
-                    skipped_cache += 1
-                    continue
+                # 0. URL 필터 (Bloom): 히스토리/캐시 어디에도 없으면 확실히 새 URL → 아래 검사 생략
+                if not db.might_have_seen(link):
+                    filter_new += 1
+                else:
+                    # 1. 히스토리 체크 (이미 처리된 것 제외: ACCEPTED, REJECTED 등)
+                    is_in_history = db.check_history(link)
+                    if is_in_history:
+                        skipped_history += 1
+                        continue
+                    
+                    # 2. 캐시 체크 (필터 오탐이면 여기서 빗나감)
+                    cached = load_from_cache(link)
+                    if cached and cached.get('text'):
+                        skipped_cache += 1
+                        continue
                 
                 print(f"   ✅ [New] Adding link: {link}")
                 all_links.append({
@@ -230,7 +218,7 @@ def collect_links(progress_callback=None) -> dict:
             total_added += added_count
             total_skipped += skipped_history + skipped_cache
             
-            print(f"   ⏭️ [{target['id']}] Result: Added={added_count}, SkipHistory={skipped_history}, SkipCache={skipped_cache}")
+            print(f"   ⏭️ [{target['id']}] Result: Added={added_count} (FilterNew={filter_new}), SkipHistory={skipped_history}, SkipCache={skipped_cache}")
             
             if progress_callback:
                 progress_callback({
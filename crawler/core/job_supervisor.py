@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Job Supervisor - 스케줄 작업 프로세스 격리 실행
+
+스케줄 작업(수집 파이프라인, 동기화)을 스케줄러 프로세스가 아닌 자식 프로세스에서 실행합니다.
+Playwright 추출이 길어지거나 newspaper3k 메모리 누수, MLL 호출 hang이 생겨도
+스케줄러는 멈추지 않고 다음 스케줄을 실행합니다.
+
+- 동시 실행 수 제한 (SCHEDULER_MAX_WORKERS, 기본 2)
+- 작업별 제한 시간 / 메모리 제한 → 초과 시 자식 프로세스 그룹 종료 (브라우저 등 하위 프로세스 포함)
+- 같은 스케줄 중복 실행 정책 (schedules.json의 overlap)
+    skip     : 실행 중이면 이번 실행 건너뜀 (기본, 기존 APScheduler max_instances=1 동작)
+    queue    : 실행 중이면 대기열에 추가 (최대 QUEUE_LIMIT개, 초과분은 skip)
+    coalesce : 실행 중이면 대기 실행 1개로 합침
+- 실행 이력: logs/schedule_runs.jsonl (대기/소요 시간, 종료 사유, 최대 메모리)
+
+schedules.json 선택 필드:
+    overlap: skip | queue | coalesce
+    timeout_minutes: 제한 시간 (기본 SCHEDULER_JOB_TIMEOUT_MINUTES=120, 0이면 제한 없음)
+    max_memory_mb: 메모리 제한 (기본 SCHEDULER_JOB_MAX_MEMORY_MB=3072, 0이면 제한 없음)
+
+종료 사유 (exit_reason):
+    ok | failed (작업이 실패 반환/예외) | timeout | memory | crashed (결과 없이 종료)
+    skipped | coalesced (중복 실행 정책으로 실행 안 함)
+"""
+import os
+import time
+import signal
+import threading
+import traceback
+import multiprocessing as mp
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional
+
+from core.logger import log_crawl_event, log_schedule_run
+
+try:
+    import psutil
+except ImportError:  # psutil 미설치 → Linux는 /proc으로 측정, 그 외에는 메모리 제한 없음
+    psutil = None
+
+
+OVERLAP_POLICIES = ('skip', 'queue', 'coalesce')
+QUEUE_LIMIT = 5
+POLL_SECONDS = 1.0
+KILL_GRACE_SECONDS = 10
+
+
+def get_default_timeout_minutes() -> float:
+    return float(os.getenv('SCHEDULER_JOB_TIMEOUT_MINUTES', 120))
+
+
+def get_default_max_memory_mb() -> float:
+    return float(os.getenv('SCHEDULER_JOB_MAX_MEMORY_MB', 3072))
+
+
+def _child_entry(target: Callable, args: tuple, conn):
+    """
+    자식 프로세스 진입점
+    새 프로세스 그룹으로 분리 → 종료 시 Playwright 브라우저 등 하위 프로세스까지 정리
+    """
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+    try:
+        result = target(*args) or {}
+        conn.send({'success': result.get('success', True), 'message': result.get('message', '')})
+    except BaseException as e:
+        traceback.print_exc()
+        conn.send({'success': False, 'message': f'{type(e).__name__}: {e}'})
+    finally:
+        conn.close()
+
+
+def _group_rss_mb(pid: int) -> Optional[float]:
+    """자식 프로세스(+하위 프로세스) RSS 합계 (측정 불가 시 None)"""
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            total = 0
+            for proc in [root] + root.children(recursive=True):
+                try:
+                    total += proc.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total / (1024 * 1024)
+        except psutil.Error:
+            return None
+
+    if not os.path.isdir('/proc'):
+        return None
+    # Linux: 같은 프로세스 그룹(pgrp == 자식 pid)의 RSS 합계
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        fields = stat[stat.rindex(')') + 2:].split()  # state ppid pgrp ... (comm 이후)
+        if int(fields[2]) == pid:
+            total += int(fields[21]) * page_size
+    return total / (1024 * 1024)
+
+
+def _kill_group(proc, sig) -> bool:
+    """프로세스 그룹에 시그널 (Windows는 자식만)"""
+    if os.name == 'nt':
+        if psutil is not None:
+            try:
+                for child in psutil.Process(proc.pid).children(recursive=True):
+                    child.kill()
+            except psutil.Error:
+                pass
+        if proc.is_alive():
+            proc.terminate()
+        return True
+    try:
+        os.killpg(proc.pid, sig)
+        return True
+    except (ProcessLookupError, PermissionError):
+        return False
+
+
+def _terminate(proc):
+    """SIGTERM → 유예 후 SIGKILL"""
+    _kill_group(proc, signal.SIGTERM)
+    proc.join(KILL_GRACE_SECONDS)
+    if proc.is_alive():
+        _kill_group(proc, getattr(signal, 'SIGKILL', signal.SIGTERM))
+        proc.join(5)
+
+
+class JobSupervisor:
+    """
+    스케줄 작업 실행기
+
+    APScheduler 작업 함수는 submit()만 호출하고 즉시 반환합니다.
+    실제 실행은 스케줄별 감시 스레드가 자식 프로세스를 띄워 감시합니다.
+    """
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers or int(os.getenv('SCHEDULER_MAX_WORKERS', 2))
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self._active: Dict[str, Dict[str, Any]] = {}   # schedule_id -> 실행(대기) 중인 run
+        self._pending: Dict[str, deque] = {}           # schedule_id -> 대기 run
+        self._procs: Dict[str, Any] = {}               # schedule_id -> 실행 중 Process
+        self._ctx = mp.get_context('spawn')
+        self._stopping = False
+        if psutil is None and not os.path.isdir('/proc'):
+            print("⚠️ [Supervisor] psutil not installed - memory limits disabled on this platform")
+
+    def submit(self, schedule_id: str, name: str, target: Callable, args: tuple = (),
+               overlap: str = 'skip', timeout_minutes: float = None, max_memory_mb: float = None) -> str:
+        """
+        스케줄 트리거 (즉시 반환)
+
+        Returns:
+            'started' | 'queued' | 'coalesced' | 'skipped'
+        """
+        run = {
+            'schedule_id': schedule_id,
+            'name': name,
+            'target': target,
+            'args': tuple(args),
+            'overlap': overlap,
+            'timeout_minutes': timeout_minutes if timeout_minutes is not None else get_default_timeout_minutes(),
+            'max_memory_mb': max_memory_mb if max_memory_mb is not None else get_default_max_memory_mb(),
+            'triggered_at': datetime.now().isoformat(),
+        }
+        with self._lock:
+            if self._stopping:
+                decision = 'skipped'
+            elif schedule_id not in self._active:
+                self._active[schedule_id] = run
+                threading.Thread(target=self._drive, args=(run,), daemon=True,
+                                 name=f'schedule-{schedule_id}').start()
+                return 'started'
+            else:
+                pending = self._pending.setdefault(schedule_id, deque())
+                if overlap == 'coalesce' and pending:
+                    decision = 'coalesced'
+                elif overlap in ('queue', 'coalesce') and len(pending) < QUEUE_LIMIT:
+                    pending.append(run)
+                    decision = 'queued'
+                else:
+                    decision = 'skipped'
+
+        if decision == 'queued':
+            print(f"⏳ [Supervisor] {name}: previous run still active, queued ({overlap})")
+        else:
+            print(f"⏭️ [Supervisor] {name}: previous run still active, {decision} ({overlap})")
+            self._record(run, decision, started=None, result=None)
+        return decision
+
+    def _drive(self, run: Dict[str, Any]):
+        """스케줄 하나의 실행 + 대기열 처리"""
+        schedule_id = run['schedule_id']
+        while run is not None:
+            try:
+                self._execute(run)
+            except Exception as e:
+                traceback.print_exc()
+                print(f"❌ [Supervisor] {run['name']} supervision error: {e}")
+            with self._lock:
+                pending = self._pending.get(schedule_id)
+                run = pending.popleft() if pending and not self._stopping else None
+                if run is None:
+                    self._active.pop(schedule_id, None)
+                else:
+                    self._active[schedule_id] = run
+
+    def _execute(self, run: Dict[str, Any]):
+        with self._slots:
+            if self._stopping:
+                return
+            parent_conn, child_conn = self._ctx.Pipe(duplex=False)
+            proc = self._ctx.Process(target=_child_entry, args=(run['target'], run['args'], child_conn),
+                                     name=f"schedule-{run['schedule_id']}")
+            started = time.time()
+            proc.start()
+            child_conn.close()
+            self._procs[run['schedule_id']] = proc
+            timeout = f"timeout {run['timeout_minutes']:g}m" if run['timeout_minutes'] else 'no timeout'
+            memory = f"memory {run['max_memory_mb']:g}MB" if run['max_memory_mb'] else 'no memory limit'
+            print(f"▶️ [Supervisor] {run['name']} started (pid {proc.pid}, {timeout}, {memory})")
+
+            reason = None
+            peak_mb = None
+            deadline = started + run['timeout_minutes'] * 60 if run['timeout_minutes'] else None
+            while proc.is_alive():
+                proc.join(POLL_SECONDS)
+                if not proc.is_alive():
+                    break
+                rss_mb = _group_rss_mb(proc.pid)
+                if rss_mb is not None:
+                    peak_mb = max(peak_mb or 0.0, rss_mb)
+                    if run['max_memory_mb'] and rss_mb > run['max_memory_mb']:
+                        reason = 'memory'
+                        break
+                if deadline is not None and time.time() > deadline:
+                    reason = 'timeout'
+                    break
+
+            if reason:
+                print(f"🛑 [Supervisor] {run['name']} killed: {reason}")
+                _terminate(proc)
+            elif os.name != 'nt':
+                _kill_group(proc, signal.SIGKILL)  # 남은 하위 프로세스 정리 (브라우저 등)
+
+            result = None
+            try:
+                if parent_conn.poll():
+                    result = parent_conn.recv()
+            except (EOFError, OSError):
+                pass
+            finally:
+                parent_conn.close()
+            self._procs.pop(run['schedule_id'], None)
+
+        if reason is None:
+            if result is None:
+                reason = 'crashed'
+            else:
+                reason = 'ok' if result['success'] else 'failed'
+        if reason in ('timeout', 'memory', 'crashed'):
+            log_crawl_event(run['name'], f"Run {reason} (exit code {proc.exitcode})",
+                            time.time() - started, success=False)
+        self._record(run, reason, started, result, exit_code=proc.exitcode, pid=proc.pid, peak_mb=peak_mb)
+
+    def _record(self, run: Dict[str, Any], reason: str, started: Optional[float], result: Optional[Dict],
+                exit_code: int = None, pid: int = None, peak_mb: float = None):
+        finished = time.time()
+        triggered = datetime.fromisoformat(run['triggered_at']).timestamp()
+        entry = {
+            'schedule_id': run['schedule_id'],
+            'name': run['name'],
+            'overlap': run['overlap'],
+            'triggered_at': run['triggered_at'],
+            'started_at': datetime.fromtimestamp(started).isoformat() if started else None,
+            'finished_at': datetime.fromtimestamp(finished).isoformat(),
+            'wait_seconds': round(started - triggered, 2) if started else 0,
+            'duration': round(finished - started, 2) if started else 0,
+            'exit_reason': reason,
+            'exit_code': exit_code,
+            'pid': pid,
+            'peak_memory_mb': round(peak_mb, 1) if peak_mb is not None else None,
+            'message': (result or {}).get('message', ''),
+        }
+        log_schedule_run(entry)
+        if started:
+            peak = f", peak {entry['peak_memory_mb']}MB" if peak_mb is not None else ''
+            print(f"🏁 [Supervisor] {run['name']}: {reason} in {entry['duration']:.1f}s{peak}")
+
+    def status(self) -> Dict[str, Any]:
+        """실행/대기 중인 스케줄"""
+        with self._lock:
+            return {
+                'active': {sid: run['triggered_at'] for sid, run in self._active.items()},
+                'pending': {sid: len(q) for sid, q in self._pending.items() if q},
+            }
+
+    def shutdown(self):
+        """스케줄러 종료 시 실행 중인 자식 프로세스 정리"""
+        with self._lock:
+            self._stopping = True
+            for queue in self._pending.values():
+                queue.clear()
+        for schedule_id, proc in list(self._procs.items()):
+            if proc.is_alive():
+                print(f"🛑 [Supervisor] Stopping {schedule_id} (pid {proc.pid})")
+                _terminate(proc)
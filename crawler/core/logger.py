@@ -47,3 +47,35 @@ def get_crawl_logs(limit: int = 20) -> list:
     
     # 최신순 정렬
     return sorted(logs, key=lambda x: x['timestamp'], reverse=True)[:limit]
+
+
+RUNS_FILE = os.path.join(LOG_DIR, 'schedule_runs.jsonl')
+
+
+def log_schedule_run(entry: dict):
+    """스케줄 실행 이력 기록 (소요 시간, 종료 사유 - core.job_supervisor)"""
+    try:
+        os.makedirs(LOG_DIR, exist_ok=True)
+        with open(RUNS_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+    except Exception as e:
+        print(f"❌ Run history save failed: {e}")
+
+
+def get_schedule_runs(limit: int = 50, schedule_id: str = None) -> list:
+    """최근 스케줄 실행 이력 조회 (최신순)"""
+    if not os.path.exists(RUNS_FILE):
+        return []
+    
+    runs = []
+    try:
+        with open(RUNS_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    run = json.loads(line)
+                    if schedule_id is None or run.get('schedule_id') == schedule_id:
+                        runs.append(run)
+    except Exception:
+        return []
+    
+    return sorted(runs, key=lambda x: x['triggered_at'], reverse=True)[:limit]
@@ -7,6 +7,9 @@ APScheduler 기반 독립 스케줄러
 PM2: pm2 start ecosystem.config.js
 
 [V2] desk 코어 기반 통합 파이프라인 사용
+[V3] 스케줄 작업은 자식 프로세스에서 실행 (core.job_supervisor)
+     - 작업이 멈추거나 죽어도 스케줄러는 계속 동작
+     - schedules.json: overlap (skip|queue|coalesce), timeout_minutes, max_memory_mb
 """
 import os
 import sys
@@ -36,11 +39,15 @@ from src.scheduler_pipeline import (
     PHASES_UNTIL_PUBLISH
 )
 from core.logger import log_crawl_event
+from core.job_supervisor import JobSupervisor, OVERLAP_POLICIES
 
 # 설정 파일 경로
 CONFIG_DIR = os.path.join(CRAWLER_DIR, 'config')
 SCHEDULES_FILE = os.path.join(CONFIG_DIR, 'schedules.json')
 
+# 스케줄 작업 실행기 (main()에서 생성)
+supervisor = None
+
 
 def load_schedules() -> list:
     """스케줄 설정 로드"""
@@ -62,11 +69,14 @@ def save_schedules(schedules: list):
         json.dump({'schedules': schedules}, f, indent=2, ensure_ascii=False)
 
 
-def run_scheduled_crawl(schedule_name: str = "Scheduled", phases: list = None):
+def run_scheduled_crawl(schedule_name: str = "Scheduled", phases: list = None) -> dict:
     """
-    스케줄에 의해 호출되는 크롤링 작업
+    스케줄에 의해 호출되는 크롤링 작업 (자식 프로세스에서 실행)
     
     [V2] desk 통합 파이프라인 사용
+    
+    Returns:
+        {'success', 'message'} - 실행 이력에 기록
     """
     print(f"\n{'='*50}")
     print(f"⏰ [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Scheduled crawl triggered")
@@ -91,14 +101,17 @@ def run_scheduled_crawl(schedule_name: str = "Scheduled", phases: list = None):
                 )
             except Exception as e:
                 print(f"⚠️ [Discord] Notification failed: {e}")
+        
+        return {'success': result.success, 'message': result.message}
                 
     except Exception as e:
         log_crawl_event("Scheduled", f"Pipeline failed: {str(e)}", 0, success=False)
         print(f"❌ Scheduled crawl error: {e}")
+        return {'success': False, 'message': str(e)}
 
 
-def run_scheduled_sync():
-    """스케줄에 의해 호출되는 캐시 동기화 작업"""
+def run_scheduled_sync() -> dict:
+    """스케줄에 의해 호출되는 캐시 동기화 작업 (자식 프로세스에서 실행)"""
     print(f"\n{'='*50}")
     print(f"☁️ [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Scheduled sync triggered")
     print(f"{'='*50}\n")
@@ -111,7 +124,7 @@ def run_scheduled_sync():
         db = DBClient()
         if not db.db:
             print("❌ [Sync] Firestore 연결 실패")
-            return
+            return {'success': False, 'message': 'Firestore 연결 실패'}
         
         CACHE_DIR = sync_os.path.join(ZND_ROOT, 'desk', 'cache')
         synced_count = 0
@@ -197,9 +210,34 @@ def run_scheduled_sync():
             except Exception as e:
                 print(f"⚠️ [Discord] 알림 실패: {e}")
         
+        return {'success': True, 'message': f'Synced {synced_count}, skipped {skipped_count}'}
+        
     except Exception as e:
         log_crawl_event("Sync", f"Sync failed: {str(e)}", 0, success=False)
         print(f"❌ Scheduled sync error: {e}")
+        return {'success': False, 'message': str(e)}
+
+
+def dispatch_job(schedule_id: str, name: str, target, args: list = None, options: dict = None):
+    """
+    APScheduler 작업 함수 - 자식 프로세스 실행을 요청하고 즉시 반환
+    (긴 작업이 스케줄러 스레드를 점유하지 않음, 중복 실행은 overlap 정책으로 처리)
+    """
+    supervisor.submit(schedule_id, name, target, args or (), **(options or {}))
+
+
+def parse_run_options(sched: dict) -> dict:
+    """schedules.json의 실행 옵션 (overlap, timeout_minutes, max_memory_mb)"""
+    overlap = sched.get('overlap', 'skip')
+    if overlap not in OVERLAP_POLICIES:
+        print(f"⚠️ Unknown overlap policy '{overlap}' for {sched.get('name')} - using skip")
+        overlap = 'skip'
+    options = {'overlap': overlap}
+    if sched.get('timeout_minutes') is not None:
+        options['timeout_minutes'] = float(sched['timeout_minutes'])
+    if sched.get('max_memory_mb') is not None:
+        options['max_memory_mb'] = float(sched['max_memory_mb'])
+    return options
 
 
 def create_scheduler() -> BlockingScheduler:
@@ -212,8 +250,9 @@ def create_scheduler() -> BlockingScheduler:
         # 기본 스케줄: 매 6시간마다
         print("📋 No schedules found. Using default: every 6 hours")
         scheduler.add_job(
-            run_scheduled_crawl,
+            dispatch_job,
             CronTrigger(hour='*/6', minute=0),
+            args=['default_crawl', 'Default 6-hour Crawl', run_scheduled_crawl],
             id='default_crawl',
             name='Default 6-hour Crawl'
         )
@@ -247,21 +286,27 @@ def create_scheduler() -> BlockingScheduler:
                 )
                 
                 # [V2] phases 인자 추가
+                # [V3] 자식 프로세스에서 실행 (dispatch_job → supervisor)
+                job_id = sched.get('id', f"job_{sched.get('name', 'unknown')}")
+                name = sched.get('name', 'Unnamed')
+                options = parse_run_options(sched)
                 scheduler.add_job(
-                    run_scheduled_crawl,
+                    dispatch_job,
                     trigger,
-                    args=[sched.get('name', 'Unnamed'), phases],
-                    id=sched.get('id', f"job_{sched.get('name', 'unknown')}"),
-                    name=sched.get('name', 'Unnamed')
+                    args=[job_id, name, run_scheduled_crawl, [name, phases], options],
+                    id=job_id,
+                    name=name
                 )
-                print(f"✅ Registered: {sched.get('name')} ({cron}) - phases: {[p.value for p in phases]}")
+                print(f"✅ Registered: {name} ({cron}) - phases: {[p.value for p in phases]}, "
+                      f"overlap: {options['overlap']}")
             except Exception as e:
                 print(f"⚠️ Failed to register schedule '{sched.get('name')}': {e}")
     
     # 자동 동기화 스케줄 추가 (매일 23시)
     scheduler.add_job(
-        run_scheduled_sync,
+        dispatch_job,
         CronTrigger(hour=23, minute=0),
+        args=['auto_sync', '자동 동기화', run_scheduled_sync],
         id='auto_sync',
         name='자동 동기화 (23시)'
     )
@@ -273,6 +318,8 @@ def create_scheduler() -> BlockingScheduler:
 def signal_handler(signum, frame):
     """종료 시그널 처리"""
     print("\n🛑 Shutdown signal received. Stopping scheduler...")
+    if supervisor is not None:
+        supervisor.shutdown()
     sys.exit(0)
 
 
@@ -293,12 +340,15 @@ Config Dir: {CONFIG_DIR}
     signal.signal(signal.SIGTERM, signal_handler)
     
     # 스케줄러 생성 및 시작
+    global supervisor
+    supervisor = JobSupervisor()
     scheduler = create_scheduler()
     
     print("\n📅 Registered Jobs:")
     for job in scheduler.get_jobs():
         print(f"   - {job.name}: {job.trigger}")
     
+    print(f"\n⚙️ Jobs run in subprocesses (max {supervisor.max_workers} concurrent)")
     print("\n🚀 Scheduler is running. Press Ctrl+C to stop.\n")
     
     try:
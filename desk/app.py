@@ -70,11 +70,29 @@ def authenticate():
     'You have to login with proper credentials', 401,
     {'WWW-Authenticate': 'Basic realm="ZND Desk Login Required"'})
 
+@app.before_request
+def tag_firestore_usage():
+    """요청 중 Firestore 비용을 라우트 단위로 집계 (firestore_usage)"""
+    from flask import g
+    from src.core.firestore_usage import set_source
+    rule = request.url_rule.rule if request.url_rule else request.path
+    g.firestore_usage_token = set_source(f"{request.method} {rule}")
+
+
+@app.teardown_request
+def untag_firestore_usage(exc=None):
+    from flask import g
+    from src.core.firestore_usage import reset_source
+    token = g.pop('firestore_usage_token', None)
+    if token is not None:
+        reset_source(token)
+
+
 @app.before_request
 def require_auth():
     """모든 요청에 대해 인증 확인 (Health Check 제외)"""
     # Health Check는 로드밸런서/모니터링을 위해 제외
-    if request.path == '/health':
+    if request.path == '/health' or request.path.startswith('/health/'):
         return
     
     # 정적 파일도 보호할지 여부는 선택사항이나, "모든 사이트 차단" 요청이므로 포함.
@@ -123,8 +141,89 @@ def health():
     return {'status': 'ok', 'version': os.getenv('SCHEMA_VERSION', '3.0')}
 
 
+@app.route('/health/live')
+def health_live():
+    """Liveness - 프로세스가 요청을 처리할 수 있으면 200 (워밍업 중에도, 내부 상태는 /api/health)"""
+    return {'status': 'ok'}
+
+
+@app.route('/health/ready')
+def health_ready():
+    """Readiness - 레지스트리 워밍업 완료 시 200, 진행 중이면 503 + 진행률"""
+    try:
+        from src.core.article_registry import get_registry
+        status = get_registry().get_warmup_status()
+    except Exception as e:
+        return {'status': 'error', 'error': str(e)}, 503
+    if status['ready']:
+        return {'status': 'ready', 'registry': status}
+    return {'status': status['phase'], 'registry': status}, 503
+
+
+@app.route('/api/health')
+def health_details():
+    """내부 상태 (인증 필요) - 레지스트리 워밍업 / 실시간 구독 / Firestore outbox"""
+    from src.core.article_registry import get_registry
+    from src.core.firestore_listener import get_listener
+    from src.core.firestore_outbox import get_outbox
+    
+    details = {}
+    for name, get_status in (('registry', lambda: get_registry().get_warmup_status()),
+                             ('listener', lambda: get_listener().get_status()),
+                             ('outbox', lambda: get_outbox().get_status())):
+        try:
+            details[name] = get_status()
+        except Exception as e:
+            details[name] = {'error': str(e)}
+    healthy = not any('error' in status for status in details.values())
+    return {'status': 'ok' if healthy else 'degraded', **details}
+
+
 # =============================================================================
-# Run Server
+# Service Initialization (개발 서버 __main__ / wsgi.py 워커 공용)
+# =============================================================================
+
+def init_services(run_singletons: bool = True):
+    """
+    레지스트리 초기화 + 프로세스 하나만 실행할 백그라운드 작업 등록
+    
+    Args:
+        run_singletons: True면 중단된 컬럼 작업 재실행 / Firestore 실시간 구독 / 캐시 압축도 시작
+                        (gunicorn 워커는 wsgi.py의 리더 잠금을 잡은 워커만 True)
+    """
+    from src.core.article_registry import init_registry
+    from src.core.firestore_client import FirestoreClient
+    
+    print("📦 Initializing Article Registry...")
+    db_client = FirestoreClient()
+    db_client.refresh_remote_hashes()  # 사이트 오픈 시 히스토리 동기화!
+    
+    # 기본: 백그라운드 워밍업 (최근 날짜부터 적재, 진행률은 /health/ready)
+    # REGISTRY_BACKGROUND_WARMUP=false 이면 적재 완료 후 서버 시작
+    background = os.getenv('REGISTRY_BACKGROUND_WARMUP', 'true').lower() == 'true'
+    registry = init_registry(db_client=db_client, background=background)
+    
+    if not run_singletons:
+        return registry
+    
+    # 오래된 날짜 폴더 segment 압축 (opt-in, 워밍업이 날짜 폴더를 다 읽은 뒤 시작)
+    if os.getenv('CACHE_COMPACTION', 'false').lower() == 'true':
+        from src.core.cache_segments import get_compactor
+        registry.on_ready(get_compactor().start)
+
+    # 재시작 전에 끝나지 않은 컬럼 작업 재실행 (대상 조회에 레지스트리 필요)
+    from src.core.job_runner import get_job_runner
+    registry.on_ready(get_job_runner().resume)
+
+    # Firestore 실시간 구독 (opt-in, 구독 중에는 refresh가 Firestore를 조회하지 않음)
+    from src.core.firestore_listener import is_listener_enabled, get_listener
+    if is_listener_enabled():
+        registry.on_ready(lambda: get_listener().start(registry, db_client))
+    return registry
+
+
+# =============================================================================
+# Run Server (개발 서버 - 운영은 gunicorn -c gunicorn.conf.py wsgi:app)
 # =============================================================================
 
 if __name__ == '__main__':
@@ -137,15 +236,8 @@ if __name__ == '__main__':
     is_reloader_process = os.environ.get('WERKZEUG_RUN_MAIN') == 'true'
     
     if not debug or is_reloader_process:
-        # Initialize Article Registry (SSOT for article metadata)
-        from src.core.article_registry import init_registry
-        from src.core.firestore_client import FirestoreClient
-        
-        print("📦 Initializing Article Registry...")
-        db_client = FirestoreClient()
-        db_client.refresh_remote_hashes()  # 사이트 오픈 시 히스토리 동기화!
-        init_registry(db_client=db_client)
-        
+        init_services()
+
         print(f"🚀 ZND Desk v2.0 starting on port {port}...")
         print(f"📍 Analyzer: http://localhost:{port}/analyzer")
         print(f"📍 Publisher: http://localhost:{port}/publisher")
@@ -6,7 +6,6 @@
 import os
 import sys
 import json
-import glob
 from datetime import datetime, timedelta
 
 # 프로젝트 경로 설정
@@ -14,6 +13,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.core.firestore_client import FirestoreClient
 from src.core_logic import get_kst_now
+from src.core.local_store import get_local_store
 
 def parse_datetime(dt_str):
     """다양한 형식의 datetime 문자열 파싱"""
@@ -56,12 +56,9 @@ def main():
 
     local_articles = {}
     if os.path.exists(cache_root):
-        files = glob.glob(os.path.join(cache_root, '*', '*.json'))
-        for fpath in files:
+        for stored in get_local_store(cache_root).iter_articles(since_date=cutoff.strftime('%Y-%m-%d')):
             try:
-                with open(fpath, 'r', encoding='utf-8') as f:
-                    content = json.load(f)
-
+                content = stored.data
                 header = content.get('_header', {})
                 created_at = header.get('created_at', '')
                 article_id = header.get('article_id')
@@ -69,7 +66,7 @@ def main():
                 if article_id and created_at >= cutoff_str:
                     local_articles[article_id] = {
                         'source': 'local',
-                        'path': fpath,
+                        'path': stored.location,
                         'state': header.get('state'),
                         'created_at': created_at,
                         'updated_at': header.get('updated_at', ''),
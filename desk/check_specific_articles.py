@@ -4,7 +4,6 @@
 """
 import os
 import sys
-import json
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -99,26 +98,24 @@ def main():
     print("[Check Local Cache]")
     print("=" * 70)
 
-    import glob
+    from src.core.local_store import get_local_store
     base_dir = os.path.dirname(os.path.abspath(__file__))
-    cache_root = os.path.join(base_dir, 'cache', env)
+    store = get_local_store(os.path.join(base_dir, 'cache', env))
 
     for aid in article_ids:
-        pattern = os.path.join(cache_root, '**', f'*{aid}*.json')
-        files = glob.glob(pattern, recursive=True)
-
-        if files:
-            for f in files:
-                print(f"\n[Local Cache] {aid}")
-                print(f"  File: {f}")
-                try:
-                    with open(f, 'r', encoding='utf-8') as fp:
-                        data = json.load(fp)
-                        header = data.get('_header', {})
-                        print(f"  State: {header.get('state')}")
-                        print(f"  Updated: {header.get('updated_at')}")
-                except Exception as e:
-                    print(f"  Error reading: {e}")
+        # 개별 파일 / 압축 segment 모두 조회
+        location = store.locate(aid)
+
+        if location:
+            print(f"\n[Local Cache] {aid}")
+            print(f"  File: {location}")
+            try:
+                data = store.get(aid) or {}
+                header = data.get('_header', {})
+                print(f"  State: {header.get('state')}")
+                print(f"  Updated: {header.get('updated_at')}")
+            except Exception as e:
+                print(f"  Error reading: {e}")
         else:
             print(f"\n[Local Cache] {aid}: NOT FOUND")
 
@@ -3,7 +3,11 @@
 문제 기사 로컬 캐시 삭제 스크립트
 """
 import os
-import glob
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.core.local_store import JsonFileStore
 
 problem_ids = [
     '09c261d90795', '1021b427ce79', '10252b522ac3', '153e514c7275',
@@ -18,17 +22,18 @@ cache_root = os.path.join(base_dir, 'cache', 'release')
 
 print("Deleting problem article cache files...")
 deleted = 0
+store = JsonFileStore(cache_root)
 
 for aid in problem_ids:
-    pattern = os.path.join(cache_root, '**', f'{aid}.json')
-    files = glob.glob(pattern, recursive=True)
-
-    for f in files:
-        try:
-            os.remove(f)
-            print(f"  Deleted: {f}")
+    # 개별 파일 + 압축 segment 항목 모두 제거
+    location = store.locate(aid)
+    if not location:
+        continue
+    try:
+        if store.delete(aid):
+            print(f"  Deleted: {location}")
             deleted += 1
-        except Exception as e:
-            print(f"  Error deleting {f}: {e}")
+    except Exception as e:
+        print(f"  Error deleting {location}: {e}")
 
 print(f"\nTotal deleted: {deleted}")
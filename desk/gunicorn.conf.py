@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+ZND Desk - gunicorn 설정
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+DESK_PORT (기본 5500), DESK_WORKERS (기본 2), DESK_THREADS (기본 4)
+"""
+import os
+
+# 워커 간 레지스트리 색인 공유 (각 워커가 캐시를 따로 적재하지 않음)
+os.environ.setdefault('REGISTRY_SHARED', 'true')
+
+bind = f"0.0.0.0:{os.getenv('DESK_PORT', 5500)}"
+workers = int(os.getenv('DESK_WORKERS', 2))
+threads = int(os.getenv('DESK_THREADS', 4))
+timeout = 120
+
+# 레지스트리 워밍업 스레드 / SQLite 연결은 fork 이후 워커 안에서 만들어야 함 (wsgi.py import 시 초기화)
+preload_app = False
@@ -11,15 +11,12 @@
 """
 import os
 import sys
-import glob
-import json
 from datetime import datetime, timezone
 
 # Path setup
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.core.firestore_client import FirestoreClient
-
-CACHE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+from src.core.local_store import get_local_store
 
 def get_valid_editions():
     """유효한 발행 회차 코드 목록 조회"""
@@ -40,13 +37,10 @@ def check_local_orphans(valid_editions):
     """로컬 캐시에서 고아 기사 찾기"""
     orphans = []
     
-    files = glob.glob(os.path.join(CACHE_ROOT, '*', '*.json'))
-    
-    for fpath in files:
+    # 현재 환경의 로컬 저장소 (개별 파일 + 압축 segment)
+    for stored in get_local_store().iter_articles():
         try:
-            with open(fpath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = stored.data
             if '_header' not in data:
                 continue
             
@@ -61,13 +55,14 @@ def check_local_orphans(valid_editions):
             if not edition_code or edition_code not in valid_editions:
                 orphans.append({
                     'source': 'local',
-                    'path': fpath,
-                    'article_id': data['_header'].get('article_id'),
+                    'path': stored.location,
+                    'date_folder': stored.date_folder,
+                    'article_id': data['_header'].get('article_id') or stored.article_id,
                     'edition_code': edition_code,
                     'data': data
                 })
         except Exception as e:
-            print(f"⚠️ Error reading {fpath}: {e}")
+            print(f"⚠️ Error reading {stored.location}: {e}")
     
     return orphans
 
@@ -118,8 +113,7 @@ def recover_local(orphan, dry_run=True):
     data['_publication'] = None
     
     if not dry_run:
-        with open(orphan['path'], 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        get_local_store().save(orphan['article_id'], data, orphan['date_folder'])
     
     return True
 
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Encoding Benchmark
+pretty(기존) / compact+gzip / compact+zstd 인코딩의 크기, 쓰기 시간, 콜드 로드 시간 비교
+
+콜드 로드는 별도 프로세스에서 파일을 전부 읽어 디코딩하는 시간입니다
+(OS 페이지 캐시는 비우지 않음).
+
+Usage:
+    python scripts/bench_cache_encoding.py
+    python scripts/bench_cache_encoding.py --count 5000 --text-size 8000
+    python scripts/bench_cache_encoding.py --cache      # 로컬 캐시 실제 기사 사용
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+from src.core import cache_codec
+from src.core.local_store import JsonFileStore, get_default_cache_root
+
+WORDS = ('AI', 'chip', 'model', 'market', 'open', 'source', 'data', 'cloud', 'GPU', 'policy',
+         '반도체', '인공지능', '시장', '발표', '공개', '투자', '규제')
+
+
+def make_article(idx: int, text_size: int, rng: random.Random) -> dict:
+    """flatten 후 저장되어 최상위 레거시 필드가 중복된 기사"""
+    url = f'https://news.example.com/{idx}'
+    text = ' '.join(rng.choice(WORDS) for _ in range(text_size // 5))[:text_size]
+    original = {'url': url, 'title': f'Article {idx}', 'text': text, 'source_id': 'example',
+                'crawled_at': '2025-01-01T00:00:00+09:00'}
+    analysis = {'title_ko': f'기사 {idx}', 'summary': '요약 ' * 60, 'tags': ['AI', 'Chip'],
+                'impact_score': round(rng.uniform(0, 10), 1), 'zero_echo_score': round(rng.uniform(0, 10), 1),
+                'mll_raw': {'IS_Analysis': {'Score_Commentary': 'c' * 400}}}
+    data = {
+        '_header': {'article_id': f'a{idx:07d}', 'state': 'ANALYZED', 'version': '3.1',
+                    'updated_at': '2025-01-01T00:00:00+09:00'},
+        '_original': original,
+        '_analysis': analysis,
+        '_classification': {'category': 'Tech'},
+        '_publication': None,
+    }
+    data.update(original)
+    data.update(analysis)
+    return data
+
+
+def load_cache_articles(limit: int) -> list:
+    store = JsonFileStore(get_default_cache_root())
+    articles = []
+    for stored in store.iter_articles():
+        articles.append(stored.data)
+        if len(articles) >= limit:
+            break
+    return articles
+
+
+COLD_LOAD = '''
+import os, sys, time
+sys.path.insert(0, {desk_dir!r})
+from src.core.cache_codec import decode_article
+t0 = time.perf_counter()
+n = 0
+for entry in os.scandir({folder!r}):
+    with open(entry.path, 'rb') as f:
+        decode_article(f.read())
+    n += 1
+print(time.perf_counter() - t0)
+'''
+
+
+def bench(label: str, articles: list, encoding: str, compression: str, workdir: str) -> dict:
+    folder = os.path.join(workdir, label)
+    os.makedirs(folder)
+
+    t0 = time.perf_counter()
+    total = 0
+    for idx, data in enumerate(articles):
+        encoded = cache_codec.encode_article(data, encoding, compression)
+        with open(os.path.join(folder, f'{idx}.json'), 'wb') as f:
+            f.write(encoded)
+        total += len(encoded)
+    t_write = time.perf_counter() - t0
+
+    out = subprocess.run(
+        [sys.executable, '-c', COLD_LOAD.format(desk_dir=desk_dir, folder=folder)],
+        capture_output=True, text=True, check=True
+    )
+    t_load = float(out.stdout.strip().splitlines()[-1])
+
+    # 왕복 검증
+    with open(os.path.join(folder, '0.json'), 'rb') as f:
+        assert cache_codec.decode_article(f.read()) == articles[0], f'{label}: round-trip mismatch'
+
+    return {'label': label, 'bytes': total, 'write': t_write, 'load': t_load}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cache encoding benchmark')
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--text-size', type=int, default=6000)
+    parser.add_argument('--cache', action='store_true', help='로컬 캐시 실제 기사 사용')
+    args = parser.parse_args()
+
+    if args.cache:
+        articles = load_cache_articles(args.count)
+        print(f"📂 Loaded {len(articles)} articles from cache")
+    else:
+        rng = random.Random(42)
+        articles = [make_article(i, args.text_size, rng) for i in range(args.count)]
+        print(f"🎲 Generated {len(articles)} articles (text {args.text_size} chars)")
+    if not articles:
+        print("❌ No articles")
+        return
+
+    cases = [('pretty', 'pretty', None), ('compact-gzip', 'compact', 'gzip')]
+    if cache_codec.zstandard is not None:
+        cases.append(('compact-zstd', 'compact', 'zstd'))
+    else:
+        print("ℹ️ zstandard not installed → zstd case skipped")
+    print(f"ℹ️ JSON engine: {'orjson' if cache_codec.orjson is not None else 'json'}")
+
+    workdir = tempfile.mkdtemp(prefix='znd_codec_')
+    try:
+        results = [bench(label, articles, enc, comp, workdir) for label, enc, comp in cases]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    base = results[0]
+    print("-" * 66)
+    print(f"   {'encoding':<14}{'size':>12}{'ratio':>8}{'write':>12}{'cold load':>14}")
+    for r in results:
+        print(f"   {r['label']:<14}{r['bytes'] / 1e6:>10.1f}MB{r['bytes'] / base['bytes'] * 100:>7.0f}%"
+              f"{r['write'] * 1000:>10.0f}ms{r['load'] * 1000:>12.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Segment Benchmark
+기사별 개별 파일 vs 날짜별 segment(mmap) 레이아웃의 전체 로드 시간 비교
+
+콜드 로드는 별도 프로세스에서 JsonFileStore.iter_articles()로 전체를 읽는 시간입니다
+(OS 페이지 캐시는 비우지 않음).
+
+Usage:
+    python scripts/bench_cache_segments.py
+    python scripts/bench_cache_segments.py --days 60 --per-day 200
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime, timedelta
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+from src.core.cache_segments import compact_cold_days
+from src.core.local_store import JsonFileStore
+
+COLD_LOAD = '''
+import sys, time
+sys.path.insert(0, {desk_dir!r})
+from src.core.local_store import JsonFileStore
+t0 = time.perf_counter()
+n = sum(1 for _ in JsonFileStore({root!r}).iter_articles())
+print(n, time.perf_counter() - t0)
+'''
+
+
+def count_files(root: str) -> int:
+    return sum(len(files) for _, _, files in os.walk(root))
+
+
+def cold_load(root: str) -> tuple:
+    out = subprocess.run(
+        [sys.executable, '-c', COLD_LOAD.format(desk_dir=desk_dir, root=root)],
+        capture_output=True, text=True, check=True
+    )
+    count, elapsed = out.stdout.strip().splitlines()[-1].split()
+    return int(count), float(elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cache segment benchmark')
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--per-day', type=int, default=150)
+    parser.add_argument('--hot-days', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    root = tempfile.mkdtemp(prefix='znd_segments_')
+    try:
+        store = JsonFileStore(root)
+        today = datetime.now()
+        for day in range(args.days):
+            date_str = (today - timedelta(days=day)).strftime('%Y-%m-%d')
+            for idx in range(args.per_day):
+                article_id = f'{day:03d}{idx:05d}'
+                store.save(article_id, {
+                    '_header': {'article_id': article_id, 'state': rng.choice(['ANALYZED', 'REJECTED'])},
+                    '_original': {'url': f'https://news.example.com/{article_id}', 'text': 'body ' * 800},
+                    '_analysis': {'impact_score': round(rng.uniform(0, 10), 1)},
+                }, date_str)
+        total = args.days * args.per_day
+        print(f"🎲 Generated {total} articles over {args.days} days")
+
+        files_before = count_files(root)
+        count_before, t_before = cold_load(root)
+
+        t0 = time.perf_counter()
+        compact_cold_days(root, args.hot_days)
+        t_compact = time.perf_counter() - t0
+
+        files_after = count_files(root)
+        count_after, t_after = cold_load(root)
+        assert count_before == count_after == total, 'article count mismatch'
+
+        print("-" * 56)
+        print(f"   {'layout':<12}{'files':>10}{'cold load':>14}")
+        print(f"   {'per-file':<12}{files_before:>10}{t_before * 1000:>12.0f}ms")
+        print(f"   {'segments':<12}{files_after:>10}{t_after * 1000:>12.0f}ms")
+        print(f"   compaction: {t_compact:.2f}s (hot days: {args.hot_days})")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Card Rendering Benchmark (SchemaAdapter)
+레거시(v3.0) 기사 카드 렌더링 비용 비교
+
+    before    : 요청마다 deepcopy 업그레이드 (기존 동작)
+    header    : _header만 복사하는 업그레이드 (persist 전)
+    persisted : 업그레이드가 저장된 v3.1 데이터 (zero-copy)
+
+Usage:
+    python scripts/bench_card_render.py
+    python scripts/bench_card_render.py --count 500 --text-size 5000 --repeat 20
+"""
+import os
+import sys
+import copy
+import time
+import random
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+from src.core.schema_adapter import SchemaAdapter
+
+
+def make_legacy_article(idx: int, text_size: int, rng: random.Random) -> dict:
+    """v3.0 기사 (url/source_id가 _original에만 있음)"""
+    return {
+        '_header': {'article_id': f'legacy{idx:06d}', 'state': 'CLASSIFIED', 'version': '3.0',
+                    'created_at': '2025-01-01T00:00:00+09:00', 'updated_at': '2025-01-01T00:00:00+09:00'},
+        '_original': {
+            'title': f'Legacy article {idx}',
+            'url': f'https://www.example.com/news/{idx}',
+            'source_id': 'example',
+            'text': ''.join(rng.choice('abcdefghij ') for _ in range(text_size)),
+            'image': None,
+            'crawled_at': '2025-01-01T00:00:00+09:00',
+        },
+        '_analysis': {
+            'title_ko': f'레거시 기사 {idx}', 'summary': '요약 ' * 40, 'tags': ['AI', 'Chip'],
+            'impact_score': round(rng.uniform(0, 10), 1), 'zero_echo_score': round(rng.uniform(0, 10), 1),
+            'mll_raw': {'IS_Analysis': {'Score_Commentary': 'c' * 500}, 'ZES_Raw_Metrics': {}},
+        },
+        '_classification': {'category': 'Tech'},
+        '_publication': None,
+    }
+
+
+def render_before(articles: list) -> list:
+    """기존 방식: deepcopy 후 업그레이드"""
+    cards = []
+    for data in articles:
+        adapter = SchemaAdapter(data)
+        upgraded = copy.deepcopy(data)
+        upgraded['_header'].update(adapter.get_header_upgrade())
+        cards.append(SchemaAdapter(upgraded).to_card_format())
+    return cards
+
+
+def render_after(articles: list) -> list:
+    """현재 방식: auto_upgrade (persist 없이)"""
+    return [SchemaAdapter(data, auto_upgrade=True, persist_upgrade=False).to_card_format() for data in articles]
+
+
+def bench(label: str, func, articles: list, repeat: int) -> float:
+    func(articles)  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        func(articles)
+    per_call = (time.perf_counter() - t0) / repeat * 1000
+    print(f"   {label:<10} {per_call:8.2f}ms / {len(articles)} cards")
+    return per_call
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Card rendering benchmark')
+    parser.add_argument('--count', type=int, default=500)
+    parser.add_argument('--text-size', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    legacy = [make_legacy_article(i, args.text_size, rng) for i in range(args.count)]
+
+    # 저장된 업그레이드 (migrate_schema_v31 / Registry write-back 이후 상태)
+    persisted = copy.deepcopy(legacy)
+    for data in persisted:
+        data['_header'].update(SchemaAdapter(data).get_header_upgrade())
+
+    # 결과 동일성 확인
+    assert render_before(legacy) == render_after(legacy) == render_after(persisted), 'card mismatch'
+
+    print(f"📊 {args.count} legacy articles (text {args.text_size} chars), repeat={args.repeat}")
+    t_before = bench('before', render_before, legacy, args.repeat)
+    t_header = bench('header', render_after, legacy, args.repeat)
+    t_persisted = bench('persisted', render_after, persisted, args.repeat)
+    print("-" * 50)
+    print(f"   header-only: x{t_before / t_header:.1f}, persisted: x{t_before / t_persisted:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Card / Content Split Benchmark (가짜 Firestore 백엔드)
+기사 목록 쿼리가 내려받는 바이트 수를 분리 전 문서와 카드 + 본문 문서(article_content)로 비교합니다.
+
+분리 전 형식의 시드 기사 (본문 --text-kb KB, mll_raw --mll-kb KB)를 넣고:
+    legacy     list_articles_by_state / list_recent_articles / list_articles_updated_since
+    migrate    scripts/migrate_article_content.py (다시 실행하면 분리할 문서 0건)
+    split      같은 목록 쿼리 (카드만) + include_content=True
+    registry   레지스트리 적재 (본문 get_all), 원격 카드 변경 반영 (로컬 본문 재사용, 본문 읽기 0),
+               원격 본문 변경 반영 (해당 기사만 본문 읽기)
+    writes     카드 필드만 바뀌는 전이 (본문 문서 쓰기 0) / mll_raw 변경 (본문 문서 다시 씀)
+
+검사 (다르면 종료 코드 1):
+    get_article / include_content=True 목록이 분리 전 문서와 같은지
+    모든 쓰기 후 Firestore 카드 + 본문 == 로컬 전체 데이터
+
+캐시는 ZND_ENV=bench_content (cache/bench_content, 시작 시 비움)를 사용합니다.
+
+Usage:
+    python scripts/bench_content_split.py
+    python scripts/bench_content_split.py --articles 500 --text-kb 16 --mll-kb 8 --json
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+sys.path.insert(0, script_dir)
+
+os.environ['ZND_ENV'] = 'bench_content'
+os.environ['FIRESTORE_BACKEND'] = 'memory'
+os.environ['REGISTRY_SHARED'] = 'false'
+os.environ['FIRESTORE_CONTENT_SPLIT'] = 'true'
+os.environ['FIRESTORE_FIELD_DIFF'] = 'true'
+
+QUERIES = ('by_state', 'recent', 'updated_since')
+
+
+def make_article(article_id: str, now: str, text_kb: int, mll_kb: int) -> dict:
+    url = f'https://bench.local/{article_id}'
+    return {
+        '_header': {
+            'version': '3.1', 'article_id': article_id, 'url': url, 'source_id': 'bench',
+            'state': 'ANALYZED', 'created_at': now, 'updated_at': now,
+            'state_history': [{'state': 'COLLECTED', 'at': now, 'by': 'crawler'},
+                              {'state': 'ANALYZED', 'at': now, 'by': 'analyzer'}],
+        },
+        '_original': {'title': f'Bench article {article_id}', 'text': 'x' * (text_kb * 1024),
+                      'url': url, 'published_at': now, 'crawled_at': now},
+        '_analysis': {'title_ko': f'벤치 {article_id}', 'impact_score': 5.0, 'zero_echo_score': 4.0,
+                      'tags': ['bench'], 'mll_raw': {'raw': 'y' * (mll_kb * 1024)}},
+        '_classification': None,
+        '_publication': None,
+    }
+
+
+def strip_marker(data: dict) -> dict:
+    """비교용 사본 ('id', 카드의 본문 요약 제외)"""
+    data = dict(data or {})
+    data.pop('id', None)
+    data['_header'] = {k: v for k, v in (data.get('_header') or {}).items() if k != 'content'}
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Listing bytes: legacy article documents vs card + content split')
+    parser.add_argument('--articles', type=int, default=200, help='기사 수')
+    parser.add_argument('--text-kb', type=int, default=8, help='_original.text 크기 (KB)')
+    parser.add_argument('--mll-kb', type=int, default=4, help='_analysis.mll_raw 크기 (KB)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    from src.core_logic import get_kst_now
+    from src.core.local_store import get_default_cache_root
+    from src.core.firestore_memory import MemoryFirestore
+    from src.core.firestore_client import FirestoreClient
+    from src.core.firestore_outbox import get_outbox
+    from src.core.article_content import CONTENTS_COLLECTION, merge_content
+    from migrate_article_content import migrate_collection
+
+    cache_root = get_default_cache_root()
+    shutil.rmtree(cache_root, ignore_errors=True)
+
+    fake = MemoryFirestore()
+    root = fake.collection(os.environ['ZND_ENV']).document('data')
+    articles_ref, contents_ref = root.collection('articles'), root.collection(CONTENTS_COLLECTION)
+    since = get_kst_now()
+    seeds = {f'c{i:05d}': make_article(f'c{i:05d}', get_kst_now(), args.text_kb, args.mll_kb)
+             for i in range(args.articles)}
+    batch = fake.batch()
+    for article_id, data in seeds.items():
+        batch.set(articles_ref.document(article_id), data)
+    batch.commit()
+
+    client = FirestoreClient.use_backend(fake)
+    n = args.articles
+    errors = []
+
+    def run_queries(label: str, include_content: bool = False) -> dict:
+        measured = {}
+        for query in QUERIES:
+            with fake.measure(f'{label}:{query}') as m:
+                if query == 'by_state':
+                    result = client.list_articles_by_state('ANALYZED', limit=n, include_content=include_content)
+                elif query == 'recent':
+                    result = client.list_recent_articles(n, include_content=include_content)
+                else:
+                    result = client.list_articles_updated_since(since)
+                    if include_content:
+                        client.attach_content(result)
+            if len(result) != n:
+                errors.append(f'{label}:{query} returned {len(result)}/{n}')
+            if include_content and query == 'by_state':
+                for data in result:
+                    aid = data['_header']['article_id']
+                    if strip_marker(data) != strip_marker(seeds[aid]):
+                        errors.append(f'{label}: assembled article differs: {aid}')
+            measured[query] = m
+        return measured
+
+    results = {'legacy': run_queries('legacy')}
+
+    with fake.measure('migrate') as m:
+        first = migrate_collection(client, page_size=50)
+    results['migrate'] = m
+    second = migrate_collection(client, page_size=50)
+    if first['migrated'] != n or second['migrated'] != 0 or second['already_split'] != n:
+        errors.append(f"migration: first={first}, second={second}")
+
+    results['split'] = run_queries('split')
+    results['split+content'] = run_queries('split+content', include_content=True)
+
+    sample = next(iter(seeds))
+    with fake.measure('get_article') as m:
+        assembled = client.get_article(sample)
+    results['get_article'] = m
+    if strip_marker(assembled) != strip_marker(seeds[sample]):
+        errors.append(f'get_article differs: {sample}')
+    card = client.get_article(sample, include_content=False)
+    if 'text' in card['_original'] or 'mll_raw' in card['_analysis']:
+        errors.append('card still carries body fields')
+
+    # 레지스트리: 적재 → 원격 카드 변경 (본문 재사용) → 원격 본문 변경
+    from src.core.article_registry import init_registry
+    with fake.measure('registry:load') as m:
+        registry = init_registry(cache_root=cache_root, db_client=client)
+    results['registry:load'] = m
+
+    edited = get_kst_now()
+    batch = fake.batch()
+    for article_id in seeds:
+        batch.update(articles_ref.document(article_id),
+                     {'_analysis.impact_score': 6.5, '_header.updated_at': get_kst_now()})
+    batch.commit()
+    with fake.measure('registry:card_change') as m:
+        registry.apply_firestore_changes(client.list_articles_updated_since(edited))
+    results['registry:card_change'] = m
+    if m.ops.get('get_all'):
+        errors.append('card-only change re-read content documents')
+    local = registry.get_full_data(sample) or {}
+    if local.get('_analysis', {}).get('impact_score') != 6.5 or 'text' not in local.get('_original', {}):
+        errors.append('card change not applied with local body')
+
+    edited = get_kst_now()
+    changed = dict(seeds[sample])
+    changed['_analysis'] = {**changed['_analysis'], 'impact_score': 6.5, 'mll_raw': {'raw': 'z' * 64}}
+    changed['_header'] = {**changed['_header'], 'updated_at': get_kst_now()}
+    client.save_article(sample, changed)
+    with fake.measure('registry:content_change') as m:
+        registry.apply_firestore_changes(client.list_articles_updated_since(edited))
+    results['registry:content_change'] = m
+    if (registry.get_full_data(sample) or {}).get('_analysis', {}).get('mll_raw') != {'raw': 'z' * 64}:
+        errors.append('remote body change not applied')
+
+    # 쓰기: 카드 필드만 / 본문 필드
+    outbox = get_outbox()
+    ids = list(seeds)
+    with fake.measure('writes:card') as m:
+        for article_id in ids:
+            registry.update_state(article_id, 'CLASSIFIED', 'bench', updates={'_classification.category': 'AI'})
+        outbox.drain()
+    results['writes:card'] = m
+    with fake.measure('writes:content') as m:
+        registry.update_fields_batch({article_id: {'_analysis.mll_raw': {'raw': 'w' * 128}} for article_id in ids})
+        outbox.drain()
+    results['writes:content'] = m
+
+    mismatched = []
+    for article_id in ids:
+        remote = articles_ref.document(article_id).get().to_dict()
+        merge_content(remote, contents_ref.document(article_id).get().to_dict() or {})
+        if strip_marker(remote) != strip_marker(registry.get_full_data(article_id)):
+            mismatched.append(article_id)
+    if mismatched:
+        errors.append(f'Firestore != local: {len(mismatched)} articles (e.g. {mismatched[0]})')
+
+    if args.json:
+        print(json.dumps({
+            'args': vars(args),
+            'results': {label: ({q: m.to_dict() for q, m in value.items()} if isinstance(value, dict) else value.to_dict())
+                        for label, value in results.items()},
+            'errors': errors,
+        }, ensure_ascii=False, indent=2))
+    else:
+        print("\n" + "=" * 78)
+        print(f"{'query':<15} {'legacy B/article':>17} {'card B/article':>15} {'ratio':>8} "
+              f"{'reads +content':>15}")
+        print("-" * 78)
+        for query in QUERIES:
+            legacy, split = results['legacy'][query], results['split'][query]
+            full = results['split+content'][query]
+            ratio = f"{split.bytes_received / legacy.bytes_received:.1%}" if legacy.bytes_received else '-'
+            print(f"{query:<15} {legacy.bytes_received / n:>17.0f} {split.bytes_received / n:>15.0f} "
+                  f"{ratio:>8} {full.reads:>15}")
+        print("=" * 78)
+        print(f"articles={n}, text={args.text_kb}KB, mll_raw={args.mll_kb}KB")
+        for label in ('migrate', 'get_article', 'registry:load', 'registry:card_change',
+                      'registry:content_change', 'writes:card', 'writes:content'):
+            print(f"   {results[label].summary()}")
+        print(f"{'✅' if not errors else '❌'} Checks: {len(errors)} problems")
+        for error in errors:
+            print(f"   ❌ {error}")
+
+    shutil.rmtree(cache_root, ignore_errors=True)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Firestore Cost Benchmark (가짜 Firestore 백엔드)
+라이브 프로젝트/에뮬레이터 없이 무거운 경로의 Firestore 읽기/쓰기/지연을 정확히 측정합니다.
+FirestoreClient를 firestore_memory.MemoryFirestore로 교체하고 시드 데이터를 넣은 뒤 단계별로 계측합니다.
+
+단계:
+    client_init     FirestoreClient 생성 (히스토리 색인 로드)
+    registry_init   빈 로컬 캐시에서 레지스트리 초기화 (Firestore 적재)
+    list_by_state   list_articles_by_state (상태별)
+    board_overview  보드 overview와 같은 상태별 조회 (COLLECTED~REJECTED)
+    publish         CLASSIFIED 기사 --publish개 발행 (미리보기 회차)
+    release         해당 회차 정식 발행
+
+--budget 단계=최대읽기 를 주면 초과 시 종료 코드 1 (회귀 검증용)
+    예) --budget publish=60 --budget release=30
+
+쓰기는 Firestore outbox(FIRESTORE_OUTBOX)를 거치므로 쓰기 단계는 끝에서 outbox를 비운 값까지 측정합니다.
+
+캐시는 ZND_ENV=bench_costs (cache/bench_costs, 시작 시 비움)를 사용합니다.
+
+Usage:
+    python scripts/bench_firestore_costs.py
+    python scripts/bench_firestore_costs.py --articles 2000 --latency-ms 25 --budget publish=60
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+os.environ['ZND_ENV'] = 'bench_costs'
+os.environ['FIRESTORE_BACKEND'] = 'memory'
+os.environ['REGISTRY_SHARED'] = 'false'
+
+SEED_STATES = ['COLLECTED', 'ANALYZED', 'CLASSIFIED', 'REJECTED']
+
+
+def make_article(index: int, state: str, now: str) -> dict:
+    article_id = f'bench{index:06d}'
+    url = f'https://bench.local/{article_id}'
+    article = {
+        '_header': {
+            'version': '3.1', 'article_id': article_id, 'url': url, 'source_id': 'bench',
+            'state': state, 'created_at': now, 'updated_at': now,
+            'state_history': [{'state': state, 'at': now, 'by': 'bench'}],
+        },
+        '_original': {'title': f'Bench article {index}', 'text': 'lorem ipsum ' * 50,
+                      'url': url, 'published_at': now, 'crawled_at': now},
+        '_analysis': None,
+        '_classification': None,
+        '_publication': None,
+    }
+    if state in ('ANALYZED', 'CLASSIFIED'):
+        article['_analysis'] = {'title_ko': f'벤치 기사 {index}', 'summary': '요약',
+                                'impact_score': index % 10, 'zero_echo_score': 5.0, 'tags': ['bench']}
+    if state == 'CLASSIFIED':
+        article['_classification'] = {'category': 'AI', 'is_selected': True, 'classified_at': now}
+    return article
+
+
+def parse_budgets(values) -> dict:
+    budgets = {}
+    for value in values or []:
+        name, _, limit = value.partition('=')
+        budgets[name] = int(limit)
+    return budgets
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Firestore read/write costs on the in-memory backend')
+    parser.add_argument('--articles', type=int, default=500, help='시드 기사 수 (상태 4종에 고르게 배분)')
+    parser.add_argument('--publish', type=int, default=20, help='발행할 CLASSIFIED 기사 수')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='원격 호출 1회당 지연')
+    parser.add_argument('--budget', action='append', help='단계=최대읽기 (여러 번 지정 가능)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    from src.core_logic import get_kst_now
+    from src.core.local_store import get_default_cache_root
+    from src.core.firestore_memory import MemoryFirestore
+    from src.core.firestore_client import FirestoreClient
+    from src.core.firestore_outbox import get_outbox
+
+    cache_root = get_default_cache_root()
+    shutil.rmtree(cache_root, ignore_errors=True)
+
+    fake = MemoryFirestore()
+    env = os.environ['ZND_ENV']
+    articles = fake.collection(env).document('data').collection('articles')
+    now = get_kst_now()
+    batch = fake.batch()
+    for i in range(args.articles):
+        state = SEED_STATES[i % len(SEED_STATES)]
+        if i < args.publish * len(SEED_STATES):
+            state = 'CLASSIFIED' if i % len(SEED_STATES) == 2 else state
+        batch.set(articles.document(f'bench{i:06d}'), make_article(i, state, now))
+        if (i + 1) % 500 == 0:
+            batch.commit()
+            batch = fake.batch()
+    batch.commit()
+    fake.stats.reset()
+    fake.latency_ms = args.latency_ms
+
+    results = []
+
+    with fake.measure('client_init') as m:
+        client = FirestoreClient.use_backend(fake)
+    results.append(m)
+
+    from src.core.article_registry import init_registry
+    from src.core.article_manager import ArticleManager
+    from src.core.article_state import ArticleState
+
+    with fake.measure('registry_init') as m:
+        init_registry(cache_root=cache_root, db_client=client)
+    results.append(m)
+
+    with fake.measure('list_by_state') as m:
+        client.list_articles_by_state('ANALYZED', limit=100)
+    results.append(m)
+
+    manager = ArticleManager()
+    with fake.measure('board_overview') as m:
+        for state in (ArticleState.COLLECTED, ArticleState.ANALYZED, ArticleState.CLASSIFIED,
+                      ArticleState.PUBLISHED, ArticleState.REJECTED):
+            manager.find_by_state(state, 100)
+    results.append(m)
+
+    classified = [a for a in manager.find_by_state(ArticleState.CLASSIFIED, args.publish * 2)][:args.publish]
+    edition_code = f"{now[2:4]}{now[5:7]}{now[8:10]}_1"
+    with fake.measure('publish') as m:
+        for article in classified:
+            article_id = article.get('_header', {}).get('article_id') or article.get('article_id')
+            manager.publish(article_id, edition_code, '1호')
+        get_outbox().drain()
+    results.append(m)
+
+    with fake.measure('release') as m:
+        manager.release_edition(edition_code)
+        get_outbox().drain()
+    results.append(m)
+
+    budgets = parse_budgets(args.budget)
+    violations = [(m.label, m.reads, budgets[m.label]) for m in results
+                  if m.label in budgets and m.reads > budgets[m.label]]
+
+    if args.json:
+        print(json.dumps({'results': [m.to_dict() for m in results],
+                          'violations': violations}, ensure_ascii=False, indent=2))
+    else:
+        print("\n" + "=" * 72)
+        print(f"{'step':<16} {'reads':>8} {'writes':>8} {'deletes':>8} {'calls':>7} {'elapsed':>12}")
+        print("-" * 72)
+        for m in results:
+            calls = sum(v['calls'] for v in m.ops.values())
+            print(f"{m.label:<16} {m.reads:>8} {m.writes:>8} {m.deletes:>8} {calls:>7} {m.elapsed_ms:>10.1f}ms")
+        print("=" * 72)
+        print(f"articles={args.articles}, published={len(classified)}, latency={args.latency_ms}ms")
+        for m in results:
+            print(f"   {m.summary()}")
+        for label, reads, limit in violations:
+            print(f"❌ {label}: {reads} reads > budget {limit}")
+
+    shutil.rmtree(cache_root, ignore_errors=True)
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Firestore Field Diff Benchmark (가짜 Firestore 백엔드)
+상태 전이마다 Firestore로 보내는 바이트 수를 전체 저장과 필드 단위 저장(FIRESTORE_FIELD_DIFF)으로 비교합니다.
+
+시드 기사 (본문 --text-kb KB, state_history --history건)를 Firestore에 넣고 레지스트리로 적재한 뒤
+같은 전이를 두 방식으로 실행합니다 (방식마다 별도 기사 묶음, 본문 분리가 켜져 있으면 카드 + 본문 문서로 시드):
+    analyze   COLLECTED → ANALYZED (_analysis, mll_raw --raw-kb KB)
+    classify  ANALYZED → CLASSIFIED (_classification)
+    rescore   update_fields_batch (점수만 변경)
+    reject    CLASSIFIED → REJECTED (_rejection)
+
+검사: 모든 전이 후 Firestore 문서 (본문 분리 시 카드 + 본문 문서)가 로컬 전체 데이터와 같은지
+      (다르면 종료 코드 1)
+
+캐시는 ZND_ENV=bench_diff (cache/bench_diff, 시작 시 비움)를 사용합니다.
+
+Usage:
+    python scripts/bench_firestore_diff.py
+    python scripts/bench_firestore_diff.py --articles 200 --text-kb 32 --raw-kb 4 --history 50 --json
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+os.environ['ZND_ENV'] = 'bench_diff'
+os.environ['FIRESTORE_BACKEND'] = 'memory'
+os.environ['REGISTRY_SHARED'] = 'false'
+
+MODES = ('full', 'diff')
+STEPS = ('analyze', 'classify', 'rescore', 'reject')
+
+
+def make_article(article_id: str, now: str, text_kb: int, history: int) -> dict:
+    url = f'https://bench.local/{article_id}'
+    return {
+        '_header': {
+            'version': '3.1', 'article_id': article_id, 'url': url, 'source_id': 'bench',
+            'state': 'COLLECTED', 'created_at': now, 'updated_at': now,
+            'state_history': [{'state': 'COLLECTED', 'at': now, 'by': f'bench-{i}'} for i in range(history)],
+        },
+        '_original': {'title': f'Bench article {article_id}', 'text': 'x' * (text_kb * 1024),
+                      'url': url, 'published_at': now, 'crawled_at': now},
+        '_analysis': None,
+        '_classification': None,
+        '_publication': None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bytes sent per state transition: full overwrite vs field diff')
+    parser.add_argument('--articles', type=int, default=50, help='방식별 기사 수')
+    parser.add_argument('--text-kb', type=int, default=8, help='기사 본문 크기 (KB)')
+    parser.add_argument('--raw-kb', type=int, default=2, help='analyze 단계 _analysis.mll_raw 크기 (KB)')
+    parser.add_argument('--history', type=int, default=20, help='시드 state_history 길이')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    from src.core_logic import get_kst_now
+    from src.core.local_store import get_default_cache_root
+    from src.core.firestore_memory import MemoryFirestore
+    from src.core.firestore_client import FirestoreClient
+    from src.core.firestore_outbox import get_outbox
+    from src.core.article_content import CONTENTS_COLLECTION, merge_content, split_article, is_content_split_enabled
+
+    cache_root = get_default_cache_root()
+    shutil.rmtree(cache_root, ignore_errors=True)
+
+    fake = MemoryFirestore()
+    collection = fake.collection(os.environ['ZND_ENV']).document('data').collection('articles')
+    contents = fake.collection(os.environ['ZND_ENV']).document('data').collection(CONTENTS_COLLECTION)
+    now = get_kst_now()
+    ids = {mode: [f'{mode}{i:05d}' for i in range(args.articles)] for mode in MODES}
+    batch = fake.batch()
+    for mode in MODES:
+        for article_id in ids[mode]:
+            article = make_article(article_id, now, args.text_kb, args.history)
+            if is_content_split_enabled():
+                article, content = split_article(article)
+                batch.set(contents.document(article_id), content)
+            batch.set(collection.document(article_id), article)
+    batch.commit()
+
+    client = FirestoreClient.use_backend(fake)
+    from src.core.article_registry import init_registry
+    registry = init_registry(cache_root=cache_root, db_client=client)
+    outbox = get_outbox()
+
+    def transition(article_id: str, step: str):
+        if step == 'analyze':
+            return registry.update_state(article_id, 'ANALYZED', 'bench', updates={
+                '_analysis.title_ko': f'벤치 {article_id}', '_analysis.summary': '요약 ' * 40,
+                '_analysis.impact_score': 5.0, '_analysis.zero_echo_score': 4.0, '_analysis.tags': ['bench'],
+                '_analysis.mll_raw': 'r' * (args.raw_kb * 1024)})
+        if step == 'classify':
+            return registry.update_state(article_id, 'CLASSIFIED', 'bench', updates={
+                '_classification.category': 'AI', '_classification.is_selected': True})
+        if step == 'reject':
+            return registry.update_state(article_id, 'REJECTED', 'bench', updates={
+                '_rejection.reason': 'cutline', '_rejection.rejected_at': get_kst_now()})
+        raise ValueError(step)
+
+    results = {mode: {} for mode in MODES}
+    for mode in MODES:
+        os.environ['FIRESTORE_FIELD_DIFF'] = 'true' if mode == 'diff' else 'false'
+        for step in STEPS:
+            with fake.measure(f'{mode}:{step}') as m:
+                if step == 'rescore':
+                    registry.update_fields_batch({aid: {'_analysis.impact_score': 7.5} for aid in ids[mode]})
+                else:
+                    for article_id in ids[mode]:
+                        transition(article_id, step)
+                outbox.drain()
+            results[mode][step] = m
+
+    # Firestore 문서 == 로컬 전체 데이터 (조회 시 붙는 'id'와 카드의 본문 요약은 제외)
+    mismatched = []
+    for mode in MODES:
+        for article_id in ids[mode]:
+            remote = merge_content(collection.document(article_id).get().to_dict(),
+                                   contents.document(article_id).get().to_dict() or {})
+            local = dict(registry.get_full_data(article_id) or {})
+            for data in (remote, local):
+                data.pop('id', None)
+                data['_header'] = {k: v for k, v in data['_header'].items() if k != 'content'}
+            if remote != local:
+                mismatched.append(article_id)
+
+    if args.json:
+        print(json.dumps({
+            'args': vars(args),
+            'results': {mode: {step: m.to_dict() for step, m in steps.items()} for mode, steps in results.items()},
+            'mismatched': mismatched,
+        }, ensure_ascii=False, indent=2))
+    else:
+        print("\n" + "=" * 76)
+        print(f"{'step':<10} {'full B/article':>15} {'diff B/article':>15} {'ratio':>8} "
+              f"{'full ms':>10} {'diff ms':>10}")
+        print("-" * 76)
+        for step in STEPS:
+            full, diff = results['full'][step], results['diff'][step]
+            per_full = full.bytes_sent / args.articles
+            per_diff = diff.bytes_sent / args.articles
+            ratio = f"{per_diff / per_full:.1%}" if per_full else '-'
+            print(f"{step:<10} {per_full:>15.0f} {per_diff:>15.0f} {ratio:>8} "
+                  f"{full.elapsed_ms:>10.1f} {diff.elapsed_ms:>10.1f}")
+        print("=" * 76)
+        print(f"articles={args.articles}/mode, text={args.text_kb}KB, history={args.history}")
+        for mode in MODES:
+            for m in results[mode].values():
+                print(f"   {m.summary()}")
+        print(f"{'✅' if not mismatched else '❌'} Firestore == local: "
+              f"{2 * args.articles - len(mismatched)}/{2 * args.articles}")
+
+    shutil.rmtree(cache_root, ignore_errors=True)
+    return 1 if mismatched else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Firestore Listener Benchmark (에뮬레이터 전용)
+다른 desk 인스턴스/스케줄러가 기사를 수정할 때
+주기 refresh() 폴링과 실시간 구독(REGISTRY_LISTENER)의 Firestore 읽기 수 / 반영 지연을 비교합니다.
+
+실제 Firestore에 쓰지 않도록 FIRESTORE_EMULATOR_HOST가 없으면 종료합니다.
+    gcloud emulators firestore start --host-port=localhost:8080
+
+측정 (ZND_ENV=bench_listener, cache/bench_listener는 시작 시 비움):
+    1. 시드 기사 --articles개 저장 → 레지스트리 초기화
+    2. polling : 라운드마다 외부 작성자가 --changes개 수정 → refresh() → 읽기 수
+    3. listener: 구독 시작 → 같은 수정 → 색인 반영까지 지연 → refresh() → 읽기 수
+    4. 기사 1건 삭제 → 구독으로 색인/로컬 저장소에서 제거되는지 확인
+
+Usage:
+    FIRESTORE_EMULATOR_HOST=localhost:8080 python scripts/bench_firestore_listener.py
+    FIRESTORE_EMULATOR_HOST=localhost:8080 python scripts/bench_firestore_listener.py --rounds 10 --full-scan
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+os.environ.setdefault('ZND_ENV', 'bench_listener')
+os.environ['REGISTRY_SHARED'] = 'false'
+
+STATES = ['COLLECTED', 'ANALYZED', 'CLASSIFIED']
+
+
+def make_article(article_id: str, now: str) -> dict:
+    url = f'https://bench.local/{article_id}'
+    return {
+        '_header': {'article_id': article_id, 'state': 'COLLECTED', 'url': url,
+                    'created_at': now, 'updated_at': now},
+        '_original': {'url': url, 'title': f'Bench {article_id}', 'published_at': now},
+    }
+
+
+def external_update(db, article_ids, state: str):
+    """다른 프로세스의 수정 흉내 (로컬 저장소를 거치지 않고 Firestore에만 기록)"""
+    from src.core_logic import get_kst_now
+    collection = db._get_collection('articles')
+    for article_id in article_ids:
+        collection.document(article_id).update({'_header.state': state, '_header.updated_at': get_kst_now()})
+
+
+def wait_reflected(registry, article_ids, state: str, timeout: float) -> float:
+    """모든 기사가 색인에 반영될 때까지 대기 (소요 초, 시간 초과 시 -1)"""
+    started = time.time()
+    while time.time() - started < timeout:
+        if all((registry.get(aid) is not None and registry.get(aid).state == state) for aid in article_ids):
+            return time.time() - started
+        time.sleep(0.05)
+    return -1
+
+
+def measure_reads(db_cls, fn):
+    before = db_cls.get_usage_stats()['reads']
+    result = fn()
+    return db_cls.get_usage_stats()['reads'] - before, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Polling refresh vs realtime listener (Firestore emulator)')
+    parser.add_argument('--articles', type=int, default=300, help='시드 기사 수')
+    parser.add_argument('--changes', type=int, default=10, help='라운드당 외부 수정 기사 수')
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--timeout', type=float, default=30, help='구독 반영 대기 한도 (초)')
+    parser.add_argument('--full-scan', action='store_true',
+                        help='polling을 watermark 없이 상태별 전체 조회로 측정 (REGISTRY_INCREMENTAL_SYNC=false)')
+    args = parser.parse_args()
+
+    if not os.getenv('FIRESTORE_EMULATOR_HOST'):
+        print("❌ FIRESTORE_EMULATOR_HOST is not set - this benchmark only runs against the emulator")
+        return 1
+    if args.full_scan:
+        os.environ['REGISTRY_INCREMENTAL_SYNC'] = 'false'
+
+    from src.core_logic import get_kst_now
+    from src.core.local_store import get_default_cache_root, get_local_store
+    from src.core.firestore_client import FirestoreClient
+    from src.core.article_registry import init_registry
+    from src.core.firestore_listener import get_listener
+
+    cache_root = get_default_cache_root()
+    shutil.rmtree(cache_root, ignore_errors=True)
+
+    db = FirestoreClient()
+    ids = [f'bench_{i:05d}' for i in range(args.articles)]
+    now = get_kst_now()
+    db.batch_save_articles({aid: make_article(aid, now) for aid in ids})
+
+    registry = init_registry(cache_root=cache_root, db_client=db)
+    print(f"\n📦 Registry: {registry.count()} articles\n")
+
+    def run_rounds(label, reflect):
+        rows = []
+        for r in range(args.rounds):
+            state = STATES[(r + 1) % len(STATES)]
+            batch = ids[r * args.changes % len(ids):][:args.changes]
+            external_update(db, batch, state)
+            reads, latency = measure_reads(FirestoreClient, lambda: reflect(batch, state))
+            refresh_reads, _ = measure_reads(FirestoreClient, registry.refresh)
+            ok = wait_reflected(registry, batch, state, 0) >= 0
+            rows.append((reads, refresh_reads, latency, ok))
+            print(f"   [{label}] round {r + 1}: listener reads {reads}, refresh reads {refresh_reads}, "
+                  f"latency {latency:.2f}s, reflected {ok}")
+        return rows
+
+    # 1. 폴링: refresh()가 Firestore 조회로 변경을 가져옴
+    polling = run_rounds('polling', lambda batch, state: 0.0)
+
+    # 2. 실시간 구독: 변경은 구독으로 반영, refresh()는 Firestore를 조회하지 않음
+    listener = get_listener()
+    listener.start(registry, db)
+    started = time.time()
+    while not listener.is_active() and time.time() - started < args.timeout:
+        time.sleep(0.05)
+    time.sleep(0.5)
+    realtime = run_rounds('listener', lambda batch, state: wait_reflected(registry, batch, state, args.timeout))
+
+    # 3. 삭제 반영
+    victim = ids[-1]
+    db.delete_article(victim)
+    deadline = time.time() + args.timeout
+    while registry.get(victim) is not None and time.time() < deadline:
+        time.sleep(0.05)
+    removed = registry.get(victim) is None and get_local_store(cache_root).get(victim) is None
+    listener.stop()
+
+    def total(rows, i):
+        return sum(row[i] for row in rows)
+
+    print("\n" + "=" * 64)
+    print(f"{'mode':<10} {'refresh reads':>14} {'listener reads':>15} {'avg latency':>12} {'reflected':>10}")
+    print("-" * 64)
+    print(f"{'polling':<10} {total(polling, 1):>14} {'-':>15} {'next refresh':>12} "
+          f"{sum(r[3] for r in polling):>6}/{len(polling)}")
+    latencies = [r[2] for r in realtime if r[2] >= 0]
+    avg = f"{sum(latencies) / len(latencies):.2f}s" if latencies else 'timeout'
+    print(f"{'listener':<10} {total(realtime, 1):>14} {total(realtime, 0):>15} {avg:>12} "
+          f"{sum(r[3] for r in realtime):>6}/{len(realtime)}")
+    print("=" * 64)
+    print(f"🗑️ Delete propagated: {removed}")
+    print(f"📊 Listener: {listener.get_status()}")
+    return 0 if removed and all(r[3] for r in realtime) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""
+History Index Sharding Benchmark (가짜 Firestore 백엔드)
+URL 히스토리 인덱스를 한 문서(history/_index)로 읽을 때와 샤드 + 로컬 사본(history_index)으로 읽을 때
+시작/새로고침마다 읽는 문서 수와 바이트를 비교합니다.
+
+    legacy        이전 형식 _index 한 문서 (시작 + /api/board/overview마다 refresh_remote_hashes)
+    migrate       scripts/migrate_history_index.py
+    cold start    로컬 사본 없이 시작 (목록 문서 + 모든 샤드)
+    warm restart  로컬 사본으로 시작, 바뀐 샤드 없음 (목록 문서 1회)
+    idle refresh  바뀐 것 없는 새로고침
+    crawl         --crawl개 URL 기록 (outbox drain과 같은 batch_update_history)
+    other server  수집 전 로컬 사본을 가진 다른 서버가 시작 (바뀐 샤드만)
+
+검사: 단계마다 원격 해시 집합 == 기록한 URL 전체, check_url_exists 상태 (다르면 종료 코드 1)
+
+캐시는 ZND_ENV=bench_history_index (cache/bench_history_index, 시작 시 비움)를 사용합니다.
+
+Usage:
+    python scripts/bench_history_index.py
+    python scripts/bench_history_index.py --urls 50000 --crawl 200 --shard-chars 1 --json
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+import contextlib
+import io
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+sys.path.insert(0, script_dir)
+
+os.environ['ZND_ENV'] = 'bench_history_index'
+os.environ['FIRESTORE_BACKEND'] = 'memory'
+
+STEPS = ('legacy start', 'legacy refresh', 'migrate', 'cold start', 'warm restart',
+         'idle refresh', 'crawl', 'other server')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='URL history index: single document vs shards + local copy')
+    parser.add_argument('--urls', type=int, default=20000, help='기존 히스토리 URL 수')
+    parser.add_argument('--crawl', type=int, default=50, help='새로 기록할 URL 수')
+    parser.add_argument('--shard-chars', type=int, choices=(1, 2, 3), default=2, help='샤드 폭')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    from src.core_logic import get_kst_now
+    from src.core.local_store import get_default_cache_root
+    from src.core.firestore_memory import MemoryFirestore
+    from src.core.firestore_client import FirestoreClient
+    from migrate_history_index import migrate
+
+    cache_root = get_default_cache_root()
+    shutil.rmtree(cache_root, ignore_errors=True)
+    os.makedirs(cache_root, exist_ok=True)
+    local_copy = os.path.join(cache_root, '_history_index.json')
+
+    fake = MemoryFirestore()
+    history = fake.collection(os.environ['ZND_ENV']).document('data').collection('history')
+    now = get_kst_now()
+    urls = [f'https://bench.local/news/{i}' for i in range(args.urls)]
+    crawl = [f'https://bench.local/new/{i}' for i in range(args.crawl)]
+
+    results = {}
+    errors = []
+
+    def quiet():
+        return contextlib.redirect_stdout(io.StringIO())
+
+    def new_client():
+        with quiet():
+            return FirestoreClient.use_backend(fake)
+
+    def check(label: str, client, expected_urls):
+        expected = {client._url_to_key(url) for url in expected_urls}
+        if client._remote_hashes != expected:
+            errors.append(f'{label}: {len(client._remote_hashes)} remote hashes, expected {len(expected)}')
+        probe = expected_urls[-1]
+        with quiet():
+            entry = client.check_url_exists(probe)
+        if not entry or entry.get('article_id') != f'a{expected_urls.index(probe)}':
+            errors.append(f'{label}: check_url_exists({probe}) = {entry}')
+
+    # 이전 형식 시드
+    key = FirestoreClient._url_to_key
+    history.document('_index').set({'urls': {key(None, url): {'article_id': f'a{i}', 'status': 'ANALYZED',
+                                                             'updated_at': now} for i, url in enumerate(urls)}})
+
+    with fake.measure('legacy start') as m:
+        client = new_client()
+    results['legacy start'] = m
+    with fake.measure('legacy refresh') as m:
+        with quiet():
+            client.refresh_remote_hashes()
+    results['legacy refresh'] = m
+    check('legacy', client, urls)
+
+    with fake.measure('migrate') as m:
+        with quiet():
+            migrate(client, shard_chars=args.shard_chars)
+    results['migrate'] = m
+
+    os.remove(local_copy)
+    with fake.measure('cold start') as m:
+        client = new_client()
+    results['cold start'] = m
+    check('cold start', client, urls)
+
+    with fake.measure('warm restart') as m:
+        client = new_client()
+    results['warm restart'] = m
+    check('warm restart', client, urls)
+    shutil.copy(local_copy, local_copy + '.before_crawl')
+
+    with fake.measure('idle refresh') as m:
+        with quiet():
+            client.refresh_remote_hashes()
+    results['idle refresh'] = m
+
+    with fake.measure('crawl') as m:
+        with quiet():
+            client.batch_update_history([(url, f'a{args.urls + i}', 'COLLECTED') for i, url in enumerate(crawl)])
+            client.refresh_remote_hashes()
+    results['crawl'] = m
+    all_urls = urls + crawl
+    check('crawl', client, all_urls)
+
+    # 다른 서버: 수집 전 로컬 사본으로 시작
+    os.replace(local_copy + '.before_crawl', local_copy)
+    with fake.measure('other server') as m:
+        client = new_client()
+    results['other server'] = m
+    check('other server', client, all_urls)
+
+    legacy_doc_bytes = len(json.dumps(history.document('_index').get().to_dict()).encode('utf-8'))
+    if args.json:
+        print(json.dumps({
+            'args': vars(args), 'legacy_doc_bytes': legacy_doc_bytes,
+            'results': {step: m.to_dict() for step, m in results.items()},
+            'errors': errors,
+        }, ensure_ascii=False, indent=2))
+    else:
+        print("\n" + "=" * 60)
+        print(f"{'step':<15} {'reads':>8} {'writes':>8} {'received':>14} {'ms':>10}")
+        print("-" * 60)
+        for step in STEPS:
+            m = results[step]
+            print(f"{step:<15} {m.reads:>8} {m.writes:>8} {m.bytes_received:>13}B {m.elapsed_ms:>10.1f}")
+        print("=" * 60)
+        print(f"urls={args.urls}, crawl={args.crawl}, shards={16 ** args.shard_chars}, "
+              f"legacy _index={legacy_doc_bytes / 1024:.0f}KB")
+        print(f"{'✅' if not errors else '❌'} Checks: {len(errors)} problems")
+        for error in errors:
+            print(f"   ❌ {error}")
+
+    shutil.rmtree(cache_root, ignore_errors=True)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
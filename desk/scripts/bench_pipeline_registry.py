@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Scheduler Pipeline Registry Benchmark
+스케줄러 파이프라인을 desk 밖 프로세스에서 실행할 때
+부분 적재 레지스트리(PIPELINE_REGISTRY=true)와 기존 경로(false)의
+Firestore 읽기 수 / 소요 시간을 비교합니다.
+
+기본 모드 (읽기 전용):
+    각 단계가 수행하는 조회(ANALYZE: COLLECTED, CLASSIFY/REJECT: ANALYZED, PUBLISH: CLASSIFIED)를
+    SchedulerPipeline과 같은 방식으로 실행 - Firestore에 쓰지 않음
+
+--full-run:
+    실제 예약 실행과 같은 PHASES_UNTIL_PUBLISH 파이프라인 실행 (발행은 dry-run)
+    수집/분류/배제 결과가 현재 ZND_ENV의 Firestore에 기록되므로 dev 환경에서만 사용하세요.
+
+Usage:
+    python scripts/bench_pipeline_registry.py
+    python scripts/bench_pipeline_registry.py --full-run --mode registry
+"""
+import os
+import io
+import sys
+import time
+import argparse
+import contextlib
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+from src.core.firestore_client import FirestoreClient
+from src.core.article_registry import get_registry
+from src.scheduler_pipeline import (
+    SchedulerPipeline,
+    PipelinePhase,
+    PHASE_STATES,
+    PHASES_UNTIL_PUBLISH,
+)
+
+# 예약 실행의 단계별 조회 (SchedulerPipeline._phase_* 와 동일한 limit)
+PHASE_LOOKUPS = [
+    (PipelinePhase.ANALYZE, 'find_collected', 50),
+    (PipelinePhase.CLASSIFY, 'find_analyzed', 100),
+    (PipelinePhase.REJECT, 'find_analyzed', 100),
+    (PipelinePhase.PUBLISH, 'find_classified', 20),
+]
+
+
+def run_lookups(use_registry: bool) -> dict:
+    """단계별 조회만 실행 (읽기 전용)"""
+    os.environ['PIPELINE_REGISTRY'] = 'true' if use_registry else 'false'
+    pipeline = SchedulerPipeline()
+    FirestoreClient.reset_usage_stats()
+    phases = []
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        owns_registry = pipeline._attach_registry()
+        try:
+            for phase, finder, limit in PHASE_LOOKUPS:
+                phase_start = time.perf_counter()
+                reads_before = FirestoreClient.get_usage_stats()['reads']
+                pipeline._load_phase_states(phase)
+                articles = getattr(pipeline.manager, finder)(limit=limit)
+                phases.append({
+                    'phase': phase.value,
+                    'states': PHASE_STATES.get(phase, []),
+                    'articles': len(articles),
+                    'reads': FirestoreClient.get_usage_stats()['reads'] - reads_before,
+                    'seconds': time.perf_counter() - phase_start,
+                })
+        finally:
+            if owns_registry:
+                pipeline.registry.reset()
+    return {
+        'seconds': time.perf_counter() - start,
+        'reads': FirestoreClient.get_usage_stats()['reads'],
+        'writes': FirestoreClient.get_usage_stats()['writes'],
+        'phases': phases,
+    }
+
+
+def run_full(use_registry: bool) -> dict:
+    """예약 실행과 같은 전체 파이프라인 (발행은 dry-run)"""
+    os.environ['PIPELINE_REGISTRY'] = 'true' if use_registry else 'false'
+    FirestoreClient.reset_usage_stats()
+    start = time.perf_counter()
+    result = SchedulerPipeline().run(PHASES_UNTIL_PUBLISH, schedule_name='Benchmark', dry_run=True)
+    usage = FirestoreClient.get_usage_stats()
+    return {
+        'seconds': time.perf_counter() - start,
+        'reads': usage['reads'],
+        'writes': usage['writes'],
+        'result': result.to_dict(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scheduler pipeline registry benchmark')
+    parser.add_argument('--full-run', action='store_true', help='전체 파이프라인 실행 (Firestore에 기록됨)')
+    parser.add_argument('--mode', choices=['both', 'registry', 'legacy'], default='both')
+    args = parser.parse_args()
+
+    if get_registry().is_initialized():
+        print("❌ Registry already initialized in this process (run outside the desk)")
+        sys.exit(1)
+
+    modes = ['legacy', 'registry'] if args.mode == 'both' else [args.mode]
+    print(f"🧪 Pipeline registry benchmark ({'full run' if args.full_run else 'phase lookups'}, "
+          f"env={FirestoreClient().get_env_name()})")
+
+    for mode in modes:
+        use_registry = mode == 'registry'
+        if args.full_run:
+            stats = run_full(use_registry)
+            print(f"\n[{mode}] {stats['seconds']:.1f}s, Firestore reads {stats['reads']}, "
+                  f"writes {stats['writes']}")
+            print(f"   {stats['result']['message']}")
+        else:
+            stats = run_lookups(use_registry)
+            print(f"\n[{mode}] {stats['seconds']:.2f}s, Firestore reads {stats['reads']}")
+            for row in stats['phases']:
+                print(f"   {row['phase']:<9} {row['articles']:>4} articles, "
+                      f"{row['reads']:>5} reads, {row['seconds'] * 1000:>7.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Registry Warmup Benchmark
+블로킹 초기화와 백그라운드 워밍업(initialize(background=True))을 비교합니다.
+
+측정 항목:
+    - 요청 처리 가능까지의 시간 (initialize 반환)
+    - 최근 날짜 게시까지의 시간 / 전체 워밍업 완료 시간
+검사 항목:
+    - 워밍업 중 아직 적재되지 않은 기사의 상태 변경이 성공하고 워밍업이 덮어쓰지 않음
+    - 워밍업 완료 후 색인 기사 수 == 저장소 기사 수
+
+임시 캐시 폴더를 사용하며 Firestore에는 접근하지 않습니다.
+
+Usage:
+    python scripts/bench_registry_warmup.py
+    python scripts/bench_registry_warmup.py --days 7 --per-day 2000
+"""
+import os
+import io
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+from datetime import datetime, timedelta
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+os.environ['LOCAL_STORE_BACKEND'] = 'json'
+
+from src.core.article_registry import get_registry
+from src.core.local_store import get_local_store
+
+
+def make_article(article_id: str, day: str) -> dict:
+    return {
+        '_header': {'article_id': article_id, 'state': 'COLLECTED', 'version': '3.1',
+                    'created_at': f'{day}T00:00:00+09:00', 'updated_at': f'{day}T00:00:00+09:00'},
+        '_original': {'url': f'https://news.example.com/{article_id}', 'title': f'Article {article_id}',
+                      'source_id': 'example', 'text': 'lorem ipsum ' * 200},
+        '_analysis': {'impact_score': 5.0, 'zero_echo_score': 3.0},
+        '_classification': {'category': 'Tech'},
+        '_publication': None,
+    }
+
+
+def build_cache(cache_root: str, days: int, per_day: int) -> list:
+    store = get_local_store(cache_root)
+    today = datetime.now()
+    day_names = []
+    for offset in range(days):
+        day = (today - timedelta(days=offset)).strftime('%Y-%m-%d')
+        day_names.append(day)
+        for idx in range(per_day):
+            article_id = f'd{offset}a{idx:06d}'
+            store.save(article_id, make_article(article_id, day), day)
+    return day_names
+
+
+def run_blocking(cache_root: str) -> float:
+    registry = get_registry()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        registry.initialize(cache_root=cache_root, db_client=None)
+    elapsed = time.perf_counter() - start
+    with contextlib.redirect_stdout(io.StringIO()):
+        registry.reset()
+    return elapsed
+
+
+def run_background(cache_root: str, days: int, errors: list) -> dict:
+    registry = get_registry()
+    timings = {}
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        start = time.perf_counter()
+        registry.initialize(cache_root=cache_root, db_client=None, background=True)
+        timings['serving'] = time.perf_counter() - start
+
+        # 가장 오래된 날짜의 기사 → 워밍업 중 상태 변경 (저장소에서 즉시 적재)
+        target = f'd{days - 1}a000000'
+        if registry.get_warmup_status()['ready']:
+            errors.append('warmup finished before the on-demand check (increase --per-day)')
+        elif not registry.update_state(target, 'REJECTED', by='bench-warmup'):
+            errors.append(f'state change during warmup failed: {target}')
+
+        while not registry.is_ready():
+            status = registry.get_warmup_status()
+            if 'first_day' not in timings and status['days_loaded'] >= 1:
+                timings['first_day'] = time.perf_counter() - start
+            if status['phase'] == 'failed':
+                errors.append(f"warmup failed: {status['error']}")
+                break
+            time.sleep(0.005)
+        timings['ready'] = time.perf_counter() - start
+        timings.setdefault('first_day', timings['ready'])
+
+    info = registry.get(target)
+    if info is None or info.state != 'REJECTED':
+        errors.append(f'warmup overwrote on-demand change: {target} is {info and info.state}')
+    timings['status'] = registry.get_warmup_status()
+    with contextlib.redirect_stdout(io.StringIO()):
+        registry.reset()
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Registry warmup benchmark')
+    parser.add_argument('--days', type=int, default=5)
+    parser.add_argument('--per-day', type=int, default=1000)
+    args = parser.parse_args()
+
+    os.environ.setdefault('REGISTRY_MAX_AGE_DAYS', str(args.days + 1))
+    cache_root = tempfile.mkdtemp(prefix='znd_warmup_')
+    errors = []
+    try:
+        print(f"🧪 Registry warmup: {args.days} days × {args.per_day} articles")
+        build_cache(cache_root, args.days, args.per_day)
+
+        blocking = run_blocking(cache_root)
+        background = run_background(cache_root, args.days, errors)
+        status = background['status']
+        stored = get_local_store(cache_root).count()
+        if status['indexed'] != stored:
+            errors.append(f"indexed {status['indexed']} != stored {stored}")
+    finally:
+        shutil.rmtree(cache_root, ignore_errors=True)
+
+    print("-" * 50)
+    print(f"   blocking   : serving after {blocking * 1000:.0f}ms")
+    print(f"   background : serving after {background['serving'] * 1000:.0f}ms, "
+          f"newest day {background['first_day'] * 1000:.0f}ms, ready {background['ready'] * 1000:.0f}ms")
+    print(f"   📊 {status['days_loaded']}/{status['days_total']} days, {status['indexed']} articles")
+    if errors:
+        print(f"❌ {len(errors)} problems")
+        for err in errors:
+            print(f"   {err}")
+        sys.exit(1)
+    print("✅ Warmup OK")
+
+
+if __name__ == '__main__':
+    main()
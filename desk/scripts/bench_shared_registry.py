@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Registry Benchmark
+워커 프로세스 N개가 동시에 레지스트리를 초기화할 때
+공유 색인(REGISTRY_SHARED=true) 유무에 따른 초기화 시간 / 메모리 / 변경 전파 지연을 비교합니다.
+
+검사 항목:
+    - 공유 모드에서 콜드 로드는 한 프로세스만 수행 (나머지는 색인 연결)
+    - 모든 워커의 기사 수 일치
+    - 한 워커의 상태 변경이 다른 워커에 보이기까지의 지연 (p50 / max)
+
+임시 캐시 폴더를 사용하며 Firestore에는 접근하지 않습니다.
+
+Usage:
+    python scripts/bench_shared_registry.py
+    python scripts/bench_shared_registry.py --articles 5000 --workers 4 --changes 50
+"""
+import os
+import io
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+import multiprocessing as mp
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+os.environ['LOCAL_STORE_BACKEND'] = 'json'
+
+
+def make_article(article_id: str, day: str) -> dict:
+    return {
+        '_header': {'article_id': article_id, 'state': 'COLLECTED', 'version': '3.1',
+                    'created_at': f'{day}T00:00:00+09:00', 'updated_at': f'{day}T00:00:00+09:00'},
+        '_original': {'url': f'https://news.example.com/{article_id}', 'title': f'Article {article_id}',
+                      'source_id': 'example', 'text': 'lorem ipsum ' * 300},
+        '_analysis': {'impact_score': 5.0, 'zero_echo_score': 3.0},
+        '_classification': {'category': 'Tech'},
+        '_publication': None,
+    }
+
+
+def max_rss_mb() -> float:
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    except ImportError:
+        return 0.0  # Windows
+
+
+def worker(idx: int, cache_root: str, shared: bool, workers: int, changes: int, barrier, started, results):
+    os.environ['REGISTRY_SHARED'] = 'true' if shared else 'false'
+    from src.core.article_registry import get_registry
+
+    registry = get_registry()
+    log = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        registry.initialize(cache_root=cache_root, db_client=None)
+    init_seconds = time.perf_counter() - start
+
+    latencies = []
+    barrier.wait()
+    if shared:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for round_no in range(changes):
+                article_id = f'a{round_no:07d}'
+                barrier.wait()
+                if round_no % workers == idx:
+                    started.value = time.time()
+                    registry.update_state(article_id, 'ANALYZED', by=f'bench-{idx}')
+                else:
+                    deadline = time.time() + 5
+                    while time.time() < deadline:
+                        info = registry.get(article_id)
+                        if info and info.state == 'ANALYZED':
+                            latencies.append(time.time() - started.value)
+                            break
+                        time.sleep(0.001)
+                    else:
+                        latencies.append(None)
+                barrier.wait()
+
+    results.put({
+        'idx': idx,
+        'attached': 'Attached to shared index' in log.getvalue(),
+        'init_seconds': init_seconds,
+        'count': registry.count(),
+        'full_data': len(registry._full_data),
+        'rss_mb': max_rss_mb(),
+        'latencies': latencies,
+    })
+    with contextlib.redirect_stdout(io.StringIO()):
+        registry.reset()
+
+
+def run(args, shared: bool) -> list:
+    ctx = mp.get_context('spawn')
+    cache_root = tempfile.mkdtemp(prefix='znd_shared_')
+    try:
+        from src.core.local_store import get_local_store
+        store = get_local_store(cache_root)
+        day = time.strftime('%Y-%m-%d')
+        for idx in range(args.articles):
+            article_id = f'a{idx:07d}'
+            store.save(article_id, make_article(article_id, day), day)
+
+        barrier = ctx.Barrier(args.workers)
+        started = ctx.Value('d', 0.0)
+        results = ctx.Queue()
+        procs = [ctx.Process(target=worker, args=(i, cache_root, shared, args.workers, args.changes,
+                                                  barrier, started, results))
+                 for i in range(args.workers)]
+        for p in procs:
+            p.start()
+        rows = [results.get(timeout=600) for _ in procs]
+        for p in procs:
+            p.join()
+        return sorted(rows, key=lambda r: r['idx'])
+    finally:
+        shutil.rmtree(cache_root, ignore_errors=True)
+
+
+def report(title: str, rows: list):
+    print(f"\n[{title}]")
+    for r in rows:
+        role = 'attach' if r['attached'] else 'load'
+        print(f"   worker {r['idx']}: {role:<6} init {r['init_seconds']:.2f}s, "
+              f"{r['count']} articles, full_data {r['full_data']}, rss {r['rss_mb']:.0f}MB")
+    print(f"   Σ init {sum(r['init_seconds'] for r in rows):.2f}s, "
+          f"Σ rss {sum(r['rss_mb'] for r in rows):.0f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared registry benchmark')
+    parser.add_argument('--articles', type=int, default=3000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--changes', type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"🧪 Shared registry: {args.articles} articles, {args.workers} workers")
+    errors = []
+
+    baseline = run(args, shared=False)
+    report('REGISTRY_SHARED=false', baseline)
+
+    shared = run(args, shared=True)
+    report('REGISTRY_SHARED=true', shared)
+
+    loaders = [r for r in shared if not r['attached']]
+    if len(loaders) != 1:
+        errors.append(f'{len(loaders)} workers performed a cold load (expected 1)')
+    if len({r['count'] for r in shared}) != 1:
+        errors.append(f"article counts differ: {[r['count'] for r in shared]}")
+
+    latencies = [lat for r in shared for lat in r['latencies']]
+    missed = sum(1 for lat in latencies if lat is None)
+    seen = sorted(lat for lat in latencies if lat is not None)
+    if missed:
+        errors.append(f'{missed} state changes never became visible')
+    if seen:
+        print(f"\n   🔔 change visibility: p50 {seen[len(seen) // 2] * 1000:.1f}ms, "
+              f"max {seen[-1] * 1000:.1f}ms ({len(seen)} observations)")
+
+    if errors:
+        print(f"❌ {len(errors)} problems")
+        for err in errors:
+            print(f"   {err}")
+        sys.exit(1)
+    print("✅ Shared index OK")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+State History Retention Benchmark (가짜 Firestore 백엔드)
+REJECTED ↔ ANALYZED를 오가는 기사(reject-all / restore-all 반복)의 state_history 크기와
+전이당 Firestore 전송 바이트를 보존 정책 없음 / 있음(STATE_HISTORY_INLINE, STATE_HISTORY_MAX)으로 비교합니다.
+
+방식마다 별도 기사 묶음에 --bounces회 왕복 전이를 실행한 뒤 측정:
+    history      문서의 state_history 길이 (archived: 보관된 기록 수)
+    doc bytes    Firestore 문서 크기 (조회/실시간 구독/전체 저장마다 오가는 크기)
+    sent/trans   전이 1회당 Firestore 전송 바이트 (outbox drain, 보관 묶음 포함)
+                 --full-writes이면 FIRESTORE_FIELD_DIFF=false (매번 전체 저장)
+
+검사: retain 방식에서 get_state_timeline()이 전체 전이를 순서대로 복원하는지 (로컬 감사 로그 /
+      로컬 로그를 비운 뒤 Firestore 서브컬렉션), 다르면 종료 코드 1
+
+캐시는 ZND_ENV=bench_history (cache/bench_history, 시작 시 비움)를 사용합니다.
+
+Usage:
+    python scripts/bench_state_history.py
+    python scripts/bench_state_history.py --articles 50 --bounces 200 --inline 20 --max 50 --json
+    python scripts/bench_state_history.py --full-writes
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+os.environ['ZND_ENV'] = 'bench_history'
+os.environ['FIRESTORE_BACKEND'] = 'memory'
+os.environ['REGISTRY_SHARED'] = 'false'
+
+MODES = ('unbounded', 'retain')
+
+
+def make_article(article_id: str, now: str) -> dict:
+    url = f'https://bench.local/{article_id}'
+    return {
+        '_header': {
+            'version': '3.1', 'article_id': article_id, 'url': url, 'source_id': 'bench',
+            'state': 'ANALYZED', 'created_at': now, 'updated_at': now,
+            'state_history': [{'state': 'COLLECTED', 'at': now, 'by': 'crawler'},
+                              {'state': 'ANALYZED', 'at': now, 'by': 'analyzer'}],
+        },
+        '_original': {'title': f'Bench article {article_id}', 'text': 'x' * 4096,
+                      'url': url, 'published_at': now, 'crawled_at': now},
+        '_analysis': {'title_ko': f'벤치 {article_id}', 'impact_score': 5.0, 'zero_echo_score': 4.0},
+        '_classification': None,
+        '_publication': None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='state_history size / bytes per transition with and without retention')
+    parser.add_argument('--articles', type=int, default=20, help='방식별 기사 수')
+    parser.add_argument('--bounces', type=int, default=100, help='REJECTED ↔ ANALYZED 왕복 횟수')
+    parser.add_argument('--inline', type=int, default=20, help='STATE_HISTORY_INLINE (retain 방식)')
+    parser.add_argument('--max', type=int, default=50, help='STATE_HISTORY_MAX (retain 방식)')
+    parser.add_argument('--full-writes', action='store_true', help='필드 단위 저장 없이 매번 전체 저장')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    from src.core_logic import get_kst_now
+    from src.core.local_store import get_default_cache_root
+    from src.core.firestore_memory import MemoryFirestore
+    from src.core.firestore_client import FirestoreClient
+    from src.core.firestore_outbox import get_outbox
+
+    cache_root = get_default_cache_root()
+    shutil.rmtree(cache_root, ignore_errors=True)
+
+    fake = MemoryFirestore()
+    collection = fake.collection(os.environ['ZND_ENV']).document('data').collection('articles')
+    now = get_kst_now()
+    ids = {mode: [f'{mode[:3]}{i:05d}' for i in range(args.articles)] for mode in MODES}
+    batch = fake.batch()
+    for mode in MODES:
+        for article_id in ids[mode]:
+            batch.set(collection.document(article_id), make_article(article_id, now))
+    batch.commit()
+
+    client = FirestoreClient.use_backend(fake)
+    from src.core.article_registry import init_registry
+    registry = init_registry(cache_root=cache_root, db_client=client)
+    outbox = get_outbox()
+    transitions = 2 * args.bounces
+
+    os.environ['FIRESTORE_FIELD_DIFF'] = 'false' if args.full_writes else 'true'
+    results = {}
+    for mode in MODES:
+        if mode == 'retain':
+            os.environ['STATE_HISTORY_INLINE'] = str(args.inline)
+            os.environ['STATE_HISTORY_MAX'] = str(args.max)
+        else:
+            os.environ['STATE_HISTORY_MAX'] = str(10 ** 9)
+        with fake.measure(mode) as m:
+            for _ in range(args.bounces):
+                for article_id in ids[mode]:
+                    registry.update_state(article_id, 'REJECTED', 'reject-all', updates={'_rejection.reason': 'bench'})
+                for article_id in ids[mode]:
+                    registry.update_state(article_id, 'ANALYZED', 'restore-all')
+                outbox.drain()
+
+        sample = collection.document(ids[mode][0]).get().to_dict()
+        results[mode] = {
+            'history': len(sample['_header']['state_history']),
+            'archived': (sample['_header'].get('state_history_archived') or {}).get('count', 0),
+            'doc_bytes': len(json.dumps(sample, ensure_ascii=False).encode('utf-8')),
+            'bytes_per_transition': m.bytes_sent / (args.articles * transitions),
+            'measurement': m,
+        }
+
+    # 전체 타임라인 복원 (시드 2건 + 전이 수, 순서대로)
+    expected = ['COLLECTED', 'ANALYZED'] + ['REJECTED', 'ANALYZED'] * args.bounces
+    mismatched = []
+    for article_id in ids['retain']:
+        timeline = registry.get_state_timeline(article_id)
+        if [entry['state'] for entry in timeline['entries']] != expected or timeline['missing_chunks']:
+            mismatched.append(('local', article_id))
+    registry._archive.delete(ids['retain'][0])  # 로컬 감사 로그 유실 → Firestore 서브컬렉션에서 복원
+    timeline = registry.get_state_timeline(ids['retain'][0])
+    if [entry['state'] for entry in timeline['entries']] != expected or timeline['missing_chunks']:
+        mismatched.append(('firestore', ids['retain'][0]))
+
+    if args.json:
+        print(json.dumps({
+            'args': vars(args),
+            'results': {mode: {**{k: v for k, v in r.items() if k != 'measurement'},
+                               'measurement': r['measurement'].to_dict()} for mode, r in results.items()},
+            'mismatched': mismatched,
+        }, ensure_ascii=False, indent=2))
+    else:
+        print("\n" + "=" * 70)
+        print(f"{'mode':<10} {'history':>8} {'archived':>9} {'doc bytes':>10} {'sent/trans':>12}")
+        print("-" * 70)
+        for mode in MODES:
+            r = results[mode]
+            print(f"{mode:<10} {r['history']:>8} {r['archived']:>9} {r['doc_bytes']:>10} "
+                  f"{r['bytes_per_transition']:>11.0f}B")
+        print("=" * 70)
+        print(f"articles={args.articles}/mode, transitions={transitions}/article, "
+              f"inline={args.inline}, max={args.max}, {'full writes' if args.full_writes else 'field diff'}")
+        for mode in MODES:
+            print(f"   {results[mode]['measurement'].summary()}")
+        print(f"{'✅' if not mismatched else '❌'} Timeline rebuilt: "
+              f"{args.articles + 1 - len(mismatched)}/{args.articles + 1}")
+
+    shutil.rmtree(cache_root, ignore_errors=True)
+    return 1 if mismatched else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+URL Filter Benchmark (가짜 Firestore 백엔드)
+collect_links의 링크별 중복 검사를 Bloom 필터 앞단(url_filter) 유무로 비교하고 오탐률을 측정합니다.
+
+    exact    check_history → load_from_cache (JSON 트리: 빗나가면 날짜 폴더/segment 전체 탐색)
+    filter   might_have_seen이 False면 바로 신규, True일 때만 exact
+
+검사 (하나라도 어긋나면 종료 코드 1):
+    - 기록한 모든 URL (히스토리, 로컬 캐시, 끝 슬래시 변형)이 필터에서 "있을 수도 있음"
+    - 다시 연 필터(영속 파일 + 로그 재생)와 다른 프로세스가 저장한 기사도 동일
+    - 재구성 후에도 동일, 측정 오탐률이 목표의 2배 이하
+
+캐시는 ZND_ENV=bench_url_filter (cache/bench_url_filter, 시작 시 비움)를 사용합니다.
+
+Usage:
+    python scripts/bench_url_filter.py
+    python scripts/bench_url_filter.py --articles 20000 --history 50000 --days 60 --probes 100000
+    python scripts/bench_url_filter.py --capacity 50000 --fp-rate 0.001 --json
+"""
+import os
+import sys
+import io
+import json
+import time
+import shutil
+import argparse
+import contextlib
+import subprocess
+from datetime import datetime, timedelta
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+os.environ['ZND_ENV'] = 'bench_url_filter'
+os.environ['FIRESTORE_BACKEND'] = 'memory'
+os.environ['URL_FILTER'] = 'true'
+
+OTHER_PROCESS = '''
+import os, sys
+os.environ['ZND_ENV'] = 'bench_url_filter'
+sys.path.insert(0, {desk_dir!r})
+from src.core_logic import save_to_cache
+for i in range({count}):
+    save_to_cache(f'https://other.local/news/{{i}}', {{'text': 'body'}}, {date!r})
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Crawl history Bloom filter: lookups and false positives')
+    parser.add_argument('--articles', type=int, default=5000, help='로컬 캐시 기사 수')
+    parser.add_argument('--history', type=int, default=20000, help='원격 히스토리 URL 수 (캐시에 없는 것)')
+    parser.add_argument('--days', type=int, default=30, help='캐시 날짜 폴더 수')
+    parser.add_argument('--probes', type=int, default=50000, help='오탐률 측정용 새 URL 수')
+    parser.add_argument('--lookups', type=int, default=2000, help='시간 측정용 링크 수 (새 URL / 본 URL 각각)')
+    parser.add_argument('--other', type=int, default=200, help='다른 프로세스가 저장할 기사 수')
+    parser.add_argument('--capacity', type=int, default=None,
+                        help='URL_FILTER_CAPACITY (기본: 증분 추가될 키 수 - 용량을 채운 상태의 오탐률 측정)')
+    parser.add_argument('--fp-rate', type=float, default=None, help='URL_FILTER_FP_RATE')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args()
+
+    # 히스토리 URL은 끝 슬래시가 있어 키 2개 (정규 키 + 이전 규칙 md5(url)), 캐시 기사는 정규 키 하나
+    os.environ['URL_FILTER_CAPACITY'] = str(args.capacity or args.history * 2 + args.articles + args.other)
+    if args.fp_rate:
+        os.environ['URL_FILTER_FP_RATE'] = str(args.fp_rate)
+
+    from src.core_logic import load_from_cache, save_to_cache
+    from src.core.local_store import get_default_cache_root
+    from src.core.firestore_memory import MemoryFirestore
+    from src.core.firestore_client import FirestoreClient
+    from src.core.url_filter import UrlFilter, get_filter_params, FILTER_FILE, LOG_FILE
+
+    cache_root = get_default_cache_root()
+    shutil.rmtree(cache_root, ignore_errors=True)
+    os.makedirs(cache_root, exist_ok=True)
+    target_fp = get_filter_params()[1]
+
+    def quiet():
+        return contextlib.redirect_stdout(io.StringIO())
+
+    errors = []
+    results = {}
+
+    # 1. 빈 필터로 시작 → 히스토리 기록/캐시 저장마다 증분 추가
+    with quiet():
+        client = FirestoreClient.use_backend(MemoryFirestore())
+    today = datetime.now()
+    cached_urls = [f'https://bench.local/cached/{i}' for i in range(args.articles)]
+    history_urls = [f'https://bench.local/history/{i}/' for i in range(args.history)]  # 끝 슬래시 (정규화 키)
+
+    started = time.perf_counter()
+    with quiet():
+        for start in range(0, len(history_urls), 500):
+            client.batch_update_history([(url, f'h{start + i}', 'ANALYZED')
+                                         for i, url in enumerate(history_urls[start:start + 500])])
+        for i, url in enumerate(cached_urls):
+            date_str = (today - timedelta(days=i % args.days)).strftime('%Y-%m-%d')
+            save_to_cache(url, {'title': f'Bench {i}', 'text': 'body ' * 50}, date_str)  # crawler와 같은 경로
+    results['seed_s'] = time.perf_counter() - started
+    client.history = {}  # 최근 5000개만 남는 로컬 히스토리 대신 원격 해시/캐시로만 판정
+
+    def check_known(label: str, might_contain):
+        misses = [url for url in cached_urls + history_urls + [u.rstrip('/') for u in history_urls[:1000]]
+                  if not might_contain(url)]
+        if misses:
+            errors.append(f'{label}: {len(misses)} known URLs reported as new (e.g. {misses[0]})')
+
+    check_known('incremental', client.might_have_seen)
+
+    # 2. 오탐률
+    probes = [f'https://bench.local/fresh/{i}' for i in range(args.probes)]
+    false_positives = sum(1 for url in probes if client.might_have_seen(url))
+    stats = client._url_filter.stats()
+    results['filter'] = stats
+    results['measured_fp_rate'] = false_positives / max(1, len(probes))
+    if results['measured_fp_rate'] > max(target_fp, stats['expected_fp_rate']) * 2:
+        errors.append(f"false positives {results['measured_fp_rate']:.3%} > 2 x target {target_fp:.3%}")
+
+    # 3. 링크별 검사 시간 (collect_links 순서)
+    def exact(url):
+        if client.check_history(url):
+            return True
+        with quiet():
+            cached = load_from_cache(url)
+        return bool(cached)
+
+    def filtered(url):
+        return client.might_have_seen(url) and exact(url)
+
+    fresh = probes[:args.lookups]
+    seen = cached_urls[-args.lookups:]
+    for label, func, urls in (('exact new', exact, fresh), ('filter new', filtered, fresh),
+                              ('exact cached', exact, seen), ('filter cached', filtered, seen)):
+        started = time.perf_counter()
+        answers = [func(url) for url in urls]
+        results[label] = (time.perf_counter() - started) / len(urls) * 1e6
+        expected = label.endswith('cached')
+        if any(answer != expected for answer in answers):
+            errors.append(f'{label}: {sum(1 for a in answers if a != expected)} wrong answers')
+
+    # 4. 영속: 다시 연 필터 (비트 배열 + 로그 재생)
+    started = time.perf_counter()
+    reopened = UrlFilter(cache_root)
+    results['reopen_ms'] = (time.perf_counter() - started) * 1000
+    check_known('reopened', reopened.might_contain_url)
+
+    # 5. 다른 프로세스가 저장한 기사 (로그 끝 이어 읽기)
+    subprocess.run([sys.executable, '-c', OTHER_PROCESS.format(
+        desk_dir=desk_dir, count=args.other, date=today.strftime('%Y-%m-%d'))], check=True,
+        capture_output=True, env=dict(os.environ))
+    other_misses = sum(1 for i in range(args.other)
+                       if not client.might_have_seen(f'https://other.local/news/{i}'))
+    if other_misses:
+        errors.append(f'other process: {other_misses}/{args.other} saved URLs reported as new')
+
+    # 6. 재구성 (scripts/rebuild_url_filter.py와 같은 경로)
+    started = time.perf_counter()
+    with quiet():
+        rebuilt = client.rebuild_url_filter()
+    results['rebuild_s'] = time.perf_counter() - started
+    results['rebuilt'] = rebuilt
+    check_known('rebuilt', client.might_have_seen)
+    check_known('reopened after rebuild', reopened.might_contain_url)  # 교체된 로그 감지 → 다시 로드
+    results['file_bytes'] = sum(os.path.getsize(os.path.join(cache_root, name)) for name in (FILTER_FILE, LOG_FILE))
+
+    if args.json:
+        print(json.dumps({'args': vars(args), 'results': results, 'errors': errors}, ensure_ascii=False, indent=2))
+    else:
+        print("\n" + "=" * 60)
+        print(f"cache: {args.articles} articles / {args.days} days, history: {args.history} URLs "
+              f"(seeded in {results['seed_s']:.1f}s)")
+        print(f"filter: {stats['keys']} keys, {stats['bytes'] / 1024:.0f}KB, k={stats['hashes']}, "
+              f"files {results['file_bytes'] / 1024:.0f}KB, reopen {results['reopen_ms']:.1f}ms")
+        print(f"false positives: {results['measured_fp_rate']:.3%} measured "
+              f"({false_positives}/{len(probes)}), {stats['expected_fp_rate']:.3%} expected, target {target_fp:.3%}")
+        print("-" * 60)
+        print(f"{'per link':<16} {'µs':>10}")
+        for label in ('exact new', 'filter new', 'exact cached', 'filter cached'):
+            print(f"{label:<16} {results[label]:>10.1f}")
+        print("-" * 60)
+        print(f"rebuild: {rebuilt['keys']} keys in {results['rebuild_s']:.2f}s")
+        print("=" * 60)
+        print(f"{'✅' if not errors else '❌'} Checks: {len(errors)} problems")
+        for error in errors:
+            print(f"   ❌ {error}")
+
+    shutil.rmtree(cache_root, ignore_errors=True)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
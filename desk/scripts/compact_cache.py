@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Compaction Tool
+오래된 날짜 폴더의 기사 파일을 segment(+offset 색인)로 압축 / 되돌리기
+
+Usage:
+    python scripts/compact_cache.py                        # CACHE_HOT_DAYS(기본 14일) 이전 폴더 압축
+    python scripts/compact_cache.py --hot-days 30
+    python scripts/compact_cache.py --day 2025-01-03       # 특정 날짜만
+    python scripts/compact_cache.py --dry-run
+    python scripts/compact_cache.py --expand 2025-01-03    # segment → 개별 파일
+    python scripts/compact_cache.py --stats
+
+서버 실행 중에도 안전합니다 (날짜 폴더 잠금 + 색인 교체 커밋).
+CACHE_COMPACTION=true 로 서버를 실행하면 같은 작업이 백그라운드에서 주기 실행됩니다.
+"""
+import os
+import sys
+import time
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+from src.core.cache_segments import DaySegment, compact_day, compact_cold_days, expand_day, get_hot_days
+from src.core.local_store import DATE_FOLDER_RE, get_default_cache_root
+
+
+def print_stats(cache_root: str):
+    folders = compacted = files = records = 0
+    for name in sorted(os.listdir(cache_root)) if os.path.isdir(cache_root) else []:
+        if not DATE_FOLDER_RE.match(name):
+            continue
+        folder = os.path.join(cache_root, name)
+        folders += 1
+        files += sum(1 for entry in os.scandir(folder) if entry.name.endswith('.json'))
+        segment = DaySegment(folder)
+        if segment.refresh():
+            compacted += 1
+            records += len(segment.entries)
+        segment.close()
+    print(f"📊 Date folders: {folders} (compacted: {compacted})")
+    print(f"   📄 Individual files: {files}")
+    print(f"   🗜️ Segment records: {records}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cache segment compaction')
+    parser.add_argument('--cache-root', default=None, help='캐시 루트 (기본: cache/<ZND_ENV>)')
+    parser.add_argument('--hot-days', type=int, default=None, help='개별 파일로 유지할 최근 일수')
+    parser.add_argument('--day', default=None, help='특정 날짜 폴더만 압축 (YYYY-MM-DD)')
+    parser.add_argument('--expand', default=None, metavar='DAY', help='segment를 개별 파일로 되돌리기')
+    parser.add_argument('--dry-run', action='store_true')
+    parser.add_argument('--stats', action='store_true')
+    args = parser.parse_args()
+
+    cache_root = args.cache_root or get_default_cache_root()
+    print("=" * 50)
+    print(f"  Cache Compaction ({cache_root})")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    if args.stats:
+        print_stats(cache_root)
+    elif args.expand:
+        written = expand_day(os.path.join(cache_root, args.expand))
+        print(f"📂 {args.expand}: {written} files restored")
+    else:
+        if args.day:
+            results = [compact_day(os.path.join(cache_root, args.day), dry_run=args.dry_run)]
+        else:
+            hot_days = get_hot_days() if args.hot_days is None else args.hot_days
+            print(f"ℹ️ Keeping last {hot_days} days as individual files")
+            results = compact_cold_days(cache_root, hot_days, dry_run=args.dry_run)
+
+        done = [r for r in results if not r['skipped']]
+        before = sum(r['bytes_before'] for r in done)
+        after = sum(r['bytes_after'] for r in done)
+        print("-" * 50)
+        print(f"📊 {'Would compact' if args.dry_run else 'Compacted'}: {len(done)} folders, "
+              f"{sum(r['files'] for r in done)} files")
+        if not args.dry_run and before:
+            print(f"   💾 {before / 1e6:.1f}MB → {after / 1e6:.1f}MB")
+        for r in results:
+            if r['skipped'] and r['skipped'] != 'nothing to compact':
+                print(f"   ⏭️ {r['folder']}: {r['skipped']}")
+    print(f"⏱️ {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
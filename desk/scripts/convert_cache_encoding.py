@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Encoding Converter
+로컬 캐시(JSON 트리) 파일을 pretty <-> compact 인코딩으로 변환
+
+Usage:
+    python scripts/convert_cache_encoding.py --to compact              # 본문 gzip 압축
+    python scripts/convert_cache_encoding.py --to compact --compression zstd
+    python scripts/convert_cache_encoding.py --to pretty               # 기존 형식으로 되돌리기
+    python scripts/convert_cache_encoding.py --to compact --dry-run
+
+변환 후 LOCAL_STORE_ENCODING=compact 로 실행해야 새로 쓰는 파일도 compact로 저장됩니다.
+(읽기는 설정과 무관하게 두 형식 모두 지원)
+"""
+import os
+import sys
+import time
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+from src.core.cache_codec import encode_article, decode_article, detect_encoding
+from src.core.local_store import DATE_FOLDER_RE, get_default_cache_root
+
+
+def iter_cache_files(cache_root: str):
+    if not os.path.isdir(cache_root):
+        return
+    for folder in sorted(os.listdir(cache_root)):
+        if not DATE_FOLDER_RE.match(folder):
+            continue
+        for entry in os.scandir(os.path.join(cache_root, folder)):
+            if entry.name.endswith('.json'):
+                yield entry.path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cache encoding converter')
+    parser.add_argument('--to', choices=['pretty', 'compact'], required=True)
+    parser.add_argument('--compression', choices=['gzip', 'zstd'], default=None)
+    parser.add_argument('--cache-root', default=None, help='캐시 루트 (기본: cache/<ZND_ENV>)')
+    parser.add_argument('--dry-run', action='store_true')
+    args = parser.parse_args()
+
+    cache_root = args.cache_root or get_default_cache_root()
+    print("=" * 50)
+    print(f"  Cache Encoding → {args.to} ({cache_root})")
+    print("=" * 50)
+
+    converted = skipped = errors = 0
+    bytes_before = bytes_after = 0
+    start = time.perf_counter()
+
+    for path in iter_cache_files(cache_root):
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            if detect_encoding(raw) == args.to and args.compression is None:
+                skipped += 1
+                bytes_before += len(raw)
+                bytes_after += len(raw)
+                continue
+
+            data = decode_article(raw)
+            if not isinstance(data, dict):
+                skipped += 1
+                continue
+            encoded = encode_article(data, args.to, args.compression)
+
+            # 왕복 검증 후 교체
+            if decode_article(encoded) != data:
+                raise ValueError('round-trip mismatch')
+
+            if not args.dry_run:
+                tmp_path = path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(encoded)
+                os.replace(tmp_path, path)
+
+            converted += 1
+            bytes_before += len(raw)
+            bytes_after += len(encoded)
+        except Exception as e:
+            errors += 1
+            print(f"❌ {path}: {e}")
+
+    elapsed = time.perf_counter() - start
+    ratio = bytes_after / bytes_before * 100 if bytes_before else 0
+    print("-" * 50)
+    print(f"📊 {'Would convert' if args.dry_run else 'Converted'}: {converted}, "
+          f"Skipped: {skipped}, Errors: {errors} ({elapsed:.1f}s)")
+    print(f"   💾 {bytes_before / 1e6:.1f}MB → {bytes_after / 1e6:.1f}MB ({ratio:.0f}%)")
+
+
+if __name__ == '__main__':
+    main()
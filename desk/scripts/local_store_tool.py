@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+Local Article Store Tool
+JSON 캐시 트리 <-> SQLite(WAL) 로컬 저장소 변환
+
+Usage:
+    python scripts/local_store_tool.py import              # cache/<env>/*/*.json → cache/<env>/articles.db
+    python scripts/local_store_tool.py export              # articles.db → cache/<env>/<date>/<id>.json
+    python scripts/local_store_tool.py export --to /tmp/cache_dump
+    python scripts/local_store_tool.py stats
+
+가져오기 후 LOCAL_STORE_BACKEND=sqlite 로 서버를 실행하면 SQLite 저장소를 사용합니다.
+"""
+import os
+import sys
+import time
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+from src.core.local_store import get_local_store, get_default_cache_root
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local article store import/export')
+    parser.add_argument('command', choices=['import', 'export', 'stats'])
+    parser.add_argument('--cache-root', default=None, help='캐시 루트 (기본: cache/<ZND_ENV>)')
+    parser.add_argument('--to', default=None, help='export 대상 폴더 (기본: 캐시 루트)')
+    args = parser.parse_args()
+
+    cache_root = args.cache_root or get_default_cache_root()
+    store = get_local_store(cache_root, backend='sqlite')
+
+    print("=" * 50)
+    print(f"  Local Store: {store.db_path}")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    if args.command == 'import':
+        store.import_json_tree(cache_root)
+    elif args.command == 'export':
+        store.export_json_tree(args.to or cache_root)
+    else:
+        json_count = get_local_store(cache_root, backend='json').count()
+        print(f"📊 SQLite: {store.count()} articles, JSON tree: {json_count} files")
+    print(f"⏱️ {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+Article Content Split Migration
+기존 Firestore 기사 문서(본문 포함)를 카드 + article_contents/{article_id} 본문 문서로 분리
+
+분리 후에도 읽기는 두 형식을 모두 지원하므로 (article_content 참고) 이전은 언제 실행해도 되고
+중단되면 다시 실행하면 됩니다 (이미 분리된 문서는 건너뜀).
+문서마다 본문 set 1건 + 카드 update 1건 (본문 요약 추가, 본문 필드 삭제)을 같은 배치로 씁니다.
+
+현재 ZND_ENV의 articles 컬렉션을 문서 ID 순서로 --page-size씩 읽습니다.
+
+검사 (--verify): 분리된 카드의 본문 요약(_header.content)이 본문 문서와 맞는지 확인
+    부분 payload 저장으로 요약이 비면 (fields: []) get_article이 본문을 합치지 않고 본문 문서는 고아가 됨
+    --repair는 본문 문서 기준으로 요약만 다시 씀 (카드 update 1건)
+
+Usage:
+    python scripts/migrate_article_content.py --dry-run        # 대상 수와 예상 절감량만 확인
+    python scripts/migrate_article_content.py --verify         # 분리된 카드 요약 검사 (--repair로 복구)
+    python scripts/migrate_article_content.py
+    python scripts/migrate_article_content.py --limit 1000 --page-size 200
+"""
+import os
+import sys
+import json
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def migrate_collection(db, page_size: int = 200, limit: int = None, dry_run: bool = False) -> dict:
+    """
+    articles 컬렉션 전체를 페이지 단위로 읽어 분리 전 문서를 분리
+
+    Returns:
+        {'scanned', 'migrated', 'already_split', 'no_content', 'content_bytes'}
+    """
+    from src.core.article_content import is_split, extract_content
+
+    result = {'scanned': 0, 'migrated': 0, 'already_split': 0, 'no_content': 0, 'content_bytes': 0}
+    collection = db._get_collection('articles')
+    last_doc = None
+    while limit is None or result['scanned'] < limit:
+        size = page_size if limit is None else min(page_size, limit - result['scanned'])
+        query = collection.limit(size)
+        page = list((query.start_after(last_doc) if last_doc is not None else query).stream())
+        db._track_read(max(1, len(page)))
+        if not page:
+            break
+        last_doc = page[-1]
+
+        pending = {}
+        for doc in page:
+            result['scanned'] += 1
+            data = doc.to_dict() or {}
+            if is_split(data):
+                result['already_split'] += 1
+                continue
+            content = extract_content(data)
+            if not content:
+                result['no_content'] += 1
+                continue
+            result['content_bytes'] += len(json.dumps(content, ensure_ascii=False, default=str).encode('utf-8'))
+            pending[doc.id] = data
+
+        if dry_run:
+            result['migrated'] += len(pending)
+        else:
+            result['migrated'] += db.split_legacy_articles(pending)
+        print(f"   ⏳ scanned {result['scanned']}, {'would split' if dry_run else 'split'} {result['migrated']}")
+        if len(page) < size:
+            break
+    return result
+
+
+def verify_collection(db, page_size: int = 200, limit: int = None, repair: bool = False) -> dict:
+    """
+    분리된 카드의 본문 요약과 본문 문서 비교 (읽기 = 카드 수 + 분리된 카드 수)
+
+    Returns:
+        {'scanned', 'split', 'ok', 'mismatched', 'missing_content', 'repaired', 'samples'}
+    """
+    from src.core.article_content import is_split, content_marker, CONTENTS_COLLECTION
+
+    result = {'scanned': 0, 'split': 0, 'ok': 0, 'mismatched': 0, 'missing_content': 0,
+              'repaired': 0, 'samples': []}
+    collection = db._get_collection('articles')
+    contents = db._get_collection(CONTENTS_COLLECTION)
+    last_doc = None
+    while limit is None or result['scanned'] < limit:
+        size = page_size if limit is None else min(page_size, limit - result['scanned'])
+        query = collection.limit(size)
+        page = list((query.start_after(last_doc) if last_doc is not None else query).stream())
+        db._track_read(max(1, len(page)))
+        if not page:
+            break
+        last_doc = page[-1]
+        result['scanned'] += len(page)
+
+        cards = {doc.id: doc.to_dict() or {} for doc in page}
+        cards = {article_id: card for article_id, card in cards.items() if is_split(card)}
+        result['split'] += len(cards)
+        if not cards:
+            continue
+        snapshots = list(db.db.get_all([contents.document(article_id) for article_id in cards]))
+        db._track_read(len(snapshots), collection=CONTENTS_COLLECTION)
+
+        batch, repairs = db.db.batch(), 0
+        for snapshot in snapshots:
+            marker = cards[snapshot.id]['_header']['content']
+            if not snapshot.exists:
+                if marker.get('fields'):
+                    result['missing_content'] += 1
+                    result['samples'].append((snapshot.id, 'content document missing'))
+                else:
+                    result['ok'] += 1
+                continue
+            expected = content_marker(snapshot.to_dict() or {})
+            if marker.get('rev') == expected['rev'] and marker.get('fields') == expected['fields']:
+                result['ok'] += 1
+                continue
+            result['mismatched'] += 1
+            if len(result['samples']) < 10:
+                result['samples'].append((snapshot.id, f"card fields {marker.get('fields')} != {expected['fields']}"))
+            if repair:
+                batch.update(collection.document(snapshot.id), {'_header.content': expected})
+                repairs += 1
+        if repairs:
+            batch.commit()
+            db._track_write(repairs)
+            result['repaired'] += repairs
+        print(f"   ⏳ scanned {result['scanned']}, mismatched {result['mismatched']}, repaired {result['repaired']}")
+        if len(page) < size:
+            break
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split article body fields into article_contents documents')
+    parser.add_argument('--dry-run', action='store_true', help='변경 없이 대상만 확인')
+    parser.add_argument('--page-size', type=int, default=200, help='한 번에 읽을 문서 수 (배치당 쓰기 = 2배)')
+    parser.add_argument('--limit', type=int, default=None, help='최대 검사 문서 수')
+    parser.add_argument('--verify', action='store_true', help='분리된 카드의 본문 요약 검사 (이전 없음)')
+    parser.add_argument('--repair', action='store_true', help='--verify에서 어긋난 본문 요약을 본문 문서 기준으로 다시 씀')
+    args = parser.parse_args()
+
+    from src.core.firestore_client import FirestoreClient
+
+    if args.verify or args.repair:
+        print("=" * 50)
+        print("  Article Content Split Verify")
+        print(f"  Env: {os.getenv('ZND_ENV', 'dev')}")
+        print("=" * 50)
+        result = verify_collection(FirestoreClient(), page_size=min(args.page_size, 250),
+                                   limit=args.limit, repair=args.repair)
+        print("-" * 50)
+        print("📊 Results:")
+        print(f"   🔎 Scanned: {result['scanned']} ({result['split']} split)")
+        print(f"   ✅ Marker matches content: {result['ok']}")
+        print(f"   ❌ Marker mismatched: {result['mismatched']}")
+        print(f"   ❌ Content document missing: {result['missing_content']}")
+        for article_id, reason in result['samples']:
+            print(f"      {article_id}: {reason}")
+        if args.repair:
+            print(f"   🔧 Repaired: {result['repaired']}")
+        elif result['mismatched']:
+            print("\n💡 Run with --repair to rewrite markers from the content documents")
+        if result['mismatched'] and not args.repair or result['missing_content']:
+            sys.exit(1)
+        return
+
+    print("=" * 50)
+    print("  Article Content Split Migration")
+    print(f"  Env: {os.getenv('ZND_ENV', 'dev')}")
+    print(f"  {'🔍 DRY RUN MODE' if args.dry_run else '🔧 MIGRATION MODE'}")
+    print("=" * 50)
+
+    db = FirestoreClient()
+    result = migrate_collection(db, page_size=min(args.page_size, 250), limit=args.limit, dry_run=args.dry_run)
+
+    print("-" * 50)
+    print("📊 Results:")
+    print(f"   🔎 Scanned: {result['scanned']}")
+    print(f"   ✅ {'Would split' if args.dry_run else 'Split'}: {result['migrated']}")
+    print(f"   ⏭️ Already split: {result['already_split']}")
+    print(f"   ⏭️ No body fields: {result['no_content']}")
+    print(f"   📦 Body moved off cards: {result['content_bytes'] / 1024:.1f}KB")
+    if args.dry_run:
+        print("\n💡 Run without --dry-run to apply changes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+History Index Migration
+history/_index 한 문서의 URL 히스토리를 해시 앞자리별 샤드 문서(history/_shard_<prefix>)로 옮기고
+목록 문서(history/_shards)에 legacy_migrated를 기록합니다 (history_index 참고).
+
+--shard-chars로 샤드 폭을 바꾸면 (재샤딩) 기존 샤드 항목도 새 폭으로 다시 씁니다.
+재샤딩 중에는 수집/상태 변경을 멈추세요 (작성 중인 샤드 폭이 바뀝니다).
+샤드 버전은 기존 최대값 + 1로 올려 모든 서버의 로컬 사본이 다음 새로고침에서 다시 읽게 합니다.
+
+Usage:
+    python scripts/migrate_history_index.py --dry-run
+    python scripts/migrate_history_index.py                     # 이전 형식 → 샤드 (_index는 남김)
+    python scripts/migrate_history_index.py --delete-legacy     # 옮긴 뒤 history/_index 삭제
+    python scripts/migrate_history_index.py --shard-chars 3     # 4096개 샤드로 재샤딩
+"""
+import os
+import sys
+import json
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SHARD_WARN_BYTES = 900 * 1024  # Firestore 문서 한도 1 MiB
+
+
+def load_index(db) -> dict:
+    """목록 문서, 이전 형식 항목, 현재 샤드 항목 읽기"""
+    from src.core.history_index import MANIFEST_DOC, LEGACY_DOC, parse_legacy_index, shard_doc_id
+
+    collection = db._get_collection('history')
+    manifest_doc = collection.document(MANIFEST_DOC).get()
+    manifest = manifest_doc.to_dict() if manifest_doc.exists else {}
+    legacy_doc = collection.document(LEGACY_DOC).get()
+    legacy = parse_legacy_index(legacy_doc.to_dict() if legacy_doc.exists else None)
+
+    shards = {}
+    prefixes = sorted(manifest.get('versions') or {})
+    for start in range(0, len(prefixes), 300):
+        refs = [collection.document(shard_doc_id(prefix)) for prefix in prefixes[start:start + 300]]
+        for snapshot in db.db.get_all(refs):
+            if snapshot.exists:
+                shards[snapshot.id] = (snapshot.to_dict() or {}).get('urls') or {}
+    db._track_read(2 + len(prefixes), collection='history')
+    return {'manifest': manifest, 'legacy': legacy, 'legacy_exists': legacy_doc.exists, 'shards': shards}
+
+
+def migrate(db, shard_chars: int = None, delete_legacy: bool = False, dry_run: bool = False) -> dict:
+    """
+    이전 형식 + 현재 샤드 → shard_chars 폭의 샤드
+
+    Returns:
+        {'entries', 'legacy', 'shards_written', 'shards_deleted', 'largest_shard_bytes', 'version'}
+    """
+    from src.core.history_index import MANIFEST_DOC, LEGACY_DOC, get_shard_chars, shard_of, shard_doc_id
+    from src.core_logic import get_kst_now
+
+    state = load_index(db)
+    manifest = state['manifest']
+    shard_chars = shard_chars or manifest.get('shard_chars') or get_shard_chars()
+
+    entries = dict(state['legacy'])
+    for urls in state['shards'].values():
+        entries.update(urls)  # 샤드 항목이 더 최신
+    by_shard = {}
+    for url_hash, entry in entries.items():
+        by_shard.setdefault(shard_of(url_hash, shard_chars), {})[url_hash] = entry
+
+    version = max((manifest.get('versions') or {}).values(), default=0) + 1
+    obsolete = [doc_id for doc_id in state['shards']
+                if doc_id not in {shard_doc_id(prefix) for prefix in by_shard}]
+    sizes = {prefix: len(json.dumps(urls, ensure_ascii=False).encode('utf-8')) for prefix, urls in by_shard.items()}
+    result = {
+        'entries': len(entries), 'legacy': len(state['legacy']),
+        'shards_written': len(by_shard), 'shards_deleted': len(obsolete),
+        'largest_shard_bytes': max(sizes.values(), default=0), 'version': version,
+    }
+    for prefix, size in sizes.items():
+        if size > SHARD_WARN_BYTES:
+            print(f"⚠️ Shard {prefix} is {size / 1024:.0f}KB - use a larger --shard-chars")
+    if dry_run:
+        return result
+
+    collection = db._get_collection('history')
+    now = get_kst_now()
+    writes = [('set', collection.document(shard_doc_id(prefix)),
+               {'urls': urls, 'version': version, 'updated_at': now}) for prefix, urls in by_shard.items()]
+    writes += [('delete', collection.document(doc_id), None) for doc_id in obsolete]
+    # 목록 문서는 마지막 배치 (샤드가 모두 써진 뒤에 새 폭이 보이도록)
+    writes.append(('set', collection.document(MANIFEST_DOC), {
+        'shard_chars': shard_chars,
+        'versions': {prefix: version for prefix in by_shard},
+        'legacy_migrated': True,
+        'updated_at': now,
+    }))
+    if delete_legacy and state['legacy_exists']:
+        writes.append(('delete', collection.document(LEGACY_DOC), None))
+
+    for start in range(0, len(writes), 400):
+        batch = db.db.batch()
+        for kind, ref, payload in writes[start:start + 400]:
+            if kind == 'delete':
+                batch.delete(ref)
+            else:
+                batch.set(ref, payload)
+        batch.commit()
+    deletes = sum(1 for kind, _, _ in writes if kind == 'delete')
+    db._track_write(len(writes) - deletes, collection='history')
+    db._track_delete(deletes, collection='history')
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shard the URL history index (history/_index)')
+    parser.add_argument('--dry-run', action='store_true', help='변경 없이 대상만 확인')
+    parser.add_argument('--shard-chars', type=int, choices=(1, 2, 3), default=None,
+                        help='샤드 폭 (해시 앞 n글자, 16^n개 샤드, 기본: 현재 값 또는 HISTORY_INDEX_SHARD_CHARS)')
+    parser.add_argument('--delete-legacy', action='store_true', help='옮긴 뒤 history/_index 삭제')
+    args = parser.parse_args()
+
+    from src.core.firestore_client import FirestoreClient
+
+    print("=" * 50)
+    print("  History Index Migration")
+    print(f"  Env: {os.getenv('ZND_ENV', 'dev')}")
+    print(f"  {'🔍 DRY RUN MODE' if args.dry_run else '🔧 MIGRATION MODE'}")
+    print("=" * 50)
+
+    result = migrate(FirestoreClient(), shard_chars=args.shard_chars,
+                     delete_legacy=args.delete_legacy, dry_run=args.dry_run)
+
+    print("-" * 50)
+    print("📊 Results:")
+    print(f"   🔗 URL entries: {result['entries']} (legacy _index: {result['legacy']})")
+    print(f"   ✅ Shards {'to write' if args.dry_run else 'written'}: {result['shards_written']} (version {result['version']})")
+    print(f"   🗑️ Obsolete shards: {result['shards_deleted']}")
+    print(f"   📦 Largest shard: {result['largest_shard_bytes'] / 1024:.1f}KB")
+    if args.dry_run:
+        print("\n💡 Run without --dry-run to apply changes")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,23 @@
 # -*- coding: utf-8 -*-
 """
 Schema v3.1 Migration Script
-기존 캐시 파일의 url, source_id를 _header로 이동
+기존 캐시 파일의 url, source_id를 _header로 이동하고 version을 3.1로 기록
+
+업그레이드 규칙은 SchemaAdapter.get_header_upgrade()와 동일합니다.
+한 번 마이그레이션된 기사는 SchemaAdapter가 복사 없이(zero-copy) 읽습니다.
 
 Usage:
     python scripts/migrate_schema_v31.py
-    python scripts/migrate_schema_v31.py --dry-run  # 테스트 모드
+    python scripts/migrate_schema_v31.py --dry-run            # 테스트 모드
+    python scripts/migrate_schema_v31.py --workers 8          # 병렬 처리 (기본: CPU 수)
+    python scripts/migrate_schema_v31.py --firestore          # 현재 ZND_ENV의 Firestore _header도 갱신
 """
 import os
 import sys
 import json
 import glob
-from datetime import datetime
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,114 +25,198 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache')
 
 
-def migrate_article(data: dict) -> tuple[dict, bool]:
+def migrate_article(data: dict) -> tuple[dict, dict]:
     """
-    단일 기사 데이터를 v3.1로 마이그레이션
-    
+    단일 기사 데이터를 v3.1로 마이그레이션 (in-place)
+
     Returns:
-        (migrated_data, was_modified)
+        (migrated_data, header_updates) - 변경 없으면 header_updates는 빈 dict
     """
-    header = data.get('_header', {})
-    original = data.get('_original', {})
-    
-    modified = False
-    
-    # 이미 v3.1이면 스킵
-    if header.get('version') == '3.1':
-        return data, False
-    
-    # url을 _header로 이동
-    if 'url' not in header and 'url' in original:
-        header['url'] = original['url']
-        modified = True
-    
-    # source_id를 _header로 이동
-    if 'source_id' not in header and 'source_id' in original:
-        header['source_id'] = original['source_id']
-        modified = True
-    
-    # article_id가 없으면 URL에서 생성
-    if 'article_id' not in header:
-        url = header.get('url') or original.get('url')
-        if url:
-            import hashlib
-            article_id = hashlib.md5(url.encode()).hexdigest()[:12]
-            header['article_id'] = article_id
-            modified = True
-    
-    # 버전 업데이트
-    if modified:
-        header['version'] = '3.1'
-        data['_header'] = header
-    
-    return data, modified
-
-
-def migrate_cache_files(dry_run: bool = False):
+    from src.core.schema_adapter import SchemaAdapter
+
+    # 기사 파일이 아니면 스킵 (롤업/인덱스 등)
+    if '_header' not in data and '_original' not in data:
+        return data, {}
+
+    adapter = SchemaAdapter(data)
+    if not adapter.needs_upgrade:
+        return data, {}
+
+    header_updates = adapter.get_header_upgrade()
+    data.setdefault('_header', {}).update(header_updates)
+    return data, header_updates
+
+
+def migrate_files(filepaths: list, dry_run: bool = False) -> dict:
     """
-    캐시 디렉토리의 모든 JSON 파일을 마이그레이션
+    파일 묶음 마이그레이션 (워커 프로세스에서 실행)
+
+    Returns:
+        {'migrated': [(article_id, header_updates)], 'skipped': int, 'errors': [str]}
     """
-    if not os.path.exists(CACHE_DIR):
-        print(f"❌ Cache directory not found: {CACHE_DIR}")
-        return
-    
-    # 모든 .json 파일 찾기
-    pattern = os.path.join(CACHE_DIR, '**', '*.json')
-    files = glob.glob(pattern, recursive=True)
-    
-    print(f"📂 Found {len(files)} cache files")
-    print(f"{'🔍 DRY RUN MODE' if dry_run else '🔧 MIGRATION MODE'}")
-    print("-" * 50)
-    
-    migrated_count = 0
-    skipped_count = 0
-    error_count = 0
-    
-    for filepath in files:
+    result = {'migrated': [], 'skipped': 0, 'errors': []}
+
+    for filepath in filepaths:
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            
-            # 마이그레이션 수행
-            migrated_data, was_modified = migrate_article(data)
-            
-            if was_modified:
+
+            migrated_data, header_updates = migrate_article(data)
+
+            if header_updates:
                 if not dry_run:
-                    with open(filepath, 'w', encoding='utf-8') as f:
+                    tmp_path = filepath + '.tmp'
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
                         json.dump(migrated_data, f, ensure_ascii=False, indent=2)
-                
+                    os.replace(tmp_path, filepath)
+
                 article_id = migrated_data.get('_header', {}).get('article_id', 'unknown')
-                print(f"✅ {'Would migrate' if dry_run else 'Migrated'}: {article_id}")
-                migrated_count += 1
+                result['migrated'].append((article_id, header_updates))
             else:
-                skipped_count += 1
-                
+                result['skipped'] += 1
+
         except json.JSONDecodeError as e:
-            print(f"⚠️ JSON Error in {filepath}: {e}")
-            error_count += 1
+            result['errors'].append(f"⚠️ JSON Error in {filepath}: {e}")
+        except Exception as e:
+            result['errors'].append(f"❌ Error in {filepath}: {e}")
+
+    return result
+
+
+def migrate_segment_entries(env_root: str, dry_run: bool = False) -> dict:
+    """
+    압축 segment에 보관된 기사 마이그레이션
+    (수정된 기사는 같은 날짜 폴더의 개별 파일로 기록되어 segment 항목보다 우선)
+    """
+    from src.core.local_store import JsonFileStore
+
+    result = {'migrated': [], 'skipped': 0, 'errors': []}
+    store = JsonFileStore(env_root)
+    for entry in store.iter_entries():
+        if '#' not in entry.location:
+            continue  # 개별 파일은 migrate_files에서 처리
+        try:
+            migrated_data, header_updates = migrate_article(entry.read())
+            if not header_updates:
+                result['skipped'] += 1
+                continue
+            if not dry_run:
+                store.save(entry.article_id, migrated_data, entry.date_folder)
+            result['migrated'].append((migrated_data['_header'].get('article_id', entry.article_id), header_updates))
         except Exception as e:
-            print(f"❌ Error in {filepath}: {e}")
-            error_count += 1
-    
+            result['errors'].append(f"❌ Error in {entry.location}: {e}")
+    return result
+
+
+def push_to_firestore(migrated: list, dry_run: bool = False) -> int:
+    """마이그레이션된 _header 필드를 Firestore에 배치 반영 (set merge)"""
+    if dry_run or not migrated:
+        return 0
+
+    from src.core.firestore_client import FirestoreClient
+    db = FirestoreClient()
+    updates = {aid: {'_header': header} for aid, header in migrated if aid and aid != 'unknown'}
+    return db.batch_save_articles(updates)
+
+
+def migrate_cache_files(dry_run: bool = False, workers: int = None, firestore: bool = False):
+    """
+    캐시 디렉토리의 모든 JSON 파일을 마이그레이션 (병렬)
+    """
+    if firestore:
+        # Firestore 반영은 현재 환경의 캐시만 대상
+        root = os.path.join(CACHE_DIR, os.getenv('ZND_ENV', 'dev'))
+    else:
+        root = CACHE_DIR
+
+    if not os.path.exists(root):
+        print(f"❌ Cache directory not found: {root}")
+        return
+
+    # 모든 기사 .json 파일 찾기 (_rollups, _cutline 등 시스템 폴더 제외)
+    pattern = os.path.join(root, '**', '*.json')
+    files = [
+        f for f in glob.glob(pattern, recursive=True)
+        if not any(part.startswith('_') for part in os.path.relpath(f, root).split(os.sep))
+    ]
+
+    workers = workers or os.cpu_count() or 1
+    print(f"📂 Found {len(files)} cache files")
+    print(f"{'🔍 DRY RUN MODE' if dry_run else '🔧 MIGRATION MODE'} (workers={workers})")
+    print("-" * 50)
+
+    # 워커당 여러 묶음으로 분할 (진행률 표시 + 부하 분산)
+    chunk_size = max(1, min(500, len(files) // (workers * 4) or 1))
+    chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+
+    migrated = []
+    skipped_count = 0
+    error_count = 0
+
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(migrate_files, chunks, [dry_run] * len(chunks))
+            for idx, result in enumerate(results, 1):
+                migrated.extend(result['migrated'])
+                skipped_count += result['skipped']
+                error_count += len(result['errors'])
+                for err in result['errors']:
+                    print(err)
+                print(f"   ⏳ {idx}/{len(chunks)} chunks")
+    else:
+        for chunk in chunks:
+            result = migrate_files(chunk, dry_run)
+            migrated.extend(result['migrated'])
+            skipped_count += result['skipped']
+            error_count += len(result['errors'])
+            for err in result['errors']:
+                print(err)
+
+    # 압축 segment 항목 (개별 파일이 없는 오래된 날짜)
+    env_roots = [root] if firestore else [
+        os.path.join(root, name) for name in sorted(os.listdir(root))
+        if not name.startswith('_') and os.path.isdir(os.path.join(root, name))
+    ]
+    for env_root in env_roots:
+        result = migrate_segment_entries(env_root, dry_run)
+        migrated.extend(result['migrated'])
+        skipped_count += result['skipped']
+        error_count += len(result['errors'])
+        for err in result['errors']:
+            print(err)
+
+    for article_id, _ in migrated[:20]:
+        print(f"✅ {'Would migrate' if dry_run else 'Migrated'}: {article_id}")
+    if len(migrated) > 20:
+        print(f"   ... ({len(migrated) - 20} more)")
+
+    pushed = push_to_firestore(migrated, dry_run) if firestore else 0
+
     print("-" * 50)
     print(f"📊 Results:")
-    print(f"   ✅ Migrated: {migrated_count}")
+    print(f"   ✅ Migrated: {len(migrated)}")
     print(f"   ⏭️ Skipped (already v3.1): {skipped_count}")
     print(f"   ❌ Errors: {error_count}")
-    
+    if firestore:
+        print(f"   ☁️ Firestore updated: {pushed}")
+
     if dry_run:
         print(f"\n💡 Run without --dry-run to apply changes")
 
 
 def main():
-    dry_run = '--dry-run' in sys.argv
-    
+    parser = argparse.ArgumentParser(description='Schema v3.1 migration')
+    parser.add_argument('--dry-run', action='store_true', help='변경 없이 대상만 확인')
+    parser.add_argument('--workers', type=int, default=None, help='병렬 워커 수 (기본: CPU 수)')
+    parser.add_argument('--firestore', action='store_true', help='현재 ZND_ENV의 Firestore _header도 갱신')
+    args = parser.parse_args()
+
     print("=" * 50)
     print("  Schema v3.1 Migration")
     print(f"  Cache Dir: {CACHE_DIR}")
     print("=" * 50)
-    
-    migrate_cache_files(dry_run=dry_run)
+
+    migrate_cache_files(dry_run=args.dry_run, workers=args.workers, firestore=args.firestore)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Header Timestamp Normalization
+Timestamp 타입으로 저장된 _header.updated_at / created_at을 KST ISO 문자열로 바꿉니다.
+
+레지스트리 증분 동기화와 실시간 리스너는 `_header.updated_at > since` (문자열) 쿼리를 씁니다.
+Firestore는 범위 비교에서 타입이 다른 값을 제외하므로 Timestamp로 저장된 기사는 변경돼도 동기화되지 않습니다.
+새 쓰기는 FirestoreClient가 문자열로 저장하고 (string_header_times), 이 스크립트는 기존 문서를 한 번 정리합니다.
+
+`_header.updated_at >= 1970-01-01` (Timestamp) 쿼리로 대상 문서만 읽으므로 읽기 비용 = 대상 수입니다.
+중단되면 다시 실행하면 됩니다 (정리된 문서는 쿼리에 다시 나오지 않음).
+
+Usage:
+    python scripts/normalize_header_timestamps.py --dry-run
+    python scripts/normalize_header_timestamps.py
+    python scripts/normalize_header_timestamps.py --limit 1000 --page-size 200
+"""
+import os
+import sys
+import argparse
+from datetime import datetime, timezone
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def normalize_collection(db, page_size: int = 200, limit: int = None, dry_run: bool = False) -> dict:
+    """
+    Timestamp 타입 _header.updated_at 문서를 페이지 단위로 찾아 문자열로 갱신
+
+    Returns:
+        {'scanned', 'updated', 'samples': [(article_id, before, after)]}
+    """
+    from src.core.firestore_client import HEADER_TIME_FIELDS, to_kst_iso
+
+    result = {'scanned': 0, 'updated': 0, 'samples': []}
+    collection = db._get_collection('articles')
+    query = collection.where('_header.updated_at', '>=', EPOCH).order_by('_header.updated_at')
+    last_doc = None
+    while limit is None or result['scanned'] < limit:
+        size = page_size if limit is None else min(page_size, limit - result['scanned'])
+        page_query = query.limit(size)
+        # 갱신한 문서는 쿼리에서 빠지므로 dry-run일 때만 커서로 넘김
+        page = list((page_query.start_after(last_doc) if last_doc is not None else page_query).stream())
+        db._track_read(max(1, len(page)))
+        if not page:
+            break
+        last_doc = page[-1] if dry_run else None
+
+        batch = db.db.batch()
+        for doc in page:
+            result['scanned'] += 1
+            header = (doc.to_dict() or {}).get('_header') or {}
+            updates = {f'_header.{field}': to_kst_iso(header[field]) for field in HEADER_TIME_FIELDS
+                       if isinstance(header.get(field), datetime)}
+            if len(result['samples']) < 5:
+                result['samples'].append((doc.id, header.get('updated_at'), updates.get('_header.updated_at')))
+            if not dry_run:
+                batch.update(doc.reference, updates)
+            result['updated'] += 1
+        if not dry_run:
+            batch.commit()
+            db._track_write(len(page))
+        print(f"   ⏳ scanned {result['scanned']}, {'would update' if dry_run else 'updated'} {result['updated']}")
+        if len(page) < size:
+            break
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert Timestamp _header.updated_at/created_at to KST ISO strings')
+    parser.add_argument('--dry-run', action='store_true', help='변경 없이 대상만 확인')
+    parser.add_argument('--page-size', type=int, default=200, help='한 번에 읽을 문서 수 (최대 500)')
+    parser.add_argument('--limit', type=int, default=None, help='최대 처리 문서 수')
+    args = parser.parse_args()
+
+    from src.core.firestore_client import FirestoreClient
+
+    print("=" * 50)
+    print("  Header Timestamp Normalization")
+    print(f"  Env: {os.getenv('ZND_ENV', 'dev')}")
+    print(f"  {'🔍 DRY RUN MODE' if args.dry_run else '🔧 MIGRATION MODE'}")
+    print("=" * 50)
+
+    db = FirestoreClient()
+    result = normalize_collection(db, page_size=min(args.page_size, 500), limit=args.limit, dry_run=args.dry_run)
+
+    print("-" * 50)
+    print("📊 Results:")
+    print(f"   🔎 Timestamp-typed documents: {result['scanned']}")
+    print(f"   ✅ {'Would update' if args.dry_run else 'Updated'}: {result['updated']}")
+    for article_id, before, after in result['samples']:
+        print(f"      {article_id}: {before} → {after}")
+    if args.dry_run:
+        print("\n💡 Run without --dry-run to apply changes")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+URL Filter Rebuild
+수집 이력 Bloom 필터(cache/<env>/_url_filter.bin + .log)를 원격 히스토리 인덱스, crawling_history.json,
+로컬 저장소 전체로 다시 만듭니다 (url_filter 참고).
+
+키 수가 용량을 넘어 오탐률이 올라갔을 때, 캐시 파일을 손으로 옮기거나 지웠을 때 실행하세요.
+서버/크롤러 실행 중에도 안전합니다 (로그를 새 세대로 먼저 교체해 재구성 중 추가된 키도 반영).
+
+Usage:
+    python scripts/rebuild_url_filter.py --stats
+    python scripts/rebuild_url_filter.py
+    python scripts/rebuild_url_filter.py --capacity 500000 --fp-rate 0.001
+"""
+import os
+import sys
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+
+def print_stats(stats: dict):
+    print(f"📊 Ready: {stats['ready']}")
+    if not stats['ready']:
+        return
+    print(f"   🔑 Keys: {stats['keys']} / capacity {stats['capacity']}")
+    print(f"   📦 Size: {stats['bytes'] / 1024:.0f}KB ({stats['bits']} bits, {stats['hashes']} hashes)")
+    print(f"   🎯 Expected false positives: {stats['expected_fp_rate']:.3%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild the crawl history Bloom filter')
+    parser.add_argument('--capacity', type=int, default=None, help='예상 URL 수 (기본: URL_FILTER_CAPACITY)')
+    parser.add_argument('--fp-rate', type=float, default=None, help='목표 오탐률 (기본: URL_FILTER_FP_RATE)')
+    parser.add_argument('--stats', action='store_true', help='재구성 없이 현재 필터 상태만 출력')
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("  URL Filter Rebuild")
+    print(f"  Env: {os.getenv('ZND_ENV', 'dev')}")
+    print("=" * 50)
+
+    if args.stats:
+        from src.core.local_store import get_default_cache_root
+        from src.core.url_filter import get_url_filter
+        print_stats(get_url_filter(get_default_cache_root()).stats())
+        return
+
+    from src.core.firestore_client import FirestoreClient
+    db = FirestoreClient()
+    db.refresh_remote_hashes()
+    print_stats(db.rebuild_url_filter(capacity=args.capacity, fp_rate=args.fp_rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+URL Re-keying Tool
+로컬 저장소의 모든 기사를 정규 URL 키(url_canonical.canonical_key)로 옮기는 계획을 세우고 보고/적용합니다.
+
+기사마다 기준 URL(_original.canonical_url, 없으면 _header/_original url)의 정규 키를 계산해 분류합니다.
+    unchanged   이미 정규 키
+    rekey       ID만 바뀜 (다른 기사와 겹치지 않음)
+    merge       서로 다른 기사가 같은 정규 URL → 가장 진행된 기사 하나로 합침
+                (발행 기사 > 상태 순서 > updated_at, 나머지는 keeper의 _header.merged_ids에 기록)
+    collision   서로 다른 정규 URL이 같은 12자리 키 → 건드리지 않음
+    pinned      발행된 기사 (공개 URL에 ID가 쓰임) → ID 유지
+    blocked     목표 ID를 옮기지 않는 다른 기사가 쓰고 있음
+
+--apply는 rekey를, --merge는 병합까지 적용합니다 (기본은 보고서만).
+ID가 바뀐 기사는 로컬 저장소 + Firestore 문서(본문 문서 포함)를 새 ID로 쓰고 이전 ID를 지우며,
+_header.previous_ids에 이전 ID를 남기고 정규 키 히스토리 항목을 새 ID로 기록합니다.
+서버/크롤러를 멈춘 상태에서 실행하고, 적용 후 scripts/rebuild_url_filter.py를 실행하세요.
+
+Usage:
+    python scripts/rekey_urls.py                          # 보고서만
+    python scripts/rekey_urls.py --report rekey.json      # 전체 계획을 JSON으로 저장
+    python scripts/rekey_urls.py --apply                  # 단독 rekey 적용
+    python scripts/rekey_urls.py --apply --merge          # 병합까지 적용
+    python scripts/rekey_urls.py --apply --local-only     # Firestore는 건드리지 않음
+"""
+import os
+import sys
+import json
+import argparse
+from collections import defaultdict
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+STATE_RANK = {'RELEASED': 6, 'PUBLISHED': 5, 'CLASSIFIED': 4, 'ANALYZED': 3, 'ANALYZING': 2,
+              'COLLECTED': 1, 'REJECTED': 0}
+CATEGORIES = ('unchanged', 'rekey', 'merge', 'collision', 'pinned', 'blocked')
+
+
+def _article_item(article_id: str, date_folder: str, data: dict) -> dict:
+    from src.core.local_store import article_url, article_edition
+    from src.core.url_canonical import canonicalize_url, canonical_key
+
+    header = data.get('_header') or {}
+    url = article_url(data)
+    source = (data.get('_original') or {}).get('canonical_url') or url
+    state = header.get('state') or ''
+    return {
+        'article_id': article_id,
+        'date_folder': date_folder,
+        'url': url,
+        'canonical': canonicalize_url(source),
+        'key': canonical_key(source),
+        'state': state,
+        'pinned': state in ('PUBLISHED', 'RELEASED') or bool(article_edition(data)),
+        'updated_at': str(header.get('updated_at') or ''),
+    }
+
+
+def _keeper_order(item: dict) -> tuple:
+    return (item['pinned'], STATE_RANK.get(item['state'], 0), item['updated_at'])
+
+
+def build_plan(store) -> dict:
+    """
+    로컬 저장소 전체 → 재키 계획
+
+    Returns:
+        {'scanned', 'no_url', 'moves': [{'from', 'to', 'merged', 'item'}], <category>: [...]}
+    """
+    items = {}
+    no_url = 0
+    for stored in store.iter_articles():
+        if stored.article_id in items:
+            continue  # 같은 ID가 여러 날짜 폴더에 있으면 최신 것
+        item = _article_item(stored.article_id, stored.date_folder, stored.data)
+        if not item['url']:
+            no_url += 1
+            continue
+        items[stored.article_id] = item
+
+    by_key = defaultdict(list)
+    for item in items.values():
+        by_key[item['key']].append(item)
+
+    plan = {category: [] for category in CATEGORIES}
+    plan.update({'scanned': len(items) + no_url, 'no_url': no_url, 'moves': []})
+    for key, group in by_key.items():
+        canonicals = sorted({item['canonical'] for item in group})
+        if len(canonicals) > 1:
+            plan['collision'].append({'key': key, 'canonicals': canonicals,
+                                      'articles': [item['article_id'] for item in group]})
+            continue
+        group.sort(key=_keeper_order, reverse=True)
+        keeper, losers = group[0], group[1:]
+        target = keeper['article_id'] if keeper['pinned'] else key
+        if losers:
+            plan['merge'].append({'key': key, 'canonical': canonicals[0], 'keeper': keeper['article_id'],
+                                  'target': target, 'merged': [item['article_id'] for item in losers],
+                                  'pinned': [item['article_id'] for item in losers if item['pinned']]})
+        elif keeper['article_id'] == key:
+            plan['unchanged'].append(keeper['article_id'])
+            continue
+        elif keeper['pinned']:
+            plan['pinned'].append({'article_id': keeper['article_id'], 'key': key, 'url': keeper['url']})
+            continue
+        else:
+            plan['rekey'].append({'from': keeper['article_id'], 'to': key, 'url': keeper['url']})
+        plan['moves'].append({'from': keeper['article_id'], 'to': target, 'item': keeper,
+                              'merged': [item['article_id'] for item in losers if not item['pinned']]})
+
+    # 목표 ID를 옮기지 않는 기사가 쓰고 있으면 보류
+    moving = {move['from'] for move in plan['moves'] if move['from'] != move['to']}
+    merged = {aid for move in plan['moves'] for aid in move['merged']}
+    kept = []
+    for move in plan['moves']:
+        occupant = move['to']
+        if (move['from'] != occupant and occupant in items
+                and occupant not in moving and occupant not in merged and occupant not in move['merged']):
+            plan['blocked'].append({'from': move['from'], 'to': occupant, 'url': move['item']['url']})
+            continue
+        kept.append(move)
+    plan['moves'] = kept
+    return plan
+
+
+def apply_plan(plan: dict, store, db=None, merge: bool = False) -> dict:
+    """
+    계획 적용 (db가 None이면 로컬 저장소만)
+
+    목표 ID를 아직 쓰고 있는 기사가 먼저 옮겨지도록 순서를 맞춥니다.
+
+    Returns:
+        {'moved', 'merged', 'firestore_docs', 'history_entries', 'deferred'}
+    """
+    from src.core_logic import get_kst_now
+    from src.core.url_canonical import canonical_key
+
+    result = {'moved': 0, 'merged': 0, 'firestore_docs': 0, 'history_entries': 0, 'deferred': 0}
+    pending = [move for move in plan['moves'] if merge or not move['merged']]
+    history = {}
+    while pending:
+        remaining = []
+        # 아직 비워지지 않은 ID (옮겨질 기사 + 병합으로 지워질 중복)
+        vacated = {move['from'] for move in pending if move['from'] != move['to']}
+        vacated.update(aid for move in pending for aid in move['merged'])
+        for move in pending:
+            waiting_on = vacated - {move['from']} - set(move['merged'])
+            if move['to'] != move['from'] and move['to'] in waiting_on and store.get(move['to']) is not None:
+                remaining.append(move)  # 목표 ID의 현재 기사가 먼저 옮겨지거나 지워져야 함
+                continue
+            _apply_move(move, store, db, merge, result)
+            for aid in [move['from']] + (move['merged'] if merge else []):
+                vacated.discard(aid)
+            item = move['item']
+            now = get_kst_now()
+            history[canonical_key(item['url'])] = {'article_id': move['to'], 'status': item['state'] or 'COLLECTED',
+                                                   'updated_at': now}
+        if len(remaining) == len(pending):
+            result['deferred'] = len(remaining)  # 서로의 ID를 맞바꾸는 순환
+            break
+        pending = remaining
+
+    if db is not None and history:
+        entries = list(history.items())
+        for start in range(0, len(entries), 400):
+            db._write_history_entries(dict(entries[start:start + 400]))
+        result['history_entries'] = len(history)
+    return result
+
+
+def _apply_move(move: dict, store, db, merge: bool, result: dict):
+    old_id, new_id = move['from'], move['to']
+    merged = move['merged'] if merge else []
+    removed = [aid for aid in merged if aid != new_id]  # 목표 ID를 쓰던 중복은 덮어씀
+    data = store.get(old_id)
+    if data is None:
+        return
+    header = data.setdefault('_header', {})
+    if old_id != new_id:
+        header['article_id'] = new_id
+        header['previous_ids'] = list(dict.fromkeys((header.get('previous_ids') or []) + [old_id]))
+    if merged:
+        header['merged_ids'] = list(dict.fromkeys((header.get('merged_ids') or []) + merged))
+
+    remote = None
+    if db is not None and old_id != new_id:
+        remote = db.get_article(old_id, include_content=True)
+        if remote:
+            remote.setdefault('_header', {}).update({k: header[k] for k in ('article_id', 'previous_ids') if k in header})
+    if remote and merged:
+        remote['_header']['merged_ids'] = header['merged_ids']
+
+    if old_id != new_id or merged:
+        store.save(new_id, data, move['item']['date_folder'])
+        if old_id != new_id:
+            store.delete(old_id)
+            result['moved'] += 1
+    if db is not None:
+        if remote:
+            db.save_article(new_id, remote)
+            db.delete_article(old_id)
+            result['firestore_docs'] += 1
+        elif merged and old_id == new_id:
+            db.update_article(new_id, {'_header.merged_ids': header['merged_ids']})
+        for loser in removed:
+            db.delete_article(loser)
+    for loser in removed:
+        store.delete(loser)
+    result['merged'] += len(merged)
+
+
+def print_plan(plan: dict, limit: int):
+    print(f"📊 Scanned: {plan['scanned']} articles ({plan['no_url']} without URL)")
+    print(f"   ✅ Unchanged: {len(plan['unchanged'])}")
+    print(f"   🔑 Re-key: {len(plan['rekey'])}")
+    for entry in plan['rekey'][:limit]:
+        print(f"      {entry['from']} → {entry['to']}  {entry['url'][:70]}")
+    print(f"   🔗 Merge groups: {len(plan['merge'])} "
+          f"({sum(len(entry['merged']) for entry in plan['merge'])} duplicates)")
+    for entry in plan['merge'][:limit]:
+        pinned = f" (pinned kept: {', '.join(entry['pinned'])})" if entry['pinned'] else ''
+        print(f"      {entry['keeper']} → {entry['target']} ← {', '.join(entry['merged'])}{pinned}  {entry['canonical'][:60]}")
+    print(f"   💥 Key collisions: {len(plan['collision'])}")
+    for entry in plan['collision'][:limit]:
+        print(f"      {entry['key']}: {' | '.join(c[:50] for c in entry['canonicals'])}")
+    print(f"   📌 Pinned (published, ID kept): {len(plan['pinned'])}")
+    print(f"   ⛔ Blocked: {len(plan['blocked'])}")
+    for entry in plan['blocked'][:limit]:
+        print(f"      {entry['from']} → {entry['to']} (ID in use)  {entry['url'][:60]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-key the corpus to canonical URL keys')
+    parser.add_argument('--cache-root', default=None, help='캐시 루트 (기본: cache/<ZND_ENV>)')
+    parser.add_argument('--apply', action='store_true', help='rekey 적용 (기본: 보고서만)')
+    parser.add_argument('--merge', action='store_true', help='--apply와 함께: 같은 정규 URL의 기사 병합')
+    parser.add_argument('--local-only', action='store_true', help='Firestore/히스토리는 건드리지 않음')
+    parser.add_argument('--report', default=None, help='전체 계획을 JSON 파일로 저장')
+    parser.add_argument('--limit', type=int, default=10, help='항목별 출력 예시 수')
+    args = parser.parse_args()
+
+    from src.core.local_store import get_local_store, get_default_cache_root
+
+    store = get_local_store(args.cache_root or get_default_cache_root())
+    print("=" * 50)
+    print("  URL Re-keying")
+    print(f"  Env: {os.getenv('ZND_ENV', 'dev')}")
+    print(f"  {'🔧 APPLY' + (' + MERGE' if args.merge else '') if args.apply else '🔍 REPORT ONLY'}")
+    print("=" * 50)
+
+    plan = build_plan(store)
+    print_plan(plan, args.limit)
+    if args.report:
+        report = {key: value for key, value in plan.items() if key != 'moves'}
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"📝 Report saved: {args.report}")
+
+    if not args.apply:
+        print("\n💡 Run with --apply (and --merge) to re-key")
+        return
+
+    db = None
+    if not args.local_only:
+        from src.core.firestore_client import FirestoreClient
+        db = FirestoreClient()
+    result = apply_plan(plan, store, db, merge=args.merge)
+    print("-" * 50)
+    print(f"✅ Moved: {result['moved']}, merged away: {result['merged']}, "
+          f"Firestore docs: {result['firestore_docs']}, history entries: {result['history_entries']}")
+    if result['deferred']:
+        print(f"⚠️ Deferred (ID swap cycle): {result['deferred']}")
+    print("💡 Run scripts/rebuild_url_filter.py and restart the server")
+
+
+if __name__ == '__main__':
+    main()
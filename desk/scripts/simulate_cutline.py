@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Cutline What-if Simulator (CLI)
+임계값을 바꿨을 때 배제될 기사 수를 소스/카테고리/일자별로 확인 (상태 변경 없음)
+
+Usage:
+    python scripts/simulate_cutline.py                        # 현재 설정 기준
+    python scripts/simulate_cutline.py --max-zes 6.5 --min-is 3
+    python scripts/simulate_cutline.py --sweep 5,5.5,6,6.5,7  # ZES 상한별 배제 수
+    python scripts/simulate_cutline.py --states ANALYZED,CLASSIFIED --json
+"""
+import os
+import sys
+import json
+import argparse
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+from src.core.cutline_simulator import get_score_corpus
+
+
+def print_group(title: str, group: dict, limit: int):
+    print(f"\n📂 {title}")
+    rows = sorted(group.items(), key=lambda x: x[1]['rejected'], reverse=True)
+    for name, counts in rows[:limit]:
+        rate = counts['rejected'] / counts['total'] * 100 if counts['total'] else 0
+        print(f"   {name:<30} {counts['rejected']:>6} / {counts['total']:<6} ({rate:5.1f}%)")
+    if len(rows) > limit:
+        print(f"   ... ({len(rows) - limit} more)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cutline what-if simulator')
+    parser.add_argument('--max-zes', type=float, default=None, help='ZES 상한 (초과 시 배제)')
+    parser.add_argument('--min-is', type=float, default=None, help='IS 하한 (미만 시 배제)')
+    parser.add_argument('--states', default=None, help='대상 상태 (쉼표 구분)')
+    parser.add_argument('--sweep', default=None, help='ZES 상한 후보 (쉼표 구분)')
+    parser.add_argument('--limit', type=int, default=15, help='그룹별 출력 행 수')
+    parser.add_argument('--json', action='store_true', help='JSON 출력')
+    args = parser.parse_args()
+
+    states = [s.strip() for s in args.states.split(',')] if args.states else None
+
+    corpus = get_score_corpus()
+    corpus.load()
+    result = corpus.simulate(max_zes=args.max_zes, min_is=args.min_is, states=states)
+    if args.sweep:
+        result['sweep'] = corpus.sweep(
+            [float(v) for v in args.sweep.split(',')],
+            min_is=result['thresholds']['min_is'], states=states
+        )
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return
+
+    th = result['thresholds']
+    cur = result['current']
+    print("=" * 60)
+    print(f"  Cutline Simulation: ZES > {th['max_zes']} or IS < {th['min_is']}")
+    print(f"  (current config: ZES > {cur['max_zes']} or IS < {cur['min_is']})")
+    print("=" * 60)
+    print(f"📊 Total: {result['total']}, Would reject: {result['rejected']}")
+    print(f"   🆕 Newly rejected: {result['newly_rejected']}, ♻️ Restored: {result['restored']}")
+    print(f"   ⏱️ {result.get('elapsed_ms', 0)}ms")
+
+    print_group('By Source', result['by_source'], args.limit)
+    print_group('By Category', result['by_category'], args.limit)
+    print_group('By Day', dict(sorted(result['by_day'].items(), reverse=True)), args.limit)
+
+    if result.get('sweep'):
+        print("\n📈 Sweep (max_zes → rejected)")
+        for point in result['sweep']:
+            print(f"   {point['max_zes']:>5.2f} → {point['rejected']} / {point['total']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""
+Article Registry Stress Test
+여러 스레드에서 동시에 상태 변경/등록/일괄 갱신/조회를 수행하며
+색인 불변식과 읽기 일관성을 검사합니다.
+
+검사 항목:
+    - check_invariants(): 상태/URL/회차 색인이 기사 메타데이터와 일치
+    - find_by_state(S) 결과의 모든 기사가 상태 S (찢어진 뷰 없음)
+    - get_stats(): 상태별 합계 == 전체 기사 수 (같은 세대)
+    - 종료 후 레지스트리 상태 == 로컬 저장소 상태 (쓰기 직렬화)
+
+임시 캐시 폴더를 사용하며 Firestore에는 접근하지 않습니다.
+
+Usage:
+    python scripts/stress_registry.py
+    python scripts/stress_registry.py --articles 1000 --writers 8 --readers 16 --seconds 20
+"""
+import os
+import io
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import threading
+import traceback
+import contextlib
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+os.environ['LOCAL_STORE_BACKEND'] = 'json'
+
+from src.core.article_registry import get_registry
+from src.core.local_store import get_local_store
+
+STATES = ['COLLECTED', 'ANALYZED', 'CLASSIFIED', 'REJECTED']
+
+
+def make_article(article_id: str, day: str) -> dict:
+    return {
+        '_header': {'article_id': article_id, 'state': 'COLLECTED', 'version': '3.1',
+                    'created_at': f'{day}T00:00:00+09:00', 'updated_at': f'{day}T00:00:00+09:00'},
+        '_original': {'url': f'https://news.example.com/{article_id}', 'title': f'Article {article_id}',
+                      'source_id': 'example'},
+        '_analysis': {'impact_score': 5.0, 'zero_echo_score': 3.0},
+        '_classification': {'category': 'Tech'},
+        '_publication': None,
+    }
+
+
+class Stress:
+    def __init__(self, args, cache_root: str):
+        self.args = args
+        self.registry = get_registry()
+        self.store = get_local_store(cache_root)
+        self.stop = threading.Event()
+        self.errors = []
+        self.ops = {'update_state': 0, 'register': 0, 'batch': 0, 'read': 0}
+        self.ops_lock = threading.Lock()
+        self.ids = []
+        self.ids_lock = threading.Lock()
+        self.day = time.strftime('%Y-%m-%d')
+
+    def fail(self, message: str):
+        self.errors.append(message)
+        self.stop.set()
+
+    def count(self, key: str):
+        with self.ops_lock:
+            self.ops[key] += 1
+
+    def pick(self, rng: random.Random) -> str:
+        with self.ids_lock:
+            return rng.choice(self.ids)
+
+    def writer(self, seed: int):
+        rng = random.Random(seed)
+        while not self.stop.is_set():
+            try:
+                roll = rng.random()
+                if roll < 0.75:
+                    article_id = self.pick(rng)
+                    state = rng.choice(STATES)
+                    updates = {'_analysis.impact_score': round(rng.uniform(0, 10), 1)}
+                    self.registry.update_state(article_id, state, by=f'stress-{seed}', updates=updates)
+                    self.count('update_state')
+                elif roll < 0.9:
+                    article_id = f'n{seed:02d}{rng.getrandbits(40):010x}'
+                    data = make_article(article_id, self.day)
+                    location = self.store.save(article_id, data, self.day)
+                    self.registry.register(data, cache_path=location, skip_firestore=True)
+                    with self.ids_lock:
+                        self.ids.append(article_id)
+                    self.count('register')
+                else:
+                    batch = {self.pick(rng): {'_analysis.zero_echo_score': round(rng.uniform(0, 10), 1)}
+                             for _ in range(20)}
+                    self.registry.update_fields_batch(batch)
+                    self.count('batch')
+            except Exception:
+                self.fail(f'writer {seed}: {traceback.format_exc()}')
+
+    def reader(self, seed: int):
+        rng = random.Random(seed)
+        while not self.stop.is_set():
+            try:
+                state = rng.choice(STATES)
+                for info in self.registry.find_by_state(state, limit=10000):
+                    if info.state != state:
+                        self.fail(f'find_by_state({state}) returned {info.article_id} in {info.state}')
+                stats = self.registry.get_stats()
+                if sum(stats['by_state'].values()) != stats['total_articles']:
+                    self.fail(f"torn stats: {stats['by_state']} vs {stats['total_articles']}")
+                violations = self.registry.check_invariants()
+                if violations:
+                    self.fail(f'invariants: {violations[:5]}')
+                data = self.registry.get_full_data(self.pick(rng))
+                if data is not None and data['_header']['state'] not in STATES:
+                    self.fail(f"bad full data state: {data['_header']['state']}")
+                self.count('read')
+            except Exception:
+                self.fail(f'reader {seed}: {traceback.format_exc()}')
+
+    def run(self):
+        args = self.args
+        for idx in range(args.articles):
+            article_id = f'a{idx:07d}'
+            self.store.save(article_id, make_article(article_id, self.day), self.day)
+            self.ids.append(article_id)
+        self.registry.initialize(cache_root=self.store.cache_root, db_client=None)
+
+        threads = [threading.Thread(target=self.writer, args=(i,), daemon=True) for i in range(args.writers)]
+        threads += [threading.Thread(target=self.reader, args=(100 + i,), daemon=True) for i in range(args.readers)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        self.stop.wait(args.seconds)
+        self.stop.set()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        # 최종 검증: 색인 불변식 + 레지스트리/로컬 저장소 일치
+        self.errors.extend(self.registry.check_invariants())
+        mismatched = 0
+        for article_id in self.ids:
+            info = self.registry.get(article_id)
+            stored = self.store.get(article_id)
+            if info is None or stored is None or stored['_header']['state'] != info.state:
+                mismatched += 1
+        if mismatched:
+            self.errors.append(f'{mismatched} articles differ between registry and local store')
+        return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Article registry stress test')
+    parser.add_argument('--articles', type=int, default=500)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=10)
+    args = parser.parse_args()
+
+    cache_root = tempfile.mkdtemp(prefix='znd_registry_')
+    print(f"🧪 Registry stress: {args.articles} articles, {args.writers} writers, "
+          f"{args.readers} readers, {args.seconds:.0f}s")
+
+    stress = Stress(args, cache_root)
+    try:
+        # 레지스트리 로그는 숨김 (상태 변경마다 출력됨)
+        with contextlib.redirect_stdout(io.StringIO()):
+            elapsed = stress.run()
+    finally:
+        shutil.rmtree(cache_root, ignore_errors=True)
+
+    registry = stress.registry
+    print("-" * 50)
+    print(f"   ⏱️ {elapsed:.1f}s, generation {registry.generation}")
+    for key, value in stress.ops.items():
+        print(f"   {key:<14}{value:>8} ({value / elapsed:.0f}/s)")
+    print(f"   📊 {registry.get_stats()['by_state']}")
+    if stress.errors:
+        print(f"❌ {len(stress.errors)} violations")
+        for err in stress.errors[:10]:
+            print(f"   {err}")
+        sys.exit(1)
+    print("✅ No violations")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Score Engine Batch Parity Check
+process_raw_analysis_batch() 결과가 스칼라 경로(process_raw_analysis)와
+완전히 동일한지 검증합니다.
+
+Usage:
+    python scripts/verify_score_batch_parity.py
+    python scripts/verify_score_batch_parity.py --count 5000 --seed 7
+    python scripts/verify_score_batch_parity.py --cache   # 로컬 캐시의 실제 mll_raw 사용
+"""
+import os
+import sys
+import io
+import time
+import random
+import argparse
+import contextlib
+
+# Add desk folder to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+desk_dir = os.path.dirname(script_dir)
+sys.path.insert(0, desk_dir)
+
+from src.core.score_engine import process_raw_analysis, process_raw_analysis_batch
+from src.core.local_store import get_local_store
+
+SCORE_KEYS = ('version', 'impact_score', 'zero_echo_score', 'impact_evidence', 'evidence')
+
+
+def _rand_score(rng: random.Random):
+    """다양한 입력 형태 (float/int/str/None/dict) 생성"""
+    value = round(rng.uniform(0, 10), rng.choice([0, 1, 2, 3]))
+    form = rng.random()
+    if form < 0.35:
+        return {'Score': value, 'Reason': 'r'}
+    if form < 0.55:
+        return value
+    if form < 0.7:
+        return str(value)
+    if form < 0.75:
+        return None
+    if form < 0.8:
+        return ''
+    return int(value)
+
+
+def make_raw(rng: random.Random) -> dict:
+    """랜덤 mll_raw 생성 (래퍼/누락/Legacy 케이스 포함)"""
+    if rng.random() < 0.05:
+        return {'impact_score': rng.uniform(0, 10), 'zero_echo_score': str(rng.uniform(0, 10))}
+
+    def items(keys):
+        body = {k: _rand_score(rng) for k in keys if rng.random() > 0.1}
+        return {'Items': body} if rng.random() < 0.5 else body
+
+    data = {'version': 'V1.0', 'Meta': {'Headline': 'h', 'Summary': 's'}}
+    if rng.random() > 0.05:
+        calc = {}
+        iw = {'Inputs': {'Tier': 'T2'}}
+        if rng.random() < 0.3:
+            calc['Tier_Score'] = rng.uniform(0, 3)
+            calc['Gap_Score'] = str(rng.uniform(0, 2))
+        else:
+            iw['Tier_Score'] = rng.choice([rng.uniform(0, 3), None, '2.5'])
+            iw['Gap_Score'] = rng.uniform(0, 2)
+        calc['IW_Analysis'] = iw
+        ie = {'Inputs': {'Scope_Matrix_Score': rng.uniform(0, 3), 'Criticality_Total': rng.uniform(0, 3)}}
+        is_analysis = {'Calculations': calc, 'Score_Commentary': 'c'}
+        if rng.random() < 0.5:
+            is_analysis['IE_Analysis'] = ie
+        else:
+            calc['IE_Analysis'] = ie
+        data['IS_Analysis'] = is_analysis
+    if rng.random() > 0.05:
+        data['ZES_Raw_Metrics'] = {
+            'Signal': items(('T1', 'T2', 'T3', 'T4')),
+            'Noise': items(('P1', 'P2', 'P3', 'P4')),
+            'Utility': items(('V1', 'V2', 'V3', 'V4')),
+            'Fine_Adjustment': {'Score': rng.choice([0, 0.5, -0.5, 1, '0.3'])}
+        }
+
+    wrap = rng.random()
+    if wrap < 0.2:
+        return {'raw_analysis': data}
+    if wrap < 0.4:
+        return {'articles': [data]}
+    return data
+
+
+def load_cache_raws() -> list:
+    """로컬 캐시의 _analysis.mll_raw 수집"""
+    raws = []
+    for stored in get_local_store().iter_articles():
+        data = stored.data
+        mll_raw = (data.get('_analysis') or {}).get('mll_raw') or data.get('mll_raw')
+        if mll_raw:
+            raws.append(mll_raw)
+    return raws
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score engine batch parity check')
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--cache', action='store_true', help='로컬 캐시의 실제 mll_raw 사용')
+    args = parser.parse_args()
+
+    if args.cache:
+        raws = load_cache_raws()
+        print(f"📂 Loaded {len(raws)} mll_raw from cache")
+    else:
+        rng = random.Random(args.seed)
+        raws = [make_raw(rng) for _ in range(args.count)]
+        print(f"🎲 Generated {len(raws)} synthetic mll_raw (seed={args.seed})")
+
+    # 스칼라 경로 (로그 억제)
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        scalar = [process_raw_analysis(raw) for raw in raws]
+    t_scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = process_raw_analysis_batch(raws)
+    t_batch = time.perf_counter() - t0
+
+    mismatches = 0
+    for idx, (a, b) in enumerate(zip(scalar, batch)):
+        expected = {k: a.get(k) for k in SCORE_KEYS}
+        actual = {k: b.get(k) for k in SCORE_KEYS} if b else None
+        if expected != actual:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"❌ Mismatch #{idx}")
+                print(f"   scalar: IS={expected['impact_score']}, ZES={expected['zero_echo_score']}")
+                print(f"   batch : {actual and (actual['impact_score'], actual['zero_echo_score'])}")
+
+    print("-" * 50)
+    print(f"⏱️ scalar: {t_scalar * 1000:.1f}ms, batch: {t_batch * 1000:.1f}ms "
+          f"(x{t_scalar / t_batch if t_batch else 0:.1f})")
+    if mismatches:
+        print(f"❌ FAIL: {mismatches}/{len(raws)} mismatches")
+        sys.exit(1)
+    print(f"✅ PASS: {len(raws)} articles identical")
+
+
+if __name__ == '__main__':
+    main()
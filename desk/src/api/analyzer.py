@@ -90,10 +90,12 @@ def list_articles():
         for article in articles:
             result.append(_format_article_for_list(article, include_text=include_text))
         
+        from src.core.article_registry import get_registry
         return jsonify({
             'success': True,
             'articles': result,
-            'count': len(result)
+            'count': len(result),
+            'warming': get_registry().is_warming()  # 워밍업 중이면 일부 결과
         })
     
     except Exception as e:
@@ -9,6 +9,7 @@ import subprocess
 from flask import Blueprint, request, jsonify, render_template
 
 from src.core import ArticleManager, ArticleState
+from src.core.job_runner import get_job_runner
 
 board_bp = Blueprint('board', __name__)
 manager = ArticleManager()
@@ -88,8 +89,11 @@ def get_overview():
     from src.core.firestore_client import FirestoreClient
     
     # 페이지 오픈 시 다중 시스템 동기화
+    # (Firestore 예상 사용량이 소프트 예산을 넘으면 생략 - firestore_usage)
+    from src.core.firestore_usage import allow_optional
     db = FirestoreClient()
-    db.refresh_remote_hashes()
+    if allow_optional('history hash refresh'):
+        db.refresh_remote_hashes()
     
     limit = int(request.args.get('limit', 50))
     since_str = request.args.get('since')
@@ -144,9 +148,11 @@ def get_overview():
                 'articles': [_format_article_card(a) for a in articles]
             }
         
+        from src.core.article_registry import get_registry
         return jsonify({
             'success': True,
-            'overview': overview
+            'overview': overview,
+            'warming': get_registry().is_warming()  # 워밍업 중이면 일부 결과
         })
     
     except Exception as e:
@@ -278,10 +284,8 @@ def reset_publication(article_id: str):
             from src.core.article_registry import get_registry
             try:
                 registry = get_registry()
-                info = registry.get(article_id)
-                if info:
-                    registry._update_article_state(info, ArticleState.CLASSIFIED.value)
-                    registry._update_local_cache(article_id, ArticleState.CLASSIFIED.value, 'reset-pub', now)
+                registry.apply_state(article_id, ArticleState.CLASSIFIED.value, 'reset-pub',
+                                     updates={'_publication': None})
             except Exception as e:
                 print(f"⚠️ Registry sync failed: {e}")
             
@@ -386,9 +390,11 @@ def get_stats():
         
         stats['total'] = total
         
+        from src.core.article_registry import get_registry
         return jsonify({
             'success': True,
-            'stats': stats
+            'stats': stats,
+            'warming': get_registry().is_warming()
         })
     
     except Exception as e:
@@ -422,6 +428,31 @@ def get_article_raw(article_id):
         }), 500
 
 
+@board_bp.route('/api/article/<article_id>/history', methods=['GET'])
+def get_article_history(article_id):
+    """
+    기사 상태 전이 전체 타임라인 (문서의 최근 기록 + 보관된 오래된 기록)
+    """
+    from src.core.article_registry import get_registry
+    try:
+        timeline = get_registry().get_state_timeline(article_id)
+        if timeline is None:
+            return jsonify({
+                'success': False,
+                'error': 'Article not found'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            **timeline
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 @board_bp.route('/api/board/context/recent', methods=['GET'])
 def get_recent_context():
     """
@@ -464,6 +495,11 @@ def get_recent_context():
         }), 500
 
 
+# 기사마다 저장이 필요한 컬럼 작업 → 백그라운드 작업으로 실행 (src.core.job_runner)
+COLUMN_JOB_ACTIONS = {'reject-all', 'restore-all', 'empty-trash', 'recalculate-scores'}
+COLUMN_ACTION_LIMIT = 500
+
+
 @board_bp.route('/api/board/column-action', methods=['POST'])
 def column_action():
     """
@@ -472,6 +508,10 @@ def column_action():
     Body:
         state: 현재 상태 (collected, analyzed, classified, published, rejected)
         action: 수행할 작업 (analyze-all, classify-all, publish-all, reject-all, empty-trash, restore-all)
+    
+    reject-all / restore-all / empty-trash / recalculate-scores 는 백그라운드 작업으로 등록하고
+    202 + job을 반환합니다. 진행률은 GET /api/board/jobs/<job_id>
+    (같은 컬럼에 진행 중인 작업이 있으면 409 + 그 작업)
     """
     data = request.get_json()
     state = data.get('state')
@@ -484,147 +524,42 @@ def column_action():
         }), 400
     
     try:
-        # 해당 상태의 모든 기사 조회 (소문자 -> 대문자 변환)
         state_enum = ArticleState(state.upper())
-        articles = manager.find_by_state(state_enum, limit=500)
         
-        count = 0
-        message = ''
-        
-        # 작업 수행
-        if action == 'reject-all':
-            # 전체 폐기
-            for art in articles:
-                aid = art.get('_header', {}).get('article_id')
-                if aid:
-                    now = datetime.now(timezone.utc).isoformat()
-                    manager.update_state(aid, ArticleState.REJECTED, by='column-action', 
-                                        section_data={
-                                            'reason': 'manual',
-                                            'rejected_at': now,
-                                            'rejected_by': 'desk_user'
-                                        })
-                    count += 1
-            message = f'{count}개 기사 폐기 완료'
-            
-        elif action == 'restore-all':
-            # 전체 복원 (rejected -> analyzed)
-            for art in articles:
-                aid = art.get('_header', {}).get('article_id')
-                if aid:
-                    manager.update_state(aid, ArticleState.ANALYZED, by='column-action')
-                    count += 1
-            message = f'{count}개 기사 복원 완료'
+        if action in COLUMN_JOB_ACTIONS:
+            if action == 'recalculate-scores':
+                # 점수 재계산 (분석완료/분류됨 상태만 허용)
+                # [FIX] PUBLISHED/RELEASED 제외 - 발행 완료된 기사는 재계산 대상 아님
+                allowed_states = ['ANALYZED', 'CLASSIFIED']
+                if state_enum.value not in allowed_states:
+                    return jsonify({'success': False, 'error': f'재계산은 분석완료/분류됨 상태에서만 가능합니다. (현재: {state_enum.value}) - PUBLISHED/RELEASED는 제외됩니다.'})
             
-        elif action == 'empty-trash':
-            # 휴지통 비우기 (영구 삭제)
-            for art in articles:
-                aid = art.get('_header', {}).get('article_id')
-                if aid:
-                    manager.delete(aid)
-                    count += 1
-            
-            # 레지스트리 새로고침
-            try:
-                from src.core.article_registry import get_registry
-                registry = get_registry()
-                registry.refresh()
-            except Exception as e:
-                print(f"⚠️ [Board] Registry refresh failed: {e}")
-            
-            message = f'{count}개 기사 영구 삭제 완료'
-            
-        elif action == 'analyze-all':
+            params = {
+                'state': state_enum.value,
+                'action': action,
+                'since_hours': data.get('since_hours', 0),
+                'force': bool(data.get('force', False)),
+            }
+            job, created = get_job_runner().submit('column-action', params, lock_key=f'column:{state_enum.value}')
+            if not created:
+                return jsonify({
+                    'success': False,
+                    'error': f'[{state_enum.value}] 컬럼에 진행 중인 작업이 있습니다.',
+                    'job': job
+                }), 409
+            return jsonify({
+                'success': True,
+                'message': f'작업 등록됨 ({job["job_id"]})',
+                'job': job
+            }), 202
+        
+        # 해당 상태의 모든 기사 조회 (안내 메시지용)
+        articles = manager.find_by_state(state_enum, limit=COLUMN_ACTION_LIMIT)
+        
+        if action == 'analyze-all':
             # 전체 분석 - MLL 필요하므로 일단 메시지만 반환
             message = f'전체 분석 기능은 Inspector를 사용해주세요 (현재 {len(articles)}개)'
             
-        elif action == 'recalculate-scores':
-            # 점수 재계산 (분석완료/분류됨 상태만 허용)
-            # [FIX] PUBLISHED/RELEASED 제외 - 발행 완료된 기사는 재계산 대상 아님
-            allowed_states = ['ANALYZED', 'CLASSIFIED']
-            if state.upper() not in allowed_states:
-                return jsonify({'success': False, 'error': f'재계산은 분석완료/분류됨 상태에서만 가능합니다. (현재: {state.upper()}) - PUBLISHED/RELEASED는 제외됩니다.'})
-            
-            # Read time filter if provided
-            since_hours = data.get('since_hours', 0)
-            
-            # Apply time filter to articles
-            if since_hours > 0:
-                since_time = datetime.now(timezone.utc) - timedelta(hours=since_hours)
-                
-                filtered = []
-                for art in articles:
-                    original = art.get('_original', {})
-                    pub_at = original.get('published_at') or original.get('crawled_at')
-                    if pub_at:
-                        try:
-                            if isinstance(pub_at, str):
-                                article_time = datetime.fromisoformat(pub_at.replace('Z', '+00:00'))
-                            else:
-                                article_time = pub_at
-                            if article_time >= since_time:
-                                filtered.append(art)
-                        except:
-                            filtered.append(art)  # 파싱 실패 시 포함
-                    else:
-                        filtered.append(art)  # 시간 정보 없으면 포함
-                articles = filtered
-            
-            from src.core.score_engine import process_raw_analysis
-            
-            scanned = 0
-            updated = 0
-            
-            for art in articles:
-                # article_id는 여러 위치에 있을 수 있음
-                aid = art.get('_header', {}).get('article_id') or art.get('article_id')
-                
-                # mll_raw는 _analysis 안에 있거나 flatten되어 최상위에 있을 수 있음
-                analysis = art.get('_analysis') or {}
-                mll_raw = analysis.get('mll_raw') or art.get('mll_raw')
-                old_score = analysis.get('impact_score') or art.get('impact_score')
-                
-                if aid and mll_raw:
-                    scanned += 1
-                    # 점수 재계산
-                    recalc = process_raw_analysis(mll_raw)
-                    new_score = recalc.get('impact_score')
-                    new_zes = recalc.get('zero_echo_score', 5.0)
-                    
-                    print(f"   📊 [{aid}] IS: {old_score} → {new_score}, ZES: {new_zes}")
-                    
-                    if new_score is not None:
-                        # 점수가 변경된 경우에만 업데이트
-                        old_zes = analysis.get('zero_echo_score') or art.get('zero_echo_score') or 0
-                        
-                        if old_score != new_score or abs(old_zes - new_zes) > 0.01:
-                            updated += 1
-                            
-                            update_data = {
-                                'impact_score': new_score,
-                                'zero_echo_score': new_zes,
-                                'impact_evidence': recalc.get('impact_evidence', {}),
-                                'evidence': recalc.get('evidence', {})
-                            }
-                            
-                            manager.update_analysis(aid, update_data)
-                            count += 1
-                            print(f"      ✅ 업데이트됨")
-                            
-                            # 자동 상태 복원: 데이터 기반으로 최적 상태 결정
-                            from src.core.article_state import get_best_restorable_state
-                            current_state = art.get('_header', {}).get('state') or art.get('state')
-                            best_state = get_best_restorable_state(art)
-                            
-                            if current_state != best_state.value:
-                                manager.update_state(aid, best_state, by='auto-restore')
-                                print(f"      🔄 {best_state.value}로 자동 복원됨")
-                        else:
-                            print(f"      ⏭️ 변경 없음 - 스킵")
-            
-            time_msg = f' ({since_hours}h filter)' if since_hours > 0 else ''
-            message = f'재계산 완료{time_msg}: 총 {scanned}개 검사, {updated}개 점수 변동됨 (전체 처리: {count}개)'
-            
         elif action == 'classify-all':
             # 전체 분류 - 분류 모달 필요하므로 메시지만 반환
             message = f'전체 분류 기능은 📂분류 버튼을 사용해주세요 (현재 {len(articles)}개)'
@@ -646,7 +581,7 @@ def column_action():
         return jsonify({
             'success': True,
             'message': message,
-            'count': count
+            'count': 0
         })
         
     except ValueError:
@@ -661,6 +596,246 @@ def column_action():
         }), 500
 
 
+def _filter_since_hours(articles: list, since_hours: float) -> list:
+    """published_at(없으면 crawled_at) 기준 최근 N시간 기사만 (시간 정보 없거나 파싱 실패 시 포함)"""
+    since_time = datetime.now(timezone.utc) - timedelta(hours=since_hours)
+    
+    filtered = []
+    for art in articles:
+        original = art.get('_original', {})
+        pub_at = original.get('published_at') or original.get('crawled_at')
+        if pub_at:
+            try:
+                if isinstance(pub_at, str):
+                    article_time = datetime.fromisoformat(pub_at.replace('Z', '+00:00'))
+                else:
+                    article_time = pub_at
+                if article_time >= since_time:
+                    filtered.append(art)
+            except:
+                filtered.append(art)  # 파싱 실패 시 포함
+        else:
+            filtered.append(art)  # 시간 정보 없으면 포함
+    return filtered
+
+
+def _run_column_job(ctx) -> str:
+    """
+    컬럼 작업 실행 (백그라운드 작업 핸들러)
+    대상은 실행 시점의 컬럼 상태로 조회 → 재시작 후 다시 실행해도 남은 기사만 처리
+    """
+    params = ctx.params
+    action = params['action']
+    articles = manager.find_by_state(ArticleState(params['state']), limit=COLUMN_ACTION_LIMIT)
+    
+    if action == 'recalculate-scores':
+        return _recalculate_column(ctx, articles)
+    
+    article_ids = [aid for aid in (art.get('_header', {}).get('article_id') for art in articles) if aid]
+    ctx.set_total(len(article_ids))
+    
+    for aid in article_ids:
+        if ctx.cancelled():
+            break
+        try:
+            if action == 'reject-all':
+                # 전체 폐기
+                now = datetime.now(timezone.utc).isoformat()
+                ok = manager.update_state(aid, ArticleState.REJECTED, by='column-action', 
+                                          section_data={
+                                              'reason': 'manual',
+                                              'rejected_at': now,
+                                              'rejected_by': 'desk_user'
+                                          })
+            elif action == 'restore-all':
+                # 전체 복원 (rejected -> analyzed)
+                ok = manager.update_state(aid, ArticleState.ANALYZED, by='column-action')
+            else:
+                # 휴지통 비우기 (영구 삭제)
+                ok = manager.delete(aid)
+            ctx.step(aid, error=None if ok else ('delete failed' if action == 'empty-trash' else 'state change rejected'))
+        except Exception as e:
+            ctx.step(aid, error=str(e))
+    
+    count = ctx.job['succeeded']
+    labels = {'reject-all': '폐기', 'restore-all': '복원', 'empty-trash': '영구 삭제'}
+    return f'{count}개 기사 {labels[action]} 완료'
+
+
+def _recalculate_column(ctx, articles: list) -> str:
+    """점수 재계산 (지문이 같은 기사는 스킵, 변경분만 청크 단위로 일괄 저장)"""
+    from src.core.score_rescorer import rescore_articles, CHUNK_SIZE
+    params = ctx.params
+    since_hours = params.get('since_hours') or 0
+    if since_hours > 0:
+        articles = _filter_since_hours(articles, since_hours)
+    ctx.set_total(len(articles))
+    
+    totals = {'scanned': 0, 'updated': 0, 'skipped': 0}
+    for start in range(0, len(articles), CHUNK_SIZE):
+        if ctx.cancelled():
+            break
+        chunk = articles[start:start + CHUNK_SIZE]
+        stats = rescore_articles(chunk, manager, force=params.get('force', False))
+        for key in totals:
+            totals[key] += stats[key]
+        ctx.step(count=len(chunk))
+    
+    time_msg = f' ({since_hours}h filter)' if since_hours > 0 else ''
+    return f'재계산 완료{time_msg}: 총 {totals["scanned"]}개 검사, {totals["updated"]}개 점수 변동됨, {totals["skipped"]}개 변경 없음 스킵'
+
+
+def _run_rescore_job(ctx) -> str:
+    """전체 점수 재계산 (백그라운드 작업 핸들러) - 컬럼 기사 전체 대상"""
+    from src.core.score_rescorer import RESCORE_LIMIT
+    articles = manager.find_by_state(ArticleState(ctx.params['state']), limit=RESCORE_LIMIT)
+    return _recalculate_column(ctx, articles)
+
+
+get_job_runner().register('column-action', _run_column_job)
+get_job_runner().register('rescore', _run_rescore_job)
+
+
+@board_bp.route('/api/board/jobs', methods=['GET'])
+def list_jobs():
+    """
+    최근 백그라운드 작업 목록
+    
+    Query:
+        state: 컬럼 상태로 필터 (선택)
+        limit: 최대 개수 (기본 20)
+    """
+    state = request.args.get('state')
+    lock_key = f'column:{state.upper()}' if state else None
+    return jsonify({
+        'success': True,
+        'jobs': get_job_runner().list_jobs(limit=request.args.get('limit', 20, type=int), lock_key=lock_key)
+    })
+
+
+@board_bp.route('/api/board/jobs/<job_id>', methods=['GET'])
+def get_job(job_id: str):
+    """백그라운드 작업 진행률 조회"""
+    job = get_job_runner().get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': f'Job not found: {job_id}'}), 404
+    return jsonify({'success': True, 'job': job})
+
+
+@board_bp.route('/api/board/jobs/<job_id>/cancel', methods=['POST'])
+def cancel_job(job_id: str):
+    """백그라운드 작업 취소 (처리한 기사는 되돌리지 않음)"""
+    job = get_job_runner().cancel(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': f'Job not found: {job_id}'}), 404
+    if not job['cancel_requested']:
+        return jsonify({'success': False, 'error': f'이미 끝난 작업입니다. ({job["status"]})', 'job': job}), 409
+    return jsonify({'success': True, 'job': job})
+
+
+
+@board_bp.route('/api/board/rescore', methods=['POST'])
+def start_rescore():
+    """
+    전체 점수 재계산 시작 (공식 변경 시, 컬럼별 백그라운드 작업)
+    
+    컬럼 작업과 같은 lock_key(column:<STATE>)로 등록하므로 같은 컬럼의 폐기/복원 작업과 동시에 실행되지 않습니다.
+    진행률은 GET /api/board/rescore/status 또는 GET /api/board/jobs/<job_id>
+    
+    Body:
+        force: True면 지문이 같아도 전부 재계산 (기본: 엔진 버전/mll_raw 변경분만)
+    """
+    from src.core.score_rescorer import RESCORE_STATES
+    data = request.get_json(silent=True) or {}
+    force = bool(data.get('force', False))
+    
+    jobs, busy = [], []
+    for state in RESCORE_STATES:
+        job, created = get_job_runner().submit('rescore', {'state': state, 'force': force},
+                                               lock_key=f'column:{state}')
+        (jobs if created else busy).append(job)
+    
+    if not jobs:
+        return jsonify({
+            'success': False,
+            'error': '재계산 대상 컬럼에 진행 중인 작업이 있습니다.',
+            'jobs': busy
+        }), 409
+    
+    return jsonify({
+        'success': True,
+        'message': f'재계산 작업 등록됨 ({", ".join(job["job_id"] for job in jobs)})',
+        'jobs': jobs,
+        'busy': busy
+    }), 202
+
+
+@board_bp.route('/api/board/rescore/status', methods=['GET'])
+def get_rescore_status():
+    """전체 점수 재계산 진행률 조회 (컬럼별 최근 재계산 작업)"""
+    from src.core.score_rescorer import RESCORE_STATES
+    runner = get_job_runner()
+    jobs = {}
+    for state in RESCORE_STATES:
+        recent = [job for job in runner.list_jobs(lock_key=f'column:{state}') if job['kind'] == 'rescore']
+        jobs[state] = recent[0] if recent else None
+    return jsonify({
+        'success': True,
+        'jobs': jobs
+    })
+
+
+@board_bp.route('/api/board/cutline-simulate', methods=['GET', 'POST'])
+def simulate_cutline():
+    """
+    커트라인 What-if 시뮬레이션 (기사 상태 변경 없음)
+    
+    Params (query 또는 JSON body):
+        max_zes: ZES 상한 (초과 시 배제, 기본: 현재 설정)
+        min_is: IS 하한 (미만 시 배제, 기본: 현재 설정)
+        states: 대상 상태 (쉼표 구분 또는 리스트, 기본: 점수 보유 전체)
+        sweep: ZES 상한 후보 목록 (쉼표 구분 또는 리스트) → 배제 수 곡선
+        reload: true면 캐시 재스캔
+    """
+    try:
+        from src.core.cutline_simulator import get_score_corpus
+        params = request.get_json(silent=True) or request.args.to_dict()
+        
+        def as_list(value):
+            if value is None or isinstance(value, list):
+                return value
+            return [v.strip() for v in str(value).split(',') if v.strip()]
+        
+        max_zes = params.get('max_zes')
+        min_is = params.get('min_is')
+        states = as_list(params.get('states'))
+        
+        corpus = get_score_corpus()
+        if str(params.get('reload', '')).lower() == 'true':
+            corpus.load()
+        
+        result = corpus.simulate(
+            max_zes=float(max_zes) if max_zes not in (None, '') else None,
+            min_is=float(min_is) if min_is not in (None, '') else None,
+            states=states
+        )
+        
+        sweep = as_list(params.get('sweep'))
+        if sweep:
+            result['sweep'] = corpus.sweep(
+                [float(v) for v in sweep],
+                min_is=result['thresholds']['min_is'],
+                states=states
+            )
+        
+        return jsonify({'success': True, **result})
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 
 @board_bp.route('/api/board/send-back', methods=['POST'])
 def send_back_articles():
@@ -807,11 +982,13 @@ def get_orphan_articles():
                 card['recoverable_to'] = best_state.value
                 unlinked.append(card)
         
+        from src.core.article_registry import get_registry
         return jsonify({
             'success': True,
             'orphans': unlinked,
             'count': len(unlinked),
-            'valid_editions': list(valid_editions)
+            'valid_editions': list(valid_editions),
+            'warming': get_registry().is_warming()
         })
     
     except Exception as e:
@@ -954,19 +1131,17 @@ def get_inconsistent_articles():
         # 히스토리 상태 로드
         history_statuses = {}
         try:
-            history_doc = db._get_collection('history').document('urls').get()
-            if history_doc.exists:
-                urls_data = history_doc.to_dict() or {}
-                for key, val in urls_data.items():
-                    if isinstance(val, dict) and 'article_id' in val:
-                        history_statuses[val['article_id']] = val.get('status', '')
+            urls_data = db.get_history_index().get('urls', {})  # 바뀐 샤드만 읽음
+            for key, val in urls_data.items():
+                if isinstance(val, dict) and 'article_id' in val:
+                    history_statuses[val['article_id']] = val.get('status', '')
             print(f"   📊 Loaded {len(history_statuses)} history records")
         except Exception as e:
             print(f"   ⚠️ History load failed: {e}")
         
         for state in states_to_check:
             try:
-                articles = db.list_articles_by_state(state, limit=500)
+                articles = db.list_articles_by_state(state, limit=500, include_content=True)
                 print(f"   🔹 [{state}] Found {len(articles)} articles")
                 
                 for article in articles:
@@ -1098,6 +1273,8 @@ def recover_inconsistent_articles():
     """
     from src.core.article_state import get_best_restorable_state
     from src.core.firestore_client import FirestoreClient
+    from src.core.article_registry import get_registry
+    from src.core.state_history import append_transition
     from datetime import datetime, timezone, timedelta
     
     def get_kst_now():
@@ -1119,18 +1296,16 @@ def recover_inconsistent_articles():
             # 히스토리 상태 로드
             history_statuses = {}
             try:
-                history_doc = db._get_collection('history').document('urls').get()
-                if history_doc.exists:
-                    urls_data = history_doc.to_dict() or {}
-                    for key, val in urls_data.items():
-                        if isinstance(val, dict) and 'article_id' in val:
-                            history_statuses[val['article_id']] = val.get('status', '')
+                urls_data = db.get_history_index().get('urls', {})
+                for key, val in urls_data.items():
+                    if isinstance(val, dict) and 'article_id' in val:
+                        history_statuses[val['article_id']] = val.get('status', '')
             except Exception:
                 pass
             
             for state in states_to_check:
                 try:
-                    articles = db.list_articles_by_state(state, limit=500)
+                    articles = db.list_articles_by_state(state, limit=500, include_content=True)
                     
                     for article in articles:
                         article_id = article.get('_header', {}).get('article_id') or article.get('id')
@@ -1233,13 +1408,13 @@ def recover_inconsistent_articles():
                         article['_publication'] = None  # 또는 del article['_publication']
                         print(f"   🧹 Cleared _publication for {article_id}")
                 
-                if 'state_history' not in article['_header']:
-                    article['_header']['state_history'] = []
-                article['_header']['state_history'].append({
+                archived = append_transition(article['_header'], {
                     'state': best_state.value,
                     'at': now,
                     'by': 'data_integrity_recovery'
                 })
+                if archived is not None:
+                    get_registry().archive_history(article_id, archived)
                 
                 db.save_article(article_id, article)
                 
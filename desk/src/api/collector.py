@@ -98,7 +98,7 @@ def run_collector():
             q.put(None) # Sentinel to stop generator
 
     # Start Worker Thread
-    thread = threading.Thread(target=worker)
+    thread = threading.Thread(target=worker, name='collector')
     thread.start()
     
     def generate():
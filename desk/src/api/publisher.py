@@ -117,7 +117,8 @@ def list_articles():
             'articles': result,
             'count': len(result),
             'source': 'registry',
-            'filtered_by_since': since_str is not None
+            'filtered_by_since': since_str is not None,
+            'warming': registry.is_warming()  # 워밍업 중이면 일부 결과
         })
     
     except Exception as e:
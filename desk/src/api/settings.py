@@ -16,6 +16,14 @@ CRAWLER_CONFIG_DIR = os.path.join(
 SCHEDULES_FILE = os.path.join(CRAWLER_CONFIG_DIR, 'schedules.json')
 
 
+def _crawler_core():
+    """크롤러 core 모듈 (스케줄러와 같은 구현 사용: 실행 옵션 / 실행 이력)"""
+    from src.api.collector import _setup_paths
+    _setup_paths()
+    from core import job_supervisor, logger
+    return job_supervisor, logger
+
+
 # =============================================================================
 # Views
 # =============================================================================
@@ -69,6 +77,9 @@ def update_schedule(schedule_id: str):
                     schedule['description'] = data['description']
                 if 'discord' in data:
                     schedule['discord'] = data['discord']
+                for key in ('overlap', 'timeout_minutes', 'max_memory_mb'):
+                    if key in data:
+                        schedule[key] = data[key]
                 break
         else:
             return jsonify({
@@ -76,6 +87,10 @@ def update_schedule(schedule_id: str):
                 'error': f'Schedule not found: {schedule_id}'
             }), 404
         
+        error = _validate_run_options(schedule)
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
+        
         _save_schedules(schedules)
         
         return jsonify({
@@ -106,8 +121,16 @@ def create_schedule():
             'enabled': data.get('enabled', True),
             'phases': data.get('phases', ['collect', 'extract']),
             'description': data.get('description', ''),
-            'discord': data.get('discord', False)
+            'discord': data.get('discord', False),
+            'overlap': data.get('overlap', 'skip')
         }
+        for key in ('timeout_minutes', 'max_memory_mb'):
+            if key in data:
+                new_schedule[key] = data[key]
+        
+        error = _validate_run_options(new_schedule)
+        if error:
+            return jsonify({'success': False, 'error': error}), 400
         
         schedules.append(new_schedule)
         _save_schedules(schedules)
@@ -153,6 +176,30 @@ def delete_schedule(schedule_id: str):
         }), 500
 
 
+@settings_bp.route('/api/settings/schedule-runs', methods=['GET'])
+def get_schedule_runs():
+    """
+    스케줄 실행 이력 (최신순)
+    
+    Query:
+        schedule_id: 스케줄 ID로 필터 (선택)
+        limit: 최대 개수 (기본 50)
+    """
+    try:
+        schedule_id = request.args.get('schedule_id')
+        limit = request.args.get('limit', 50, type=int)
+        _, logger = _crawler_core()
+        return jsonify({
+            'success': True,
+            'runs': logger.get_schedule_runs(limit=limit, schedule_id=schedule_id)
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 # =============================================================================
 # Firestore Usage Stats
 # =============================================================================
@@ -162,10 +209,13 @@ def get_firebase_stats():
     """Firebase 사용량 통계"""
     try:
         from src.core import FirestoreClient
+        from src.core.firestore_usage import get_usage_ledger
         stats = FirestoreClient.get_usage_stats()
         return jsonify({
             'success': True,
-            'stats': stats
+            'stats': stats,
+            # 출처(라우트/파이프라인 단계/작업)별 집계 + 일일 한도 예측 (재시작 후에도 유지)
+            'usage': get_usage_ledger().report()
         })
     except Exception as e:
         return jsonify({
@@ -191,6 +241,47 @@ def reset_firebase_stats():
         }), 500
 
 
+# =============================================================================
+# Firestore Outbox
+# =============================================================================
+
+@settings_bp.route('/api/settings/outbox', methods=['GET'])
+def get_outbox_status():
+    """Firestore 쓰기 대기열 상태 (대기/dead 항목 수, 가장 오래된 항목 나이, 재시도 대기)"""
+    try:
+        from src.core.firestore_outbox import get_outbox
+        return jsonify({
+            'success': True,
+            'outbox': get_outbox().get_status()
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@settings_bp.route('/api/settings/outbox/drain', methods=['POST'])
+def drain_outbox():
+    """Firestore 쓰기 대기열 즉시 반영 (body: {"retry_dead": true}면 dead 항목도 재시도)"""
+    try:
+        from src.core.firestore_outbox import get_outbox
+        data = request.get_json(silent=True) or {}
+        outbox = get_outbox()
+        result = outbox.drain(retry_dead=bool(data.get('retry_dead')))
+        return jsonify({
+            'success': result['error'] is None,
+            'result': result,
+            'outbox': outbox.get_status(),
+            'error': result['error']
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
@@ -204,6 +295,18 @@ def _load_schedules() -> list:
     return []
 
 
+def _validate_run_options(schedule: dict) -> str:
+    """실행 옵션 검증 (오류 메시지, 정상이면 빈 문자열) - timeout_minutes / max_memory_mb는 0이면 제한 없음"""
+    job_supervisor, _ = _crawler_core()
+    if schedule.get('overlap', 'skip') not in job_supervisor.OVERLAP_POLICIES:
+        return f"overlap must be one of {', '.join(job_supervisor.OVERLAP_POLICIES)}"
+    for key in ('timeout_minutes', 'max_memory_mb'):
+        value = schedule.get(key)
+        if value is not None and (not isinstance(value, (int, float)) or value < 0):
+            return f'{key} must be a non-negative number'
+    return ''
+
+
 def _save_schedules(schedules: list):
     """스케줄 설정 파일 저장"""
     os.makedirs(CRAWLER_CONFIG_DIR, exist_ok=True)
@@ -4,9 +4,9 @@ Trend Reporter API - 주간 트렌드 리포트 생성용 API
 """
 from datetime import datetime, timezone, timedelta
 from flask import Blueprint, request, jsonify
-from collections import Counter
 
 from src.core.article_manager import ArticleManager
+from src.core.trend_rollup import get_trend_rollup_store, tag_cooccurrence, tag_growth
 from src.core_logic import get_kst_now
 
 trend_reporter_bp = Blueprint('trend_reporter', __name__)
@@ -44,49 +44,36 @@ def generate_trend_prompt():
         else:
             # 기존 days 파라미터 사용
             days = int(request.args.get('days', 7))
-            end_date = datetime.now(timezone.utc)
+            end_date = datetime.now(timezone.utc) + timedelta(days=1)  # 오늘 포함
             start_date = end_date - timedelta(days=days)
         
-        # 1. 최근 발행된 회차 목록 조회
-        editions = manager.get_editions(limit=50)  # 넉넉하게 조회
+        # 1. 기간 문자열 (양 끝 포함)
+        start_day = start_date.strftime('%Y-%m-%d')
+        end_day = (end_date - timedelta(days=1)).strftime('%Y-%m-%d')
         
-        # 2. 기간 내 회차 필터링
-        filtered_editions = []
-        for ed in editions:
-            pub_at = ed.get('published_at', '')
-            if pub_at:
-                try:
-                    # ISO 형식 파싱
-                    if isinstance(pub_at, str):
-                        pub_dt = datetime.fromisoformat(pub_at.replace('Z', '+00:00'))
-                    else:
-                        pub_dt = pub_at
-                    
-                    if start_date <= pub_dt <= end_date:
-                        filtered_editions.append(ed)
-                except:
-                    pass
-        
-        # 3. 해당 회차들의 기사 수집
-        all_articles = []
-        for ed in filtered_editions:
-            edition_code = ed.get('edition_code') or ed.get('code')
-            if edition_code:
-                articles = manager.get_edition_articles(edition_code)
-                all_articles.extend(articles)
+        # 2. 일자별 집계 병합 (집계가 없으면 기존 회차에서 1회 백필)
+        store = get_trend_rollup_store()
+        store.ensure_backfill(manager)
+        merged = store.merge_range(start_day, end_day)
+        all_articles = merged['articles']
         
         if not all_articles:
             return jsonify({
                 'success': False,
-                'error': f'최근 {days}일 내 발행된 기사가 없습니다.'
+                'error': f'{start_day} ~ {end_day} 기간 내 발행된 기사가 없습니다.'
             })
         
-        # 4. 태그 빈도 집계
-        tag_counter = Counter()
-        for art in all_articles:
-            tags = art.get('tags') or []
-            if isinstance(tags, list):
-                tag_counter.update(tags)
+        # 3. 태그 빈도 (집계 병합 결과)
+        tag_counter = merged['tag_counts']
+        
+        # 4. 동시 출현 / 직전 기간 대비 증감 (직전 동일 길이 기간)
+        span = (datetime.strptime(end_day, '%Y-%m-%d') - datetime.strptime(start_day, '%Y-%m-%d')).days + 1
+        prev_end = datetime.strptime(start_day, '%Y-%m-%d') - timedelta(days=1)
+        prev_start = prev_end - timedelta(days=span - 1)
+        previous = store.merge_range(prev_start.strftime('%Y-%m-%d'), prev_end.strftime('%Y-%m-%d'))
+        
+        cooccurrence = tag_cooccurrence(all_articles)
+        growth = tag_growth(tag_counter, previous['tag_counts'])
         
         # 5. 기사 목록 포맷팅
         article_entries = []
@@ -107,10 +94,16 @@ def generate_trend_prompt():
         # 6. 태그 통계 포맷팅
         top_tags = tag_counter.most_common(10)
         tag_stats_lines = [f"- {tag}: {count}건" for tag, count in top_tags]
+        cooccurrence_lines = [f"- {' + '.join(c['tags'])}: {c['count']}건" for c in cooccurrence] or ['- (없음)']
+        growth_lines = []
+        for g in growth:
+            rate = '신규' if g['growth'] is None else f"{g['growth'] * 100:+.0f}%"
+            growth_lines.append(f"- {g['tag']}: {g['previous']}건 → {g['count']}건 ({rate})")
+        growth_lines = growth_lines or ['- (없음)']
         
         # 7. 프롬프트 생성
-        start_str = start_date.strftime('%Y-%m-%d')
-        end_str = (end_date - timedelta(days=1)).strftime('%Y-%m-%d')  # end_date에서 +1일 했으므로 원복
+        start_str = start_day
+        end_str = end_day
         
         prompt_text = f"""아래는 {start_str} ~ {end_str} 기간 동안 수집된 AI 뉴스 기사 요약 목록입니다.
 이 데이터를 분석하여 주간 트렌드 리포트를 작성해주세요.
@@ -124,6 +117,14 @@ def generate_trend_prompt():
 [태그별 빈도]
 {chr(10).join(tag_stats_lines)}
 
+---
+[함께 등장한 태그]
+{chr(10).join(cooccurrence_lines)}
+
+---
+[직전 {span}일 대비 태그 증감]
+{chr(10).join(growth_lines)}
+
 ---
 위 정보를 바탕으로 JSON 형식의 주간 트렌드 리포트를 작성해주세요.
 
@@ -156,8 +157,11 @@ def generate_trend_prompt():
 
 응답은 반드시 JSON 형식으로 제공하세요.""",
             'article_count': len(all_articles),
-            'edition_count': len(filtered_editions),
+            'edition_count': len(merged['edition_codes']),
             'tag_stats': dict(tag_counter),  # 전체 태그 카운트 (저장용)
+            'category_stats': dict(merged['category_counts']),
+            'tag_cooccurrence': cooccurrence,
+            'tag_growth': growth,
             'period': {
                 'start': start_str,
                 'end': end_str
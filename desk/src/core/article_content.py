@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Article Content - Firestore 기사 문서를 가벼운 카드 + 무거운 본문 문서로 분리
+
+보드/통계/목록 쿼리는 헤더, 점수, 태그, 제목만 쓰는데 기사 문서마다
+_original.text와 _analysis.mll_raw가 함께 내려옵니다.
+본문 필드(CONTENT_FIELDS)는 같은 article_id의 article_contents/{article_id} 문서로 옮기고
+카드(articles/{article_id})에는 본문 요약만 남깁니다.
+
+    카드:  {..., '_header': {..., 'content': {'rev': <본문 해시>, 'fields': [...], 'bytes': n}}}
+    본문:  {'_original': {'text': ...}, '_analysis': {'mll_raw': ...}}
+
+- 읽기: _header.content가 없는 문서는 분리 전 형식 (문서 자체가 전체 데이터, 호환 경로)
+        목록 쿼리는 카드만, FirestoreClient.get_article / attach_content가 본문을 합침
+- 쓰기 (FirestoreClient): 전체 저장은 카드 set(merge) + 본문 set, 카드에 남은 본문 필드는 DELETE_FIELD
+                         변경 필드 저장은 바뀐 본문 필드만 본문 문서에 update
+                         (본문 문서가 없는 분리 전 기사는 NotFound → 전체 저장으로 분리)
+- 레지스트리는 로컬 사본의 본문 해시가 카드의 rev와 같으면 본문 문서를 읽지 않음
+- 기존 문서 이전: scripts/migrate_article_content.py
+
+FIRESTORE_CONTENT_SPLIT (기본 true): false이면 기존처럼 한 문서에 저장 (읽기는 두 형식 모두 지원)
+"""
+import os
+import json
+import hashlib
+from typing import Dict, Any, List, Optional, Tuple
+
+CONTENTS_COLLECTION = 'article_contents'
+
+# 카드에서 빼는 본문 필드 (점 표기)
+CONTENT_FIELDS = (
+    '_original.text',
+    '_original.html',
+    '_original.raw_html',
+    '_original.content',
+    '_analysis.mll_raw',
+)
+
+_MISSING = object()
+
+
+def is_content_split_enabled() -> bool:
+    return os.getenv('FIRESTORE_CONTENT_SPLIT', 'true').lower() == 'true'
+
+
+def _get(data: Dict[str, Any], path: str):
+    section, key = path.split('.', 1)
+    value = data.get(section)
+    if not isinstance(value, dict) or key not in value:
+        return _MISSING
+    return value[key]
+
+
+def extract_content(data: Dict[str, Any]) -> Dict[str, Any]:
+    """본문 필드만 담은 중첩 dict (본문 문서 형식)"""
+    content: Dict[str, Any] = {}
+    for path in CONTENT_FIELDS:
+        value = _get(data, path)
+        if value is not _MISSING:
+            section, key = path.split('.', 1)
+            content.setdefault(section, {})[key] = value
+    return content
+
+
+def content_rev(data: Dict[str, Any]) -> str:
+    """본문 필드 해시 (카드의 _header.content.rev와 비교)"""
+    encoded = json.dumps(extract_content(data), ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.md5(encoded.encode('utf-8')).hexdigest()[:12]
+
+
+def content_marker(data: Dict[str, Any]) -> Dict[str, Any]:
+    content = extract_content(data)
+    fields = [path for path in CONTENT_FIELDS if _get(content, path) is not _MISSING]
+    return {
+        'rev': content_rev(data),
+        'fields': fields,
+        'bytes': len(json.dumps(content, ensure_ascii=False, default=str).encode('utf-8')),
+    }
+
+
+def is_split(data: Optional[Dict[str, Any]]) -> bool:
+    """본문이 분리된 카드인지 (분리 전 문서는 False)"""
+    return bool(data) and isinstance((data.get('_header') or {}).get('content'), dict)
+
+
+def needs_content(data: Optional[Dict[str, Any]]) -> bool:
+    """카드에 본문이 아직 합쳐지지 않았는지"""
+    if not is_split(data):
+        return False
+    return any(_get(data, path) is _MISSING for path in data['_header']['content'].get('fields') or [])
+
+
+def is_full_document(data: Dict[str, Any]) -> bool:
+    """전체 기사 데이터인지 (_header + _original) - 부분 payload로 본문 요약을 다시 계산하면 빈 요약이 됨"""
+    return isinstance(data.get('_header'), dict) and isinstance(data.get('_original'), dict)
+
+
+def split_article(data: Dict[str, Any], delete_value=None,
+                  marker: bool = True) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    전체 데이터 → (카드, 본문) - 원본은 변경하지 않음
+
+    Args:
+        delete_value: 카드의 본문 필드 자리에 넣을 삭제 값 (firestore DELETE_FIELD, 분리 전 문서 정리용)
+        marker: False면 카드에 본문 요약(_header.content)을 넣지 않음 (부분 payload)
+    """
+    card = dict(data)
+    for section in {path.split('.', 1)[0] for path in CONTENT_FIELDS}:
+        value = data.get(section)
+        if not isinstance(value, dict):
+            continue
+        stripped = dict(value)
+        for path in CONTENT_FIELDS:
+            prefix, key = path.split('.', 1)
+            if prefix != section:
+                continue
+            stripped.pop(key, None)
+            if delete_value is not None:
+                stripped[key] = delete_value
+        card[section] = stripped
+    if marker:
+        card['_header'] = dict(data.get('_header') or {})
+        card['_header']['content'] = content_marker(data)
+    return card, extract_content(data)
+
+
+def merge_content(card: Dict[str, Any], content: Dict[str, Any]) -> Dict[str, Any]:
+    """카드에 본문 필드 채우기 (card를 제자리에서 갱신, 섹션은 새 dict로 교체)"""
+    for section, fields in (content or {}).items():
+        if not isinstance(fields, dict):
+            continue
+        current = card.get(section)
+        merged = dict(current) if isinstance(current, dict) else {}
+        merged.update(fields)
+        card[section] = merged
+    return card
+
+
+def _covers(path: str, field: str) -> bool:
+    return field == path or field.startswith(path + '.')
+
+
+def split_diff(diff: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    """
+    article_diff 변경분 → (카드 변경분, 본문 변경 여부)
+    본문 필드를 포함하는 상위 경로가 통째로 바뀌면 본문도 바뀐 것으로 봄 (카드 값에서는 본문 필드 제외)
+    """
+    card = {'set': {}, 'append': {}}
+    changed = False
+    for kind in ('set', 'append'):
+        for path, value in (diff.get(kind) or {}).items():
+            if any(_covers(field, path) for field in CONTENT_FIELDS):
+                changed = True  # 본문 필드 자체 또는 그 하위
+                continue
+            if _covers('_header.content', path):
+                continue  # 카드의 본문 요약은 저장 시 다시 계산
+            below = [field for field in CONTENT_FIELDS if _covers(path, field)]
+            if kind == 'set' and below:
+                changed = True
+                if isinstance(value, dict):
+                    value = _without(value, path, below)
+            if kind == 'set' and _covers(path, '_header.content') and isinstance(value, dict):
+                value = _without(value, path, ['_header.content'])
+            card[kind][path] = value
+    return card, changed
+
+
+def changed_content_fields(diff: Dict[str, Any]) -> List[str]:
+    """변경분이 건드린 본문 필드 (본문 필드 자체, 그 하위, 또는 본문 필드를 포함하는 상위 경로)"""
+    paths = [path for kind in ('set', 'append') for path in (diff.get(kind) or {})]
+    return [field for field in CONTENT_FIELDS
+            if any(_covers(field, path) or _covers(path, field) for path in paths)]
+
+
+def content_updates(data: Dict[str, Any], fields: List[str], delete_value=None) -> Dict[str, Any]:
+    """본문 문서 update() 인자 - 바뀐 본문 필드만 (점 표기, 없어진 필드는 delete_value)"""
+    updates = {}
+    for field in fields:
+        value = _get(data, field)
+        if value is not _MISSING:
+            updates[field] = value
+        elif delete_value is not None:
+            updates[field] = delete_value
+    return updates
+
+
+def stale_fields(paths) -> List[str]:
+    """변경 경로에 덮이지 않은 본문 필드 (분리 전 카드에 남은 값을 지울 대상)"""
+    return [field for field in CONTENT_FIELDS if not any(_covers(path, field) for path in paths)]
+
+
+def _without(value: Dict[str, Any], path: str, fields: List[str]) -> Dict[str, Any]:
+    """path 위치의 값(value)에서 fields 경로 제거 (복사본)"""
+    value = dict(value)
+    for field in fields:
+        parts = field[len(path) + 1:].split('.')
+        target = value
+        for part in parts[:-1]:
+            if not isinstance(target.get(part), dict):
+                target = None
+                break
+            target[part] = dict(target[part])
+            target = target[part]
+        if target is not None:
+            target.pop(parts[-1], None)
+    return value
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+Article Diff - 마지막으로 저장된 기사 대비 변경된 필드 경로만 계산
+
+상태 변경마다 _original.text, state_history 전체를 다시 보내지 않도록
+이전 버전(base)과 새 버전을 비교해 Firestore update()에 넘길 변경분을 만듭니다.
+
+diff 형식 (JSON 직렬화 가능 - Firestore outbox에 그대로 저장):
+    {'set': {'_header.state': 'ANALYZED', '_analysis': {...}},
+     'append': {'_header.state_history': [{...}]}}
+
+- dict는 하위 키 단위로 비교 (점 표기 경로), 단순 식별자가 아닌 키는 상위 값을 통째로 교체
+- list는 이전 목록이 앞부분 그대로면 추가분만 append (FirestoreClient가 ArrayUnion으로 반영)
+- 새 버전에서 사라진 키는 삭제하지 않음 (기존 set(merge=True)와 같은 의미)
+- 변경 경로가 DIFF_MAX_PATHS를 넘으면 None → 전체 저장
+
+FIRESTORE_FIELD_DIFF (기본 true): false이면 항상 전체 저장
+"""
+import os
+import re
+from typing import Dict, Any, List, Optional
+
+DIFF_MAX_PATHS = 200
+
+_SIMPLE_KEY = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_MISSING = object()
+
+
+def is_field_diff_enabled() -> bool:
+    return os.getenv('FIRESTORE_FIELD_DIFF', 'true').lower() == 'true'
+
+
+def _walk(base: Dict[str, Any], data: Dict[str, Any], prefix: str, diff: Dict[str, Dict[str, Any]]):
+    for key, value in data.items():
+        path = f'{prefix}{key}'
+        old = base.get(key, _MISSING)
+        if old is not _MISSING and old == value:
+            continue
+        if isinstance(value, dict) and isinstance(old, dict) and value and all(_SIMPLE_KEY.match(k) for k in value):
+            _walk(old, value, f'{path}.', diff)
+        elif (isinstance(value, list) and isinstance(old, list) and old
+              and len(value) > len(old) and value[:len(old)] == old):
+            diff['append'][path] = value[len(old):]
+        else:
+            diff['set'][path] = value
+
+
+def diff_article(base: Optional[Dict[str, Any]], data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    base → data 변경분
+
+    Returns:
+        diff (변경 없으면 빈 set/append), 비교할 수 없거나 경로가 너무 많으면 None (전체 저장)
+    """
+    if not base or not isinstance(base, dict) or '_header' not in base:
+        return None
+    if not all(_SIMPLE_KEY.match(k) for k in data):
+        return None
+    diff = {'set': {}, 'append': {}}
+    _walk(base, data, '', diff)
+    if len(diff['set']) + len(diff['append']) > DIFF_MAX_PATHS:
+        return None
+    return diff
+
+
+def is_empty(diff: Dict[str, Any]) -> bool:
+    return not diff.get('set') and not diff.get('append')
+
+
+def get_path(data: Dict[str, Any], path: str):
+    value = data
+    for part in path.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _covered(path: str, paths) -> bool:
+    """path 자신 또는 상위 경로가 paths에 있는지"""
+    parts = path.split('.')
+    return any('.'.join(parts[:i]) in paths for i in range(1, len(parts) + 1))
+
+
+def merge_diffs(diffs: List[Dict[str, Any]], latest: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    연속된 diff를 하나로 합침 (outbox에서 같은 기사 항목을 한 번에 반영할 때)
+    set 경로 값은 최신 전체 데이터에서 가져오고, set에 덮이지 않은 append는 순서대로 이어 붙임
+
+    Returns:
+        합친 diff, 최신 데이터에서 경로를 찾을 수 없으면 None (전체 저장)
+    """
+    set_paths = set()
+    for diff in diffs:
+        set_paths.update(diff.get('set') or {})
+    # 상위 경로가 함께 있으면 상위만 (Firestore는 겹치는 경로 update를 거부)
+    roots = {p for p in set_paths if not _covered(p, set_paths - {p})}
+
+    merged = {'set': {}, 'append': {}}
+    for path in sorted(roots):
+        value = get_path(latest, path)
+        if value is _MISSING:
+            return None
+        merged['set'][path] = value
+    for diff in diffs:
+        for path, items in (diff.get('append') or {}).items():
+            if not _covered(path, roots):
+                merged['append'].setdefault(path, []).extend(items)
+    return merged
@@ -4,12 +4,13 @@ Article Manager - 기사 중앙 관리 시스템
 모든 기사 CRUD 및 상태 전이의 단일 진입점
 """
 import os
-import hashlib
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 
 from .article_state import ArticleState, can_transition
 from .firestore_client import FirestoreClient
+from .firestore_usage import allow_optional
+from .url_canonical import article_id_for, legacy_keys
 from src.core_logic import get_kst_now
 
 
@@ -37,11 +38,9 @@ class ArticleManager:
     # =========================================================================
     
     @staticmethod
-    def generate_article_id(url: str) -> str:
-        """URL에서 article_id 생성 (12자리 MD5 해시)"""
-        # URL 정규화: 끝 슬래시 제거하여 일관된 ID 생성
-        normalized_url = url.rstrip('/')
-        return hashlib.md5(normalized_url.encode()).hexdigest()[:12]
+    def generate_article_id(url: str, canonical_url: str = None) -> str:
+        """URL에서 article_id 생성 (정규 URL의 12자리 MD5 해시, url_canonical)"""
+        return article_id_for(url, canonical_url)
     
     # =========================================================================
     # CRUD Operations
@@ -77,11 +76,7 @@ class ArticleManager:
                 registry = get_registry()
                 if registry.is_initialized():
                     # Register to memory cache (without re-saving to Firestore)
-                    info = registry._parse_article_data(article)
-                    if info and info.article_id not in registry._articles:
-                        info.firestore_synced = True
-                        registry._register_article(info, source='lazy_firestore')
-                        registry._full_data[info.article_id] = article
+                    if registry.get(article_id) is None and registry.cache_article(article):
                         print(f"📥 [Lazy Load] Cached from Firestore: {article_id}")
             except Exception as e:
                 print(f"⚠️ [Lazy Load] Cache failed: {e}")
@@ -90,9 +85,17 @@ class ArticleManager:
         return None
     
     def get_by_url(self, url: str) -> Optional[Dict[str, Any]]:
-        """URL로 기사 조회"""
+        """URL로 기사 조회 (정규 키, 없으면 정규화 이전 규칙의 ID)"""
         article_id = self.generate_article_id(url)
-        return self.get(article_id)
+        article = self.get(article_id)
+        if article:
+            return article
+        for legacy_id in legacy_keys(url):
+            if legacy_id != article_id:
+                article = self.get(legacy_id)
+                if article:
+                    return article
+        return None
     
     def create(self, url: str, original_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -105,14 +108,19 @@ class ArticleManager:
         Returns:
             생성된 기사 데이터, 이미 존재하면 None
         """
-        article_id = self.generate_article_id(url)
+        article_id = self.generate_article_id(url, original_data.get('canonical_url'))
         
         # [CRITICAL FIX] 기존 기사가 있으면 생성하지 않음 (발행 기사 보호)
-        existing = self.get(article_id)
-        if existing:
-            current_state = existing.get('_header', {}).get('state', 'unknown')
-            print(f"⚠️ [ArticleManager.create] Article already exists: {article_id} (state: {current_state})")
-            return None  # 기존 기사를 덮어쓰지 않음
+        # 정규 키 이전 규칙의 ID로 저장된 기사도 확인 (get_by_url과 동일)
+        candidate_ids = [article_id]
+        for legacy_url in filter(None, (url, original_data.get('canonical_url'))):
+            candidate_ids.extend(key for key in legacy_keys(legacy_url) if key not in candidate_ids)
+        for existing_id in candidate_ids:
+            existing = self.get(existing_id)
+            if existing:
+                current_state = existing.get('_header', {}).get('state', 'unknown')
+                print(f"⚠️ [ArticleManager.create] Article already exists: {existing_id} (state: {current_state})")
+                return None  # 기존 기사를 덮어쓰지 않음
         
         source_id = original_data.get('source_id', 'unknown')
         now = get_kst_now() # [FIX] Use KST
@@ -141,6 +149,7 @@ class ArticleManager:
                 'image': original_data.get('image'),
                 'description': original_data.get('description', ''),
                 'published_at': original_data.get('published_at'),
+                'canonical_url': original_data.get('canonical_url'),
                 'crawled_at': now
             },
             '_analysis': None,
@@ -348,6 +357,11 @@ class ArticleManager:
             if key in analysis_data:
                 section_data[field_name] = analysis_data[key]
         
+        # 점수 계산 지문 (재계산 스킵 판단용)
+        if analysis_data.get('mll_raw') and 'impact_score' in analysis_data:
+            from .score_engine import score_fingerprint
+            section_data.update(score_fingerprint(analysis_data['mll_raw']))
+        
         # 업데이트 시간은 항상 추가
         section_data['analyzed_at'] = now
         
@@ -358,6 +372,41 @@ class ArticleManager:
             section_data=section_data
         )
     
+    def update_analysis_batch(self, updates: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        분석 결과 일괄 저장 (점수 재계산용, 상태 변경 없음)
+        
+        Args:
+            updates: {article_id: analysis_data} - update_analysis와 동일한 필드
+            
+        Returns:
+            저장된 article_id 목록 (PUBLISHED/RELEASED 기사는 제외)
+        """
+        from .article_registry import get_registry
+        registry = get_registry()
+        if not registry.is_initialized():
+            print("⚠️ [ArticleManager] Registry not initialized, skipping batch update")
+            return []
+        
+        now = get_kst_now()
+        protected_states = ['PUBLISHED', 'RELEASED']
+        field_names = ['title_ko', 'summary', 'tags', 'impact_score', 'zero_echo_score',
+                       'mll_raw', 'impact_evidence', 'evidence',
+                       'score_engine_version', 'mll_raw_hash']
+        
+        section_updates = {}
+        for article_id, analysis_data in updates.items():
+            info = registry.get(article_id)
+            if not info or info.state in protected_states:
+                continue
+            fields = {f'_analysis.{key}': analysis_data[key] for key in field_names if key in analysis_data}
+            # 지문만 기록하는 경우(점수 불변)는 analyzed_at 유지
+            if 'impact_score' in analysis_data or 'zero_echo_score' in analysis_data:
+                fields['_analysis.analyzed_at'] = now
+            section_updates[article_id] = fields
+        
+        return registry.update_fields_batch(section_updates)
+    
     def update_classification(self, article_id: str, category: str, is_selected: bool = True) -> bool:
         """
         분류 정보 저장 (Desk UI용)
@@ -515,6 +564,16 @@ class ArticleManager:
                 self.update_state(article_id, ArticleState.CLASSIFIED, by='publish_rollback')
                 return False
 
+            # 4. Trend Rollup (일자별 집계 증분 반영)
+            try:
+                from .trend_rollup import get_trend_rollup_store
+                get_trend_rollup_store().record_edition(
+                    edition_code, pub_doc['published_at'], [formatted_article],
+                    status=pub_doc.get('status', 'preview')
+                )
+            except Exception as e:
+                print(f"⚠️ [Publish] Trend rollup update failed: {e}")
+
             # Cache Warmup
             self._warmup_cache()
         
@@ -581,9 +640,38 @@ class ArticleManager:
                 'rejected_by': by
             }
         )
-    
 
-    
+    def delete(self, article_id: str) -> bool:
+        """
+        기사 영구 삭제 (휴지통 비우기)
+        Firestore 문서 삭제 후 Registry 색인 / 로컬 저장소에서 제거
+        (Registry 미초기화 시 로컬 저장소에서 직접 제거)
+
+        Returns:
+            Firestore/로컬 삭제가 모두 성공하면 True
+        """
+        try:
+            if not self.db.delete_article(article_id):
+                return False
+        except Exception as e:
+            print(f"❌ [ArticleManager] Firestore delete failed: {article_id} - {e}")
+            return False  # 로컬 사본 유지 (다시 시도 가능)
+
+        try:
+            from .article_registry import get_registry
+            registry = get_registry()
+            if registry.is_initialized():
+                registry.remove(article_id)
+            else:
+                self.db._get_local_store().delete(article_id)
+        except Exception as e:
+            print(f"⚠️ [ArticleManager] Local delete failed: {article_id} - {e}")
+            return False
+
+        return True
+
+
+
     # =========================================================================
     # Query Operations
     # =========================================================================
@@ -675,6 +763,11 @@ class ArticleManager:
     
     def _warmup_cache(self):
         """최근 2회차 데이터 메모리 로드"""
+        if not allow_optional('edition cache warmup'):
+            # 예산 초과: 미리 읽지 않고 캐시만 비움 (조회 시 DB에서 직접 읽음)
+            self._local_cache['meta'] = None
+            self._local_cache['articles'] = {}
+            return
         try:
             # 1. Meta 로드
             meta = self.db.get_publications_meta()
@@ -790,6 +883,16 @@ class ArticleManager:
                     updated_count += 1
                 except Exception as e:
                     print(f"⚠️ [Release] Failed to update article {art_id}: {e}")
+        
+        # Trend Rollup (released 표시 + 누락 기사 백필)
+        try:
+            from .trend_rollup import get_trend_rollup_store
+            get_trend_rollup_store().record_edition(
+                edition_code, target_issue.get('published_at') or pub_doc.get('published_at'),
+                articles, status='released'
+            )
+        except Exception as e:
+            print(f"⚠️ [Release] Trend rollup update failed: {e}")
                 
         # 3. Warmup Cache
         self._warmup_cache()
@@ -816,6 +919,7 @@ class ArticleManager:
         issues = meta.get('issues', [])
         
         # 해당 회차 필터링 (제거)
+        removed_issue = next((i for i in issues if i.get('edition_code') == edition_code or i.get('code') == edition_code), {})
         initial_len = len(issues)
         issues = [i for i in issues if not (i.get('edition_code') == edition_code or i.get('code') == edition_code)]
         
@@ -867,6 +971,13 @@ class ArticleManager:
                 print(f"      ✅ Reverted to CLASSIFIED")
             else:
                 print(f"      ❌ Failed to revert")
+        
+        # Trend Rollup에서 제거
+        try:
+            from .trend_rollup import get_trend_rollup_store
+            get_trend_rollup_store().remove_edition(edition_code, removed_issue.get('published_at'))
+        except Exception as e:
+            print(f"⚠️ [DeleteEdition] Trend rollup update failed: {e}")
             
         # Cache Warmup
         self._warmup_cache()
@@ -5,14 +5,68 @@ Article Registry - 중앙 기사 정보 시스템
 
 서버 시작 시 로컬 캐시와 Firestore에서 기사를 로드하여
 인메모리 색인을 구축하고, 모든 상태 변경을 중앙에서 관리합니다.
+
+동시성 모델 (Flask 요청 스레드 + 수집/스케줄러 백그라운드 스레드):
+    - 읽기: 현재 색인 세대(_IndexSnapshot)의 참조만 얻어 잠금 없이 사용
+    - 쓰기: 단일 쓰기 잠금(RLock) 아래에서 다음 세대를 copy-on-write로 만든 뒤
+            참조 한 번 교체로 게시 → 읽기는 항상 완결된 세대만 봄
+    - 게시된 ArticleInfo / 전체 데이터 dict는 변경하지 않고 교체만 합니다
+
+다중 프로세스 (REGISTRY_SHARED=true, gunicorn 워커/스케줄러):
+    - 첫 프로세스만 콜드 로드 후 공유 색인(registry_index)에 기록, 나머지는 색인만 읽어 연결
+    - 각 프로세스의 변경은 공유 색인에 기록되고 감시 스레드가 다른 프로세스에 반영
+    - 로컬 저장소에 있는 기사 본문은 프로세스 메모리에 두지 않음 (워커 수와 무관한 메모리)
+
+백그라운드 워밍업 (initialize(background=True)):
+    - 최근 날짜 → 오래된 날짜 → Firestore 동기화 순으로 단계별 적재, 날짜마다 세대 게시
+    - 워밍업 중에도 조회/변경 가능 (부분 결과, 색인에 없는 기사는 저장소에서 즉시 적재)
+    - 진행률은 get_warmup_status(), 완료는 is_ready() / on_ready()
+
+부분 적재 (initialize_partial(), 스케줄러 파이프라인 등 desk 밖 프로세스):
+    - 전체 적재 없이 필요한 상태만 load_states()로 공유 색인/로컬 저장소에서 증분 적재
+    - 적재된 상태는 실시간 캐시 스캔 없이 색인으로 조회
+
+Firestore 증분 동기화 (REGISTRY_INCREMENTAL_SYNC, 기본 true):
+    - 마지막으로 반영한 _header.updated_at 최댓값(watermark)을 cache/<env>/_firestore_watermark.json에 저장
+    - 이후 초기 적재/새로고침은 watermark 이후 수정된 기사만 조회 (읽기 비용 = 변경된 기사 수)
+    - 필요한 복합 색인은 저장소 루트의 firestore.indexes.json (미배포 시 상태별 전체 조회로 대체)
+    - watermark 파일을 지우면 다음 시작 시 전체 적재
+
+Firestore 쓰기 outbox (FIRESTORE_OUTBOX, 기본 true):
+    - 상태 변경/등록은 로컬 저장 + outbox 항목만 커밋하고 반환 (요청이 Firestore 왕복을 기다리지 않음)
+    - firestore_outbox drainer가 배치로 반영하고 실패 시 재시도 (대기 수는 /api/health)
+
+필드 단위 저장 (FIRESTORE_FIELD_DIFF, 기본 true):
+    - Firestore에 있는 기사(firestore_synced)는 이전 버전 대비 바뀐 필드 경로만 update
+      (state_history는 추가분만 ArrayUnion) → 본문/이력 길이와 무관한 쓰기 크기
+    - 이전 버전을 모르거나 저장이 실패한 기사는 전체 저장
+
+state_history 보존 (STATE_HISTORY_INLINE / STATE_HISTORY_MAX):
+    - 문서에는 최근 기록만 두고 오래된 전이는 묶음으로 로컬 감사 로그 + Firestore 서브컬렉션에 보관
+    - 전체 타임라인은 get_state_timeline() (state_history 모듈 참고)
+
+카드 / 본문 분리 (FIRESTORE_CONTENT_SPLIT, article_content 모듈):
+    - Firestore 목록/변경 조회는 카드만 받음 → 로컬에 저장할 기사만 본문을 채움
+      (로컬 사본의 본문이 카드의 rev와 같으면 재사용, 아니면 본문 문서를 get_all로 조회)
+    - 로컬 저장소와 메모리에는 항상 전체 데이터
 """
 import os
-import glob
 import json
-from dataclasses import dataclass, field, asdict
+import threading
+from itertools import groupby
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict, replace
 from datetime import datetime, timezone, timedelta
 from src.core_logic import get_kst_now
-from typing import Dict, List, Optional, Set, Any
+from .local_store import get_local_store, article_date_folder
+from .firestore_usage import allow_optional
+from .firestore_outbox import get_outbox, is_outbox_enabled, article_op, article_diff_op, history_op, archive_op
+from .article_diff import diff_article, is_field_diff_enabled
+from .state_history import append_transition, build_timeline, get_history_archive
+from .article_content import needs_content, content_rev, extract_content, merge_content
+from .registry_index import SharedRegistryIndex, IndexWatcher, get_shared_index_path, is_shared_enabled
+from .url_canonical import canonical_key
+from typing import Dict, List, Optional, Set, FrozenSet, Any
 from enum import Enum
 
 
@@ -60,6 +114,161 @@ class ArticleInfo:
         return asdict(self)
 
 
+class _IndexSnapshot:
+    """
+    레지스트리 색인 한 세대 (게시 후 변경되지 않음)
+    읽기 측은 self._snapshot 참조 하나로 일관된 뷰를 얻습니다.
+    """
+    __slots__ = ('generation', 'articles', 'by_state', 'by_url', 'by_edition')
+
+    def __init__(self, generation: int = 0, articles: Dict[str, ArticleInfo] = None,
+                 by_state: Dict[str, FrozenSet[str]] = None, by_url: Dict[str, str] = None,
+                 by_edition: Dict[str, FrozenSet[str]] = None):
+        self.generation = generation
+        self.articles = articles if articles is not None else {}      # article_id -> ArticleInfo
+        self.by_state = by_state if by_state is not None else {}      # state -> frozenset[article_id]
+        self.by_url = by_url if by_url is not None else {}            # url_hash -> article_id
+        self.by_edition = by_edition if by_edition is not None else {}  # edition_code -> frozenset[article_id]
+
+
+class _IndexDraft:
+    """다음 색인 세대 (쓰기 잠금을 가진 스레드 전용, 변경된 집합만 복사)"""
+
+    def __init__(self, base: _IndexSnapshot):
+        self.base = base
+        self.articles = dict(base.articles)
+        self.by_url = dict(base.by_url)
+        self.by_state: Dict[str, Any] = dict(base.by_state)
+        self.by_edition: Dict[str, Any] = dict(base.by_edition)
+        self._touched: Set[tuple] = set()
+        self.changed: Set[str] = set()
+        self.removed: Set[str] = set()
+        self.dirty = False
+
+    def _mutable(self, index: Dict[str, Any], kind: str, key: str) -> Set[str]:
+        if (kind, key) not in self._touched:
+            index[key] = set(index.get(key, ()))
+            self._touched.add((kind, key))
+        return index[key]
+
+    def put(self, info: ArticleInfo):
+        """기사 추가/교체 (이전 상태/회차 색인에서 자동 제거)"""
+        article_id = info.article_id
+        old = self.articles.get(article_id)
+        if old is not None and old.state != info.state:
+            self._mutable(self.by_state, 'state', old.state).discard(article_id)
+        if old is not None and old.edition_code and old.edition_code != info.edition_code:
+            self._mutable(self.by_edition, 'edition', old.edition_code).discard(article_id)
+
+        self.articles[article_id] = info
+        if old is None or old.state != info.state:
+            self._mutable(self.by_state, 'state', info.state).add(article_id)
+        if info.edition_code and (old is None or old.edition_code != info.edition_code):
+            self._mutable(self.by_edition, 'edition', info.edition_code).add(article_id)
+        if info.url:
+            self.by_url[_url_hash(info.url)] = article_id
+        self.changed.add(article_id)
+        self.removed.discard(article_id)
+        self.dirty = True
+
+    def remove(self, article_id: str) -> Optional[ArticleInfo]:
+        """기사 제거 (모든 보조 색인에서 제거, 없으면 None)"""
+        old = self.articles.pop(article_id, None)
+        if old is None:
+            return None
+        self._mutable(self.by_state, 'state', old.state).discard(article_id)
+        if old.edition_code:
+            self._mutable(self.by_edition, 'edition', old.edition_code).discard(article_id)
+        if old.url and self.by_url.get(_url_hash(old.url)) == article_id:
+            del self.by_url[_url_hash(old.url)]
+        self.changed.discard(article_id)
+        self.removed.add(article_id)
+        self.dirty = True
+        return old
+
+    def publish(self) -> _IndexSnapshot:
+        for kind, key in self._touched:
+            index = self.by_state if kind == 'state' else self.by_edition
+            index[key] = frozenset(index[key])
+        return _IndexSnapshot(self.base.generation + 1, self.articles, self.by_state,
+                              self.by_url, self.by_edition)
+
+
+_INFO_FIELDS = set(ArticleInfo.__dataclass_fields__)
+
+
+def _info_from_dict(data: Dict[str, Any]) -> ArticleInfo:
+    return ArticleInfo(**{k: v for k, v in data.items() if k in _INFO_FIELDS})
+
+
+# 워밍업 단계 (진행 순서)
+WARMUP_PHASES = ('recent', 'older', 'firestore')
+
+
+# Firestore 증분 동기화 (cache/<env>/_firestore_watermark.json)
+UNPUBLISHED_STATES = ['COLLECTED', 'ANALYZED', 'CLASSIFIED', 'REJECTED']
+WATERMARK_FILE = '_firestore_watermark.json'
+WATERMARK_OVERLAP_SECONDS = 120
+
+
+def is_incremental_sync_enabled() -> bool:
+    """REGISTRY_INCREMENTAL_SYNC=false 이면 매번 상태별 전체 조회 (이전 방식)"""
+    return os.getenv('REGISTRY_INCREMENTAL_SYNC', 'true').lower() == 'true'
+
+
+def _newest_updated_at(articles: List[Dict[str, Any]]) -> str:
+    return max((_normalize_timestamp(a.get('_header', {}).get('updated_at')) for a in articles), default='')
+
+
+def _shift_timestamp(value: str, seconds: int) -> str:
+    """ISO 문자열 시각 이동 (KST 형식으로 반환, 파싱 실패 시 그대로)"""
+    try:
+        shifted = datetime.fromisoformat(value) + timedelta(seconds=seconds)
+    except ValueError:
+        return value
+    if shifted.tzinfo is not None:
+        shifted = shifted.astimezone(timezone(timedelta(hours=9)))
+    return shifted.isoformat()
+
+
+def get_warmup_recent_days() -> int:
+    """먼저 적재해 게시할 최근 날짜 수 (REGISTRY_WARMUP_RECENT_DAYS)"""
+    return int(os.getenv('REGISTRY_WARMUP_RECENT_DAYS', 2))
+
+
+def _url_hash(url: str) -> str:
+    """URL을 해시로 변환 (정규 URL 키, core_logic.get_url_hash와 동일)"""
+    return canonical_key(url)
+
+
+def _apply_updates(full_data: Dict[str, Any], updates: Dict[str, Any], verbose: bool = False):
+    """
+    업데이트 적용 (full_data는 호출자가 만든 얕은 복사본)
+    - 'section.field' 형식은 해당 섹션을 복사한 뒤 변경 (게시된 섹션 dict는 건드리지 않음)
+    """
+    copied = set()
+    for key, value in updates.items():
+        if '.' in key:
+            section, field_name = key.split('.', 1)
+            # [FIX] 섹션이 없거나 None인 경우 빈 dict로 초기화
+            if full_data.get(section) is None:
+                full_data[section] = {}
+                copied.add(section)
+            if not isinstance(full_data[section], dict):
+                if verbose:
+                    print(f"      ⚠️ Cannot update {section}.{field_name}: section is {type(full_data[section])}")
+                continue
+            if section not in copied:
+                full_data[section] = dict(full_data[section])
+                copied.add(section)
+            full_data[section][field_name] = value
+            if verbose:
+                print(f"      → {section}.{field_name} = {type(value).__name__}")
+        else:
+            full_data[key] = value
+            copied.add(key)
+
+
 class ArticleRegistry:
     """
     중앙 기사 레지스트리 (싱글톤)
@@ -79,17 +288,43 @@ class ArticleRegistry:
         if ArticleRegistry._initialized:
             return
         
-        # 인덱스 구조
-        self._articles: Dict[str, ArticleInfo] = {}  # article_id -> ArticleInfo (메타데이터)
-        self._full_data: Dict[str, Dict] = {}         # article_id -> 전체 JSON 데이터 (캐시)
-        self._by_state: Dict[str, Set[str]] = {}     # state -> Set[article_id]
-        self._by_url: Dict[str, str] = {}            # url_hash -> article_id
-        self._by_edition: Dict[str, Set[str]] = {}   # edition_code -> Set[article_id]
+        # 인덱스 구조 (현재 세대, 읽기는 잠금 없이 참조)
+        self._snapshot = _IndexSnapshot()
+        self._full_data: Dict[str, Dict] = {}         # article_id -> 전체 JSON 데이터 (캐시, 값은 교체만)
+        
+        # 쓰기 직렬화 (중첩 쓰기는 같은 draft 재사용)
+        self._write_lock = threading.RLock()
+        self._draft: Optional[_IndexDraft] = None
+        
+        # 프로세스 간 공유 색인 (REGISTRY_SHARED=true)
+        self._shared: Optional[SharedRegistryIndex] = None
+        self._shared_ready = False
+        self._applying_remote = False
+        self._watcher: Optional[IndexWatcher] = None
+        self._unshared: Set[str] = set()  # 공유 색인 연결 전 변경된 기사
+        
+        # 워밍업 진행 상태 (initialize 단계별)
+        self._ready = threading.Event()
+        self._ready_callbacks: List[Any] = []
+        self._warmup_loaded: Set[str] = set()  # 워밍업이 적재한 기사 (요청 중 적재된 기사와 구분)
+        self._warmup = {'phase': 'idle', 'days_total': 0, 'days_loaded': 0, 'articles': 0,
+                        'started_at': None, 'finished_at': None, 'error': None}
+        
+        # 부분 적재 모드: 적재된 상태 집합 (None이면 전체 적재 레지스트리)
+        self._partial_states: Optional[Set[str]] = None
+        
+        # 스키마 업그레이드 지연 저장 (article_id -> {'_header': {...}})
+        self._pending_schema_upgrades: Dict[str, Dict] = {}
+        self._schema_flush_timer = None
         
         # 설정
         self._max_age_days = int(os.getenv('REGISTRY_MAX_AGE_DAYS', 7))
         self._cache_root = None
+        self._store = None  # LocalArticleStore (json | sqlite)
         self._db = None
+        self._listener = None  # firestore_listener.RegistryListener (실시간 구독)
+        self._outbox = None  # firestore_outbox.FirestoreOutbox (FIRESTORE_OUTBOX)
+        self._archive = None  # state_history.StateHistoryArchive (보관된 전이 기록)
         
         # 통계
         self._stats = {
@@ -99,17 +334,290 @@ class ArticleRegistry:
             'initialized_at': None
         }
     
+    # =========================================================================
+    # Concurrency
+    # =========================================================================
+    
+    @contextmanager
+    def _writing(self):
+        """
+        쓰기 구간 - 다음 색인 세대를 만들고 정상 종료 시 게시
+        - 예외 발생 시 draft를 버림 (읽기 측에는 변경이 보이지 않음)
+        - 같은 스레드의 중첩 호출은 바깥 draft에 합쳐져 한 번에 게시
+        """
+        with self._write_lock:
+            if self._draft is not None:
+                yield self._draft
+                return
+            draft = _IndexDraft(self._snapshot)
+            self._draft = draft
+            try:
+                yield draft
+                if draft.dirty:
+                    self._snapshot = draft.publish()
+                    if self._shared_ready and not self._applying_remote:
+                        self._publish_shared(draft)
+                    elif self._shared is not None and not self._applying_remote:
+                        self._unshared.update(draft.changed | draft.removed)
+            finally:
+                self._draft = None
+    
+    def _remember_full_data(self, article_id: str, data: Dict[str, Any], cache_path: Optional[str]):
+        """
+        전체 데이터 메모리 캐시
+        - 공유 모드에서 로컬 저장소에 있는 기사는 캐시하지 않음 (필요 시 저장소에서 읽음)
+        """
+        if self._shared is not None and cache_path:
+            self._full_data.pop(article_id, None)
+        else:
+            self._full_data[article_id] = data
+    
+    def _current(self):
+        """쓰기 중이면 draft, 아니면 게시된 세대 (쓰기 구간 안에서 자기 변경을 보기 위함)"""
+        return self._draft or self._snapshot
+    
+    @property
+    def generation(self) -> int:
+        """게시된 색인 세대 번호 (쓰기마다 증가)"""
+        return self._snapshot.generation
+    
+    def check_invariants(self) -> List[str]:
+        """
+        현재 세대의 색인 일관성 검사 (스트레스 테스트/진단용)
+        
+        Returns:
+            위반 내용 목록 (비어 있으면 정상)
+        """
+        snap = self._snapshot
+        errors = []
+        seen = {}
+        for state, ids in snap.by_state.items():
+            for aid in ids:
+                info = snap.articles.get(aid)
+                if info is None:
+                    errors.append(f"by_state[{state}] has unknown {aid}")
+                elif info.state != state:
+                    errors.append(f"by_state[{state}] has {aid} in state {info.state}")
+                if aid in seen:
+                    errors.append(f"{aid} in both {seen[aid]} and {state}")
+                seen[aid] = state
+        missing = set(snap.articles) - set(seen)
+        if missing:
+            errors.append(f"{len(missing)} articles missing from by_state")
+        for url_hash, aid in snap.by_url.items():
+            if aid not in snap.articles:
+                errors.append(f"by_url[{url_hash}] points to unknown {aid}")
+        for code, ids in snap.by_edition.items():
+            for aid in ids:
+                info = snap.articles.get(aid)
+                if info is None or info.edition_code != code:
+                    errors.append(f"by_edition[{code}] has stale {aid}")
+        return errors
+    
+    # =========================================================================
+    # Partial Registry (scheduler pipeline)
+    # =========================================================================
+    
+    def initialize_partial(self, cache_root: str = None, db_client = None):
+        """
+        부분 적재 레지스트리 초기화 (기사는 적재하지 않음)
+        - 필요한 상태는 load_states()로 증분 적재 (find_by_state도 자동 적재)
+        - 이미 초기화된 레지스트리(desk 프로세스)는 그대로 사용
+        """
+        if ArticleRegistry._initialized:
+            return
+        
+        self._configure(cache_root, db_client)
+        self._partial_states = set()
+        
+        # desk가 공유 색인을 운영 중이면 색인에서 적재 + 변경 공유
+        path = get_shared_index_path(self._cache_root)
+        if is_shared_enabled() and os.path.exists(path):
+            index = SharedRegistryIndex(path)
+            if index.is_populated() and index.has_live_workers():
+                self._shared = index
+                self._start_shared_watch(index.last_seq())
+        
+        self._stats['initialized_at'] = get_kst_now()
+        ArticleRegistry._initialized = True
+        source = 'shared index' if self._shared is not None else 'local store'
+        print(f"🧩 [Registry] Partial registry ready (states loaded on demand from {source})")
+    
+    def is_partial(self) -> bool:
+        """부분 적재 모드 여부"""
+        return self._partial_states is not None
+    
+    def load_states(self, states: List[str]) -> int:
+        """
+        부분 적재 모드에서 상태별 기사 증분 적재 (이미 적재된 상태는 건너뜀)
+        
+        Returns:
+            새로 색인된 기사 수 (전체 적재 레지스트리는 항상 0)
+        """
+        if self._partial_states is None:
+            return 0
+        
+        loaded = 0
+        cutoff_str = (datetime.now() - timedelta(days=self._max_age_days)).strftime('%Y-%m-%d')
+        with self._writing() as draft:
+            for state in states:
+                if state in self._partial_states:
+                    continue
+                if self._shared is not None:
+                    infos = [(_info_from_dict(data), None) for data in self._shared.load_by_state(state)]
+                else:
+                    infos = [
+                        (self._parse_article_data(stored.data, cache_path=stored.location), stored.data)
+                        for stored in self._get_store().list_by_state(state, since_date=cutoff_str)
+                    ]
+                for info, data in infos:
+                    # 이번 실행에서 이미 색인/변경된 기사는 유지
+                    if not info or not info.article_id or info.article_id in draft.articles:
+                        continue
+                    draft.put(info)
+                    if data is not None:
+                        self._remember_full_data(info.article_id, data, None)
+                    loaded += 1
+                self._partial_states.add(state)
+        
+        if loaded:
+            print(f"🧩 [Registry] Loaded {loaded} articles for {list(states)}")
+        return loaded
+    
+    def _loads_on_miss(self) -> bool:
+        """색인에 없는 기사를 저장소에서 즉시 적재할지 (워밍업 중 / 부분 적재 모드)"""
+        return self._partial_states is not None or self.is_warming()
+    
+    # =========================================================================
+    # Warmup / Readiness
+    # =========================================================================
+    
+    def _mark_ready(self):
+        self._warmup.update({'phase': 'ready', 'finished_at': get_kst_now(), 'articles': self.count()})
+        self._warmup_loaded = set()
+        self._ready.set()
+        for callback in self._ready_callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️ [Registry] Ready callback failed: {e}")
+        self._ready_callbacks = []
+    
+    def is_ready(self) -> bool:
+        """워밍업 완료 여부 (모든 단계 적재 완료)"""
+        return self._ready.is_set()
+    
+    def is_warming(self) -> bool:
+        """워밍업 진행 중 여부 (조회 결과가 일부일 수 있음)"""
+        return self._warmup['phase'] in WARMUP_PHASES
+    
+    def wait_ready(self, timeout: float = None) -> bool:
+        return self._ready.wait(timeout)
+    
+    def on_ready(self, callback):
+        """워밍업 완료 후 실행 (이미 완료됐으면 즉시 실행)"""
+        if self._ready.is_set():
+            callback()
+        else:
+            self._ready_callbacks.append(callback)
+    
+    def set_listener(self, listener):
+        """Firestore 실시간 구독 연결 (구독 중에는 refresh가 Firestore를 조회하지 않음)"""
+        self._listener = listener
+    
+    def is_live_synced(self) -> bool:
+        return self._listener is not None and self._listener.is_active()
+    
+    def get_warmup_status(self) -> Dict[str, Any]:
+        """워밍업 진행 상태 (readiness 엔드포인트용)"""
+        status = dict(self._warmup)
+        status['ready'] = self.is_ready()
+        status['warming'] = self.is_warming()
+        status['indexed'] = self.count()
+        return status
+    
+    # =========================================================================
+    # Shared Index (multi-process)
+    # =========================================================================
+    
+    def _publish_shared(self, draft: _IndexDraft):
+        """게시된 변경을 공유 색인에 기록 (다른 프로세스에 알림)"""
+        try:
+            self._shared.publish([draft.articles[aid].to_dict() for aid in draft.changed],
+                                 removed=list(draft.removed))
+        except Exception as e:
+            print(f"⚠️ [Registry] Shared index publish failed: {e}")
+    
+    def _apply_shared_changes(self, infos: List[Dict[str, Any]]):
+        """다른 프로세스의 변경 반영 (다시 공유 색인에 기록하지 않음)"""
+        with self._write_lock:
+            self._applying_remote = True
+            try:
+                with self._writing() as draft:
+                    for data in infos:
+                        # 본문은 다음 조회 시 저장소에서 최신으로 읽음
+                        self._full_data.pop(data['article_id'], None)
+                        if data.get('deleted'):
+                            draft.remove(data['article_id'])
+                        else:
+                            draft.put(_info_from_dict(data))
+            finally:
+                self._applying_remote = False
+    
+    def _load_from_shared_index(self) -> int:
+        """공유 색인 전체로 현재 세대 교체"""
+        infos, seq = self._shared.load_all()
+        with self._write_lock:
+            draft = _IndexDraft(_IndexSnapshot(self._snapshot.generation))
+            for data in infos:
+                draft.put(_info_from_dict(data))
+            self._snapshot = draft.publish()
+            self._full_data = {}
+        return seq
+    
+    def _attach_shared_index(self):
+        """공유 색인으로 교체 + 연결 전(워밍업 중) 이 프로세스의 변경은 다시 기록"""
+        with self._write_lock:
+            pending = [self._snapshot.articles[aid] for aid in self._unshared if aid in self._snapshot.articles]
+            removed = [aid for aid in self._unshared if aid not in self._snapshot.articles]
+            self._unshared.clear()
+            seq = self._load_from_shared_index()
+            self._start_shared_watch(seq)
+            if pending or removed:
+                with self._writing() as draft:
+                    for info in pending:
+                        draft.put(info)
+                    for article_id in removed:
+                        draft.remove(article_id)
+    
+    def _start_shared_watch(self, seq: int):
+        self._shared_ready = True
+        self._watcher = IndexWatcher(
+            self._shared, seq,
+            on_changes=self._apply_shared_changes,
+            on_reload=self._load_from_shared_index,
+        )
+        self._watcher.start()
+    
+    def sync_shared(self) -> int:
+        """공유 색인 변경 즉시 반영 (감시 주기를 기다리지 않을 때)"""
+        if self._watcher is None:
+            return 0
+        return self._watcher.poll()
+    
     # =========================================================================
     # Initialization
     # =========================================================================
     
-    def initialize(self, cache_root: str = None, db_client = None):
+    def initialize(self, cache_root: str = None, db_client = None, background: bool = False):
         """
         레지스트리 초기화 - 서버 시작 시 한 번 호출
         
         Args:
             cache_root: 로컬 캐시 루트 경로
             db_client: FirestoreClient 인스턴스
+            background: True면 적재를 백그라운드 스레드에서 단계별로 수행하고 즉시 반환
+                        (워밍업 중에도 조회/변경 가능, 완료 여부는 is_ready())
         """
         if ArticleRegistry._initialized:
             print("⚠️ [Registry] Already initialized, skipping.")
@@ -118,7 +626,22 @@ class ArticleRegistry:
         print("🚀 [Registry] Initializing Article Registry...")
         start_time = datetime.now()
         
-        # 경로 설정
+        self._configure(cache_root, db_client)
+        self._warmup.update({'phase': WARMUP_PHASES[0], 'started_at': get_kst_now()})
+        
+        if background:
+            # 요청 처리 가능 상태로 표시 후 적재는 백그라운드에서 (부분 결과 + warming 표시)
+            ArticleRegistry._initialized = True
+            threading.Thread(
+                target=self._warm_up, args=(start_time, True), daemon=True, name='registry-warmup'
+            ).start()
+            print("🔥 [Registry] Warming up in background (newest days first)")
+            return
+        
+        self._warm_up(start_time)
+    
+    def _configure(self, cache_root: str = None, db_client = None):
+        """캐시 경로 / 저장소 / DB 클라이언트 설정"""
         if cache_root:
             self._cache_root = cache_root
         else:
@@ -127,9 +650,43 @@ class ArticleRegistry:
             self._cache_root = os.path.join(base_dir, 'cache', env)
         
         self._db = db_client
+        self._store = get_local_store(self._cache_root)
+        self._archive = get_history_archive().attach(self._cache_root)
         
+        self._outbox = None
+        if db_client is not None and is_outbox_enabled():
+            try:
+                self._outbox = get_outbox().attach(db_client, self._store)
+            except Exception as e:
+                print(f"⚠️ [Registry] Firestore outbox unavailable, writing synchronously: {e}")
+    
+    def _warm_up(self, start_time: datetime, background: bool = False):
+        """단계별 적재 (initialize에서 직접 또는 백그라운드 스레드로 실행)"""
+        try:
+            self._run_warmup_stages(start_time)
+        except Exception as e:
+            self._warmup.update({'phase': 'failed', 'error': str(e), 'finished_at': get_kst_now()})
+            print(f"❌ [Registry] Warmup failed: {e}")
+            if not background:
+                raise
+        finally:
+            ArticleRegistry._initialized = True
+    
+    def _run_warmup_stages(self, start_time: datetime):
+        # 0. 공유 색인: 다른 프로세스가 이미 적재했으면 색인만 읽어 연결
+        if is_shared_enabled():
+            self._shared = SharedRegistryIndex(get_shared_index_path(self._cache_root))
+            if not self._shared.claim_loader():
+                if self._shared.wait_populated():
+                    self._attach_shared_index()
+                    self._stats['initialized_at'] = get_kst_now()
+                    elapsed = (datetime.now() - start_time).total_seconds()
+                    print(f"✅ [Registry] Attached to shared index in {elapsed:.2f}s ({self.count()} articles)")
+                    self._mark_ready()
+                    return
+                self._shared.claim_loader()  # 로더가 사라짐 → 직접 적재
         
-        # 1. 로컬 캐시 로드 (메모리에만, Firestore 동기화는 아직 안 함)
+        # 1. 로컬 캐시 로드 (최근 날짜부터, 메모리에만, Firestore 동기화는 아직 안 함)
         self._load_from_local_cache()
         
         # 2. Firestore에서 미발행 기사 동기화 (필수)
@@ -138,23 +695,31 @@ class ArticleRegistry:
         skip_firestore = os.getenv('REGISTRY_SKIP_FIRESTORE', 'false').lower() == 'true'
         
         if self._db and not skip_firestore:
+            self._warmup['phase'] = 'firestore'
             self._load_from_firestore()
             
             # 3. 로컬에만 있는 기사 → Firestore에 동기화 (양방향 동기화 완성)
             self._sync_local_only_to_firestore()
         
+        # 4. 공유 색인에 적재 결과 기록 → 다른 프로세스 연결 가능
+        if self._shared is not None:
+            with self._write_lock:
+                self._shared.publish_all([info.to_dict() for info in self._snapshot.articles.values()])
+                self._unshared.clear()
+                self._start_shared_watch(self._shared.last_seq())
+            print(f"   🔗 [Registry] Shared index published: {self._shared.db_path}")
+        
         # 완료
         elapsed = (datetime.now() - start_time).total_seconds()
         self._stats['initialized_at'] = get_kst_now()
-        
-        ArticleRegistry._initialized = True
+        self._mark_ready()
         
         print(f"✅ [Registry] Initialized in {elapsed:.2f}s")
         print(f"   📂 Local Cache: {self._stats['local_loaded']} articles")
         print(f"   ☁️ Firestore (unpublished only): {self._stats['firestore_loaded']} synced")
         print(f"   📤 Synced to Firestore: {self._stats.get('synced_to_firestore', 0)} articles")
         print(f"   🔄 Merged Duplicates: {self._stats['duplicates_merged']}")
-        print(f"   📊 Total in Registry: {len(self._articles)} unique articles")
+        print(f"   📊 Total in Registry: {self.count()} unique articles")
     
     def _load_from_local_cache(self):
         """로컬 캐시에서 기사 로드 (시간 제한 적용)"""
@@ -170,113 +735,313 @@ class ArticleRegistry:
         print(f"🔍 [DEBUG] now = {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"🔍 [DEBUG] cutoff_str = '{cutoff_str}' (max_age_days={self._max_age_days})")
         
-        # 날짜별 폴더 순회
-        date_folders = glob.glob(os.path.join(self._cache_root, '*'))
-        print(f"🔍 [DEBUG] Found folders: {[os.path.basename(f) for f in date_folders]}")
+        store = self._get_store()
+        recent_days = get_warmup_recent_days()
+        self._warmup['days_total'] = len(store.date_folders(since_date=cutoff_str))
         
-        for folder in sorted(date_folders, reverse=True):  # 최신순
-            folder_name = os.path.basename(folder)
-            
-            # 날짜 형식 체크 및 시간 제한 적용
-            if folder_name < cutoff_str:
-                print(f"   ⏭️ [Registry] Skipping old folder: {folder_name} (< {cutoff_str})")
-                continue
-            
-            # 폴더 내 JSON 파일 로드
-            json_files = glob.glob(os.path.join(folder, '*.json'))
-            
-            for fpath in json_files:
-                try:
-                    with open(fpath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # [최적화] 초기화 시 Firestore 저장 스킵 (로컬 캐시 → 메모리만)
-                    # 실제 상태 변경 시에만 Firestore에 저장
-                    info = self.register(data, cache_path=fpath, skip_firestore=True)
-                    if info:
-                        self._stats['local_loaded'] += 1
-                        
-                except Exception as e:
-                    print(f"⚠️ [Registry] Error loading {fpath}: {e}")
+        # 날짜별 기사 순회 (최신순, cutoff 이전 날짜 제외) - 날짜마다 한 세대로 게시
+        stored_by_day = groupby(store.iter_articles(since_date=cutoff_str), key=lambda stored: stored.date_folder)
+        for day_index, (folder, day_articles) in enumerate(stored_by_day):
+            self._warmup['phase'] = 'recent' if day_index < recent_days else 'older'
+            with self._writing() as draft:
+                for stored in day_articles:
+                    # 워밍업 중 요청으로 먼저 적재/변경된 기사는 덮어쓰지 않음
+                    if stored.article_id in draft.articles and stored.article_id not in self._warmup_loaded:
+                        continue
+                    try:
+                        # [최적화] 초기화 시 Firestore 저장 스킵 (로컬 캐시 → 메모리만)
+                        # 실제 상태 변경 시에만 Firestore에 저장
+                        info = self.register(stored.data, cache_path=stored.location, skip_firestore=True)
+                        if info:
+                            self._warmup_loaded.add(info.article_id)
+                            self._stats['local_loaded'] += 1
+                            
+                    except Exception as e:
+                        print(f"⚠️ [Registry] Error loading {stored.location}: {e}")
+            self._warmup['days_loaded'] = day_index + 1
+            self._warmup['articles'] = self._stats['local_loaded']
     
     def _load_from_firestore(self):
-        """Firestore에서 미발행 기사만 로드 (PUBLISHED는 Lazy Load)"""
+        """
+        Firestore에서 미발행 기사만 로드 (PUBLISHED는 Lazy Load)
+        - watermark가 있으면 그 이후 수정된 기사만 (증분)
+        - 없으면 cutoff 이후 수정된 미발행 기사 전체 후 watermark 기록
+        """
+        watermark = self._read_watermark()
+        if watermark:
+            print(f"   📡 [Registry] Incremental Firestore sync since {watermark}")
+            try:
+                changed = self._sync_firestore_changes(watermark)
+                print(f"      ✅ Applied {changed} changed articles")
+                return
+            except Exception as e:
+                print(f"⚠️ [Registry] Incremental sync failed, loading all unpublished: {e}")
+        
         cutoff_date = datetime.now() - timedelta(days=self._max_age_days)
         cutoff_iso = cutoff_date.strftime('%Y-%m-%dT%H:%M:%S+09:00')
         
         # 미발행 상태만 로드 (PUBLISHED는 요청 시 Lazy Load)
-        states_to_load = ['COLLECTED', 'ANALYZED', 'CLASSIFIED', 'REJECTED']
+        states_to_load = UNPUBLISHED_STATES
         print(f"   📡 [Registry] Loading unpublished from Firestore: {states_to_load}")
         print(f"   📅 [Registry] Cutoff: {cutoff_iso}")
         
+        query_started = get_kst_now()
+        try:
+            # 복합 색인 (_header.state, _header.updated_at) 필요 - firestore.indexes.json
+            articles = self._db.list_articles_updated_since(cutoff_iso, states=states_to_load)
+        except Exception as e:
+            print(f"⚠️ [Registry] Updated-since query failed (deploy firestore.indexes.json?): {e}")
+            self._load_from_firestore_by_state(states_to_load, cutoff_iso)
+            return
+        
+        self._attach_content(articles, cutoff_iso)
+        counts = {'loaded': 0, 'merged': 0, 'skipped': 0}
+        with self._writing() as draft:
+            for data in articles:
+                counts[self._merge_firestore_article(draft, data, cutoff_iso)] += 1
+            self._save_watermark(_newest_updated_at(articles) or query_started)
+        print(f"      ✅ Firestore returned {len(articles)}: loaded {counts['loaded']}, "
+              f"merged {counts['merged']}, skipped {counts['skipped']}")
+    
+    def _load_from_firestore_by_state(self, states_to_load: List[str], cutoff_iso: str):
+        """상태별 전체 조회 (updated_at 색인이 없을 때의 이전 방식, watermark 기록 안 함)"""
         for state in states_to_load:
             try:
                 # FirestoreClient 직접 호출
                 articles = self._db.list_articles_by_state(state, limit=500) if self._db else []
                 print(f"      🔹 [{state}] Firestore returned {len(articles)} articles")
+                self._attach_content(articles, cutoff_iso)
                 
-                loaded_count = 0
-                skipped_count = 0
-                
-                for data in articles:
-                    article_id = data.get('_header', {}).get('article_id') or data.get('id', 'unknown')
-                    
-                    # 시간 체크 (updated_at 확인 추가 - 롤백/수정된 기사 포함)
-                    # [Fix] Firestore DatetimeWithNanoseconds를 문자열로 변환
-                    published_at = _normalize_timestamp(data.get('_original', {}).get('published_at'))
-                    created_at = _normalize_timestamp(data.get('_header', {}).get('created_at'))
-                    updated_at = _normalize_timestamp(data.get('_header', {}).get('updated_at'))
-                    
-                    # 최근 수정되었으면 로드 (OR 조건)
-                    # [Fix] Rollback된 기사는 created_at이 오래되어도 updated_at이 최신임
-                    is_recent_update = updated_at and updated_at >= cutoff_iso
-                    
-                    date_source = published_at or created_at
-                    is_recent_create = date_source and date_source >= cutoff_iso
-                    
-                    if not (is_recent_create or is_recent_update):
-                        skipped_count += 1
-                        print(f"         ⏭️ Skipped {article_id}: created={created_at[:16] if created_at else 'N/A'}, updated={updated_at[:16] if updated_at else 'N/A'}")
-                        continue  # 오래되고 최근 수정되지 않은 기사 스킵
-                    
-                    info = self._parse_article_data(data)
-                    if info:
-                        existing = self._articles.get(info.article_id)
-                        if existing:
-                            # 이미 로컬에서 로드됨 - Firestore 상태로 갱신
-                            existing.firestore_synced = True
-                            
-                            # REJECTED는 최우선 적용 (폐기된 기사는 복구 불가)
-                            if info.state == 'REJECTED' and existing.state != 'REJECTED':
-                                self._update_article_state(existing, 'REJECTED')
-                                print(f"   ⚠️ [Registry] Synced REJECTED: {info.article_id}")
-                            # Firestore 상태가 더 진행된 경우 적용
-                            elif self._is_more_advanced_state(info.state, existing.state):
-                                self._update_article_state(existing, info.state)
-                                print(f"   🔄 [Registry] Synced state: {info.article_id} ({existing.state} → {info.state})")
-                            
-                            self._stats['duplicates_merged'] += 1
-                        else:
-                            # Firestore에만 있는 데이터 → 로컬에도 저장
-                            info.firestore_synced = True
-                            
-                            # 전체 데이터 캐시에 저장 (메모리)
-                            self._full_data[info.article_id] = data
-                            
-                            # 로컬 캐시에 저장
-                            cache_path = self._save_to_local_cache(data, info.article_id)
-                            if cache_path:
-                                info.cache_path = cache_path
-                            
-                            self._register_article(info, source='firestore')
-                            self._stats['firestore_loaded'] += 1
-                            loaded_count += 1
+                counts = {'loaded': 0, 'merged': 0, 'skipped': 0}
+                with self._writing() as draft:
+                    for data in articles:
+                        counts[self._merge_firestore_article(draft, data, cutoff_iso)] += 1
                 
-                print(f"      ✅ [{state}] Loaded: {loaded_count}, Skipped: {skipped_count}")
+                print(f"      ✅ [{state}] Loaded: {counts['loaded']}, Skipped: {counts['skipped']}")
                         
             except Exception as e:
                 print(f"⚠️ [Registry] Firestore load error for {state}: {e}")
     
+    def _merge_firestore_article(self, draft: '_IndexDraft', data: Dict, cutoff_iso: str) -> str:
+        """
+        초기 적재 시 Firestore 기사 병합
+        
+        Returns:
+            'loaded' (새로 등록) | 'merged' (로컬 기사 상태 갱신) | 'skipped'
+        """
+        article_id = data.get('_header', {}).get('article_id') or data.get('id', 'unknown')
+        
+        # 시간 체크 (updated_at 확인 추가 - 롤백/수정된 기사 포함)
+        # [Fix] Firestore DatetimeWithNanoseconds를 문자열로 변환
+        published_at = _normalize_timestamp(data.get('_original', {}).get('published_at'))
+        created_at = _normalize_timestamp(data.get('_header', {}).get('created_at'))
+        updated_at = _normalize_timestamp(data.get('_header', {}).get('updated_at'))
+        
+        # 최근 수정되었으면 로드 (OR 조건)
+        # [Fix] Rollback된 기사는 created_at이 오래되어도 updated_at이 최신임
+        is_recent_update = updated_at and updated_at >= cutoff_iso
+        
+        date_source = published_at or created_at
+        is_recent_create = date_source and date_source >= cutoff_iso
+        
+        if not (is_recent_create or is_recent_update):
+            print(f"         ⏭️ Skipped {article_id}: created={created_at[:16] if created_at else 'N/A'}, updated={updated_at[:16] if updated_at else 'N/A'}")
+            return 'skipped'  # 오래되고 최근 수정되지 않은 기사 스킵
+        
+        info = self._parse_article_data(data)
+        if not info:
+            return 'skipped'
+        
+        existing = draft.articles.get(info.article_id)
+        if existing is None and needs_content(data):
+            print(f"         ⚠️ Skipped {article_id}: content document unavailable")
+            return 'skipped'
+        if existing:
+            # 이미 로컬에서 로드됨 - Firestore 상태로 갱신
+            synced = replace(existing, firestore_synced=True)
+            
+            # REJECTED는 최우선 적용 (폐기된 기사는 복구 불가)
+            if info.state == 'REJECTED' and existing.state != 'REJECTED':
+                synced.state = 'REJECTED'
+                print(f"   ⚠️ [Registry] Synced REJECTED: {info.article_id}")
+            # Firestore 상태가 더 진행된 경우 적용
+            elif self._is_more_advanced_state(info.state, existing.state):
+                synced.state = info.state
+                print(f"   🔄 [Registry] Synced state: {info.article_id} ({existing.state} → {info.state})")
+            
+            draft.put(synced)
+            self._stats['duplicates_merged'] += 1
+            return 'merged'
+        
+        # Firestore에만 있는 데이터 → 로컬에도 저장
+        info.firestore_synced = True
+        
+        # 로컬 캐시에 저장
+        cache_path = self._save_to_local_cache(data, info.article_id)
+        if cache_path:
+            info.cache_path = cache_path
+        
+        # 전체 데이터 캐시에 저장 (메모리)
+        self._remember_full_data(info.article_id, data, info.cache_path)
+        
+        draft.put(info)
+        self._stats['firestore_loaded'] += 1
+        return 'loaded'
+    
+    # =========================================================================
+    # Incremental Firestore Sync (updated_at watermark)
+    # =========================================================================
+    
+    def _watermark_path(self) -> str:
+        return os.path.join(self._cache_root, WATERMARK_FILE)
+    
+    def _read_watermark(self) -> Optional[str]:
+        """마지막 Firestore 동기화 시점 (_header.updated_at 최댓값, 없으면 None)"""
+        if not is_incremental_sync_enabled() or not self._cache_root:
+            return None
+        try:
+            with open(self._watermark_path(), 'r', encoding='utf-8') as f:
+                return json.load(f).get('updated_at') or None
+        except (OSError, ValueError):
+            return None
+    
+    def _save_watermark(self, updated_at: str):
+        if not is_incremental_sync_enabled() or not self._cache_root:
+            return
+        try:
+            os.makedirs(self._cache_root, exist_ok=True)
+            path = self._watermark_path()
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'updated_at': updated_at, 'saved_at': get_kst_now()}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"⚠️ [Registry] Failed to save Firestore watermark: {e}")
+    
+    def get_firestore_sync_since(self) -> str:
+        """Firestore 변경 조회/구독 시작 시점 (watermark - overlap, 없으면 보관 기간 시작)"""
+        watermark = self._read_watermark()
+        if watermark:
+            return _shift_timestamp(watermark, -WATERMARK_OVERLAP_SECONDS)
+        return (datetime.now() - timedelta(days=self._max_age_days)).strftime('%Y-%m-%dT%H:%M:%S+09:00')
+    
+    def _sync_firestore_changes(self, watermark: str) -> int:
+        """
+        watermark 이후 수정된 기사만 반영 (읽기 비용 = 변경된 기사 수)
+        - 다른 프로세스/기기의 시계 오차를 고려해 WATERMARK_OVERLAP_SECONDS 만큼 겹쳐 조회
+        - 이미 같은 updated_at으로 반영된 기사(자기 변경 포함)는 건너뜀
+        
+        Returns:
+            색인에 반영한 기사 수
+        """
+        since = _shift_timestamp(watermark, -WATERMARK_OVERLAP_SECONDS)
+        articles = self._db.list_articles_updated_since(since)
+        
+        return self.apply_firestore_changes(articles)
+    
+    def apply_firestore_changes(self, articles: List[Dict], removed_ids: List[str] = ()) -> int:
+        """
+        Firestore 변경분 반영 (증분 동기화 / 실시간 구독 공용)
+        - 수정된 기사: updated_at이 로컬보다 최신일 때만 적용
+        - 삭제된 기사: 색인 + 로컬 저장소에서 제거
+        - 반영 후 watermark 전진
+        
+        Returns:
+            색인에 반영한 기사 수
+        """
+        cutoff_iso = (datetime.now() - timedelta(days=self._max_age_days)).strftime('%Y-%m-%dT%H:%M:%S+09:00')
+        self._attach_content(articles, cutoff_iso)
+        applied = 0
+        with self._writing() as draft:
+            for data in articles:
+                if self._apply_firestore_change(draft, data, cutoff_iso):
+                    applied += 1
+            for article_id in removed_ids:
+                if article_id in draft.articles:
+                    self.remove(article_id)
+                    applied += 1
+                    print(f"   🗑️ [Sync] Deleted in Firestore: {article_id}")
+            newest = _newest_updated_at(articles)
+            watermark = self._read_watermark()
+            if newest and (not watermark or newest > watermark):
+                self._save_watermark(newest)
+        return applied
+    
+    def _apply_firestore_change(self, draft: '_IndexDraft', data: Dict, cutoff_iso: str) -> bool:
+        """Firestore에서 변경된 기사 반영 (updated_at이 더 최신인 쪽 우선)"""
+        header = data.get('_header', {})
+        article_id = header.get('article_id') or data.get('id')
+        if not article_id:
+            return False
+        
+        existing = draft.articles.get(article_id)
+        if existing is None:
+            # 색인에 없는 발행 기사는 요청 시 Lazy Load / 오래된 기사는 적재하지 않음
+            if header.get('state') not in UNPUBLISHED_STATES:
+                return False
+            date_source = (_normalize_timestamp(data.get('_original', {}).get('published_at'))
+                           or _normalize_timestamp(header.get('created_at')))
+            if date_source and date_source < cutoff_iso:
+                return False
+        elif existing.updated_at and _normalize_timestamp(header.get('updated_at')) <= existing.updated_at:
+            return False  # 이미 반영됨
+        
+        if needs_content(data):
+            print(f"   ⚠️ [Sync] Content document unavailable, skipped: {article_id}")
+            return False
+        
+        info = self._parse_article_data(data)
+        if not info:
+            return False
+        info.firestore_synced = True
+        
+        # 로컬 캐시도 최신 데이터로 교체
+        cache_path = self._save_to_local_cache(data, article_id)
+        info.cache_path = cache_path or (existing.cache_path if existing else None)
+        self._remember_full_data(article_id, data, info.cache_path)
+        
+        draft.put(info)
+        if existing is None:
+            self._stats['firestore_loaded'] += 1
+            print(f"   ☁️ [Sync] New from Firestore: {article_id}")
+        elif existing.state != info.state:
+            print(f"   🔄 [Sync] {article_id}: {existing.state} → {info.state}")
+        return True
+    
+    def _wants_firestore_data(self, data: Dict, cutoff_iso: str) -> bool:
+        """Firestore 기사 데이터를 로컬에 저장하게 되는지 (새 미발행 기사 / 더 최신 변경)"""
+        header = data.get('_header', {})
+        existing = self._snapshot.articles.get(header.get('article_id') or data.get('id'))
+        updated_at = _normalize_timestamp(header.get('updated_at'))
+        if existing is not None:
+            return not existing.updated_at or updated_at > existing.updated_at
+        if header.get('state') not in UNPUBLISHED_STATES:
+            return False
+        date_source = (_normalize_timestamp(data.get('_original', {}).get('published_at'))
+                       or _normalize_timestamp(header.get('created_at')))
+        return bool((date_source and date_source >= cutoff_iso) or (updated_at and updated_at >= cutoff_iso))
+    
+    def _attach_content(self, articles: List[Dict], cutoff_iso: str):
+        """
+        본문이 분리된 카드 중 로컬에 저장할 기사만 본문 채우기 (article_content)
+        로컬 사본의 본문이 같은 버전이면 재사용, 아니면 Firestore 본문 문서를 한 번에 조회
+        """
+        missing = []
+        for data in articles:
+            if not needs_content(data) or not self._wants_firestore_data(data, cutoff_iso):
+                continue
+            local = self.get_full_data(data['_header'].get('article_id') or data.get('id'))
+            if local and content_rev(local) == data['_header']['content'].get('rev'):
+                merge_content(data, extract_content(local))
+            else:
+                missing.append(data)
+        if not missing:
+            return
+        try:
+            self._db.attach_content(missing)
+        except Exception as e:
+            print(f"⚠️ [Registry] Content documents unavailable ({len(missing)} articles): {e}")
+    
     def _sync_local_only_to_firestore(self):
         """
         로컬에만 있는 기사를 Firestore에 동기화 (양방향 동기화 3단계)
@@ -289,7 +1054,9 @@ class ArticleRegistry:
         unpublished_states = {'COLLECTED', 'ANALYZED', 'CLASSIFIED', 'REJECTED'}
         protected_states = {'PUBLISHED', 'RELEASED'}
 
-        for article_id, info in self._articles.items():
+        synced_ids = []
+        
+        for article_id, info in self._snapshot.articles.items():
             # Firestore에 이미 있으면 스킵
             if info.firestore_synced:
                 continue
@@ -299,7 +1066,7 @@ class ArticleRegistry:
                 continue
 
             # Firestore에 저장
-            full_data = self._full_data.get(article_id)
+            full_data = self._load_full_data(info) if self._db else None  # 공유 색인 모드는 메모리 캐시 없음
             if full_data and self._db:
                 try:
                     # [FIX] Firestore 현재 상태 먼저 확인 - 상태 역전 방지
@@ -308,12 +1075,12 @@ class ArticleRegistry:
                         existing_state = existing_doc.to_dict().get('_header', {}).get('state', '')
                         if existing_state in protected_states:
                             print(f"🛡️ [Registry] Sync blocked: {article_id} (Firestore={existing_state}, Local={info.state})")
-                            info.firestore_synced = True  # 동기화된 것으로 표시하여 재시도 방지
+                            synced_ids.append(article_id)  # 동기화된 것으로 표시하여 재시도 방지
                             skip_count += 1
                             continue
 
                     self._db.save_article(article_id, full_data)
-                    info.firestore_synced = True
+                    synced_ids.append(article_id)
                     sync_count += 1
 
                     # 히스토리도 동기화
@@ -323,6 +1090,13 @@ class ArticleRegistry:
                 except Exception as e:
                     print(f"⚠️ [Registry] Sync to Firestore failed for {article_id}: {e}")
 
+        # 네트워크 I/O가 끝난 뒤 한 번에 표시 (쓰기 잠금을 오래 잡지 않음)
+        with self._writing() as draft:
+            for article_id in synced_ids:
+                current = draft.articles.get(article_id)
+                if current and not current.firestore_synced:
+                    draft.put(replace(current, firestore_synced=True))
+
         self._stats['synced_to_firestore'] = sync_count
         if sync_count > 0:
             print(f"   📤 [Registry] Synced {sync_count} local-only articles to Firestore")
@@ -384,33 +1158,16 @@ class ArticleRegistry:
             return None
     
     def _register_article(self, info: ArticleInfo, source: str = 'unknown'):
-        """기사를 인덱스에 등록"""
+        """기사를 인덱스에 등록 (같은 ID가 있으면 교체)"""
         if not info.article_id:
             return
         
-        # 메인 인덱스
-        self._articles[info.article_id] = info
-        
-        # 상태별 인덱스
-        if info.state not in self._by_state:
-            self._by_state[info.state] = set()
-        self._by_state[info.state].add(info.article_id)
-        
-        # URL 인덱스
-        if info.url:
-            url_hash = self._url_to_hash(info.url)
-            self._by_url[url_hash] = info.article_id
-        
-        # 회차 인덱스
-        if info.edition_code:
-            if info.edition_code not in self._by_edition:
-                self._by_edition[info.edition_code] = set()
-            self._by_edition[info.edition_code].add(info.article_id)
+        with self._writing() as draft:
+            draft.put(info)
     
     def _url_to_hash(self, url: str) -> str:
         """URL을 해시로 변환"""
-        import hashlib
-        return hashlib.md5(url.encode()).hexdigest()[:12]
+        return _url_hash(url)
     
     def _is_more_advanced_state(self, new_state: str, current_state: str) -> bool:
         """새 상태가 현재 상태보다 더 진행된 상태인지 확인"""
@@ -424,45 +1181,26 @@ class ArticleRegistry:
         }
         return state_order.get(new_state, 0) > state_order.get(current_state, 0)
     
-    def _update_article_state(self, info: ArticleInfo, new_state: str):
-        """기사 상태 인덱스 업데이트 (내부용)"""
-        old_state = info.state
-        
-        # 이전 상태 인덱스에서 제거
-        if old_state in self._by_state:
-            self._by_state[old_state].discard(info.article_id)
-        
-        # 새 상태 설정
-        info.state = new_state
-        
-        # 새 상태 인덱스에 추가
-        if new_state not in self._by_state:
-            self._by_state[new_state] = set()
-        self._by_state[new_state].add(info.article_id)
+    def _update_article_state(self, info: ArticleInfo, new_state: str) -> ArticleInfo:
+        """기사 상태 인덱스 업데이트 (내부용, 교체된 ArticleInfo 반환)"""
+        updated = replace(info, state=new_state)
+        with self._writing() as draft:
+            draft.put(updated)
+        return updated
+    
+    def _get_store(self):
+        """로컬 기사 저장소 (미초기화 시 기본 캐시 루트 사용)"""
+        if self._store is None:
+            self._store = get_local_store(self._cache_root)
+        return self._store
     
     def _save_to_local_cache(self, data: Dict, article_id: str) -> Optional[str]:
         """Firestore 데이터를 로컬 캐시에 저장"""
         try:
             # 날짜 폴더 결정 (published_at 우선, 없으면 created_at, 최후에 오늘)
-            published_at = data.get('_original', {}).get('published_at', '')
-            created_at = data.get('_header', {}).get('created_at', '')
-            
-            date_source = published_at or created_at
-            if date_source:
-                date_str = date_source.split('T')[0]
-            else:
-                date_str = datetime.now().strftime('%Y-%m-%d')
-            
-            # 캐시 경로 생성
-            cache_folder = os.path.join(self._cache_root, date_str)
-            os.makedirs(cache_folder, exist_ok=True)
-            
-            cache_path = os.path.join(cache_folder, f'{article_id}.json')
-            
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            print(f"   💾 [Registry] Saved to local: {cache_path}")
+            cache_path = self._get_store().save(article_id, data, article_date_folder(data))
+            if cache_path:
+                print(f"   💾 [Registry] Saved to local: {cache_path}")
             return cache_path
         except Exception as e:
             print(f"   ⚠️ [Registry] Local save failed: {e}")
@@ -473,53 +1211,28 @@ class ArticleRegistry:
     # =========================================================================
     
     def get(self, article_id: str) -> Optional[ArticleInfo]:
-        """기사 메타데이터 조회 (ID로)"""
-        return self._articles.get(article_id)
+        """기사 메타데이터 조회 (ID로, 워밍업 중 색인에 없으면 저장소에서 적재)"""
+        info = self._snapshot.articles.get(article_id)
+        if info is None and self._loads_on_miss():
+            info = self.find_and_register(article_id)
+        return info
     
-    def get_full_data(self, article_id: str) -> Optional[Dict[str, Any]]:
-        """전체 기사 데이터 반환 (메모리 캐시)"""
-        return self._full_data.get(article_id)
-
     def find_and_register(self, article_id: str) -> Optional[ArticleInfo]:
         """
         [Lazy Load] Registry에 없는 기사를 디스크(cache)에서 찾아 등록.
         (초기화되지 않았거나 아직 로드되지 않은 경우 대비)
         """
-        import glob
-        import json
-        import os
-        
-        # Cache Root 찾기 (미초기화 대비)
-        if self._cache_root:
-            cache_root = self._cache_root
-        else:
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            env = os.getenv('ZND_ENV', 'dev')
-            cache_root = os.path.join(base_dir, 'cache', env)
-            
-        if not os.path.exists(cache_root):
-            return None
-            
-        # Recursive Search
-        # [Fix] 파일명 패턴 유연화 (source_id 유무 상관없이 매칭)
-        # 기존: *_{article_id}.json -> 수정: *{article_id}.json
-        pattern = f"*{article_id}.json"
-        search_pattern = os.path.join(cache_root, "**", pattern)
-        files = glob.glob(search_pattern, recursive=True)
-        
-        if not files:
-            return None
-            
-        target_file = files[0]
-        
+        store = self._get_store()
         try:
-            with open(target_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = store.get(article_id)
+            if not data:
+                return None
             
-            info = self._parse_article_data(data, cache_path=target_file)
+            location = store.locate(article_id)
+            info = self._parse_article_data(data, cache_path=location)
             if info:
                 self._register_article(info, source='lazy_disk')
-                print(f"📦 [Registry] Lazy loaded: {article_id} from {target_file}")
+                print(f"📦 [Registry] Lazy loaded: {article_id} from {location}")
                 return info
         except Exception as e:
             print(f"⚠️ [Registry] Lazy load failed for {article_id}: {e}")
@@ -528,10 +1241,10 @@ class ArticleRegistry:
     
     def get_by_url(self, url: str) -> Optional[ArticleInfo]:
         """기사 조회 (URL로)"""
-        url_hash = self._url_to_hash(url)
-        article_id = self._by_url.get(url_hash)
+        snap = self._snapshot
+        article_id = snap.by_url.get(_url_hash(url))
         if article_id:
-            return self._articles.get(article_id)
+            return snap.articles.get(article_id)
         return None
     
     def get_full_data(self, article_id: str) -> Optional[dict]:
@@ -543,42 +1256,48 @@ class ArticleRegistry:
         Returns:
             캐시된 전체 기사 데이터 또는 None (캐시 미스)
         """
-        return self._full_data.get(article_id)
+        data = self._full_data.get(article_id)
+        if data is None:
+            # 메모리에 없으면 로컬 저장소에서 (공유 모드 / 부분 적재 모드는 본문을 메모리에 두지 않음)
+            info = self.get(article_id)
+            if info and info.cache_path:
+                data = self._load_full_data(info)
+        return data
     
     def find_by_state(self, state: str, limit: int = 100) -> List[ArticleInfo]:
         """상태별 기사 목록 조회 (+ 실시간 캐시 스캔)"""
-        # 1. 메모리 인덱스에서 조회
-        article_ids = self._by_state.get(state, set())
-        articles = [self._articles[aid] for aid in article_ids if aid in self._articles]
+        # 0. 부분 적재 모드: 필요한 상태만 색인에 적재 (실시간 스캔 불필요)
+        if self._partial_states is not None:
+            self.load_states([state])
+            snap = self._snapshot
+            articles = [snap.articles[aid] for aid in snap.by_state.get(state, ()) if aid in snap.articles]
+            articles.sort(key=lambda x: x.updated_at or '', reverse=True)
+            return articles[:limit]
+        
+        # 1. 메모리 인덱스에서 조회 (한 세대 안에서 일관된 뷰)
+        snap = self._snapshot
+        article_ids = snap.by_state.get(state, ())
+        articles = [snap.articles[aid] for aid in article_ids if aid in snap.articles]
         
-        # 2. 최근 캐시 파일 스캔 (서버 시작 이후 추가된 파일)
+        # 2. 최근 캐시 스캔 (서버 시작 이후 추가된 기사, 색인에 있는 기사는 제외)
         try:
-            if self._cache_root and os.path.exists(self._cache_root):
-                cutoff_date = datetime.now() - timedelta(days=self._max_age_days)
-                cutoff_str = cutoff_date.strftime('%Y-%m-%d')
-                
-                for folder in glob.glob(os.path.join(self._cache_root, '*')):
-                    folder_name = os.path.basename(folder)
-                    if not folder_name.startswith('20') or folder_name < cutoff_str:
-                        continue
-                    
-                    for fpath in glob.glob(os.path.join(folder, '*.json')):
-                        try:
-                            article_id = os.path.basename(fpath).replace('.json', '')
-                            if article_id in self._articles:
-                                continue  # 이미 인덱스에 있음
-                            
-                            with open(fpath, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            
-                            file_state = data.get('_header', {}).get('state')
-                            if file_state == state:
-                                # [최적화] 조회 시 Firestore 저장 스킵 (읽기 작업에서 쓰기 방지)
-                                info = self.register(data, cache_path=fpath, skip_firestore=True)
-                                if info:
-                                    articles.append(info)
-                        except Exception:
+            cutoff_date = datetime.now() - timedelta(days=self._max_age_days)
+            cutoff_str = cutoff_date.strftime('%Y-%m-%d')
+            
+            # 게시된 세대의 articles dict는 변경되지 않으므로 복사 없이 제외 목록으로 사용
+            new_articles = self._get_store().list_by_state(
+                state, since_date=cutoff_str, exclude_ids=snap.articles
+            )
+            if new_articles:
+                with self._writing() as draft:
+                    for stored in new_articles:
+                        # 스캔 이후 다른 스레드/프로세스가 등록한 기사는 덮어쓰지 않음 (스캔 데이터가 더 오래됨)
+                        if stored.article_id in draft.articles:
                             continue
+                        # [최적화] 조회 시 Firestore 저장 스킵 (읽기 작업에서 쓰기 방지)
+                        info = self.register(stored.data, cache_path=stored.location, skip_firestore=True)
+                        if info:
+                            articles.append(info)
         except Exception as e:
             print(f"⚠️ [Registry] Live scan error: {e}")
         
@@ -606,31 +1325,34 @@ class ArticleRegistry:
     
     def get_all(self, limit: int = 500) -> List[ArticleInfo]:
         """전체 기사 목록"""
-        articles = list(self._articles.values())
+        articles = list(self._snapshot.articles.values())
         articles.sort(key=lambda x: x.updated_at or '', reverse=True)
         return articles[:limit]
     
     def count(self) -> int:
         """전체 기사 수"""
-        return len(self._articles)
+        return len(self._snapshot.articles)
     
     def count_by_state(self, state: str) -> int:
         """상태별 기사 수"""
-        return len(self._by_state.get(state, set()))
+        return len(self._snapshot.by_state.get(state, ()))
     
     def get_by_edition(self, edition_code: str) -> List[ArticleInfo]:
         """회차별 기사 목록 조회"""
-        article_ids = self._by_edition.get(edition_code, set())
-        articles = [self._articles[aid] for aid in article_ids if aid in self._articles]
+        snap = self._snapshot
+        article_ids = snap.by_edition.get(edition_code, ())
+        articles = [snap.articles[aid] for aid in article_ids if aid in snap.articles]
         articles.sort(key=lambda x: x.updated_at or '', reverse=True)
         return articles
     
     def get_stats(self) -> Dict[str, Any]:
         """레지스트리 통계"""
+        snap = self._snapshot
         return {
             **self._stats,
-            'total_articles': len(self._articles),
-            'by_state': {state: len(ids) for state, ids in self._by_state.items()}
+            'generation': snap.generation,
+            'total_articles': len(snap.articles),
+            'by_state': {state: len(ids) for state, ids in snap.by_state.items()}
         }
     
     # =========================================================================
@@ -650,25 +1372,21 @@ class ArticleRegistry:
                            (초기화 시 사용 - 3단계 _sync_local_only_to_firestore에서 일괄 동기화)
         """
         info = self._parse_article_data(data, cache_path)
-        if info:
-            self._register_article(info, source='new')
-            
-            # 전체 데이터 캐시에 저장 (메모리)
-            self._full_data[info.article_id] = data
+        if info and info.article_id:
+            if self._db and not skip_firestore:
+                self._outbox_backpressure()
+            with self._writing() as draft:
+                draft.put(info)
+                
+                # 전체 데이터 캐시에 저장 (메모리)
+                self._remember_full_data(info.article_id, data, info.cache_path)
             
             # Firestore에도 저장 (수집 = 상태 변화 = 저장)
             # [최적화] skip_firestore=True면 저장 스킵 (초기화 시 비용 절감)
             if self._db and not skip_firestore:
-                try:
-                    self._db.save_article(info.article_id, data)
-                    
-                    # 히스토리도 저장 (URL이 있는 경우)
-                    url = info.url or data.get('_original', {}).get('url')
-                    if url:
-                        state = info.state or data.get('_header', {}).get('state', 'COLLECTED')
-                        self._db.save_history(url, status=state, article_id=info.article_id)
-                except Exception as e:
-                    print(f"⚠️ [Registry] Firestore save on register failed: {e}")
+                # 로컬 저장은 호출자가 이미 수행 (cache_path) → Firestore 쪽만
+                state = info.state or data.get('_header', {}).get('state', 'COLLECTED')
+                self._persist(info.article_id, data, state, url=info.url)
             
             return info
         return None
@@ -688,79 +1406,72 @@ class ArticleRegistry:
         Returns:
             성공 여부
         """
-        info = self._articles.get(article_id)
-        if not info:
-            print(f"⚠️ [Registry] Article not found: {article_id}")
-            return False
-        
-        old_state = info.state
-        now = get_kst_now()
-        
-        # 1. 레지스트리 업데이트
-        # 이전 상태 인덱스에서 제거
-        if old_state in self._by_state:
-            self._by_state[old_state].discard(article_id)
-        
-        # 새 상태 설정
-        info.state = new_state
-        info.updated_at = now
-        
-        # 새 상태 인덱스에 추가
-        if new_state not in self._by_state:
-            self._by_state[new_state] = set()
-        self._by_state[new_state].add(article_id)
-        
-        # 2. 데이터 저장 (Update = Save Full Data)
-        # 단순히 상태만 바꾸는 게 아니라, 전체 데이터를 갱신하여 정본 유지
-        save_success = self._save_full_state(info, new_state, by, now, updates)
+        self._outbox_backpressure()
+        with self._writing() as draft:
+            info = draft.articles.get(article_id)
+            if not info and self._loads_on_miss():
+                info = self.find_and_register(article_id)
+            if not info:
+                print(f"⚠️ [Registry] Article not found: {article_id}")
+                return False
+            
+            old_state = info.state
+            now = get_kst_now()
+            
+            # 1. 데이터 저장 (Update = Save Full Data)
+            # 단순히 상태만 바꾸는 게 아니라, 전체 데이터를 갱신하여 정본 유지
+            updated = replace(info, state=new_state, updated_at=now)
+            save_success = self._save_full_state(updated, new_state, by, now, updates)
+            
+            if not save_success:
+                # 색인은 아직 변경 전 (draft에 반영하지 않음)
+                print(f"❌ [Registry] State change failed, rolled back: {article_id}")
+                return False
+            
+            # 2. 레지스트리 업데이트 (쓰기 구간 종료 시 새 세대로 게시)
+            # Firestore에 이 버전이 저장(또는 outbox에 기록)됐으므로 다음 변경은 필드 단위로
+            draft.put(replace(updated, firestore_synced=True) if self._db else updated)
         
-        if save_success:
-            print(f"✅ [Registry] State changed: {article_id} ({old_state} → {new_state})")
-            return True
-        else:
-            # 롤백
-            info.state = old_state
-            if old_state not in self._by_state:
-                self._by_state[old_state] = set()
-            self._by_state[old_state].add(article_id)
-            self._by_state[new_state].discard(article_id)
-            print(f"❌ [Registry] State change failed, rolled back: {article_id}")
-            return False
+        print(f"✅ [Registry] State changed: {article_id} ({old_state} → {new_state})")
+        return True
+    
+    def _load_full_data(self, info: ArticleInfo) -> Optional[Dict[str, Any]]:
+        """전체 데이터 로드 (메모리 우선 → 로컬 저장소)"""
+        full_data = self._full_data.get(info.article_id)
+        if full_data is None and info.cache_path:
+            try:
+                full_data = self._get_store().get(info.article_id)
+            except Exception as e:
+                print(f"⚠️ [Registry] Failed to load local cache: {e}")
+        return full_data
     
     def _save_full_state(self, info: ArticleInfo, new_state: str, by: str, timestamp: str, updates: Dict[str, Any] = None) -> bool:
         """
         전체 기사 데이터를 로드하고 갱신하여 저장소(DB, Local)에 저장 (SSOT 유지)
+        - 게시된 데이터는 변경하지 않고 변경 경로만 복사한 새 dict를 만들어 교체
         """
-        import json
-        
-        full_data = None
+        # 1. Load Full Data (Memory Priority -> Local Store)
+        source = self._load_full_data(info)
         
-        # 1. Load Full Data (Memory Priority -> Local File)
-        if info.article_id in self._full_data:
-             full_data = self._full_data[info.article_id]
-        elif info.cache_path and os.path.exists(info.cache_path):
-            try:
-                with open(info.cache_path, 'r', encoding='utf-8') as f:
-                    full_data = json.load(f)
-            except Exception as e:
-                print(f"⚠️ [Registry] Failed to load local cache: {e}")
-        
-        if not full_data:
+        if not source:
             print(f"❌ [Registry] Cannot Save: Source data not found for {info.article_id}")
             return False
 
-        # 2. Update In-Memory Data
+        # 2. Build Updated Data (copy-on-write)
         # V2 Schema Update
-        if '_header' not in full_data:
-             full_data = {
-                 '_header': {
-                     'article_id': full_data.get('article_id', info.article_id),
-                     'state': new_state,
-                     'created_at': full_data.get('crawled_at', timestamp),
-                     'updated_at': timestamp,
-                 },
-                 '_original': full_data,
-             }
+        if '_header' not in source:
+            full_data = {
+                '_header': {
+                    'article_id': source.get('article_id', info.article_id),
+                    'state': new_state,
+                    'created_at': source.get('crawled_at', timestamp),
+                    'updated_at': timestamp,
+                },
+                '_original': source,
+            }
+        else:
+            full_data = dict(source)
+            full_data['_header'] = dict(source['_header'])
         
         # Standard Header Update
         full_data['_header']['state'] = new_state
@@ -769,19 +1480,7 @@ class ArticleRegistry:
         # Apply Extra Updates (with dot notation support)
         if updates:
             print(f"   📝 [Registry] Applying updates: {list(updates.keys())}")
-            for key, value in updates.items():
-                if '.' in key:
-                    section, field = key.split('.', 1)
-                    # [FIX] 섹션이 없거나 None인 경우 빈 dict로 초기화
-                    if section not in full_data or full_data[section] is None:
-                        full_data[section] = {}
-                    if isinstance(full_data[section], dict):
-                        full_data[section][field] = value
-                        print(f"      → {section}.{field} = {type(value).__name__}")
-                    else:
-                        print(f"      ⚠️ Cannot update {section}.{field}: section is {type(full_data[section])}")
-                else:
-                    full_data[key] = value
+            _apply_updates(full_data, updates, verbose=True)
         else:
             print(f"   ⚠️ [Registry] No updates provided for state change to {new_state}")
         
@@ -798,45 +1497,345 @@ class ArticleRegistry:
                 print(f"   ❌ [Registry] REJECTED: Cannot change to CLASSIFIED without _classification data!")
                 return False
         
-        # History
-        if 'state_history' not in full_data['_header']:
-            full_data['_header']['state_history'] = []
-            
-        full_data['_header']['state_history'].append({
+        # History (목록도 새로 만들어 이전 세대와 공유하지 않음, 오래된 기록은 보관 묶음으로)
+        archived = append_transition(full_data['_header'], {
             'state': new_state,
             'at': timestamp,
             'by': by
         })
 
         # [Important] Update Memory Cache
-        self._full_data[info.article_id] = full_data
+        self._remember_full_data(info.article_id, full_data, info.cache_path)
         
-        # 3. Save to Local (Atomic Write Update)
-        try:
-            if info.cache_path:
-                with open(info.cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(full_data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"⚠️ [Registry] Local save failed: {e}")
+        # 3~4. Save to Local Store + Firestore (History 컬렉션도 함께)
+        # Firestore에 있는 기사는 이전 버전(source) 대비 바뀐 필드만
+        return self._persist(info.article_id, full_data, new_state, cache_path=info.cache_path,
+                             url=full_data.get('_original', {}).get('url'),
+                             base=source if info.firestore_synced else None, archived=archived)
+    
+    @staticmethod
+    def _field_diff(base: Optional[Dict[str, Any]], full_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Firestore에 저장된 이전 버전 대비 변경 필드 (None이면 전체 저장)"""
+        if base is None or not is_field_diff_enabled():
+            return None
+        return diff_article(base, full_data)
+    
+    @staticmethod
+    def _article_op(article_id: str, full_data: Dict[str, Any], diff: Optional[Dict[str, Any]]):
+        if diff is not None:
+            return article_diff_op(article_id, diff, full_data)
+        return article_op(article_id, full_data)
+    
+    def _persist(self, article_id: str, full_data: Dict[str, Any], state: str,
+                 cache_path: Optional[str] = None, url: Optional[str] = None,
+                 base: Optional[Dict[str, Any]] = None, archived: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        로컬 저장소(cache_path가 있을 때) + Firestore 저장 (기사 + URL 히스토리)
+        - outbox 사용 시: 로컬 저장과 outbox 항목을 함께 커밋, Firestore는 drainer가 반영
+        - 미사용 시: save_article(또는 update_article_fields) + save_history 동기 호출
+        - base: Firestore에 저장된 이전 버전 (있으면 변경 필드만 저장)
+        - archived: 이번 저장에서 state_history에서 잘려 나간 보관 묶음 (기사보다 먼저 보관)
+        
+        Returns:
+            성공 여부 (outbox 사용 시 Firestore 반영 전이라도 커밋되면 True)
+        """
+        if archived is not None:
+            self.archive_history(article_id, archived)
+        url = url or full_data.get('_original', {}).get('url')
+        diff = self._field_diff(base, full_data)
+        if self._outbox is not None:
+            ops = [self._article_op(article_id, full_data, diff)]
+            if url:
+                ops.append(history_op(url, state, article_id))
+                self._db.remember_history(url)  # 수집 중복 검사는 즉시 반영
+            return self._save_with_outbox(article_id, full_data, cache_path, ops)
+        
+        if cache_path and not self._get_store().save(article_id, full_data):
+            print(f"⚠️ [Registry] Local save failed: {article_id}")
             return False
-            
-        # 4. Save to Firestore (Full Overwrite)
         if self._db:
             try:
-                # Use set(merge=True) to be safe, but practically it's overwriting with full data
-                self._db.save_article(info.article_id, full_data)
-                
-                # [Fix] History 컬렉션도 함께 업데이트 (URL 상태 동기화)
-                url = full_data.get('_original', {}).get('url')
+                if diff is not None:
+                    self._db.update_article_fields(article_id, diff, full_data)
+                else:
+                    self._db.save_article(article_id, full_data)
                 if url:
-                    self._db.save_history(url, status=new_state, article_id=info.article_id)
-                    
+                    self._db.save_history(url, status=state, article_id=article_id)
             except Exception as e:
                 print(f"⚠️ [Registry] Firestore save failed: {e}")
+                self._mark_unsynced([article_id])
                 return False
-                
         return True
     
+    def archive_history(self, article_id: str, chunk: Dict[str, Any]):
+        """
+        state_history에서 잘려 나간 묶음 보관 - 로컬 감사 로그 + Firestore 서브컬렉션
+        (Firestore는 outbox 사용 시 대기열로, 실패해도 로컬 기록은 남음)
+        """
+        try:
+            self._archive.append(article_id, chunk)
+        except Exception as e:
+            print(f"⚠️ [Registry] History archive write failed for {article_id}: {e}")
+        if not self._db:
+            return
+        try:
+            if self._outbox is not None:
+                self._outbox.enqueue([archive_op(article_id, chunk)], wait=False)
+            else:
+                self._db.batch_save_history_archives([(article_id, chunk)])
+        except Exception as e:
+            print(f"⚠️ [Registry] Firestore history archive failed for {article_id}: {e}")
+    
+    def get_state_timeline(self, article_id: str) -> Optional[Dict[str, Any]]:
+        """
+        전체 상태 전이 타임라인 (보관 묶음 + 문서의 최근 기록)
+        로컬 감사 로그에 없는 묶음은 Firestore 서브컬렉션에서 읽어 로컬에도 기록
+        
+        Returns:
+            {'article_id', 'entries', 'inline', 'archived', 'missing_chunks'} 또는 None (기사 없음)
+        """
+        full_data = self.get_full_data(article_id)
+        if not full_data or '_header' not in full_data:
+            return None
+        header = full_data['_header']
+        chunks = self._archive.get_chunks(article_id) if self._archive is not None else []
+        timeline = build_timeline(header, chunks)
+        if timeline['missing_chunks'] and self._db:
+            missing = set(timeline['missing_chunks'])
+            try:
+                fetched = [chunk for chunk in self._db.get_history_archive(article_id) if chunk.get('seq') in missing]
+            except Exception as e:
+                print(f"⚠️ [Registry] Firestore history archive read failed for {article_id}: {e}")
+                fetched = []
+            for chunk in fetched:
+                self._archive.append(article_id, chunk)
+            if fetched:
+                timeline = build_timeline(header, chunks + fetched)
+        timeline['article_id'] = article_id
+        return timeline
+    
+    def _mark_unsynced(self, article_ids: List[str]):
+        """Firestore 저장 실패 - 마지막 저장 버전을 모르므로 다음 저장은 전체 저장"""
+        with self._writing() as draft:
+            for article_id in article_ids:
+                current = draft.articles.get(article_id)
+                if current and current.firestore_synced:
+                    draft.put(replace(current, firestore_synced=False))
+    
+    def _outbox_backpressure(self):
+        """
+        outbox 백프레셔 대기 (최대 OUTBOX_BACKPRESSURE_SECONDS)
+        쓰기 잠금을 잡기 전에 호출 - 잠금 안에서 기다리면 다른 쓰기가 모두 멈춤
+        """
+        if self._outbox is not None:
+            self._outbox.wait_for_capacity()
+
+    def _save_with_outbox(self, article_id: str, full_data: Dict[str, Any], cache_path: Optional[str], ops) -> bool:
+        """로컬 저장 + outbox 기록 (cache_path가 없으면 outbox만, 백프레셔는 호출 진입점에서)"""
+        try:
+            if cache_path:
+                if not self._get_store().save_with_outbox(article_id, full_data, self._outbox, ops, wait=False):
+                    print(f"⚠️ [Registry] Local save failed: {article_id}")
+                    return False
+            else:
+                self._outbox.enqueue(ops, wait=False)
+            return True
+        except Exception as e:
+            print(f"⚠️ [Registry] Outbox write failed for {article_id}: {e}")
+            return False
+    
+    def apply_state(self, article_id: str, new_state: str, by: str = 'system', updates: Dict[str, Any] = None) -> bool:
+        """
+        이미 Firestore에 반영된 상태 변경을 메모리/로컬 캐시에만 반영
+        (검증/Firestore 저장 없음 - 발행 초기화 등 외부 경로용)
+        """
+        with self._writing() as draft:
+            info = draft.articles.get(article_id)
+            if not info and self._loads_on_miss():
+                info = self.find_and_register(article_id)
+            if not info:
+                return False
+            now = get_kst_now()
+            source = self._load_full_data(info)
+            if source and '_header' in source:
+                full_data = dict(source)
+                full_data['_header'] = dict(source['_header'])
+                if updates:
+                    _apply_updates(full_data, updates)
+                full_data['_header']['state'] = new_state
+                full_data['_header']['updated_at'] = now
+                archived = append_transition(full_data['_header'], {
+                    'state': new_state,
+                    'at': now,
+                    'by': by
+                })
+                if archived is not None:
+                    self.archive_history(article_id, archived)
+                self._remember_full_data(article_id, full_data, info.cache_path)
+                if info.cache_path and not self._get_store().save(article_id, full_data):
+                    print(f"⚠️ [Registry] Local save failed: {article_id}")
+            # 로컬 기록(state_history 등)이 Firestore 문서와 달라졌으므로 다음 저장은 전체 저장
+            draft.put(replace(info, state=new_state, updated_at=now, firestore_synced=False))
+        return True
+
+    def remove(self, article_id: str) -> bool:
+        """
+        기사 영구 삭제 - 색인 + 로컬 저장소에서 제거 (Firestore 삭제는 호출자 담당)
+
+        Returns:
+            색인 또는 저장소에 있었으면 True
+        """
+        with self._writing() as draft:
+            removed = draft.remove(article_id) is not None
+            self._full_data.pop(article_id, None)
+        try:
+            removed = self._get_store().delete(article_id) or removed
+            if self._archive is not None:
+                self._archive.delete(article_id)
+        except Exception as e:
+            print(f"⚠️ [Registry] Local delete failed for {article_id}: {e}")
+        return removed
+
+    def cache_article(self, data: Dict[str, Any], source: str = 'lazy_firestore') -> Optional[ArticleInfo]:
+        """
+        Firestore에서 조회한 기사를 메모리 캐시에만 등록 (재저장 없음)
+        이미 등록된 기사는 그대로 둡니다.
+        """
+        info = self._parse_article_data(data)
+        if not info or not info.article_id:
+            return None
+        with self._writing() as draft:
+            existing = draft.articles.get(info.article_id)
+            if existing:
+                return existing
+            info.firestore_synced = True
+            draft.put(info)
+            self._full_data[info.article_id] = data
+        return info
+    
+    def update_fields_batch(self, updates: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        상태 변경 없이 여러 기사의 필드만 일괄 갱신 (점수 재계산 등)
+        로컬 캐시는 기사별로 저장하고, Firestore는 한 번의 배치 커밋으로 저장
+        
+        Args:
+            updates: {article_id: {'section.field': value, ...}}
+            
+        Returns:
+            갱신된 article_id 목록
+        """
+        now = get_kst_now()
+        changed = {}
+        diffs = {}  # Firestore에 있는 기사: article_id -> (변경 필드, 전체 데이터)
+        
+        self._outbox_backpressure()
+        with self._writing() as draft:
+            for article_id, fields in updates.items():
+                info = draft.articles.get(article_id)
+                if not info:
+                    continue
+                
+                source = self._load_full_data(info)
+                if not source or '_header' not in source:
+                    continue
+                
+                full_data = dict(source)
+                _apply_updates(full_data, fields)
+                full_data['_header'] = dict(full_data['_header'])
+                full_data['_header']['updated_at'] = now
+                
+                analysis = full_data.get('_analysis') or {}
+                self._remember_full_data(article_id, full_data, info.cache_path)
+                
+                diff = self._field_diff(source if info.firestore_synced else None, full_data)
+                if self._outbox is not None:
+                    if not self._save_with_outbox(article_id, full_data, info.cache_path,
+                                                  [self._article_op(article_id, full_data, diff)]):
+                        continue
+                elif info.cache_path and not self._get_store().save(article_id, full_data):
+                    print(f"⚠️ [Registry] Local save failed: {article_id}")
+                    continue
+                
+                draft.put(replace(
+                    info,
+                    impact_score=float(analysis.get('impact_score', 0) or 0),
+                    zero_echo_score=float(analysis.get('zero_echo_score', 0) or 0),
+                    updated_at=now,
+                ))
+                changed[article_id] = full_data
+                if diff is not None:
+                    diffs[article_id] = (diff, full_data)
+            
+            if self._db and changed and self._outbox is None:
+                try:
+                    self._db.batch_save_articles({k: v for k, v in changed.items() if k not in diffs})
+                    self._db.batch_update_articles(diffs)
+                except Exception as e:
+                    print(f"⚠️ [Registry] Firestore batch save failed: {e}")
+                    self._mark_unsynced(list(changed))
+        
+        print(f"✅ [Registry] Batch updated {len(changed)}/{len(updates)} articles")
+        return list(changed.keys())
+    
+    def persist_schema_upgrade(self, article_id: str, header_updates: Dict[str, Any]):
+        """
+        SchemaAdapter 업그레이드 결과를 1회 저장 (Lazy Write-back)
+        - 메모리/로컬 캐시는 즉시 반영
+        - Firestore는 모아서 배치 커밋 (SCHEMA_UPGRADE_FLUSH_SECONDS 후)
+        """
+        with self._write_lock:
+            info = self._current().articles.get(article_id)
+            # 공유 색인/부분 로드 모드는 메모리 캐시가 비어 있을 수 있음 → 로컬 저장소에서 로드
+            source = self._load_full_data(info) if info else self._full_data.get(article_id)
+            if not source or '_header' not in source:
+                return
+            
+            header = dict(source['_header'])
+            applied = {}
+            for key, value in header_updates.items():
+                if key == 'version' or key not in header:
+                    header[key] = value
+                    applied[f'_header.{key}'] = value
+            full_data = dict(source)
+            full_data['_header'] = header
+            
+            self._remember_full_data(article_id, full_data, info.cache_path if info else None)
+            if info and info.cache_path and not self._get_store().save(article_id, full_data):
+                print(f"⚠️ [Registry] Schema upgrade local save failed: {article_id}")
+            
+            if not self._db:
+                return
+            
+            # 헤더 경로만 update (부분 payload를 전체 저장으로 보내면 카드의 본문 요약이 빈 값으로 바뀜)
+            self._pending_schema_upgrades[article_id] = {'set': applied}
+            
+            timer = self._schema_flush_timer
+            if timer is None or not timer.is_alive():
+                delay = float(os.getenv('SCHEMA_UPGRADE_FLUSH_SECONDS', 5))
+                self._schema_flush_timer = threading.Timer(delay, self.flush_schema_upgrades)
+                self._schema_flush_timer.daemon = True
+                self._schema_flush_timer.start()
+    
+    def flush_schema_upgrades(self) -> int:
+        """대기 중인 스키마 업그레이드를 Firestore에 배치 저장 (_header.* 경로만 update)"""
+        with self._write_lock:
+            pending = self._pending_schema_upgrades
+            if not pending or not self._db:
+                return 0
+            self._pending_schema_upgrades = {}
+        
+        try:
+            saved = self._db.batch_update_articles({aid: (diff, None) for aid, diff in pending.items()})
+            print(f"🆙 [Registry] Schema upgrades persisted: {saved} articles")
+            return saved
+        except Exception as e:
+            print(f"⚠️ [Registry] Schema upgrade flush failed: {e}")
+            # 실패분은 다음 flush에서 재시도 (그 사이 들어온 최신 값 우선)
+            with self._write_lock:
+                for article_id, value in pending.items():
+                    self._pending_schema_upgrades.setdefault(article_id, value)
+            return 0
+    
     # =========================================================================
     # Utility
     # =========================================================================
@@ -847,10 +1846,18 @@ class ArticleRegistry:
     
     def reset(self):
         """레지스트리 리셋 (테스트용)"""
-        self._articles.clear()
-        self._by_state.clear()
-        self._by_url.clear()
-        ArticleRegistry._initialized = False
+        with self._write_lock:
+            if self._watcher is not None:
+                self._watcher.stop()
+                self._watcher = None
+            self._shared_ready = False
+            self._snapshot = _IndexSnapshot(self._snapshot.generation + 1)
+            self._full_data = {}
+            self._ready.clear()
+            self._warmup['phase'] = 'idle'
+            self._shared = None
+            self._partial_states = None
+            ArticleRegistry._initialized = False
         print("🔄 [Registry] Reset completed.")
     
     def refresh(self, include_firestore: bool = True):
@@ -864,85 +1871,88 @@ class ArticleRegistry:
         new_count = 0
         firestore_count = 0
         
-        # 1. Firestore에서 새 기사 가져오기 (먼저!)
-        if include_firestore and self._db:
+        # 1. Firestore에서 새 기사 가져오기 (먼저!) - 실시간 구독 중이면 이미 반영됨
+        # Firestore 예상 사용량이 소프트 예산을 넘으면 생략 (다음 refresh 또는 구독에서 반영)
+        if include_firestore and self._db and not self.is_live_synced() \
+                and allow_optional('registry Firestore refresh'):
             firestore_count = self._sync_new_from_firestore()
         
-        # 2. 로컬 캐시 스캔
-        if self._cache_root and os.path.exists(self._cache_root):
-            cutoff_date = datetime.now() - timedelta(days=self._max_age_days)
-            cutoff_str = cutoff_date.strftime('%Y-%m-%d')
-            
-            for folder in glob.glob(os.path.join(self._cache_root, '*')):
-                folder_name = os.path.basename(folder)
-                if not folder_name.startswith('20') or folder_name < cutoff_str:
+        # 2. 로컬 캐시 스캔 (이미 등록된 기사 제외)
+        cutoff_date = datetime.now() - timedelta(days=self._max_age_days)
+        cutoff_str = cutoff_date.strftime('%Y-%m-%d')
+        
+        with self._writing() as draft:
+            for stored in self._get_store().iter_articles(since_date=cutoff_str, exclude_ids=draft.articles):
+                try:
+                    # [최적화] 새로고침 시 Firestore 저장 스킵
+                    info = self.register(stored.data, cache_path=stored.location, skip_firestore=True)
+                    if info:
+                        new_count += 1
+                except Exception:
                     continue
-                
-                for fpath in glob.glob(os.path.join(folder, '*.json')):
-                    try:
-                        article_id = os.path.basename(fpath).replace('.json', '')
-                        if article_id in self._articles:
-                            continue  # 이미 등록됨
-                        
-                        with open(fpath, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
-                        # [최적화] 새로고침 시 Firestore 저장 스킵
-                        info = self.register(data, cache_path=fpath, skip_firestore=True)
-                        if info:
-                            new_count += 1
-                    except Exception:
-                        continue
         
         total = new_count + firestore_count
         if total > 0:
             print(f"🔄 [Registry] Refreshed: {new_count} from local, {firestore_count} from Firestore")
     
     def _sync_new_from_firestore(self) -> int:
-        """Firestore에서 Registry에 없는 새 기사만 가져오기"""
+        """
+        Firestore 변경분 가져오기
+        - watermark가 있으면 그 이후 수정된 기사만 (새 기사 + 다른 곳에서 바뀐 기사)
+        - 없으면 Registry에 없는 새 기사만 상태별 전체 조회
+        """
         if not self._db:
             return 0
         
+        watermark = self._read_watermark()
+        if watermark:
+            try:
+                return self._sync_firestore_changes(watermark)
+            except Exception as e:
+                print(f"⚠️ [Registry] Incremental sync failed, scanning by state: {e}")
+        
         new_count = 0
         cutoff_date = datetime.now() - timedelta(days=self._max_age_days)
         cutoff_iso = cutoff_date.strftime('%Y-%m-%dT%H:%M:%S+09:00')
         
-        states_to_load = ['COLLECTED', 'ANALYZED', 'CLASSIFIED', 'REJECTED']
-        
-        for state in states_to_load:
+        for state in UNPUBLISHED_STATES:
             try:
                 articles = self._db.list_articles_by_state(state, limit=500)
+                self._attach_content(articles, cutoff_iso)
                 
-                for data in articles:
-                    article_id = data.get('_header', {}).get('article_id')
-                    if not article_id:
-                        continue
-                    
-                    # 이미 Registry에 있으면 스킵
-                    if article_id in self._articles:
-                        continue
-                    
-                    # 시간 체크 (Firestore DatetimeWithNanoseconds 대응)
-                    published_at = _normalize_timestamp(data.get('_original', {}).get('published_at', ''))
-                    created_at = _normalize_timestamp(data.get('_header', {}).get('created_at', ''))
-                    date_source = published_at or created_at
-                    if date_source and date_source < cutoff_iso:
-                        continue
-                    
-                    # 새 기사 등록
-                    info = self._parse_article_data(data)
-                    if info:
-                        info.firestore_synced = True
-                        self._full_data[info.article_id] = data
+                with self._writing() as draft:
+                    for data in articles:
+                        article_id = data.get('_header', {}).get('article_id')
+                        if not article_id:
+                            continue
                         
-                        # 로컬 캐시에도 저장
-                        cache_path = self._save_to_local_cache(data, info.article_id)
-                        if cache_path:
-                            info.cache_path = cache_path
+                        # 이미 Registry에 있으면 스킵
+                        if article_id in draft.articles:
+                            continue
                         
-                        self._register_article(info, source='firestore_sync')
-                        new_count += 1
-                        print(f"   ☁️ [Sync] New from Firestore: {article_id}")
+                        # 시간 체크 (Firestore DatetimeWithNanoseconds 대응)
+                        published_at = _normalize_timestamp(data.get('_original', {}).get('published_at', ''))
+                        created_at = _normalize_timestamp(data.get('_header', {}).get('created_at', ''))
+                        date_source = published_at or created_at
+                        if date_source and date_source < cutoff_iso:
+                            continue
+                        if needs_content(data):
+                            continue  # 본문 문서를 읽지 못함 - 다음 새로고침에서 다시 시도
+                        
+                        # 새 기사 등록
+                        info = self._parse_article_data(data)
+                        if info:
+                            info.firestore_synced = True
+                            
+                            # 로컬 캐시에도 저장
+                            cache_path = self._save_to_local_cache(data, info.article_id)
+                            if cache_path:
+                                info.cache_path = cache_path
+                            self._remember_full_data(info.article_id, data, info.cache_path)
+                            
+                            draft.put(info)
+                            new_count += 1
+                            print(f"   ☁️ [Sync] New from Firestore: {article_id}")
                         
             except Exception as e:
                 print(f"⚠️ [Registry] Firestore sync error for {state}: {e}")
@@ -959,8 +1969,8 @@ def get_registry() -> ArticleRegistry:
     return ArticleRegistry()
 
 
-def init_registry(cache_root: str = None, db_client = None):
-    """레지스트리 초기화 (서버 시작 시 호출)"""
+def init_registry(cache_root: str = None, db_client = None, background: bool = False):
+    """레지스트리 초기화 (서버 시작 시 호출, background=True면 워밍업 후 즉시 반환)"""
     registry = get_registry()
-    registry.initialize(cache_root, db_client)
+    registry.initialize(cache_root, db_client, background=background)
     return registry
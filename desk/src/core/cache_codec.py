@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Codec - 로컬 캐시 기사 인코딩
+
+인코딩 (LOCAL_STORE_ENCODING 환경변수):
+    pretty  : json.dump(indent=2, ensure_ascii=False) - 기존 형식 (기본)
+    compact : 공백 없는 JSON + 긴 본문 필드 압축 + 중복 레거시 필드 제거
+
+compact 형식도 유효한 JSON이므로 캐시를 직접 읽는 도구는 헤더/점수를 그대로 읽을 수 있습니다.
+본문 필드는 {"__z__": "gzip"|"zstd", "b64": ...}로 저장되고,
+최상위 "_codec" 마커에 복원 정보(버전, 중복 필드 위치)가 기록됩니다.
+
+decode_article()은 두 형식을 모두 자동 판별합니다.
+"""
+import os
+import json
+import gzip
+import base64
+from typing import Dict, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경 → 표준 json 사용
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 환경 → gzip 사용
+    zstandard = None
+
+CODEC_VERSION = 1
+ENCODINGS = ('pretty', 'compact')
+
+# 압축 대상 본문 필드 (_original 섹션 + 최상위 레거시 필드)
+PACKED_FIELDS = ('text', 'html', 'raw_html', 'content')
+MIN_PACK_LENGTH = 512
+
+# 최상위 중복 필드 탐색 순서 (ArticleManager._flatten_article 우선순위와 동일)
+DEDUPE_SECTIONS = ('_publication', '_classification', '_analysis', '_original', '_header')
+
+
+def get_default_encoding() -> str:
+    encoding = os.getenv('LOCAL_STORE_ENCODING', 'pretty').lower()
+    return encoding if encoding in ENCODINGS else 'pretty'
+
+
+def get_default_compression() -> str:
+    method = os.getenv('CACHE_TEXT_COMPRESSION', 'gzip').lower()
+    if method == 'zstd' and zstandard is None:
+        return 'gzip'
+    return method if method in ('gzip', 'zstd') else 'gzip'
+
+
+def _json_default(obj):
+    """datetime(Firestore Timestamp 포함) 등 직렬화"""
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+
+# =============================================================================
+# Text Compression
+# =============================================================================
+
+def _compress_text(text: str, method: str) -> Dict[str, str]:
+    raw = text.encode('utf-8')
+    if method == 'zstd':
+        packed = zstandard.ZstdCompressor(level=6).compress(raw)
+    else:
+        packed = gzip.compress(raw, compresslevel=6, mtime=0)
+    return {'__z__': method, 'b64': base64.b64encode(packed).decode('ascii')}
+
+
+def _decompress_text(value: Dict[str, str]) -> str:
+    packed = base64.b64decode(value['b64'])
+    if value['__z__'] == 'zstd':
+        if zstandard is None:
+            raise RuntimeError("zstd-compressed cache requires the 'zstandard' package")
+        raw = zstandard.ZstdDecompressor().decompress(packed)
+    else:
+        raw = gzip.decompress(packed)
+    return raw.decode('utf-8')
+
+
+def _is_packed(value) -> bool:
+    return isinstance(value, dict) and '__z__' in value and 'b64' in value
+
+
+def _pack_fields(section: Dict[str, Any], method: str) -> Dict[str, Any]:
+    packed = None
+    for key in PACKED_FIELDS:
+        value = section.get(key)
+        if isinstance(value, str) and len(value) >= MIN_PACK_LENGTH:
+            if packed is None:
+                packed = dict(section)
+            packed[key] = _compress_text(value, method)
+    return packed if packed is not None else section
+
+
+def _unpack_fields(section: Dict[str, Any]):
+    for key in PACKED_FIELDS:
+        if _is_packed(section.get(key)):
+            section[key] = _decompress_text(section[key])
+
+
+# =============================================================================
+# Pack / Unpack
+# =============================================================================
+
+def pack_article(data: Dict[str, Any], compression: str = None) -> Dict[str, Any]:
+    """
+    compact 형식으로 변환 (원본은 변경하지 않음)
+    - 최상위 레거시 필드 중 섹션 값과 같은 것은 제거하고 위치만 기록
+    - 긴 본문 필드는 압축
+    """
+    method = compression or get_default_compression()
+    packed = {}
+    dup = {}
+    for key, value in data.items():
+        if key == '_codec':
+            continue
+        if not key.startswith('_'):
+            for section in DEDUPE_SECTIONS:
+                section_data = data.get(section)
+                if isinstance(section_data, dict) and key in section_data and section_data[key] == value:
+                    dup[key] = section
+                    break
+            if key in dup:
+                continue
+        packed[key] = value
+
+    if isinstance(packed.get('_original'), dict):
+        packed['_original'] = _pack_fields(packed['_original'], method)
+    packed = _pack_fields(packed, method)
+
+    packed['_codec'] = {'v': CODEC_VERSION, 'dup': dup}
+    return packed
+
+
+def unpack_article(data: Dict[str, Any]) -> Dict[str, Any]:
+    """compact 형식 복원 (in-place, 방금 파싱한 데이터 전용)"""
+    codec = data.pop('_codec', None)
+    if codec is None:
+        return data
+
+    if isinstance(data.get('_original'), dict):
+        _unpack_fields(data['_original'])
+    _unpack_fields(data)
+
+    for key, section in (codec.get('dup') or {}).items():
+        section_data = data.get(section)
+        if isinstance(section_data, dict) and key in section_data:
+            data[key] = section_data[key]
+    return data
+
+
+# =============================================================================
+# Encode / Decode
+# =============================================================================
+
+def _dumps_compact(obj: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # orjson이 처리하지 못하는 값 (64bit 초과 정수 등) → 표준 json
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # BOM/NaN 등 표준 json만 허용하는 입력 → 아래에서 재시도
+    return json.loads(raw.decode('utf-8-sig'))
+
+
+def encode_article(data: Dict[str, Any], encoding: str = None, compression: str = None) -> bytes:
+    """기사 데이터를 디스크 저장용 바이트로 인코딩"""
+    encoding = encoding or get_default_encoding()
+    if encoding == 'compact':
+        return _dumps_compact(pack_article(data, compression))
+    return json.dumps(data, ensure_ascii=False, indent=2, default=_json_default).encode('utf-8')
+
+
+def decode_article(raw: bytes) -> Optional[Dict[str, Any]]:
+    """
+    기존(pretty) / compact 형식 자동 판별 디코딩
+
+    Raises:
+        json.JSONDecodeError: 손상된 데이터
+    """
+    data = _loads(raw)
+    if isinstance(data, dict) and '_codec' in data:
+        unpack_article(data)
+    return data
+
+
+def detect_encoding(raw: bytes) -> str:
+    """저장된 바이트의 인코딩 판별 (변환/통계용)"""
+    return 'compact' if b'"_codec"' in raw else 'pretty'
@@ -0,0 +1,511 @@
+# -*- coding: utf-8 -*-
+"""
+Cache Segments - 날짜별 기사 캐시 압축 보관 (segment + offset index)
+
+오래된 날짜 폴더의 기사 파일들을 하나의 segment 파일로 묶고,
+article_id -> (offset, length) 색인으로 mmap 읽기를 합니다.
+최근(hot) 날짜는 기존처럼 기사별 개별 파일로 유지됩니다.
+
+폴더 구조 (압축 후):
+    cache/<env>/<YYYY-MM-DD>/segment.<gen>.dat   # "<article_id>\\t<compact json>\\n" 레코드 연속
+    cache/<env>/<YYYY-MM-DD>/segment.idx         # {"segment": ..., "entries": {id: [offset, length]}}
+    cache/<env>/<YYYY-MM-DD>/<article_id>.json   # 압축 이후 수정된 기사 (segment보다 우선)
+
+Crash-safety:
+    새 segment(새 세대 번호)를 임시 파일로 쓰고 fsync → rename,
+    색인을 임시 파일로 쓰고 fsync → os.replace (커밋 지점),
+    그 후에야 개별 파일과 이전 세대 segment를 삭제합니다.
+    어느 단계에서 중단되어도 (이전 색인 + 개별 파일) 또는 (새 색인 + 중복 개별 파일)
+    상태가 되어 데이터가 유실되지 않습니다.
+"""
+import os
+import re
+import json
+import mmap
+import time
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple
+
+from src.core_logic import get_kst_now
+from .cache_codec import encode_article, decode_article
+
+SEGMENT_INDEX = 'segment.idx'
+SEGMENT_LOCK = 'segment.lock'
+SEGMENT_RE = re.compile(r'^segment\.(\d+)\.dat$')
+INDEX_VERSION = 1
+LOCK_STALE_SECONDS = 3600
+
+
+def get_hot_days() -> int:
+    """개별 파일로 유지할 최근 일수"""
+    return int(os.getenv('CACHE_HOT_DAYS', 14))
+
+
+# =============================================================================
+# Reader
+# =============================================================================
+
+class DaySegment:
+    """하루치 segment 읽기 전용 뷰 (mmap, 색인 변경 시 자동 재적재)"""
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.index_path = os.path.join(folder, SEGMENT_INDEX)
+        self.segment_path: Optional[str] = None
+        self.entries: Dict[str, List[int]] = {}
+        self.mtime = 0.0
+        self.stamp = None
+        self._fh = None
+        self._mm = None
+        self._lock = threading.Lock()
+
+    def refresh(self) -> bool:
+        """
+        색인 파일이 바뀌었으면 다시 읽기
+
+        Returns:
+            segment가 존재하면 True
+        """
+        try:
+            st = os.stat(self.index_path)
+        except FileNotFoundError:
+            self.close()
+            self.entries = {}
+            return False
+
+        stamp = (st.st_mtime_ns, st.st_ino, st.st_size)
+        if stamp == self.stamp:
+            return True
+
+        with self._lock:
+            index = read_index(self.folder)
+            if not index:
+                return False
+            segment_path = os.path.join(self.folder, index['segment'])
+            if segment_path != self.segment_path:
+                self._close_map()
+                self._fh = open(segment_path, 'rb')
+                size = os.fstat(self._fh.fileno()).st_size
+                self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+                self.segment_path = segment_path
+            self.entries = index['entries']
+            self.mtime = st.st_mtime
+            self.stamp = stamp
+        return True
+
+    def __contains__(self, article_id: str) -> bool:
+        return article_id in self.entries
+
+    def location(self, article_id: str) -> str:
+        return f'{self.segment_path}#{article_id}'
+
+    def read_raw(self, article_id: str) -> Optional[bytes]:
+        entry = self.entries.get(article_id)
+        if entry is None or self._mm is None:
+            return None
+        offset, length = entry
+        with self._lock:
+            return self._mm[offset:offset + length]
+
+    def read(self, article_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.read_raw(article_id)
+        return decode_article(raw) if raw is not None else None
+
+    def _close_map(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        self.segment_path = None
+
+    def close(self):
+        with self._lock:
+            self._close_map()
+            self.mtime = 0.0
+            self.stamp = None
+
+
+# =============================================================================
+# Index I/O
+# =============================================================================
+
+def _fsync_write(path: str, payload: bytes):
+    with open(path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _fsync_dir(folder: str):
+    """rename 결과를 디스크에 고정 (POSIX 전용, Windows는 무시)"""
+    if os.name != 'posix':
+        return
+    fd = os.open(folder, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _segment_files(folder: str) -> List[Tuple[int, str]]:
+    found = []
+    for name in os.listdir(folder):
+        match = SEGMENT_RE.match(name)
+        if match:
+            found.append((int(match.group(1)), name))
+    return sorted(found)
+
+
+def scan_segment(segment_path: str) -> Dict[str, List[int]]:
+    """segment 레코드를 순차 스캔하여 색인 재구성 (색인 손상 시 복구용)"""
+    entries = {}
+    offset = 0
+    with open(segment_path, 'rb') as f:
+        for line in f:
+            tab = line.find(b'\t')
+            if tab > 0 and line.endswith(b'\n'):
+                article_id = line[:tab].decode('utf-8')
+                entries[article_id] = [offset + tab + 1, len(line) - tab - 2]
+            offset += len(line)
+    return entries
+
+
+def read_index(folder: str) -> Optional[Dict[str, Any]]:
+    """색인 읽기 (손상 시 최신 세대 segment 스캔으로 복구)"""
+    index_path = os.path.join(folder, SEGMENT_INDEX)
+    if not os.path.exists(index_path):
+        return None
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') == INDEX_VERSION and os.path.exists(os.path.join(folder, index['segment'])):
+            return index
+    except Exception as e:
+        print(f"⚠️ [Segments] Broken index in {folder}: {e}")
+
+    segments = _segment_files(folder)
+    if not segments:
+        return None
+    generation, name = segments[-1]
+    print(f"🛠️ [Segments] Rebuilding index from {name}")
+    return {
+        'version': INDEX_VERSION,
+        'segment': name,
+        'generation': generation,
+        'entries': scan_segment(os.path.join(folder, name)),
+    }
+
+
+def _write_index(folder: str, index: Dict[str, Any]):
+    index_path = os.path.join(folder, SEGMENT_INDEX)
+    tmp_path = index_path + '.tmp'
+    _fsync_write(tmp_path, json.dumps(index, ensure_ascii=False).encode('utf-8'))
+    os.replace(tmp_path, index_path)
+    _fsync_dir(folder)
+
+
+# =============================================================================
+# Lock
+# =============================================================================
+
+class _FolderLock:
+    """날짜 폴더 단위 프로세스 간 잠금 (O_EXCL 잠금 파일)"""
+
+    def __init__(self, folder: str):
+        self.path = os.path.join(folder, SEGMENT_LOCK)
+        self.fd = None
+
+    def acquire(self) -> bool:
+        try:
+            if time.time() - os.stat(self.path).st_mtime > LOCK_STALE_SECONDS:
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        try:
+            self.fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(self.fd, str(os.getpid()).encode())
+            return True
+        except FileExistsError:
+            return False
+
+    def release(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+# =============================================================================
+# Writer
+# =============================================================================
+
+def compact_day(folder: str, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    날짜 폴더를 segment로 압축 (기존 segment + 개별 파일 병합)
+
+    Returns:
+        {'folder', 'files', 'records', 'bytes_before', 'bytes_after', 'skipped'}
+    """
+    result = {'folder': os.path.basename(folder), 'files': 0, 'records': 0,
+              'bytes_before': 0, 'bytes_after': 0, 'skipped': None}
+
+    lock = _FolderLock(folder)
+    if not lock.acquire():
+        result['skipped'] = 'locked'
+        return result
+
+    try:
+        records: Dict[str, bytes] = {}
+        index = read_index(folder)
+        previous = DaySegment(folder)
+        if index and previous.refresh():
+            for article_id in previous.entries:
+                records[article_id] = previous.read_raw(article_id)
+            result['bytes_before'] += os.path.getsize(previous.segment_path)
+        previous.close()
+
+        # 개별 파일 (segment보다 최신) - 읽은 시점의 mtime 기록
+        files: Dict[str, float] = {}
+        for entry in os.scandir(folder):
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                stat = entry.stat()
+                with open(entry.path, 'rb') as f:
+                    data = decode_article(f.read())
+                if not isinstance(data, dict):
+                    continue
+            except Exception as e:
+                print(f"⚠️ [Segments] Skipping unreadable {entry.path}: {e}")
+                continue
+            records[entry.name[:-5]] = encode_article(data, 'compact')
+            files[entry.path] = stat.st_mtime
+            result['bytes_before'] += stat.st_size
+
+        result['files'] = len(files)
+        result['records'] = len(records)
+        if not files or dry_run:
+            if not files:
+                result['skipped'] = 'nothing to compact'
+            return result
+
+        # 1. 새 세대 segment 기록
+        generation = max([g for g, _ in _segment_files(folder)] + [index.get('generation', 0) if index else 0]) + 1
+        segment_name = f'segment.{generation}.dat'
+        segment_path = os.path.join(folder, segment_name)
+        tmp_path = segment_path + '.tmp'
+        entries = {}
+        offset = 0
+        with open(tmp_path, 'wb') as f:
+            for article_id in sorted(records):
+                body = records[article_id]
+                prefix = article_id.encode('utf-8') + b'\t'
+                f.write(prefix + body + b'\n')
+                entries[article_id] = [offset + len(prefix), len(body)]
+                offset += len(prefix) + len(body) + 1
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, segment_path)
+        result['bytes_after'] = offset
+
+        # 2. 색인 교체 (커밋 지점)
+        _write_index(folder, {
+            'version': INDEX_VERSION,
+            'segment': segment_name,
+            'generation': generation,
+            'compacted_at': get_kst_now(),
+            'entries': entries,
+        })
+
+        # 3. 정리: 읽은 이후 수정되지 않은 개별 파일 + 이전 세대 segment
+        for path, mtime in files.items():
+            try:
+                if os.stat(path).st_mtime == mtime:
+                    os.remove(path)
+            except OSError:
+                pass
+        for _, name in _segment_files(folder):
+            if name != segment_name:
+                try:
+                    os.remove(os.path.join(folder, name))
+                except OSError:
+                    pass  # Windows: 다른 프로세스가 mmap 중 → 다음 압축 때 삭제
+
+        return result
+    finally:
+        lock.release()
+
+
+def remove_from_segment(folder: str, article_id: str) -> bool:
+    """segment 색인에서 기사 제거 (데이터 바이트는 다음 압축 때 정리)"""
+    lock = _FolderLock(folder)
+    for _ in range(50):
+        if lock.acquire():
+            break
+        time.sleep(0.1)
+    else:
+        print(f"⚠️ [Segments] Lock timeout: {folder}")
+        return False
+
+    try:
+        index = read_index(folder)
+        if not index or article_id not in index['entries']:
+            return False
+        del index['entries'][article_id]
+        _write_index(folder, index)
+        return True
+    finally:
+        lock.release()
+
+
+def expand_day(folder: str) -> int:
+    """segment를 다시 개별 파일로 풀기 (압축 되돌리기)"""
+    from .cache_codec import get_default_encoding
+
+    lock = _FolderLock(folder)
+    if not lock.acquire():
+        print(f"⚠️ [Segments] Locked: {folder}")
+        return 0
+
+    try:
+        segment = DaySegment(folder)
+        if not segment.refresh():
+            return 0
+        written = 0
+        encoding = get_default_encoding()
+        for article_id in list(segment.entries):
+            path = os.path.join(folder, f'{article_id}.json')
+            if os.path.exists(path):
+                continue  # 개별 파일이 더 최신
+            tmp_path = path + '.tmp'
+            _fsync_write(tmp_path, encode_article(segment.read(article_id), encoding))
+            os.replace(tmp_path, path)
+            written += 1
+        segment.close()
+
+        os.remove(os.path.join(folder, SEGMENT_INDEX))
+        for _, name in _segment_files(folder):
+            try:
+                os.remove(os.path.join(folder, name))
+            except OSError:
+                pass
+        return written
+    finally:
+        lock.release()
+
+
+def compact_cold_days(cache_root: str, hot_days: int = None, dry_run: bool = False,
+                      progress: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    """hot_days 이전의 모든 날짜 폴더 압축"""
+    from .local_store import DATE_FOLDER_RE
+
+    hot_days = get_hot_days() if hot_days is None else hot_days
+    cutoff = (datetime.now() - timedelta(days=hot_days)).strftime('%Y-%m-%d')
+    if not os.path.isdir(cache_root):
+        return []
+    folders = sorted(
+        name for name in os.listdir(cache_root)
+        if DATE_FOLDER_RE.match(name) and name < cutoff
+    )
+    if progress is not None:
+        progress['total'] = len(folders)
+
+    results = []
+    for name in folders:
+        result = compact_day(os.path.join(cache_root, name), dry_run=dry_run)
+        results.append(result)
+        if progress is not None:
+            progress['processed'] += 1
+            progress['compacted'] += 0 if result['skipped'] else 1
+        if not result['skipped'] and not dry_run:
+            print(f"🗜️ [Segments] {name}: {result['files']} files → {result['records']} records "
+                  f"({result['bytes_before'] / 1e6:.1f}MB → {result['bytes_after'] / 1e6:.1f}MB)")
+    return results
+
+
+# =============================================================================
+# Background Compactor
+# =============================================================================
+
+class CacheCompactor:
+    """
+    백그라운드 캐시 압축기 (싱글톤)
+
+    CACHE_COMPACTION=true 이면 서버 시작 시 주기 실행
+    (CACHE_COMPACT_INTERVAL_HOURS, 기본 6시간)
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        from .local_store import get_default_cache_root
+        self.cache_root = get_default_cache_root()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._progress = {'status': 'idle', 'total': 0, 'processed': 0, 'compacted': 0,
+                          'started_at': None, 'finished_at': None, 'error': None}
+        self._initialized = True
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_progress(self) -> Dict[str, Any]:
+        return dict(self._progress)
+
+    def run_once(self, hot_days: int = None) -> List[Dict[str, Any]]:
+        self._progress.update({'status': 'running', 'total': 0, 'processed': 0, 'compacted': 0,
+                               'started_at': get_kst_now(), 'finished_at': None, 'error': None})
+        try:
+            results = compact_cold_days(self.cache_root, hot_days, progress=self._progress)
+            self._progress['status'] = 'completed'
+            return results
+        except Exception as e:
+            self._progress['status'] = 'failed'
+            self._progress['error'] = str(e)
+            print(f"⚠️ [Segments] Compaction failed: {e}")
+            return []
+        finally:
+            self._progress['finished_at'] = get_kst_now()
+
+    def start(self, interval_hours: float = None) -> bool:
+        """주기 압축 스레드 시작 (이미 실행 중이면 False)"""
+        if self.is_running():
+            return False
+        interval = float(interval_hours or os.getenv('CACHE_COMPACT_INTERVAL_HOURS', 6)) * 3600
+        self._stop.clear()
+
+        def _loop():
+            while not self._stop.is_set():
+                self.run_once()
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=_loop, daemon=True, name='cache-compactor')
+        self._thread.start()
+        print(f"🗜️ [Segments] Background compactor started (hot_days={get_hot_days()})")
+        return True
+
+    def stop(self):
+        self._stop.set()
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+def get_compactor() -> CacheCompactor:
+    """압축기 인스턴스 반환"""
+    return CacheCompactor()
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+"""
+Cutline Simulator - 커트라인 What-if 시뮬레이션
+
+로컬 캐시 전체(기간 제한 없음)의 IS/ZES를 컬럼 배열로 적재해 두고,
+임의의 임계값에 대해 "배제될 기사 수"를 소스/카테고리/일자별로 즉시 집계합니다.
+기사 상태는 전혀 변경하지 않습니다.
+
+배제 규칙 (SchedulerPipeline._phase_reject와 동일):
+    ZES > max_zes  또는  IS < min_is
+"""
+import os
+import json
+import time
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+from src.core_logic import get_config
+from .local_store import get_local_store
+
+SCORED_STATES = ['ANALYZED', 'CLASSIFIED', 'PUBLISHED', 'RELEASED', 'REJECTED']
+INDEX_VERSION = 1
+
+
+def get_cutline_defaults() -> Dict[str, float]:
+    """현재 적용 중인 커트라인 (automation_config.json scoring 섹션)"""
+    return {
+        'max_zes': float(get_config('scoring', 'max_acceptable_zes', 6.0)),
+        'min_is': float(get_config('scoring', 'min_impact_score', 0.0)),
+    }
+
+
+class ScoreCorpus:
+    """
+    캐시 전체 점수 컬럼 저장소 (싱글톤)
+
+    항목별 (stamp, 행) 인덱스를 _cutline/corpus_index.json에 보관하여
+    재적재 시 변경된 항목만 다시 파싱합니다.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = os.getenv('ZND_ENV', 'dev')
+        self.cache_root = os.path.join(base_dir, 'cache', env)
+        self.index_path = os.path.join(self.cache_root, '_cutline', 'corpus_index.json')
+        self._rows: Dict[str, list] = {}   # location -> [stamp, article_id, is, zes, state, source, category, day]
+        self._columns: Optional[Dict[str, Any]] = None
+        self._loaded_at = 0.0
+        self._initialized = True
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    def _load_index(self):
+        if self._rows or not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == INDEX_VERSION:
+                self._rows = index.get('rows', {})
+        except Exception as e:
+            print(f"⚠️ [Cutline] Failed to read index: {e}")
+
+    def _save_index(self):
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'rows': self._rows}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            print(f"⚠️ [Cutline] Failed to save index: {e}")
+
+    @staticmethod
+    def _parse_row(data: dict, day: str) -> Optional[list]:
+        header = data.get('_header', {})
+        analysis = data.get('_analysis') or {}
+        if 'zero_echo_score' not in analysis and 'impact_score' not in analysis:
+            return None
+        original = data.get('_original', {})
+        classification = data.get('_classification') or {}
+        return [
+            header.get('article_id', ''),
+            float(analysis.get('impact_score', 0) or 0),
+            float(analysis.get('zero_echo_score', 10) or 0),
+            header.get('state', ''),
+            header.get('source_id') or original.get('source_id') or 'unknown',
+            classification.get('category') or '',
+            day,
+        ]
+
+    def load(self, force: bool = False) -> int:
+        """
+        캐시 스캔 후 컬럼 재구성 (변경 파일만 파싱)
+
+        Returns:
+            적재된 기사 수
+        """
+        self._load_index()
+        if force:
+            self._rows = {}
+
+        start = time.perf_counter()
+        seen = set()
+        parsed = 0
+        # 개별 파일 / 압축 segment / SQLite 모두 항목별 stamp로 변경 감지
+        for entry in get_local_store(self.cache_root).iter_entries():
+            path = entry.location
+            seen.add(path)
+            cached = self._rows.get(path)
+            if cached and cached[0] == entry.stamp:
+                continue
+            try:
+                data = entry.read()
+                row = self._parse_row(data, entry.date_folder) if isinstance(data, dict) else None
+            except Exception:
+                row = None
+            self._rows[path] = [entry.stamp] + row if row else [entry.stamp]
+            parsed += 1
+
+        for path in set(self._rows) - seen:
+            del self._rows[path]
+
+        if parsed or force or self._columns is None:
+            self._build_columns()
+            if parsed:
+                self._save_index()
+
+        self._loaded_at = time.time()
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"📊 [Cutline] Corpus loaded: {self.size()} scored articles "
+              f"({parsed} files parsed, {elapsed:.0f}ms)")
+        return self.size()
+
+    def _build_columns(self):
+        rows = [r[1:] for r in self._rows.values() if len(r) > 1]
+        if not rows:
+            self._columns = None
+            return
+        ids, is_vals, zes_vals, states, sources, categories, days = zip(*rows)
+        columns = {
+            'article_id': np.array(ids, dtype=object),
+            'is': np.array(is_vals, dtype=np.float64),
+            'zes': np.array(zes_vals, dtype=np.float64),
+        }
+        for key, values in (('state', states), ('source', sources), ('category', categories), ('day', days)):
+            labels, codes = np.unique(np.array(values, dtype=object).astype(str), return_inverse=True)
+            columns[f'{key}_labels'] = labels
+            columns[f'{key}_codes'] = codes.astype(np.int32)
+        self._columns = columns
+
+    def ensure_loaded(self, max_age_seconds: int = 300):
+        """적재 후 max_age_seconds가 지났으면 변경분만 재적재"""
+        if self._columns is None or time.time() - self._loaded_at > max_age_seconds:
+            self.load()
+
+    def size(self) -> int:
+        return 0 if self._columns is None else len(self._columns['is'])
+
+    # =========================================================================
+    # Simulation
+    # =========================================================================
+
+    def _state_mask(self, states: Optional[List[str]]):
+        cols = self._columns
+        wanted = [s.upper() for s in (states or SCORED_STATES)]
+        wanted_codes = [i for i, label in enumerate(cols['state_labels']) if label in wanted]
+        return np.isin(cols['state_codes'], wanted_codes)
+
+    @staticmethod
+    def _group(labels, codes, mask, reject) -> Dict[str, Dict[str, int]]:
+        total = np.bincount(codes[mask], minlength=len(labels))
+        rejected = np.bincount(codes[mask & reject], minlength=len(labels))
+        return {
+            str(labels[i]) or '(none)': {'total': int(total[i]), 'rejected': int(rejected[i])}
+            for i in np.nonzero(total)[0]
+        }
+
+    def simulate(self, max_zes: float = None, min_is: float = None,
+                 states: List[str] = None) -> Dict[str, Any]:
+        """
+        임계값 적용 시 배제 결과 집계 (상태 변경 없음)
+
+        Args:
+            max_zes: ZES 상한 (초과 시 배제, 기본: 현재 설정)
+            min_is: IS 하한 (미만 시 배제, 기본: 현재 설정)
+            states: 대상 상태 목록 (기본: 점수가 있는 모든 상태)
+        """
+        defaults = get_cutline_defaults()
+        max_zes = defaults['max_zes'] if max_zes is None else float(max_zes)
+        min_is = defaults['min_is'] if min_is is None else float(min_is)
+
+        self.ensure_loaded()
+        result = {
+            'thresholds': {'max_zes': max_zes, 'min_is': min_is},
+            'current': defaults,
+            'states': states or SCORED_STATES,
+            'total': 0, 'rejected': 0, 'newly_rejected': 0, 'restored': 0,
+            'by_source': {}, 'by_category': {}, 'by_day': {}
+        }
+        if self._columns is None:
+            return result
+
+        start = time.perf_counter()
+        cols = self._columns
+        mask = self._state_mask(states)
+        reject = (cols['zes'] > max_zes) | (cols['is'] < min_is)
+
+        rejected_codes = [i for i, label in enumerate(cols['state_labels']) if label == 'REJECTED']
+        currently_rejected = np.isin(cols['state_codes'], rejected_codes)
+
+        result.update({
+            'total': int(mask.sum()),
+            'rejected': int((mask & reject).sum()),
+            'newly_rejected': int((mask & reject & ~currently_rejected).sum()),
+            'restored': int((mask & ~reject & currently_rejected).sum()),
+            'by_source': self._group(cols['source_labels'], cols['source_codes'], mask, reject),
+            'by_category': self._group(cols['category_labels'], cols['category_codes'], mask, reject),
+            'by_day': self._group(cols['day_labels'], cols['day_codes'], mask, reject),
+        })
+        result['elapsed_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        return result
+
+    def sweep(self, zes_values: List[float], min_is: float = None,
+              states: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        여러 ZES 상한에 대한 배제 수 곡선 (정렬 + searchsorted, O(log n) per 값)
+        """
+        defaults = get_cutline_defaults()
+        min_is = defaults['min_is'] if min_is is None else float(min_is)
+        self.ensure_loaded()
+        if self._columns is None:
+            return [{'max_zes': float(v), 'rejected': 0, 'total': 0} for v in zes_values]
+
+        cols = self._columns
+        mask = self._state_mask(states)
+        zes = cols['zes'][mask]
+        is_low = cols['is'][mask] < min_is
+        always = int(is_low.sum())
+        zes_sorted = np.sort(zes[~is_low])
+        total = len(zes)
+        return [
+            {
+                'max_zes': float(v),
+                'rejected': always + int(len(zes_sorted) - np.searchsorted(zes_sorted, float(v), side='right')),
+                'total': total
+            }
+            for v in zes_values
+        ]
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+def get_score_corpus() -> ScoreCorpus:
+    """점수 코퍼스 인스턴스 반환"""
+    return ScoreCorpus()
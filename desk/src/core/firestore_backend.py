@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Firestore Backend - FirestoreClient 저장소 백엔드 선택
+
+FirestoreClient는 google-cloud-firestore Client API 중 아래 부분집합만 사용합니다.
+같은 의미로 구현한 객체는 FirestoreClient(backend=...) / FirestoreClient.use_backend()로 끼워 넣을 수 있습니다.
+
+    client.collection(name) / batch() / transaction() / get_all(문서 참조 목록)
+    CollectionReference / Query : document(), where(), order_by(), limit(), offset(), start_after(),
+                                  stream(), get(), count(), on_snapshot()
+    DocumentReference           : id, collection(), get(), set(data, merge), update(점 표기, ArrayUnion),
+                                  delete() / 필드 삭제 값 DELETE_FIELD, 숫자 증가 값 Increment
+    DocumentSnapshot            : id, exists, reference, to_dict(), get(field_path)
+    WriteBatch / Transaction    : set(), update(), delete(), commit(), (Transaction) get()
+    정렬 방향                    : ASCENDING / DESCENDING 문자열 (firestore.Query와 같은 값)
+
+FIRESTORE_BACKEND:
+    firebase (기본) - firebase_admin 서비스 계정 키, FIRESTORE_EMULATOR_HOST가 있으면 에뮬레이터
+    memory          - 프로세스 내 가짜 Firestore (firestore_memory.MemoryFirestore)
+                      FIRESTORE_FAKE_LATENCY_MS로 호출당 지연 흉내 (기본 0)
+"""
+import os
+
+
+ASCENDING = 'ASCENDING'
+DESCENDING = 'DESCENDING'
+
+BACKENDS = ('firebase', 'memory')
+
+
+def get_backend_name() -> str:
+    name = os.getenv('FIRESTORE_BACKEND', 'firebase').lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown FIRESTORE_BACKEND: {name} (expected one of {BACKENDS})")
+    return name
+
+
+def create_memory_backend(latency_ms: float = None):
+    """가짜 Firestore 생성 (latency_ms 미지정 시 FIRESTORE_FAKE_LATENCY_MS)"""
+    from .firestore_memory import MemoryFirestore
+    if latency_ms is None:
+        latency_ms = float(os.getenv('FIRESTORE_FAKE_LATENCY_MS', 0))
+    return MemoryFirestore(latency_ms=latency_ms)
+
+
+def is_memory_backend(db) -> bool:
+    from .firestore_memory import MemoryFirestore
+    return isinstance(db, MemoryFirestore)
+
+
+def run_in_transaction(db, fn, *args, **kwargs):
+    """
+    fn(transaction, ...)을 트랜잭션으로 실행 (충돌 시 재시도) - 백엔드 공용
+    firebase: firestore.transactional / memory: MemoryFirestore.run_transaction
+    """
+    if is_memory_backend(db):
+        return db.run_transaction(fn, *args, **kwargs)
+    from firebase_admin import firestore
+    return firestore.transactional(fn)(db.transaction(), *args, **kwargs)
+
+
+def array_union(db, values):
+    """update()에 넘길 배열 추가 값 (기존 배열에 없는 값만 뒤에 붙음) - 백엔드 공용"""
+    if is_memory_backend(db):
+        from .firestore_memory import ArrayUnion
+        return ArrayUnion(values)
+    from firebase_admin import firestore
+    return firestore.ArrayUnion(values)
+
+
+def increment(db, value: int = 1):
+    """update() / set(merge=True)에서 숫자 필드에 더하는 값 - 백엔드 공용"""
+    if is_memory_backend(db):
+        from .firestore_memory import Increment
+        return Increment(value)
+    from firebase_admin import firestore
+    return firestore.Increment(value)
+
+
+def delete_field(db):
+    """update() / set(merge=True)에서 필드를 지우는 값 - 백엔드 공용"""
+    if is_memory_backend(db):
+        from .firestore_memory import DELETE_FIELD
+        return DELETE_FIELD
+    from firebase_admin import firestore
+    return firestore.DELETE_FIELD
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """update() 대상 문서 없음 (google.api_core.exceptions.NotFound / firestore_memory.NotFound)"""
+    return type(error).__name__ == 'NotFound' or str(error).startswith('404')
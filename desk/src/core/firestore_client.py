@@ -4,12 +4,61 @@ Firestore Client for Article Management
 Firestore 연동 클래스 - 모든 데이터의 SSOT(Single Source of Truth)
 """
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any
 
-import firebase_admin
-from firebase_admin import credentials, firestore
+try:
+    import firebase_admin
+    from firebase_admin import credentials, firestore
+except ImportError:  # FIRESTORE_BACKEND=memory 는 firebase_admin 없이 동작
+    firebase_admin = credentials = firestore = None
 from src.core_logic import get_kst_now # [IMPORTS]
+from .firestore_backend import (DESCENDING, get_backend_name, create_memory_backend,
+                                array_union, delete_field, increment, is_not_found_error)
+from .article_diff import is_empty
+from .article_content import (CONTENTS_COLLECTION, is_content_split_enabled, split_article, split_diff,
+                              stale_fields, content_marker, content_rev, extract_content,
+                              merge_content, needs_content, is_split, changed_content_fields,
+                              content_updates, is_full_document)
+from .firestore_usage import record_usage, usage_scope
+from .history_index import (HistoryIndexCache, MANIFEST_DOC, LEGACY_DOC, SHARD_DOC_PREFIX,
+                            get_shard_chars, shard_of, shard_doc_id, parse_legacy_index)
+from .url_filter import get_url_filter, is_url_filter_enabled, collect_store_keys, url_keys
+from .url_canonical import canonical_key, lookup_keys, article_id_for
+
+KST = timezone(timedelta(hours=9))
+# 증분 동기화 쿼리(_header.updated_at > since)는 문자열 비교 - Firestore는 타입이 다른 값을 범위 비교에서 제외하므로
+# Timestamp로 저장된 시각은 문자열(KST ISO)로 맞춰 씀 (기존 문서: scripts/normalize_header_timestamps.py)
+HEADER_TIME_FIELDS = ('created_at', 'updated_at')
+
+
+def to_kst_iso(value):
+    """datetime (Firestore DatetimeWithNanoseconds 포함) → KST ISO 문자열 (get_kst_now 형식), 그 외는 그대로"""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(KST).isoformat()
+    return value
+
+
+def string_header_times(data: Dict[str, Any]) -> Dict[str, Any]:
+    """_header.created_at / updated_at을 문자열로 (바뀌는 경우에만 복사본)"""
+    header = data.get('_header') if isinstance(data, dict) else None
+    if not isinstance(header, dict) or not any(isinstance(header.get(f), datetime) for f in HEADER_TIME_FIELDS):
+        return data
+    header = {k: to_kst_iso(v) if k in HEADER_TIME_FIELDS else v for k, v in header.items()}
+    return {**data, '_header': header}
+
+
+def string_time_updates(updates: Dict[str, Any]) -> Dict[str, Any]:
+    """update() 인자의 _header 시각 (점 표기 또는 _header 전체)을 문자열로"""
+    paths = {f'_header.{f}' for f in HEADER_TIME_FIELDS}
+    if not any(path in updates for path in paths) and '_header' not in updates:
+        return updates
+    updates = {k: to_kst_iso(v) if k in paths else v for k, v in updates.items()}
+    if isinstance(updates.get('_header'), dict):
+        updates['_header'] = string_header_times({'_header': updates['_header']})['_header']
+    return updates
 
 
 class FirestoreClient:
@@ -23,30 +72,61 @@ class FirestoreClient:
         'session_start': None
     }
     
-    def __new__(cls):
+    def __new__(cls, backend=None):
         """싱글톤 패턴"""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._initialized = False
         return cls._instance
     
-    def __init__(self):
+    def __init__(self, backend=None):
+        """
+        Args:
+            backend: 저장소 백엔드 (None이면 FIRESTORE_BACKEND 설정, firestore_backend 참고)
+        """
         if self._initialized:
             return
-        self.db = self._initialize_firebase()
+        self.db = backend if backend is not None else self._initialize_backend()
         self._initialized = True
         
         # History Setup
         self.history = self._load_history()  # Local: URL -> timestamp
         self._remote_hashes = set()          # Remote: Hash set
-        self._load_remote_history_hashes()   # Load remote hashes
+        self._history_index = HistoryIndexCache(os.path.join(self._get_cache_dir(), '_history_index.json'))
+        self._url_filter = get_url_filter(self._get_cache_dir())
+        self._load_remote_history_hashes()   # Load remote hashes (바뀐 샤드만)
+        if is_url_filter_enabled() and not self._url_filter.ready:
+            self.rebuild_url_filter()        # 필터 파일이 없으면 한 번 전체 적재
         
         # Initialize usage stats
         self.reset_usage_stats()
         FirestoreClient._usage_stats['session_start'] = get_kst_now()
     
+    @classmethod
+    def use_backend(cls, backend) -> 'FirestoreClient':
+        """백엔드 교체 (벤치마크/검증용) - 싱글톤을 새 백엔드로 다시 생성"""
+        cls._instance = None
+        return cls(backend)
+    
+    def _initialize_backend(self):
+        """FIRESTORE_BACKEND에 따라 저장소 백엔드 생성"""
+        if get_backend_name() == 'memory':
+            print("🧪 Firestore backend: in-memory fake")
+            return create_memory_backend()
+        return self._initialize_firebase()
+    
     def _initialize_firebase(self):
         """Firebase 초기화"""
+        if firebase_admin is None:
+            raise ImportError("firebase_admin is not installed (FIRESTORE_BACKEND=memory for the in-memory fake)")
+        
+        # 에뮬레이터 (FIRESTORE_EMULATOR_HOST) - 서비스 계정 키 없이 연결
+        if os.getenv('FIRESTORE_EMULATOR_HOST'):
+            from google.auth.credentials import AnonymousCredentials
+            project_id = os.getenv('FIRESTORE_PROJECT_ID', 'demo-znd')
+            print(f"🧪 Firestore emulator: {os.getenv('FIRESTORE_EMULATOR_HOST')} (project {project_id})")
+            return firestore.Client(project=project_id, credentials=AnonymousCredentials())
+        
         if not firebase_admin._apps:
             # 서비스 계정 키 경로 탐색 (여러 위치 확인)
             base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -103,6 +183,11 @@ class FirestoreClient:
         env = os.getenv('ZND_ENV', 'dev')
         return os.path.join(base_dir, 'cache', env)
 
+    def _get_local_store(self):
+        """로컬 기사 저장소 반환 (LOCAL_STORE_BACKEND: json | sqlite)"""
+        from .local_store import get_local_store
+        return get_local_store(self._get_cache_dir())
+
     def _load_history(self):
         """crawling_history.json 로드 (로컬 전용)"""
         import json
@@ -116,31 +201,59 @@ class FirestoreClient:
         return {}
     
     def _load_remote_history_hashes(self):
-        """Firestore 히스토리 인덱스 로드 (Hash Set)"""
+        """Firestore 히스토리 인덱스 로드 (Hash Set) - 버전이 바뀐 샤드만 읽음 (history_index)"""
         try:
-            doc_ref = self._get_collection('history').document('_index')
-            doc = doc_ref.get()
-            self._track_read()
-
-            if doc.exists:
-                data = doc.to_dict()
-
-                # Case 1: 중첩 객체 형태 {'urls': {'hash1': {...}, 'hash2': {...}}}
-                urls_map = data.get('urls', {})
-                if urls_map:
-                    self._remote_hashes = set(urls_map.keys())
-                else:
-                    # Case 2: 플랫 키 형태 {'urls.hash1': {...}, 'urls.hash2': {...}}
-                    self._remote_hashes = set()
-                    for key in data.keys():
-                        if key.startswith('urls.'):
-                            hash_part = key[5:]  # 'urls.' 제거
-                            self._remote_hashes.add(hash_part)
-
-                print(f"📥 [History] Loaded {len(self._remote_hashes)} remote hashes")
+            fetched = self._refresh_history_index()
+            if fetched or not self._remote_hashes:
+                self._remote_hashes = self._history_index.hashes()
+                print(f"📥 [History] Loaded {len(self._remote_hashes)} remote hashes ({fetched} documents read)")
         except Exception as e:
             print(f"⚠️ [History] Remote hash load failed: {e}")
 
+    def _refresh_history_index(self) -> int:
+        """
+        로컬 사본을 Firestore 샤드 인덱스에 맞춤
+        
+        Returns:
+            새로 읽은 인덱스 문서 수 (목록 문서 제외, 0이면 바뀐 것 없음)
+        """
+        cache = self._history_index
+        collection = self._get_collection('history')
+        manifest_doc = collection.document(MANIFEST_DOC).get()
+        self._track_read(collection='history')
+        manifest = manifest_doc.to_dict() if manifest_doc.exists else None
+
+        fetched = 0
+        if manifest is None or (cache.legacy is None and not manifest.get('legacy_migrated')):
+            # 이전 형식 history/_index (샤드 인덱스가 생기기 전에는 매번, 이후에는 한 번만)
+            legacy_doc = collection.document(LEGACY_DOC).get()
+            self._track_read(collection='history')
+            cache.legacy = parse_legacy_index(legacy_doc.to_dict() if legacy_doc.exists else None)
+            fetched += 1
+        if manifest is not None:
+            if manifest.get('legacy_migrated') and cache.legacy:
+                cache.legacy = {}  # 샤드로 옮겨진 항목
+            shard_chars = manifest.get('shard_chars') or get_shard_chars()
+            if cache.shard_chars != shard_chars:
+                cache.reset(shard_chars)
+            versions = manifest.get('versions') or {}
+            stale = cache.stale_shards(versions)
+            for start in range(0, len(stale), 300):
+                refs = [collection.document(shard_doc_id(prefix)) for prefix in stale[start:start + 300]]
+                snapshots = list(self.db.get_all(refs))
+                self._track_read(len(refs), collection='history')
+                for snapshot in snapshots:
+                    prefix = snapshot.id[len(SHARD_DOC_PREFIX):]
+                    data = snapshot.to_dict() if snapshot.exists else None
+                    urls = (data or {}).get('urls') or {}
+                    cache.put_shard(prefix, urls, versions[prefix])
+                    self._url_filter.add_keys(urls)
+            fetched += len(stale)
+        if fetched:
+            self._url_filter.add_keys(cache.legacy or ())
+            cache.save()
+        return fetched
+
     def _save_history_file(self):
         """crawling_history.json 저장 (최근 5000개 유지)"""
         import json
@@ -159,21 +272,28 @@ class FirestoreClient:
     # Usage Tracking
     # =========================================================================
     
+    # 세션 합계(_usage_stats) + 출처/컬렉션별 장부(firestore_usage)
+    
     @classmethod
-    def _track_read(cls, count: int = 1):
+    def _track_read(cls, count: int = 1, collection: str = 'articles'):
         cls._usage_stats['reads'] += count
+        record_usage('reads', count, collection)
     
     @classmethod
-    def _track_write(cls, count: int = 1):
+    def _track_write(cls, count: int = 1, collection: str = 'articles'):
         cls._usage_stats['writes'] += count
+        record_usage('writes', count, collection)
     
     @classmethod
-    def _track_delete(cls, count: int = 1):
+    def _track_delete(cls, count: int = 1, collection: str = 'articles'):
         cls._usage_stats['deletes'] += count
+        record_usage('deletes', count, collection)
     
     @classmethod
     def get_usage_stats(cls) -> Dict[str, Any]:
         return cls._usage_stats.copy()
+
+    @classmethod
     def reset_usage_stats(cls):
         cls._usage_stats = {
             'reads': 0,
@@ -186,37 +306,26 @@ class FirestoreClient:
     # Articles Collection CRUD
     # =========================================================================
     
-    def get_article(self, article_id: str) -> Optional[Dict[str, Any]]:
+    def get_article(self, article_id: str, include_content: bool = True) -> Optional[Dict[str, Any]]:
         """
         기사 조회 (updated_at 기준 최신 데이터)
         - 로컬/Firestore 둘 다 조회 후 updated_at 비교
         - 최신 데이터가 정본
+        - 본문이 분리된 카드는 본문 문서를 합쳐 반환 (로컬 사본의 본문이 같은 버전이면 재사용)
+        
+        Args:
+            include_content: False이면 Firestore 카드만 조회 (본문/로컬 병합 없음, 분리 전 문서는 그대로)
         """
-        import glob
-        import json
+        if not include_content:
+            return self.get_article_card(article_id)
         
         local_data = None
         remote_data = None
+        store = self._get_local_store()
         
         # 1. Local Cache 조회
         try:
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            env = os.getenv('ZND_ENV', 'dev')
-            cache_root = os.path.join(base_dir, 'cache', env)
-            
-            search_pattern = os.path.join(cache_root, '*', f'{article_id}.json')
-            found_paths = glob.glob(search_pattern)
-            
-            # DEBUG
-            if not found_paths:
-                print(f"🔍 [DEBUG get_article] pattern='{search_pattern}', found={len(found_paths)}")
-            
-            if found_paths:
-                found_paths.sort(key=os.path.getmtime, reverse=True)
-                target_path = found_paths[0]
-                
-                with open(target_path, 'r', encoding='utf-8') as f:
-                    local_data = json.load(f)
+            local_data = store.get(article_id)
         except Exception as e:
             print(f"⚠️ [FirestoreClient] Local cache lookup failed: {e}")
 
@@ -229,6 +338,11 @@ class FirestoreClient:
             if doc.exists:
                 remote_data = doc.to_dict()
                 remote_data['id'] = doc.id
+                if needs_content(remote_data):
+                    if local_data and content_rev(local_data) == remote_data['_header']['content'].get('rev'):
+                        merge_content(remote_data, extract_content(local_data))
+                    else:
+                        self.attach_content([remote_data])
         except Exception as e:
             print(f"⚠️ [FirestoreClient] Firestore lookup failed: {e}")
         
@@ -256,10 +370,8 @@ class FirestoreClient:
                 if remote_complete:
                     # Case 1: Remote가 정본 -> Local만 업데이트 (Cache Refresh)
                     try:
-                        if target_path:
-                            with open(target_path, 'w', encoding='utf-8') as f:
-                                json.dump(remote_data, f, ensure_ascii=False, indent=2)
-                            # print(f"📥 [Sync] Local cache updated from Firestore: {article_id}")
+                        store.save(article_id, remote_data)
+                        # print(f"📥 [Sync] Local cache updated from Firestore: {article_id}")
                     except Exception as e:
                         print(f"⚠️ [Sync] Local update failed: {e}")
                     return remote_data
@@ -284,9 +396,7 @@ class FirestoreClient:
                         
                     # 2. Update Local
                     try:
-                        if target_path:
-                            with open(target_path, 'w', encoding='utf-8') as f:
-                                json.dump(merged, f, ensure_ascii=False, indent=2)
+                        store.save(article_id, merged)
                     except Exception as e:
                         print(f"⚠️ [Sync] Local update failed: {e}")
                             
@@ -311,10 +421,8 @@ class FirestoreClient:
                     print(f"🛡️ [Sync] State downgrade blocked: {article_id} (Remote={remote_state}, Local={local_state})")
                     # Remote 데이터 유지, Local 캐시만 업데이트
                     try:
-                        if target_path:
-                            with open(target_path, 'w', encoding='utf-8') as f:
-                                json.dump(remote_data, f, ensure_ascii=False, indent=2)
-                            print(f"   📥 Local cache corrected to {remote_state}")
+                        store.save(article_id, remote_data)
+                        print(f"   📥 Local cache corrected to {remote_state}")
                     except Exception as e:
                         print(f"⚠️ [Sync] Local cache correction failed: {e}")
                     return remote_data
@@ -342,12 +450,22 @@ class FirestoreClient:
         
         return None
 
+    def get_article_card(self, article_id: str) -> Optional[Dict[str, Any]]:
+        """Firestore 카드만 조회 (읽기 1회, 목록/상태 확인용)"""
+        doc = self._get_collection('articles').document(article_id).get()
+        self._track_read()
+        if not doc.exists:
+            return None
+        data = doc.to_dict()
+        data['id'] = doc.id
+        return data
+
 
     def list_recent_articles(self, limit: int = 1000) -> List[Dict[str, Any]]:
         """최근 기사 목록 조회 (중복 검사용)"""
         # Firestore Query
         query = self._get_collection('articles')\
-            .order_by('_header.created_at', direction=firestore.Query.DESCENDING)\
+            .order_by('_header.created_at', direction=DESCENDING)\
             .limit(limit)
             
         docs = query.stream()
@@ -448,50 +566,11 @@ class FirestoreClient:
             article_id: 문서 ID
             updates: 업데이트할 필드 딕셔너리
         """
-        # 1. Local Cache Update
+        # 1. Local Cache Update (updated_at 갱신 포함)
         try:
-            import glob
-            import json
-            
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            env = os.getenv('ZND_ENV', 'dev')
-            cache_root = os.path.join(base_dir, 'cache', env)
-            
-            # Robust search pattern (With or without underscore prefix)
-            search_pattern = os.path.join(cache_root, '**', f'*{article_id}.json')
-            files = glob.glob(search_pattern, recursive=True)
-            
-            if files:
-                target_file = files[0]
-                with open(target_file, 'r', encoding='utf-8') as f:
-                    content = json.load(f)
-                
-                # Apply dot-notation locally
-                # We can reuse _expand_dot_notation logic concept, but we need to merge INTO content.
-                # Let's keep existing explicit merge logic for file safety.
-                for key, value in updates.items():
-                    parts = key.split('.')
-                    target = content
-                    for part in parts[:-1]:
-                        if part not in target:
-                            if isinstance(target, dict):
-                                target[part] = {}
-                            target = target[part]
-                        elif isinstance(target[part], dict):
-                            target = target[part]
-                        else:
-                            # Conflict: Trying to traverse non-dict
-                            pass 
-                    if isinstance(target, dict):
-                         target[parts[-1]] = value
-                
-                # Ensure updated_at exists
-                if '_header' in content:
-                    content['_header']['updated_at'] = get_kst_now()
-
-                with open(target_file, 'w', encoding='utf-8') as f:
-                    json.dump(content, f, ensure_ascii=False, indent=2)
-                print(f"✅ [FirestoreClient] Local file updated during upsert: {target_file}")
+            content = self._get_local_store().update_fields(article_id, updates, touch=True)
+            if content is not None:
+                print(f"✅ [FirestoreClient] Local store updated during upsert: {article_id}")
         except Exception as e:
             print(f"⚠️ [FirestoreClient] Local upsert failed: {e}")
 
@@ -525,55 +604,261 @@ class FirestoreClient:
             print(f"❌ [FirestoreClient] Firestore Upsert Failed: {e}")
             return False, str(e)
 
+    # -------------------------------------------------------------------------
+    # 카드 / 본문 문서 (article_content, FIRESTORE_CONTENT_SPLIT)
+    # -------------------------------------------------------------------------
+    
+    def _content_ref(self, article_id: str):
+        return self._get_collection(CONTENTS_COLLECTION).document(article_id)
+    
+    def _article_writes(self, article_id: str, data: Dict[str, Any]) -> List[tuple]:
+        """
+        전체 저장 쓰기 목록 [(kind, ref, payload, collection)]
+        본문 분리 시 카드 set(merge) + 본문 set, 카드에 남은 본문 필드는 삭제
+        전체 문서가 아닌 부분 payload는 본문 요약/본문 문서를 건드리지 않고 merge만 (is_full_document)
+        """
+        doc_ref = self._get_collection('articles').document(article_id)
+        data = string_header_times(data)
+        if not is_content_split_enabled():
+            return [('merge', doc_ref, data, 'articles')]
+        if not is_full_document(data):
+            card, content = split_article(data, marker=False)
+            writes = [('merge', doc_ref, card, 'articles')]
+            if content:
+                writes.append(('merge', self._content_ref(article_id), content, CONTENTS_COLLECTION))
+            return writes
+        card, content = split_article(data, delete_value=delete_field(self.db))
+        writes = [('merge', doc_ref, card, 'articles')]
+        if content:
+            writes.append(('set', self._content_ref(article_id), content, CONTENTS_COLLECTION))
+        return writes
+    
+    def _diff_writes(self, article_id: str, diff: Dict[str, Any],
+                     full_data: Optional[Dict[str, Any]]) -> List[tuple]:
+        """
+        변경 필드 저장 쓰기 목록 - 바뀐 본문 필드만 본문 문서에 update
+        (카드의 본문 요약 갱신 + 분리 전 카드에 남은 본문 필드 삭제)
+        본문 문서가 없으면 (분리 전 기사) 배치가 NotFound로 실패 → 호출자가 전체 저장으로 분리
+        """
+        doc_ref = self._get_collection('articles').document(article_id)
+        if not is_content_split_enabled() or full_data is None:
+            return [('update', doc_ref, self._diff_updates(diff), 'articles')]
+        card_diff, content_changed = split_diff(diff)
+        updates = self._diff_updates(card_diff)
+        writes = []
+        if content_changed:
+            marker = content_marker(full_data)
+            for field in stale_fields(updates):
+                updates[field] = delete_field(self.db)
+            if isinstance(updates.get('_header'), dict):
+                updates['_header'] = {**updates['_header'], 'content': marker}
+            else:
+                updates['_header.content'] = marker
+            fields = changed_content_fields(diff)
+            writes.append(('update', self._content_ref(article_id),
+                           content_updates(full_data, fields, delete_value=delete_field(self.db)),
+                           CONTENTS_COLLECTION))
+        if updates:
+            writes.insert(0, ('update', doc_ref, updates, 'articles'))
+        return writes
+    
+    def _commit_writes(self, groups: List[List[tuple]]):
+        """
+        기사별 쓰기 목록을 WriteBatch로 커밋 (한 기사의 쓰기는 같은 배치, 배치당 최대 500건)
+        쓰기가 1건뿐이면 배치 없이 바로 반영
+        """
+        if len(groups) == 1 and len(groups[0]) == 1:
+            kind, ref, payload, collection = groups[0][0]
+            if kind == 'update':
+                ref.update(payload)
+            else:
+                ref.set(payload, merge=(kind == 'merge'))
+            self._track_write(collection=collection)
+            return
+        batch, pending = self.db.batch(), []
+        for writes in groups:
+            if pending and len(pending) + len(writes) > 500:
+                self._commit_batch(batch, pending)
+                batch, pending = self.db.batch(), []
+            for kind, ref, payload, collection in writes:
+                if kind == 'update':
+                    batch.update(ref, payload)
+                else:
+                    batch.set(ref, payload, merge=(kind == 'merge'))
+                pending.append(collection)
+        if pending:
+            self._commit_batch(batch, pending)
+    
+    def _commit_batch(self, batch, collections: List[str]):
+        batch.commit()
+        for collection in set(collections):
+            self._track_write(collections.count(collection), collection=collection)
+    
+    def attach_content(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        본문이 분리된 카드에 본문 문서 합치기 (get_all, 읽기 = 카드 수)
+        분리 전 문서나 이미 본문이 있는 기사는 그대로 둠
+        """
+        cards = {}
+        for data in articles:
+            if needs_content(data):
+                cards.setdefault(data.get('id') or data['_header'].get('article_id'), []).append(data)
+        article_ids = list(cards)
+        for start in range(0, len(article_ids), 300):
+            refs = [self._content_ref(article_id) for article_id in article_ids[start:start + 300]]
+            snapshots = list(self.db.get_all(refs))
+            self._track_read(len(refs), collection=CONTENTS_COLLECTION)
+            for snapshot in snapshots:
+                if not snapshot.exists:
+                    print(f"⚠️ [FirestoreClient] Content document missing: {snapshot.id}")
+                    continue
+                content = snapshot.to_dict()
+                for data in cards.get(snapshot.id, []):
+                    merge_content(data, content)
+        return articles
+
+    def split_legacy_articles(self, articles: Dict[str, Dict[str, Any]]) -> int:
+        """
+        분리 전 기사 문서 → 카드 + 본문 문서 (scripts/migrate_article_content.py)
+        카드는 본문 요약 추가 + 본문 필드 삭제만 update (카드 전체를 다시 쓰지 않음)
+
+        Returns:
+            분리한 기사 수 (이미 분리됐거나 본문 필드가 없는 기사는 제외)
+        """
+        groups = []
+        for article_id, data in articles.items():
+            content = extract_content(data)
+            if is_split(data) or not content:
+                continue
+            marker = content_marker(data)
+            updates = {'_header.content': marker}
+            for field in marker['fields']:
+                updates[field] = delete_field(self.db)
+            groups.append([
+                ('set', self._content_ref(article_id), content, CONTENTS_COLLECTION),
+                ('update', self._get_collection('articles').document(article_id), updates, 'articles'),
+            ])
+        if groups:
+            self._commit_writes(groups)
+        return len(groups)
+
     def save_article(self, article_id: str, data: Dict[str, Any]) -> bool:
         """기사 저장 (생성 또는 업데이트)"""
-        doc_ref = self._get_collection('articles').document(article_id)
-        doc_ref.set(data, merge=True)
-        self._track_write()
+        self._commit_writes([self._article_writes(article_id, data)])
+        return True
+    
+    def batch_save_articles(self, articles: Dict[str, Dict[str, Any]]) -> int:
+        """
+        여러 기사를 WriteBatch로 일괄 저장 (set merge=True)
+        Firestore 배치 한도(500건)에 맞춰 나누어 커밋
+        
+        Returns:
+            저장된 문서 수
+        """
+        if not articles:
+            return 0
+        
+        self._commit_writes([self._article_writes(article_id, data) for article_id, data in articles.items()])
+        saved = len(articles)
+        
+        print(f"📦 [Firestore] Batch saved {saved} articles")
+        return saved
+    
+    def _diff_updates(self, diff: Dict[str, Any]) -> Dict[str, Any]:
+        """article_diff 변경분 → update() 인자 (추가된 목록 항목은 ArrayUnion)"""
+        updates = string_time_updates(dict(diff.get('set') or {}))
+        for path, items in (diff.get('append') or {}).items():
+            updates[path] = array_union(self.db, items)
+        return updates
+    
+    def update_article_fields(self, article_id: str, diff: Dict[str, Any],
+                              full_data: Dict[str, Any] = None) -> bool:
+        """
+        변경된 필드 경로만 저장 (article_diff.diff_article 결과)
+        문서가 없으면 full_data로 전체 저장
+        """
+        if is_empty(diff):
+            return True
+        try:
+            self._commit_writes([self._diff_writes(article_id, diff, full_data)])
+        except Exception as e:
+            if full_data is None or not is_not_found_error(e):
+                raise
+            return self.save_article(article_id, full_data)
         return True
     
+    def batch_update_articles(self, diffs: Dict[str, tuple]) -> int:
+        """
+        여러 기사의 변경 필드를 WriteBatch로 일괄 저장
+        배치에 없는 문서가 섞여 있으면 (NotFound) 그 묶음은 전체 저장으로 다시 커밋
+        (full_data가 None인 항목은 기사별 update로 다시 시도, 없는 문서는 건너뜀)
+        
+        Args:
+            diffs: {article_id: (diff, full_data)}
+        
+        Returns:
+            저장된 문서 수
+        """
+        items = [(article_id, diff, full_data) for article_id, (diff, full_data) in diffs.items()
+                 if not is_empty(diff)]
+        saved = 0
+        for start in range(0, len(items), 250):
+            chunk = items[start:start + 250]  # 본문 문서까지 기사당 최대 2건
+            try:
+                self._commit_writes([self._diff_writes(article_id, diff, full_data)
+                                     for article_id, diff, full_data in chunk])
+            except Exception as e:
+                if not is_not_found_error(e):
+                    raise
+                saved += self.batch_save_articles({article_id: full_data for article_id, _, full_data in chunk
+                                                   if full_data is not None})
+                for article_id, diff, full_data in chunk:
+                    if full_data is None:
+                        try:
+                            self._commit_writes([self._diff_writes(article_id, diff, None)])
+                            saved += 1
+                        except Exception as retry_error:
+                            if not is_not_found_error(retry_error):
+                                raise
+                continue
+            saved += len(chunk)
+        return saved
+
+    def batch_save_history_archives(self, chunks: List[tuple]) -> int:
+        """
+        보관된 상태 전이 묶음 저장 (articles/{id}/state_history/{seq:06d}, state_history 모듈)
+
+        Args:
+            chunks: [(article_id, {'seq', 'entries', 'archived_at'})]
+        """
+        collection = self._get_collection('articles')
+        for start in range(0, len(chunks), 500):
+            part = chunks[start:start + 500]
+            batch = self.db.batch()
+            for article_id, chunk in part:
+                doc_ref = collection.document(article_id).collection('state_history').document(f"{chunk['seq']:06d}")
+                batch.set(doc_ref, chunk)
+            batch.commit()
+            self._track_write(len(part), collection='state_history')
+        return len(chunks)
+
+    def get_history_archive(self, article_id: str) -> List[Dict[str, Any]]:
+        """보관된 상태 전이 묶음 조회 (seq 순)"""
+        docs = list(self._get_collection('articles').document(article_id).collection('state_history').stream())
+        self._track_read(max(1, len(docs)), collection='state_history')
+        return sorted((doc.to_dict() for doc in docs), key=lambda chunk: chunk.get('seq', 0))
+
     def update_article(self, article_id: str, updates: Dict[str, Any]) -> bool:
         """기사 부분 업데이트 (Firestore + Local Cache) - 둘 다 업데이트"""
-        
+        updates = string_time_updates(updates)
         local_success = False
         firestore_success = False
         
         # 1. Try Local Cache Update first
         try:
-            import glob
-            import json
-            from datetime import datetime
-            
-            base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            env = os.getenv('ZND_ENV', 'dev')
-            cache_root = os.path.join(base_dir, 'cache', env)
-            
-            search_pattern = os.path.join(cache_root, '*', f'{article_id}.json')
-            files = glob.glob(search_pattern)
-            
-            if files:
-                target_file = files[0]
-                print(f"📂 [FirestoreClient] Updating local file: {target_file}")
-                
-                with open(target_file, 'r', encoding='utf-8') as f:
-                    content = json.load(f)
-                
-                # Apply dot-notation updates
-                for key, value in updates.items():
-                    parts = key.split('.')
-                    target = content
-                    for i, part in enumerate(parts[:-1]):
-                        if part not in target:
-                            target[part] = {}
-                        target = target[part]
-                    target[parts[-1]] = value
-                
-                with open(target_file, 'w', encoding='utf-8') as f:
-                    json.dump(content, f, ensure_ascii=False, indent=2)
-                
-                print(f"✅ [FirestoreClient] Local file updated: {article_id}")
+            if self._get_local_store().update_fields(article_id, updates) is not None:
+                print(f"✅ [FirestoreClient] Local store updated: {article_id}")
                 local_success = True
-                
         except Exception as e:
             print(f"⚠️ [FirestoreClient] Local update failed: {e}")
 
@@ -590,44 +875,32 @@ class FirestoreClient:
         return local_success or firestore_success
     
     def delete_article(self, article_id: str) -> bool:
-        """기사 삭제"""
-        doc_ref = self._get_collection('articles').document(article_id)
-        doc_ref.delete()
+        """기사 삭제 (본문 문서 포함)"""
+        batch = self.db.batch()
+        batch.delete(self._get_collection('articles').document(article_id))
+        batch.delete(self._content_ref(article_id))
+        batch.commit()
         self._track_delete()
+        self._track_delete(collection=CONTENTS_COLLECTION)
         return True
     
-    def list_articles_by_state(self, state: str, limit: int = 100) -> List[Dict[str, Any]]:
-        """상태별 기사 목록 조회 (로컬 읽기 + Firestore, updated_at 기준 최신 우선)"""
+    def list_articles_by_state(self, state: str, limit: int = 100,
+                               include_content: bool = False) -> List[Dict[str, Any]]:
+        """
+        상태별 기사 목록 조회 (로컬 읽기 + Firestore, updated_at 기준 최신 우선)
+        Firestore 기사는 카드 (include_content=True이면 본문 문서까지 합침)
+        """
         local_articles = {}  # article_id -> article
         firestore_articles = {}
         
         # 1. Local Cache 검색 (읽기 전용)
         if state in ['COLLECTED', 'ANALYZED', 'CLASSIFIED', 'PUBLISHED', 'REJECTED']:
             try:
-                import glob
-                import json
-                
-                base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                env = os.getenv('ZND_ENV', 'dev')
-                cache_root = os.path.join(base_dir, 'cache', env)
-                
-                if os.path.exists(cache_root):
-                    files = glob.glob(os.path.join(cache_root, '*', '*.json'))
-                    files.sort(key=os.path.getmtime, reverse=True)
-                    
-                    for fpath in files[:limit * 2]:  # 여유있게 로드
-                        try:
-                            with open(fpath, 'r', encoding='utf-8') as f:
-                                content = json.load(f)
-                                
-                            if '_header' in content:
-                                file_state = content['_header'].get('state')
-                                article_id = content['_header'].get('article_id')
-                                if file_state == state and article_id:
-                                    local_articles[article_id] = content
-                        except Exception:
-                            continue
-                    print(f"📂 [Local] Loaded {len(local_articles)} articles for state {state}")
+                for stored in self._get_local_store().list_by_state(state, limit=limit * 2):
+                    article_id = stored.data.get('_header', {}).get('article_id')
+                    if article_id:
+                        local_articles[article_id] = stored.data
+                print(f"📂 [Local] Loaded {len(local_articles)} articles for state {state}")
             except Exception as e:
                 print(f"⚠️ Local cache search failed: {e}")
 
@@ -637,8 +910,8 @@ class FirestoreClient:
                 '_header.state', '==', state
             ).limit(limit * 2)
             
-            docs = query.stream()
-            self._track_read()
+            docs = list(query.stream())
+            self._track_read(max(1, len(docs)))
             
             for doc in docs:
                 data = doc.to_dict()
@@ -690,16 +963,78 @@ class FirestoreClient:
         result = list(merged.values())
         result.sort(key=lambda x: x.get('_header', {}).get('updated_at', ''), reverse=True)
         
+        if include_content:
+            self.attach_content(result[:limit])
         return result[:limit]
-    
-    def list_recent_articles(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """최근 기사 목록 조회"""
+
+    def list_articles_updated_since(self, since: str, states: List[str] = None,
+                                    page_size: int = 300) -> List[Dict[str, Any]]:
+        """
+        _header.updated_at > since 인 기사 (updated_at 오름차순, 페이지 단위 전체 조회)
+        Firestore 전용 - 읽기 비용 = 반환 문서 수 (결과가 없어도 쿼리 1회 과금)
+        본문이 분리된 기사는 카드만 (필요하면 attach_content)
+
+        Args:
+            since: KST ISO 문자열 (get_kst_now 형식과 사전순 비교)
+                   Timestamp 타입 updated_at은 매칭되지 않음 → 쓰기 시 문자열로 저장 (string_header_times)
+            states: 지정 시 _header.state in states
+                    → 복합 색인 (_header.state, _header.updated_at) 필요 (firestore.indexes.json)
+        """
+        query = self._updated_since_query(since, states).limit(page_size)
+
+        articles = []
+        last_doc = None
+        while True:
+            page = query.start_after(last_doc) if last_doc is not None else query
+            docs = list(page.stream())
+            self._track_read(max(1, len(docs)))
+            for doc in docs:
+                data = doc.to_dict()
+                data['id'] = doc.id
+                articles.append(data)
+            if len(docs) < page_size:
+                break
+            last_doc = docs[-1]
+        return articles
+
+    def _updated_since_query(self, since: str, states: List[str] = None):
+        query = self._get_collection('articles').where('_header.updated_at', '>', since)
+        if states:
+            query = query.where('_header.state', 'in', list(states))
+        return query.order_by('_header.updated_at')
+
+    def watch_articles_updated_since(self, since: str, callback):
+        """
+        _header.updated_at > since 인 기사 실시간 구독 (on_snapshot)
+        읽기 비용 = 전달된 변경 문서 수 (첫 스냅샷 포함)
+
+        Args:
+            callback: callable(changes, read_time)
+                      changes = [(ADDED|MODIFIED|REMOVED, article_id, data)]
+        Returns:
+            Watch (unsubscribe()로 구독 해제)
+        """
+        def on_snapshot(docs, changes, read_time):
+            if changes:
+                with usage_scope('registry:listener'):
+                    self._track_read(len(changes))
+            deltas = []
+            for change in changes:
+                data = change.document.to_dict() or {}
+                data['id'] = change.document.id
+                deltas.append((change.type.name, change.document.id, data))
+            callback(deltas, read_time)
+
+        return self._updated_since_query(since).on_snapshot(on_snapshot)
+
+    def list_recent_articles(self, limit: int = 100, include_content: bool = False) -> List[Dict[str, Any]]:
+        """최근 기사 목록 조회 (카드, include_content=True이면 본문 문서까지 합침)"""
         query = self._get_collection('articles').order_by(
-            '_header.updated_at', direction=firestore.Query.DESCENDING
+            '_header.updated_at', direction=DESCENDING
         ).limit(limit)
         
-        docs = query.stream()
-        self._track_read()
+        docs = list(query.stream())
+        self._track_read(max(1, len(docs)))
         
         articles = []
         for doc in docs:
@@ -707,6 +1042,8 @@ class FirestoreClient:
             data['id'] = doc.id
             articles.append(data)
         
+        if include_content:
+            self.attach_content(articles)
         return articles
     
     # =========================================================================
@@ -714,49 +1051,91 @@ class FirestoreClient:
     # =========================================================================
     
     def get_history_index(self) -> Dict[str, Any]:
-        """히스토리 인덱스 조회"""
-        doc_ref = self._get_collection('history').document('_index')
-        doc = doc_ref.get()
-        self._track_read()
+        """히스토리 인덱스 조회 ({'urls': {hash: 항목}}, 바뀐 샤드만 읽은 뒤 로컬 사본에서)"""
+        self._refresh_history_index()
+        return {'urls': self._history_index.entries()}
+    
+    def _write_history_entries(self, entries: Dict[str, Dict[str, Any]]):
+        """
+        히스토리 항목을 샤드 문서에 기록 (샤드 set merge + 목록 문서 버전 증가, 배치 1회)
+        쓰기 = 바뀐 샤드 수 + 1
+        """
+        shard_chars = self._history_index.shard_chars or get_shard_chars()
+        by_shard: Dict[str, Dict[str, Any]] = {}
+        for url_hash, entry in entries.items():
+            by_shard.setdefault(shard_of(url_hash, shard_chars), {})[url_hash] = entry
         
-        if doc.exists:
-            return doc.to_dict()
-        return {'urls': {}}
+        collection = self._get_collection('history')
+        now = get_kst_now()
+        batch = self.db.batch()
+        for prefix, urls in by_shard.items():
+            batch.set(collection.document(shard_doc_id(prefix)),
+                      {'urls': urls, 'version': increment(self.db), 'updated_at': now}, merge=True)
+        batch.set(collection.document(MANIFEST_DOC), {
+            'shard_chars': shard_chars,
+            'versions': {prefix: increment(self.db) for prefix in by_shard},
+            'updated_at': now,
+        }, merge=True)
+        batch.commit()
+        self._track_write(len(by_shard) + 1, collection='history')
+        self._history_index.add_entries(entries)
+        self._url_filter.add_keys(entries)
     
     def update_history(self, url: str, article_id: str, status: str):
         """히스토리 업데이트 (Firestore + 런타임 캐시)"""
         url_hash = self._url_to_key(url)
 
         # 1. Firestore 업데이트
-        doc_ref = self._get_collection('history').document('_index')
-        doc_ref.set({
-            f'urls.{url_hash}': {
-                'article_id': article_id,
-                'status': status,
-                'updated_at': get_kst_now()
-            }
-        }, merge=True)
-        self._track_write()
+        self._write_history_entries({url_hash: {
+            'article_id': article_id,
+            'status': status,
+            'updated_at': get_kst_now()
+        }})
 
         # 2. 런타임 해시 캐시에도 추가 (중복 수집 방지)
         self._remote_hashes.add(url_hash)
 
         # 3. 로컬 히스토리에도 추가 (세션 간 중복 방지)
-        self.history[url] = get_kst_now()
+        self.remember_history(url)
+    
+    def batch_update_history(self, entries: List[tuple]) -> int:
+        """
+        여러 URL 히스토리를 배치 1회로 갱신 (Firestore outbox drainer용, 쓰기 = 바뀐 샤드 수 + 1)
+        
+        Args:
+            entries: [(url, article_id, status)]
+        """
+        if not entries:
+            return 0
+        now = get_kst_now()
+        fields = {}
+        for url, article_id, status in entries:
+            fields[self._url_to_key(url)] = {
+                'article_id': article_id,
+                'status': status,
+                'updated_at': now
+            }
+        self._write_history_entries(fields)
+        
+        for url, _, _ in entries:
+            self._remote_hashes.add(self._url_to_key(url))
+            self.history[url] = now
+        self._url_filter.add_keys(key for url, _, _ in entries for key in url_keys(url))
         self._save_history_file()
+        return len(entries)
     
     def check_url_exists(self, url: str) -> Optional[Dict[str, Any]]:
-        """URL이 이미 처리되었는지 확인"""
-        history = self.get_history_index()
-        url_key = self._url_to_key(url)
-        return history.get('urls', {}).get(url_key)
+        """URL이 이미 처리되었는지 확인 (정규 키, 없으면 정규화 이전 규칙의 키)"""
+        self._refresh_history_index()
+        for url_hash in lookup_keys(url):
+            entry = self._history_index.get(url_hash)
+            if entry is not None:
+                return entry
+        return None
     
     def _url_to_key(self, url: str) -> str:
-        """URL을 Firestore 키로 변환 (정규화 후 해시)"""
-        import hashlib
-        # URL 정규화: 끝 슬래시 제거하여 일관된 키 생성
-        normalized_url = url.rstrip('/')
-        return hashlib.md5(normalized_url.encode()).hexdigest()[:12]
+        """URL을 Firestore 키로 변환 (정규 URL 해시, url_canonical)"""
+        return canonical_key(url)
     
     # =========================================================================
     # Local History Management (Ported from DBClient)
@@ -771,12 +1150,33 @@ class FirestoreClient:
             return True
             
         # 2. Remote Hash Check (Frequency: Low, Cost: Low - InMemory Set)
-        url_hash = self._url_to_key(url)
-        if url_hash in self._remote_hashes:
+        #    정규 키 + 정규화 이전 규칙으로 기록된 키
+        if any(url_hash in self._remote_hashes for url_hash in lookup_keys(url)):
             return True
             
         return False
 
+    def might_have_seen(self, url: str) -> bool:
+        """
+        URL 필터 조회 (url_filter, O(1))
+        False면 히스토리와 로컬 캐시 어디에도 없는 확실히 새 URL → check_history/load_from_cache 생략 가능
+        True면 오탐일 수 있으므로 정확한 검사로 확인
+        """
+        return self._url_filter.might_contain_url(url)
+
+    def rebuild_url_filter(self, capacity: int = None, fp_rate: float = None) -> Dict[str, Any]:
+        """URL 필터 전체 재구성 (원격 히스토리 + crawling_history.json + 로컬 저장소)"""
+        import time
+        start = time.time()
+        keys = set(self._history_index.hashes())
+        for url in self.history:
+            keys.update(url_keys(url))
+        keys.update(collect_store_keys(self._get_cache_dir()))
+        stats = self._url_filter.rebuild(keys, capacity=capacity, fp_rate=fp_rate)
+        print(f"🧮 [UrlFilter] Rebuilt: {stats['keys']} keys, {stats['bytes'] / 1024:.0f}KB, "
+              f"expected false positives {stats['expected_fp_rate']:.2%} ({time.time() - start:.1f}s)")
+        return stats
+
     def get_history_status(self, url: str) -> Optional[str]:
         """(Deprecated) 히스토리 상태 반환 - 호환성 유지용"""
         if url in self.history:
@@ -785,15 +1185,12 @@ class FirestoreClient:
 
     def save_history(self, url: str, status: str = None, reason: str = None, article_id: str = None):
         """히스토리 저장 (URL 방문 기록) - 로컬 + Firestore 둘 다"""
-        import hashlib
-        
         # 로컬 히스토리 저장
-        self.history[url] = get_kst_now()
-        self._save_history_file()
+        self.remember_history(url)
         
         # [FIX] article_id 없으면 자동 생성
         if not article_id:
-            article_id = hashlib.md5(url.encode()).hexdigest()[:12]
+            article_id = article_id_for(url)
         
         # Firestore 히스토리 항상 동기화 (조건 제거)
         try:
@@ -804,6 +1201,12 @@ class FirestoreClient:
         except Exception as e:
             print(f"⚠️ [History] Firestore sync failed: {e}")
 
+    def remember_history(self, url: str):
+        """로컬 히스토리만 기록 (Firestore 반영은 호출자 또는 outbox 담당)"""
+        self.history[url] = get_kst_now()
+        self._url_filter.add_url(url)
+        self._save_history_file()
+
     def refresh_remote_hashes(self):
         """원격 히스토리 해시 강제 새로고침 (사이트 재오픈 시)"""
         self._load_remote_history_hashes()
@@ -827,8 +1230,6 @@ class FirestoreClient:
         크롤러 수집 데이터 저장 (V2 Schema 변환 및 저장)
         DBClient.save_article 로직 이식
         """
-        import hashlib
-        
         # Ensure crawled_at
         crawled_at = article_data.get('crawled_at')
         now = get_kst_now()
@@ -838,7 +1239,7 @@ class FirestoreClient:
 
         # Generate ID
         url = article_data.get('url', '')
-        article_id = article_data.get('article_id') or hashlib.md5(url.encode()).hexdigest()[:12]
+        article_id = article_data.get('article_id') or article_id_for(url, article_data.get('canonical_url'))
         
         # V2 Schema Construction
         v2_article = {
@@ -879,8 +1280,7 @@ class FirestoreClient:
         # Using upsert_article_state might be tricky for full replace/create of structure.
         # Direct set is better for new articles.
         try:
-            self._get_collection('articles').document(article_id).set(v2_article, merge=True)
-            self._track_write()
+            self.save_article(article_id, v2_article)
             print(f"✅ [FirestoreClient] Saved crawled article: {article_id}")
             
             # Update History
@@ -898,7 +1298,7 @@ class FirestoreClient:
         """발행 정보 조회"""
         doc_ref = self._get_collection('publications').document(edition_code)
         doc = doc_ref.get()
-        self._track_read()
+        self._track_read(collection='publications')
         
         if doc.exists:
             return doc.to_dict()
@@ -908,14 +1308,14 @@ class FirestoreClient:
         """발행 정보 저장"""
         doc_ref = self._get_collection('publications').document(edition_code)
         doc_ref.set(data, merge=True)
-        self._track_write()
+        self._track_write(collection='publications')
         return True
     
     def get_publications_meta(self) -> Optional[Dict[str, Any]]:
         """발행 메타 정보 조회"""
         doc_ref = self._get_collection('publications').document('_meta')
         doc = doc_ref.get()
-        self._track_read()
+        self._track_read(collection='publications')
         
         if doc.exists:
             return doc.to_dict()
@@ -965,17 +1365,17 @@ class FirestoreClient:
         """발행 메타 정보 업데이트"""
         doc_ref = self._get_collection('publications').document('_meta')
         doc_ref.set(data, merge=True)
-        self._track_write()
+        self._track_write(collection='publications')
         return True
 
     def list_publications(self, limit: int = 20) -> List[Dict[str, Any]]:
         """발행 회차 목록 조회 (최신순)"""
         query = self._get_collection('publications')\
-            .order_by('published_at', direction=firestore.Query.DESCENDING)\
+            .order_by('published_at', direction=DESCENDING)\
             .limit(limit)
         
-        docs = query.stream()
-        self._track_read()
+        docs = list(query.stream())
+        self._track_read(max(1, len(docs)), collection='publications')
         
         return [doc.to_dict() for doc in docs]
 
@@ -984,16 +1384,15 @@ class FirestoreClient:
         # publications/{edition_code} 문서에서 articles 배열 읽기
         pub_doc = self.get_publication(edition_code)
         if pub_doc and 'articles' in pub_doc:
-            self._track_read()
-            return pub_doc['articles']
+            return pub_doc['articles']  # get_publication에서 읽기 1회 집계됨
         
         # Fallback: articles 컬렉션에서 쿼리 (구버전 호환)
         query = self._get_collection('articles').where(
             '_publication.edition_code', '==', edition_code
         )
         
-        docs = query.stream()
-        self._track_read()
+        docs = list(query.stream())
+        self._track_read(max(1, len(docs)))
         
         articles = []
         for doc in docs:
@@ -1010,7 +1409,7 @@ class FirestoreClient:
         """트렌드 리포트 저장"""
         doc_ref = self._get_collection('trend_reports').document(report_id)
         doc_ref.set(data, merge=True)
-        self._track_write()
+        self._track_write(collection='trend_reports')
         print(f"✅ [FirestoreClient] Trend report saved: {report_id}")
         return True
     
@@ -1018,7 +1417,7 @@ class FirestoreClient:
         """트렌드 리포트 조회"""
         doc_ref = self._get_collection('trend_reports').document(report_id)
         doc = doc_ref.get()
-        self._track_read()
+        self._track_read(collection='trend_reports')
         
         if doc.exists:
             data = doc.to_dict()
@@ -1029,11 +1428,11 @@ class FirestoreClient:
     def list_trend_reports(self, limit: int = 20) -> List[Dict[str, Any]]:
         """트렌드 리포트 목록 조회 (최신순)"""
         query = self._get_collection('trend_reports')\
-            .order_by('created_at', direction=firestore.Query.DESCENDING)\
+            .order_by('created_at', direction=DESCENDING)\
             .limit(limit)
         
-        docs = query.stream()
-        self._track_read()
+        docs = list(query.stream())
+        self._track_read(max(1, len(docs)), collection='trend_reports')
         
         reports = []
         for doc in docs:
@@ -1051,10 +1450,30 @@ class FirestoreClient:
         try:
             doc_ref = self._get_collection('trend_reports').document(report_id)
             doc_ref.delete()
-            self._track_delete()
+            self._track_delete(collection='trend_reports')
             print(f"🗑️ [FirestoreClient] Trend report deleted: {report_id}")
             return True
         except Exception as e:
             print(f"❌ [FirestoreClient] Failed to delete report: {e}")
             return False
 
+    # =========================================================================
+    # Trend Rollups Collection (일자별 집계, 옵션)
+    # =========================================================================
+
+    def save_trend_rollup(self, date_str: str, data: Dict[str, Any]) -> bool:
+        """일자별 트렌드 집계 저장 (감소 반영을 위해 전체 덮어쓰기)"""
+        doc_ref = self._get_collection('trend_rollups').document(date_str)
+        doc_ref.set(data)
+        self._track_write(collection='trend_rollups')
+        return True
+
+    def get_trend_rollup(self, date_str: str) -> Optional[Dict[str, Any]]:
+        """일자별 트렌드 집계 조회"""
+        doc_ref = self._get_collection('trend_rollups').document(date_str)
+        doc = doc_ref.get()
+        self._track_read(collection='trend_rollups')
+
+        if doc.exists:
+            return doc.to_dict()
+        return None
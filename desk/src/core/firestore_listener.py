@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+Firestore Listener - {env}/data/articles 실시간 구독 → ArticleRegistry 반영
+
+다른 desk 인스턴스, 스케줄러 프로세스, 콘솔에서 수정한 기사를
+다음 refresh() 전에 레지스트리 색인과 로컬 캐시에 반영합니다.
+구독이 연결되어 있는 동안 refresh()는 Firestore를 조회하지 않습니다 (주기 폴링 읽기 없음).
+
+- 구독 범위: _header.updated_at > watermark - overlap (없으면 최근 REGISTRY_MAX_AGE_DAYS일)
+    상태 조건은 쿼리에 넣지 않습니다. 상태가 바뀌어 조건을 벗어난 기사는 REMOVED로 전달되어
+    실제 삭제와 구분되지 않기 때문입니다. 미발행 상태 필터는 레지스트리 반영 단계에서 적용합니다.
+- ADDED/MODIFIED: updated_at이 로컬보다 최신이면 색인 + 로컬 캐시 갱신
+- REMOVED: updated_at은 줄지 않으므로 문서 삭제 → 색인 + 로컬 저장소에서 제거
+- 연결 끊김/오류: 백오프 후 마지막 watermark부터 재구독 (overlap 구간은 중복 전달되지만 건너뜀)
+- 구독 대상이 계속 늘지 않도록 REGISTRY_LISTENER_RESUBSCRIBE_HOURS(기본 6)마다 최신 watermark로 재구독
+
+활성화: REGISTRY_LISTENER=true (desk 서버, 레지스트리 워밍업 완료 후 시작)
+에뮬레이터: FIRESTORE_EMULATOR_HOST=localhost:8080 (scripts/bench_firestore_listener.py)
+"""
+import os
+import time
+import queue
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.core_logic import get_kst_now
+
+
+RECONNECT_MIN_SECONDS = 1
+RECONNECT_MAX_SECONDS = 60
+HEALTH_CHECK_SECONDS = 5
+
+
+def is_listener_enabled() -> bool:
+    """REGISTRY_LISTENER=true 이면 desk 서버에서 실시간 구독 사용"""
+    return os.getenv('REGISTRY_LISTENER', 'false').lower() == 'true'
+
+
+def get_resubscribe_hours() -> float:
+    return float(os.getenv('REGISTRY_LISTENER_RESUBSCRIBE_HOURS', 6))
+
+
+def _watch_alive(watch) -> bool:
+    """구독 스트림이 살아있는지 (google-cloud-firestore Watch)"""
+    if watch is None or getattr(watch, '_closed', False):
+        return False
+    return bool(getattr(watch, 'is_active', True))
+
+
+class RegistryListener:
+    """
+    Firestore 실시간 구독기 (싱글톤)
+
+    on_snapshot 콜백은 SDK 스레드에서 변경분을 큐에 넣기만 하고,
+    반영/재연결은 firestore-listener 스레드가 담당합니다.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._registry = None
+        self._db = None
+        self._watch = None
+        self._generation = 0          # 구독 세대 (해제된 구독의 늦은 콜백 무시)
+        self._connected = False       # 현재 구독의 첫 스냅샷 수신 여부
+        self._events: queue.Queue = queue.Queue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {'status': 'stopped', 'subscribed_since': None, 'connected_at': None,
+                       'snapshots': 0, 'changes': 0, 'applied': 0, 'reconnects': 0,
+                       'last_change_at': None, 'error': None}
+        self._initialized = True
+
+    def start(self, registry=None, db_client=None) -> bool:
+        """구독 시작 (이미 실행 중이면 False)"""
+        if self.is_running():
+            return False
+        from .article_registry import get_registry
+        self._registry = registry or get_registry()
+        if db_client is None:
+            from .firestore_client import FirestoreClient
+            db_client = FirestoreClient()
+        self._db = db_client
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True, name='firestore-listener')
+        self._thread.start()
+        self._registry.set_listener(self)
+        print("📡 [Listener] Realtime Firestore sync started")
+        return True
+
+    def stop(self):
+        self._stop.set()
+        self._events.put(None)
+        if self._thread is not None:
+            self._thread.join(HEALTH_CHECK_SECONDS + 1)
+        self._unsubscribe()
+        self._stats['status'] = 'stopped'
+        if self._registry is not None:
+            self._registry.set_listener(None)
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_active(self) -> bool:
+        """구독이 연결되어 변경을 받고 있는지 (첫 스냅샷 수신 후)"""
+        return self.is_running() and self._connected and _watch_alive(self._watch)
+
+    def get_status(self) -> Dict[str, Any]:
+        status = dict(self._stats)
+        status['active'] = self.is_active()
+        status['pending'] = self._events.qsize()
+        return status
+
+    # =========================================================================
+    # Subscription
+    # =========================================================================
+
+    def _subscribe(self):
+        since = self._registry.get_firestore_sync_since()
+        self._generation += 1
+        self._connected = False
+        generation = self._generation
+        self._watch = self._db.watch_articles_updated_since(
+            since, lambda changes, read_time: self._on_snapshot(generation, changes, read_time))
+        self._stats.update(status='connecting', subscribed_since=since, error=None)
+
+    def _unsubscribe(self):
+        watch, self._watch = self._watch, None
+        self._connected = False
+        if watch is not None:
+            try:
+                watch.unsubscribe()
+            except Exception as e:
+                print(f"⚠️ [Listener] Unsubscribe failed: {e}")
+
+    def _on_snapshot(self, generation: int, changes: List[Tuple[str, str, Dict]], read_time):
+        """SDK 스레드 - 큐에만 넣음"""
+        if generation != self._generation:
+            return
+        if not self._connected:
+            self._connected = True
+            self._stats.update(status='connected', connected_at=get_kst_now())
+        if changes:
+            self._events.put(changes)
+
+    # =========================================================================
+    # Apply / Reconnect Loop
+    # =========================================================================
+
+    def _apply(self, changes: List[Tuple[str, str, Dict]]):
+        upserts = [data for kind, _, data in changes if kind != 'REMOVED']
+        removed = [article_id for kind, article_id, _ in changes if kind == 'REMOVED']
+        applied = self._registry.apply_firestore_changes(upserts, removed)
+        self._stats['snapshots'] += 1
+        self._stats['changes'] += len(changes)
+        self._stats['applied'] += applied
+        self._stats['last_change_at'] = get_kst_now()
+
+    def _loop(self):
+        backoff = RECONNECT_MIN_SECONDS
+        resubscribe_at = 0.0
+        while not self._stop.is_set():
+            try:
+                if self._watch is None:
+                    self._subscribe()
+                    resubscribe_at = time.time() + get_resubscribe_hours() * 3600
+
+                try:
+                    changes = self._events.get(timeout=HEALTH_CHECK_SECONDS)
+                except queue.Empty:
+                    changes = None
+                if changes:
+                    self._apply(changes)
+                    backoff = RECONNECT_MIN_SECONDS
+
+                if not _watch_alive(self._watch):
+                    raise ConnectionError('snapshot stream closed')
+                if time.time() >= resubscribe_at and self._events.empty():
+                    self._unsubscribe()  # 다음 반복에서 최신 watermark로 재구독
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                self._stats.update(status='reconnecting', error=str(e))
+                self._stats['reconnects'] += 1
+                print(f"⚠️ [Listener] {e} - resubscribing in {backoff}s")
+                self._unsubscribe()
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, RECONNECT_MAX_SECONDS)
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+def get_listener() -> RegistryListener:
+    """구독기 인스턴스 반환"""
+    return RegistryListener()
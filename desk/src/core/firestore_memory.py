@@ -0,0 +1,845 @@
+# -*- coding: utf-8 -*-
+"""
+Memory Firestore - 프로세스 내 가짜 Firestore 백엔드 (FIRESTORE_BACKEND=memory)
+
+라이브 프로젝트나 에뮬레이터 없이 FirestoreClient의 무거운 경로
+(레지스트리 초기화, 발행/정식 발행, 상태별 조회, 보드 overview)를 벤치마크/회귀 검증합니다.
+FirestoreClient가 쓰는 google-cloud-firestore API 부분집합을 같은 의미로 구현합니다.
+
+    문서: collection().document().get/set(merge)/update(점 표기, ArrayUnion, Increment, DELETE_FIELD)/delete(),
+          하위 컬렉션
+          get_all(문서 참조 목록) - 여러 문서 한 번에 조회
+    쿼리: where(==, !=, <, <=, >, >=, in, not-in, array_contains, array_contains_any)
+          order_by(방향), limit, offset, start_after, stream/get, count()
+    일괄/트랜잭션: batch() (최대 500건, 원자적), transaction() + run_transaction (낙관적 재시도)
+    실시간: Query.on_snapshot (ADDED/MODIFIED/REMOVED 변경분, 별도 스레드로 전달)
+
+계측 (Firestore 과금 규칙과 같게 계산):
+    읽기  - 문서 get 1건 (없어도 1), get_all은 참조 수, 쿼리는 반환 문서 수 (최소 1), count()는 1000건당 1,
+            on_snapshot은 전달된 변경 문서 수
+    쓰기  - set/update 1건, 일괄 처리는 작업 수만큼 / 삭제는 deletes로 따로 집계
+    지연  - 작업별 호출 수, 누적/최대 ms (latency_ms로 원격 왕복 흉내, 작업별 재정의 가능)
+    전송량 - set/update 페이로드의 JSON 바이트 수 (bytes_sent, 전체 저장 vs 변경 필드 비교용)
+    수신량 - get/get_all/쿼리가 돌려준 문서의 JSON 바이트 수 (bytes_received, 카드 / 본문 분리 비교용)
+
+    db = MemoryFirestore(latency_ms=20)
+    client = FirestoreClient.use_backend(db)
+    with db.measure() as m:
+        manager.publish(...)
+    assert m.reads <= 40, m.summary()
+"""
+import copy
+import json
+import time
+import queue
+import threading
+import functools
+from enum import Enum
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple
+
+from .firestore_backend import ASCENDING, DESCENDING
+
+
+MAX_BATCH_WRITES = 500
+MAX_TRANSACTION_ATTEMPTS = 5
+COUNT_ENTRIES_PER_READ = 1000
+
+_MISSING = object()
+
+
+class NotFound(Exception):
+    """google.api_core.exceptions.NotFound와 같은 메시지 형식 (호출부가 문자열로 판별)"""
+
+
+class Aborted(Exception):
+    """트랜잭션 충돌 (읽은 문서가 커밋 전에 바뀜)"""
+
+
+class ArrayUnion:
+    """firestore.ArrayUnion - 기존 배열에 없는 값만 뒤에 추가"""
+
+    def __init__(self, values):
+        self.values = list(values)
+
+
+class Increment:
+    """firestore.Increment - 기존 숫자에 더함 (없거나 숫자가 아니면 0에서 시작)"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def apply(self, existing):
+        return (existing if isinstance(existing, (int, float)) and not isinstance(existing, bool) else 0) + self.value
+
+
+class _DeleteField:
+    """firestore.DELETE_FIELD - update() / set(merge=True)에서 필드 삭제"""
+
+    def __repr__(self):
+        return 'DELETE_FIELD'
+
+    def __deepcopy__(self, memo):
+        return self  # 배치/트랜잭션이 페이로드를 복사해도 같은 값 (is 비교)
+
+
+DELETE_FIELD = _DeleteField()
+
+
+def _payload_bytes(payload) -> int:
+    """요청 페이로드 크기 추정 (JSON 바이트)"""
+    if payload is None:
+        return 0
+    encoded = json.dumps(payload, ensure_ascii=False,
+                         default=lambda o: o.values if isinstance(o, ArrayUnion)
+                         else o.value if isinstance(o, Increment) else str(o))
+    return len(encoded.encode('utf-8'))
+
+
+def _received_bytes(snapshots) -> int:
+    return sum(_payload_bytes(snapshot.to_dict()) for snapshot in snapshots)
+
+
+class ChangeType(Enum):
+    ADDED = 1
+    REMOVED = 2
+    MODIFIED = 3
+
+
+# =============================================================================
+# Field Path Helpers
+# =============================================================================
+
+def _get_field(data: Dict[str, Any], field_path: str):
+    value = data
+    for part in field_path.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def _set_field(data: Dict[str, Any], field_path: str, value):
+    parts = field_path.split('.')
+    target = data
+    for part in parts[:-1]:
+        if not isinstance(target.get(part), dict):
+            if value is DELETE_FIELD:
+                return
+            target[part] = {}
+        target = target[part]
+    if value is DELETE_FIELD:
+        target.pop(parts[-1], None)
+    else:
+        target[parts[-1]] = value
+
+
+def _deep_merge(target: Dict[str, Any], source: Dict[str, Any]):
+    """set(merge=True) - 중첩 map은 합치고 나머지 값은 교체 (DELETE_FIELD는 삭제)"""
+    for key, value in source.items():
+        if value is DELETE_FIELD:
+            target.pop(key, None)
+        elif isinstance(value, Increment):
+            target[key] = value.apply(target.get(key))
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            _deep_merge(target[key], value)
+        else:
+            target[key] = _strip_deletes(value)
+
+
+def _strip_deletes(value):
+    """새로 쓰는 map 안의 DELETE_FIELD 제거 (없는 필드 삭제는 아무 일도 하지 않음)"""
+    if isinstance(value, dict):
+        return {k: _strip_deletes(v) for k, v in value.items() if v is not DELETE_FIELD}
+    if isinstance(value, Increment):
+        return value.apply(None)
+    return copy.deepcopy(value)
+
+
+def _type_rank(value) -> int:
+    """Firestore 타입 간 정렬 순서 (null < bool < number < timestamp < string < bytes < array < map)"""
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float)):
+        return 2
+    if isinstance(value, datetime):
+        return 3
+    if isinstance(value, str):
+        return 4
+    if isinstance(value, bytes):
+        return 5
+    if isinstance(value, (list, tuple)):
+        return 6
+    return 7
+
+
+def _compare(a, b) -> int:
+    rank_a, rank_b = _type_rank(a), _type_rank(b)
+    if rank_a != rank_b:
+        return -1 if rank_a < rank_b else 1
+    if rank_a == 3 and (a.tzinfo is None) != (b.tzinfo is None):
+        a = a if a.tzinfo else a.replace(tzinfo=timezone.utc)
+        b = b if b.tzinfo else b.replace(tzinfo=timezone.utc)
+    try:
+        return (a > b) - (a < b)
+    except TypeError:
+        return (str(a) > str(b)) - (str(a) < str(b))
+
+
+def _matches(value, op: str, operand) -> bool:
+    if value is _MISSING:
+        return False
+    if op == '==':
+        return _compare(value, operand) == 0
+    if op == '!=':
+        return value is not None and _compare(value, operand) != 0
+    if op in ('<', '<=', '>', '>='):
+        if _type_rank(value) != _type_rank(operand):
+            return False  # 범위 비교는 같은 타입끼리만
+        result = _compare(value, operand)
+        return {'<': result < 0, '<=': result <= 0, '>': result > 0, '>=': result >= 0}[op]
+    if op == 'in':
+        return any(_compare(value, item) == 0 for item in operand)
+    if op == 'not-in':
+        return value is not None and all(_compare(value, item) != 0 for item in operand)
+    if op == 'array_contains':
+        return isinstance(value, list) and any(_compare(item, operand) == 0 for item in value)
+    if op == 'array_contains_any':
+        return isinstance(value, list) and any(_compare(item, o) == 0 for item in value for o in operand)
+    raise ValueError(f"Unsupported operator: {op}")
+
+
+# =============================================================================
+# Accounting
+# =============================================================================
+
+class OperationStats:
+    """작업별 읽기/쓰기/삭제 수와 지연 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.reads = 0
+            self.writes = 0
+            self.deletes = 0
+            self.bytes_sent = 0
+            self.bytes_received = 0
+            self.ops: Dict[str, Dict[str, float]] = {}
+
+    def record(self, op: str, elapsed_ms: float, reads: int = 0, writes: int = 0, deletes: int = 0,
+               bytes_sent: int = 0, bytes_received: int = 0):
+        with self._lock:
+            self.reads += reads
+            self.writes += writes
+            self.deletes += deletes
+            self.bytes_sent += bytes_sent
+            self.bytes_received += bytes_received
+            entry = self.ops.setdefault(op, {'calls': 0, 'reads': 0, 'writes': 0, 'deletes': 0,
+                                             'bytes_sent': 0, 'bytes_received': 0,
+                                             'total_ms': 0.0, 'max_ms': 0.0})
+            entry['calls'] += 1
+            entry['reads'] += reads
+            entry['writes'] += writes
+            entry['deletes'] += deletes
+            entry['bytes_sent'] += bytes_sent
+            entry['bytes_received'] += bytes_received
+            entry['total_ms'] += elapsed_ms
+            entry['max_ms'] = max(entry['max_ms'], elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {'reads': self.reads, 'writes': self.writes, 'deletes': self.deletes,
+                    'bytes_sent': self.bytes_sent, 'bytes_received': self.bytes_received,
+                    'ops': copy.deepcopy(self.ops)}
+
+
+class Measurement:
+    """measure() 구간의 증가분 (with 블록 종료 후 채워짐)"""
+
+    def __init__(self, label: str = ''):
+        self.label = label
+        self.reads = 0
+        self.writes = 0
+        self.deletes = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.elapsed_ms = 0.0
+        self.ops: Dict[str, Dict[str, float]] = {}
+
+    def summary(self) -> str:
+        parts = [f"{op} x{v['calls']} ({v['reads']}r/{v['writes']}w/{v['deletes']}d, {v['total_ms']:.1f}ms)"
+                 for op, v in sorted(self.ops.items())]
+        head = f"{self.label + ': ' if self.label else ''}reads={self.reads} writes={self.writes} " \
+               f"deletes={self.deletes} sent={self.bytes_sent}B received={self.bytes_received}B " \
+               f"elapsed={self.elapsed_ms:.1f}ms"
+        return head + (' | ' + ', '.join(parts) if parts else '')
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'label': self.label, 'reads': self.reads, 'writes': self.writes, 'deletes': self.deletes,
+                'bytes_sent': self.bytes_sent, 'bytes_received': self.bytes_received,
+                'elapsed_ms': round(self.elapsed_ms, 2), 'ops': self.ops}
+
+
+# =============================================================================
+# Snapshots / References
+# =============================================================================
+
+class MemoryDocumentSnapshot:
+    def __init__(self, reference: 'MemoryDocumentReference', data: Optional[Dict[str, Any]],
+                 create_time=None, update_time=None):
+        self.reference = reference
+        self.id = reference.id
+        self._data = data
+        self.exists = data is not None
+        self.create_time = create_time
+        self.update_time = update_time
+        self.read_time = datetime.now(timezone.utc)
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        return copy.deepcopy(self._data) if self._data is not None else None
+
+    def get(self, field_path: str):
+        value = _get_field(self._data or {}, field_path)
+        if value is _MISSING:
+            raise KeyError(field_path)
+        return copy.deepcopy(value)
+
+
+class MemoryDocumentReference:
+    def __init__(self, db: 'MemoryFirestore', collection_path: str, doc_id: str):
+        self._db = db
+        self.id = doc_id
+        self.path = f"{collection_path}/{doc_id}"
+        self._collection_path = collection_path
+
+    @property
+    def parent(self) -> 'MemoryCollectionReference':
+        return MemoryCollectionReference(self._db, self._collection_path)
+
+    def collection(self, name: str) -> 'MemoryCollectionReference':
+        return MemoryCollectionReference(self._db, f"{self.path}/{name}")
+
+    def get(self, transaction: 'MemoryTransaction' = None) -> MemoryDocumentSnapshot:
+        if transaction is not None:
+            return transaction.get(self)
+        with self._db._operation('doc.get') as op:
+            op.reads = 1
+            snapshot = self._db._snapshot(self)
+            op.bytes_received = _payload_bytes(snapshot.to_dict())
+            return snapshot
+
+    def set(self, data: Dict[str, Any], merge: bool = False):
+        with self._db._operation('doc.set') as op:
+            op.writes = 1
+            op.bytes_sent = _payload_bytes(data)
+            self._db._commit([('set', self, data, merge)])
+
+    def update(self, updates: Dict[str, Any]):
+        with self._db._operation('doc.update') as op:
+            self._db._commit([('update', self, updates, False)])
+            op.writes = 1
+            op.bytes_sent = _payload_bytes(updates)
+
+    def delete(self):
+        with self._db._operation('doc.delete') as op:
+            op.deletes = 1
+            self._db._commit([('delete', self, None, False)])
+
+
+class MemoryQuery:
+    """불변 쿼리 (where/order_by/limit 등은 새 쿼리 반환)"""
+
+    def __init__(self, db: 'MemoryFirestore', collection_path: str, filters=(), orders=(),
+                 limit: int = None, offset: int = 0, cursor=None):
+        self._db = db
+        self._collection_path = collection_path
+        self._filters: Tuple = tuple(filters)
+        self._orders: Tuple = tuple(orders)
+        self._limit = limit
+        self._offset = offset
+        self._cursor = cursor
+
+    def _copy(self, **changes) -> 'MemoryQuery':
+        state = {'filters': self._filters, 'orders': self._orders, 'limit': self._limit,
+                 'offset': self._offset, 'cursor': self._cursor}
+        state.update(changes)
+        return MemoryQuery(self._db, self._collection_path, **state)
+
+    def where(self, field_path: str = None, op_string: str = None, value=None, filter=None) -> 'MemoryQuery':
+        if filter is not None:  # FieldFilter(field_path, op_string, value)
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        return self._copy(filters=self._filters + ((field_path, op_string, value),))
+
+    def order_by(self, field_path: str, direction: str = ASCENDING) -> 'MemoryQuery':
+        return self._copy(orders=self._orders + ((field_path, direction),))
+
+    def limit(self, count: int) -> 'MemoryQuery':
+        return self._copy(limit=count)
+
+    def offset(self, count: int) -> 'MemoryQuery':
+        return self._copy(offset=count)
+
+    def start_after(self, document_fields_or_snapshot) -> 'MemoryQuery':
+        return self._copy(cursor=document_fields_or_snapshot)
+
+    # -------------------------------------------------------------------------
+
+    def _effective_orders(self) -> List[Tuple[str, str]]:
+        """Firestore 암묵적 정렬: 부등호 필드 → 명시 정렬 → 문서 ID"""
+        orders = list(self._orders)
+        ordered = {field for field, _ in orders}
+        for field, op, _ in self._filters:
+            if op in ('<', '<=', '>', '>=', '!=', 'not-in') and field not in ordered:
+                orders.insert(0, (field, ASCENDING))
+                ordered.add(field)
+        orders.append(('__name__', orders[-1][1] if orders else ASCENDING))
+        return orders
+
+    def _run(self) -> List[MemoryDocumentSnapshot]:
+        """조회 실행 (계측 없음)"""
+        orders = self._effective_orders()
+        rows = []
+        for doc_id, entry in self._db._collection_items(self._collection_path):
+            data = entry['data']
+            if all(_matches(_get_field(data, f), op, v) for f, op, v in self._filters):
+                if all(f == '__name__' or _get_field(data, f) is not _MISSING for f, _ in orders):
+                    rows.append((doc_id, entry))
+
+        def key_values(doc_id, data):
+            return [doc_id if f == '__name__' else _get_field(data, f) for f, _ in orders]
+
+        def compare_rows(a, b):
+            for (field, direction), va, vb in zip(orders, a[0], b[0]):
+                result = _compare(va, vb)
+                if result:
+                    return -result if direction == DESCENDING else result
+            return 0
+
+        keyed = sorted(((key_values(doc_id, e['data']), doc_id, e) for doc_id, e in rows),
+                       key=functools.cmp_to_key(compare_rows))
+
+        if self._cursor is not None:
+            cursor = self._cursor_values(orders)
+            keyed = [row for row in keyed if compare_rows((row[0],), (cursor,)) > 0]
+
+        keyed = keyed[self._offset:]
+        if self._limit is not None:
+            keyed = keyed[:self._limit]
+        return [self._db._make_snapshot(self._collection_path, doc_id, entry) for _, doc_id, entry in keyed]
+
+    def _cursor_values(self, orders) -> List[Any]:
+        """커서 값 (dict/list 커서는 앞쪽 정렬 필드만 → 그 값이 같은 문서는 모두 건너뜀)"""
+        cursor = self._cursor
+        if isinstance(cursor, MemoryDocumentSnapshot):
+            data = cursor._data or {}
+            return [cursor.id if f == '__name__' else _get_field(data, f) for f, _ in orders]
+        if isinstance(cursor, dict):
+            values = []
+            for field, _ in orders:
+                if field not in cursor:
+                    break
+                values.append(cursor[field])
+            return values
+        return list(cursor)
+
+    def stream(self, transaction: 'MemoryTransaction' = None):
+        if transaction is not None:
+            return iter(transaction.get(self))
+        with self._db._operation('query') as op:
+            docs = self._run()
+            op.reads = max(1, len(docs))
+            op.bytes_received = _received_bytes(docs)
+        return iter(docs)
+
+    def get(self, transaction: 'MemoryTransaction' = None) -> List[MemoryDocumentSnapshot]:
+        return list(self.stream(transaction))
+
+    def count(self, alias: str = None) -> 'MemoryAggregationQuery':
+        return MemoryAggregationQuery(self, alias or 'count')
+
+    def on_snapshot(self, callback) -> 'MemoryWatch':
+        return self._db._watch(self, callback)
+
+
+class MemoryAggregationResult:
+    def __init__(self, alias: str, value: int):
+        self.alias = alias
+        self.value = value
+        self.read_time = datetime.now(timezone.utc)
+
+
+class MemoryAggregationQuery:
+    def __init__(self, query: MemoryQuery, alias: str):
+        self._query = query
+        self._alias = alias
+
+    def get(self, transaction: 'MemoryTransaction' = None) -> List[List[MemoryAggregationResult]]:
+        with self._query._db._operation('query.count') as op:
+            count = len(self._query._run())
+            op.reads = max(1, -(-count // COUNT_ENTRIES_PER_READ))
+        return [[MemoryAggregationResult(self._alias, count)]]
+
+
+class MemoryCollectionReference(MemoryQuery):
+    def __init__(self, db: 'MemoryFirestore', path: str):
+        super().__init__(db, path)
+        self.path = path
+        self.id = path.rsplit('/', 1)[-1]
+
+    def document(self, doc_id: str = None) -> MemoryDocumentReference:
+        return MemoryDocumentReference(self._db, self.path, doc_id or self._db._auto_id())
+
+    def add(self, data: Dict[str, Any], document_id: str = None):
+        ref = self.document(document_id)
+        ref.set(data)
+        return datetime.now(timezone.utc), ref
+
+    def list_documents(self) -> List[MemoryDocumentReference]:
+        return [self.document(doc_id) for doc_id, _ in self._db._collection_items(self.path)]
+
+
+# =============================================================================
+# Batches / Transactions
+# =============================================================================
+
+class MemoryWriteBatch:
+    def __init__(self, db: 'MemoryFirestore'):
+        self._db = db
+        self._writes: List[Tuple] = []
+
+    def _add(self, write: Tuple):
+        if len(self._writes) >= MAX_BATCH_WRITES:
+            raise ValueError(f"400 maximum {MAX_BATCH_WRITES} writes allowed per request")
+        self._writes.append(write)
+
+    def set(self, reference: MemoryDocumentReference, data: Dict[str, Any], merge: bool = False):
+        self._add(('set', reference, copy.deepcopy(data), merge))
+
+    def update(self, reference: MemoryDocumentReference, updates: Dict[str, Any]):
+        self._add(('update', reference, copy.deepcopy(updates), False))
+
+    def delete(self, reference: MemoryDocumentReference):
+        self._add(('delete', reference, None, False))
+
+    def commit(self):
+        with self._db._operation('batch.commit') as op:
+            self._db._commit(self._writes)
+            op.writes = sum(1 for w in self._writes if w[0] != 'delete')
+            op.deletes = len(self._writes) - op.writes
+            op.bytes_sent = sum(_payload_bytes(w[2]) for w in self._writes)
+        writes, self._writes = self._writes, []
+        return writes
+
+
+class MemoryTransaction(MemoryWriteBatch):
+    """낙관적 트랜잭션 - 읽은 문서 버전이 커밋 시점까지 그대로일 때만 반영"""
+
+    def __init__(self, db: 'MemoryFirestore'):
+        super().__init__(db)
+        self._read_versions: Dict[str, int] = {}
+
+    def get(self, ref_or_query):
+        if self._writes:
+            raise ValueError("Transactions require all reads to happen before all writes")
+        with self._db._operation('transaction.get') as op:
+            if isinstance(ref_or_query, MemoryDocumentReference):
+                snapshot = self._db._snapshot(ref_or_query)
+                self._read_versions[ref_or_query.path] = self._db._version(ref_or_query.path)
+                op.reads = 1
+                op.bytes_received = _received_bytes([snapshot])
+                return snapshot
+            docs = ref_or_query._run()
+            for doc in docs:
+                self._read_versions[doc.reference.path] = self._db._version(doc.reference.path)
+            op.reads = max(1, len(docs))
+            op.bytes_received = _received_bytes(docs)
+            return docs
+
+    def commit(self):
+        with self._db._operation('transaction.commit') as op:
+            self._db._commit(self._writes, expected_versions=self._read_versions)
+            op.writes = sum(1 for w in self._writes if w[0] != 'delete')
+            op.deletes = len(self._writes) - op.writes
+            op.bytes_sent = sum(_payload_bytes(w[2]) for w in self._writes)
+        writes, self._writes = self._writes, []
+        self._read_versions = {}
+        return writes
+
+
+# =============================================================================
+# Realtime Listener
+# =============================================================================
+
+class MemoryDocumentChange:
+    def __init__(self, change_type: ChangeType, document: MemoryDocumentSnapshot, old_index: int, new_index: int):
+        self.type = change_type
+        self.document = document
+        self.old_index = old_index
+        self.new_index = new_index
+
+
+class MemoryWatch:
+    def __init__(self, db: 'MemoryFirestore', query: MemoryQuery, callback):
+        self._db = db
+        self._query = query
+        self._callback = callback
+        self._known: Dict[str, Tuple[int, MemoryDocumentSnapshot]] = {}  # doc_id -> (version, snapshot)
+        self._closed = False
+
+    @property
+    def is_active(self) -> bool:
+        return not self._closed
+
+    def unsubscribe(self):
+        self._closed = True
+        self._db._unwatch(self)
+
+    def _diff(self) -> Tuple[List[MemoryDocumentSnapshot], List[MemoryDocumentChange]]:
+        docs = self._query._run()
+        current = {doc.id: (self._db._version(doc.reference.path), doc) for doc in docs}
+        changes = []
+        for index, doc in enumerate(docs):
+            known = self._known.get(doc.id)
+            if known is None:
+                changes.append(MemoryDocumentChange(ChangeType.ADDED, doc, -1, index))
+            elif known[0] != current[doc.id][0]:
+                changes.append(MemoryDocumentChange(ChangeType.MODIFIED, doc, index, index))
+        for doc_id, (_, doc) in self._known.items():
+            if doc_id not in current:
+                changes.append(MemoryDocumentChange(ChangeType.REMOVED, doc, 0, -1))
+        self._known = current
+        return docs, changes
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+class MemoryFirestore:
+    """
+    가짜 Firestore 클라이언트
+
+    Args:
+        latency_ms: 원격 호출 1회당 지연 (쿼리/문서 조회/쓰기/일괄 커밋마다 1회)
+        latency_by_op: 작업별 지연 재정의 (예: {'query': 80, 'batch.commit': 120})
+    """
+
+    def __init__(self, latency_ms: float = 0.0, latency_by_op: Dict[str, float] = None):
+        self.latency_ms = latency_ms
+        self.latency_by_op = dict(latency_by_op or {})
+        self.stats = OperationStats()
+        self._lock = threading.RLock()
+        self._collections: Dict[str, Dict[str, Dict[str, Any]]] = {}  # collection path -> doc_id -> entry
+        self._clock = 0
+        self._watches: List[MemoryWatch] = []
+        self._notify: Optional[queue.Queue] = None
+
+    # -------------------------------------------------------------------------
+    # google-cloud-firestore Client API
+    # -------------------------------------------------------------------------
+
+    def collection(self, name: str) -> MemoryCollectionReference:
+        return MemoryCollectionReference(self, name)
+
+    def document(self, path: str) -> MemoryDocumentReference:
+        collection_path, doc_id = path.rsplit('/', 1)
+        return MemoryDocumentReference(self, collection_path, doc_id)
+
+    def batch(self) -> MemoryWriteBatch:
+        return MemoryWriteBatch(self)
+
+    def get_all(self, references: List[MemoryDocumentReference]):
+        """여러 문서 조회 (없는 문서도 exists=False 스냅샷, 읽기 = 참조 수)"""
+        references = list(references)
+        with self._operation('get_all') as op:
+            op.reads = len(references)
+            snapshots = [self._snapshot(ref) for ref in references]
+            op.bytes_received = _received_bytes(snapshots)
+            return iter(snapshots)
+
+    def transaction(self) -> MemoryTransaction:
+        return MemoryTransaction(self)
+
+    def run_transaction(self, fn, *args, **kwargs):
+        """fn(transaction, ...) 실행 후 커밋, 충돌 시 재시도 (firestore.transactional과 같은 동작)"""
+        for attempt in range(MAX_TRANSACTION_ATTEMPTS):
+            transaction = self.transaction()
+            result = fn(transaction, *args, **kwargs)
+            try:
+                transaction.commit()
+                return result
+            except Aborted:
+                if attempt == MAX_TRANSACTION_ATTEMPTS - 1:
+                    raise
+        return None
+
+    # -------------------------------------------------------------------------
+    # Accounting
+    # -------------------------------------------------------------------------
+
+    @contextmanager
+    def measure(self, label: str = ''):
+        """구간 내 읽기/쓰기/지연 증가분 측정"""
+        before = self.stats.snapshot()
+        result = Measurement(label)
+        started = time.perf_counter()
+        try:
+            yield result
+        finally:
+            result.elapsed_ms = (time.perf_counter() - started) * 1000
+            after = self.stats.snapshot()
+            result.reads = after['reads'] - before['reads']
+            result.writes = after['writes'] - before['writes']
+            result.deletes = after['deletes'] - before['deletes']
+            result.bytes_sent = after['bytes_sent'] - before['bytes_sent']
+            result.bytes_received = after['bytes_received'] - before['bytes_received']
+            for op, entry in after['ops'].items():
+                prev = before['ops'].get(op, {})
+                delta = {k: v - prev.get(k, 0) for k, v in entry.items() if k != 'max_ms'}
+                if delta['calls']:
+                    delta['max_ms'] = entry['max_ms']
+                    result.ops[op] = delta
+
+    @contextmanager
+    def _operation(self, op: str):
+        """원격 호출 1회 (지연 흉내 + 계측)"""
+        record = Measurement(op)
+        started = time.perf_counter()
+        delay = self.latency_by_op.get(op, self.latency_ms)
+        if delay:
+            time.sleep(delay / 1000)
+        try:
+            yield record
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.stats.record(op, elapsed, record.reads, record.writes, record.deletes, record.bytes_sent,
+                              record.bytes_received)
+
+    def document_count(self, collection_path: str = None) -> int:
+        """저장된 문서 수 (계측 없음, 검증용)"""
+        with self._lock:
+            if collection_path is not None:
+                return len(self._collections.get(collection_path, {}))
+            return sum(len(docs) for docs in self._collections.values())
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _auto_id(self) -> str:
+        import uuid
+        return uuid.uuid4().hex[:20]
+
+    def _collection_items(self, collection_path: str) -> List[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            return list(self._collections.get(collection_path, {}).items())
+
+    def _version(self, path: str) -> int:
+        collection_path, doc_id = path.rsplit('/', 1)
+        with self._lock:
+            entry = self._collections.get(collection_path, {}).get(doc_id)
+            return entry['version'] if entry else 0
+
+    def _make_snapshot(self, collection_path: str, doc_id: str, entry: Optional[Dict[str, Any]]):
+        ref = MemoryDocumentReference(self, collection_path, doc_id)
+        if entry is None:
+            return MemoryDocumentSnapshot(ref, None)
+        return MemoryDocumentSnapshot(ref, copy.deepcopy(entry['data']), entry['create_time'], entry['update_time'])
+
+    def _snapshot(self, ref: MemoryDocumentReference) -> MemoryDocumentSnapshot:
+        with self._lock:
+            entry = self._collections.get(ref._collection_path, {}).get(ref.id)
+            return self._make_snapshot(ref._collection_path, ref.id, entry)
+
+    def _commit(self, writes: List[Tuple], expected_versions: Dict[str, int] = None):
+        """쓰기 묶음을 원자적으로 반영 (검증 실패 시 아무것도 반영하지 않음)"""
+        with self._lock:
+            for path, version in (expected_versions or {}).items():
+                if self._version(path) != version:
+                    raise Aborted(f"409 Transaction aborted: {path} changed")
+            # 결과를 먼저 계산 (중간 실패 시 원자성 유지)
+            staged: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+            for kind, ref, payload, merge in writes:
+                key = (ref._collection_path, ref.id)
+                if key in staged:
+                    current = staged[key]
+                else:
+                    entry = self._collections.get(ref._collection_path, {}).get(ref.id)
+                    current = copy.deepcopy(entry['data']) if entry else None
+                if kind == 'delete':
+                    staged[key] = None
+                elif kind == 'update':
+                    if current is None:
+                        raise NotFound(f"404 No document to update: {ref.path}")
+                    for field_path, value in payload.items():
+                        if isinstance(value, ArrayUnion):
+                            existing = _get_field(current, field_path)
+                            existing = list(existing) if isinstance(existing, list) else []
+                            value = existing + [v for v in value.values if v not in existing]
+                        elif isinstance(value, Increment):
+                            value = value.apply(_get_field(current, field_path))
+                        _set_field(current, field_path, value if value is DELETE_FIELD else copy.deepcopy(value))
+                    staged[key] = current
+                elif merge and current is not None:
+                    _deep_merge(current, payload)
+                    staged[key] = current
+                else:
+                    staged[key] = _strip_deletes(payload)
+
+            now = datetime.now(timezone.utc)
+            for (collection_path, doc_id), data in staged.items():
+                docs = self._collections.setdefault(collection_path, {})
+                if data is None:
+                    docs.pop(doc_id, None)
+                    continue
+                self._clock += 1
+                previous = docs.get(doc_id)
+                docs[doc_id] = {'data': data, 'version': self._clock, 'update_time': now,
+                                'create_time': previous['create_time'] if previous else now}
+            if self._watches:
+                self._notify.put(True)
+
+    # -------------------------------------------------------------------------
+    # Realtime
+    # -------------------------------------------------------------------------
+
+    def _watch(self, query: MemoryQuery, callback) -> MemoryWatch:
+        watch = MemoryWatch(self, query, callback)
+        with self._lock:
+            if self._notify is None:
+                self._notify = queue.Queue()
+                threading.Thread(target=self._dispatch, daemon=True, name='memory-firestore-watch').start()
+            self._watches.append(watch)
+        self._notify.put(watch)  # 첫 스냅샷 (현재 결과 전체가 ADDED)
+        return watch
+
+    def _unwatch(self, watch: MemoryWatch):
+        with self._lock:
+            if watch in self._watches:
+                self._watches.remove(watch)
+
+    def _dispatch(self):
+        """변경 알림 스레드 - 쓰기마다 구독 쿼리를 다시 계산해 변경분만 전달"""
+        while True:
+            item = self._notify.get()
+            targets = [item] if isinstance(item, MemoryWatch) else list(self._watches)
+            for watch in targets:
+                if watch._closed:
+                    continue
+                first = not watch._known and isinstance(item, MemoryWatch)
+                with self._lock:
+                    docs, changes = watch._diff()
+                if not changes and not first:
+                    continue
+                self.stats.record('listen', 0.0, reads=len(changes),
+                                  bytes_received=_received_bytes(change.document for change in changes))
+                try:
+                    watch._callback(docs, changes, datetime.now(timezone.utc))
+                except Exception as e:
+                    print(f"⚠️ [MemoryFirestore] Snapshot callback failed: {e}")
@@ -0,0 +1,535 @@
+# -*- coding: utf-8 -*-
+"""
+Firestore Outbox - 로컬 저장과 함께 커밋되는 Firestore 쓰기 대기열 (SQLite)
+
+상태 변경 요청이 Firestore 왕복(save_article + save_history)을 기다리지 않도록
+로컬 저장과 outbox 기록만 커밋하고, 백그라운드 drainer가 배치로 Firestore에 반영합니다.
+
+- 원자성: LOCAL_STORE_BACKEND=sqlite이면 outbox 테이블이 articles.db 안에 있어
+          기사 행과 outbox 항목이 한 트랜잭션으로 커밋됨
+          json 백엔드는 outbox(cache/<env>/_firestore_outbox.db)를 먼저 기록하고
+          로컬 저장이 실패하면 해당 항목을 취소
+- 멱등 키: article:<article_id>, history:<url>, archive:<article_id>:<seq> (state_history 보관 묶음)
+          같은 키는 대기 중 최신 항목만 반영 (이전 항목은 함께 삭제)
+          기사 변경분(update_article)이 이어지면 article_diff.merge_diffs로 합쳐 한 번에 반영,
+          전체 저장이 하나라도 섞이면 최신 전체 데이터로 저장
+          반영은 set(merge=True) / 필드 update라 같은 항목을 재시도해도 결과가 같음
+- 배치: 기사는 WriteBatch 1회 커밋, 히스토리는 샤드 인덱스 배치 1회로 합침 (history_index)
+- 재시도: 배치가 실패하면 그 배치 항목을 1건씩 시험 반영해 문제 항목을 분리
+          실패한 키는 키별 백오프 동안 보류(parked)하고 나머지 항목은 계속 반영
+          보류 이후 다른 항목이 반영됐으면 (Firestore는 정상, 항목 문제) OUTBOX_POISON_ATTEMPTS,
+          아니면 OUTBOX_MAX_ATTEMPTS 초과 시 dead로 보관
+          시험 반영이 연달아 실패하면 (장애) 전체 지수 백오프 (최대 OUTBOX_MAX_BACKOFF_SECONDS)
+- 백프레셔: 대기 항목이 OUTBOX_MAX_PENDING 이상이면 쓰기 호출이
+            OUTBOX_BACKPRESSURE_SECONDS까지 drain을 기다림 (기록은 버리지 않음)
+- 여러 프로세스(desk / 스케줄러)가 같은 outbox를 공유하며, 임대(lease) 행으로 한 번에 한 drainer만 반영
+
+환경 변수:
+    FIRESTORE_OUTBOX (true) - false이면 기존처럼 요청 안에서 동기 저장
+    OUTBOX_BATCH_SIZE (200) / OUTBOX_DRAIN_INTERVAL (1.0초)
+    OUTBOX_MAX_PENDING (5000) / OUTBOX_BACKPRESSURE_SECONDS (10)
+    OUTBOX_MAX_ATTEMPTS (20) / OUTBOX_POISON_ATTEMPTS (3) / OUTBOX_MAX_BACKOFF_SECONDS (300)
+"""
+import os
+import time
+import atexit
+import sqlite3
+import threading
+from collections import namedtuple
+from typing import Dict, Any, List, Optional, Iterable
+
+from .cache_codec import encode_article, decode_article
+from .article_diff import merge_diffs
+
+
+OUTBOX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS firestore_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL,              -- 멱등 키 (같은 키는 최신 항목만 반영)
+    kind TEXT NOT NULL,             -- save_article | update_article | update_history | archive_history
+    payload BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    dead INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_firestore_outbox_key ON firestore_outbox (key);
+CREATE TABLE IF NOT EXISTS firestore_outbox_lease (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    owner TEXT NOT NULL,
+    until REAL NOT NULL
+);
+"""
+
+LEASE_SECONDS = 60
+IDLE_POLL_SECONDS = 5.0
+EXIT_DRAIN_SECONDS = 10.0
+# 성공 없이 연달아 실패하면 (배치 1회 + 시험 반영 2회) 항목 문제가 아니라 장애로 보고 전체 백오프
+OUTBOX_OUTAGE_FAILURES = 3
+
+# 대기열 항목 한 건 (key: 멱등 키, kind: 반영 방식, payload: dict)
+OutboxOp = namedtuple('OutboxOp', ['key', 'kind', 'payload'])
+
+
+def is_outbox_enabled() -> bool:
+    return os.getenv('FIRESTORE_OUTBOX', 'true').lower() == 'true'
+
+
+def article_op(article_id: str, data: Dict[str, Any]) -> OutboxOp:
+    """기사 전체 저장 (FirestoreClient.batch_save_articles)"""
+    return OutboxOp(f'article:{article_id}', 'save_article', {'article_id': article_id, 'data': data})
+
+
+def article_diff_op(article_id: str, diff: Dict[str, Any], data: Dict[str, Any]) -> OutboxOp:
+    """기사 변경 필드만 저장 (FirestoreClient.batch_update_articles, 문서가 없으면 data로 전체 저장)"""
+    return OutboxOp(f'article:{article_id}', 'update_article',
+                    {'article_id': article_id, 'diff': diff, 'data': data})
+
+
+def history_op(url: str, status: str, article_id: str) -> OutboxOp:
+    """URL 히스토리 갱신 (FirestoreClient.batch_update_history)"""
+    return OutboxOp(f'history:{url}', 'update_history',
+                    {'url': url, 'status': status, 'article_id': article_id})
+
+
+def archive_op(article_id: str, chunk: Dict[str, Any]) -> OutboxOp:
+    """보관된 상태 전이 묶음 저장 (FirestoreClient.batch_save_history_archives, state_history 모듈)"""
+    return OutboxOp(f"archive:{article_id}:{chunk['seq']}", 'archive_history',
+                    {'article_id': article_id, 'chunk': chunk})
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, default))
+
+
+class FirestoreOutbox:
+    """
+    Firestore 쓰기 대기열 (싱글톤)
+
+    attach()로 FirestoreClient와 로컬 저장소를 연결하면 drainer 스레드가 시작됩니다.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self.db_path: Optional[str] = None
+        self._db = None
+        self._local = threading.local()
+        self._wake = threading.Event()
+        self._drain_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._owner = f"{os.getpid()}-{id(self)}"
+        self._retry_at = 0.0
+        self._failures_in_row = 0
+        self._probe_until_id = 0  # 실패한 배치의 마지막 id까지 1건씩 시험 반영 (0이면 배치 모드)
+        self._parked: Dict[str, tuple] = {}  # 시험 반영에 실패한 키 → (재시도 시각, 첫 실패 시각)
+        self._last_success_at = 0.0
+        self._stats = {'enqueued': 0, 'drained': 0, 'superseded': 0, 'batches': 0,
+                       'failures': 0, 'dead': 0, 'backpressure_waits': 0,
+                       'last_error': None, 'last_drain_at': None}
+        self._initialized = True
+
+    # -------------------------------------------------------------------------
+    # Setup
+    # -------------------------------------------------------------------------
+
+    def attach(self, db_client, store) -> 'FirestoreOutbox':
+        """
+        FirestoreClient / 로컬 저장소 연결 후 drainer 시작
+        sqlite 저장소면 같은 articles.db를, 아니면 cache_root/_firestore_outbox.db를 사용
+        """
+        if getattr(store, 'backend', None) == 'sqlite':
+            db_path = store.db_path
+        else:
+            db_path = os.path.join(store.cache_root, '_firestore_outbox.db')
+        if db_path != self.db_path:
+            self.db_path = db_path
+            self._local = threading.local()
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+            self._conn().executescript(OUTBOX_SCHEMA)
+        self._db = db_client
+        self._start()
+        pending = self.pending_count()
+        if pending:
+            print(f"📮 [Outbox] {pending} queued Firestore writes from a previous run")
+        return self
+
+    def is_attached(self) -> bool:
+        return self._db is not None and self.db_path is not None
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._drain_loop, daemon=True, name='firestore-outbox')
+        self._thread.start()
+        atexit.register(self._drain_on_exit)
+
+    def stop(self):
+        self._stopping = True
+        self._wake.set()
+
+    # -------------------------------------------------------------------------
+    # Enqueue
+    # -------------------------------------------------------------------------
+
+    def enqueue(self, ops: Iterable[OutboxOp], conn: sqlite3.Connection = None, wait: bool = True) -> List[int]:
+        """
+        항목 기록
+
+        Args:
+            ops: OutboxOp 목록
+            conn: 호출자 트랜잭션 연결 (sqlite 저장소가 기사 행과 함께 커밋할 때)
+                  없으면 자체 트랜잭션으로 기록 후 drainer를 깨움
+            wait: False면 백프레셔 대기 생략 (호출자가 잠금을 잡기 전에 wait_for_capacity를 이미 호출)
+
+        Returns:
+            기록된 항목 id (cancel()용)
+        """
+        ops = list(ops)
+        if not ops:
+            return []
+        rows = [(op.key, op.kind, encode_article(op.payload, 'compact'), time.time()) for op in ops]
+        sql = 'INSERT INTO firestore_outbox (key, kind, payload, created_at) VALUES (?, ?, ?, ?)'
+
+        if conn is not None:
+            ids = [conn.execute(sql, row).lastrowid for row in rows]
+        else:
+            if wait:
+                self.wait_for_capacity()
+            conn = self._conn()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                ids = [conn.execute(sql, row).lastrowid for row in rows]
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            self.notify()
+        self._stats['enqueued'] += len(ids)
+        return ids
+
+    def cancel(self, ids: List[int]):
+        """아직 반영되지 않은 항목 취소 (로컬 저장 실패 시)"""
+        if ids:
+            marks = ','.join('?' * len(ids))
+            self._conn().execute(f'DELETE FROM firestore_outbox WHERE id IN ({marks})', ids)
+
+    def notify(self):
+        """drainer 깨우기 (커밋 후 호출)"""
+        self._wake.set()
+
+    def wait_for_capacity(self):
+        """백프레셔 - 대기 항목이 한도 이상이면 drain을 잠시 기다림 (시간 초과 시 그대로 진행)"""
+        limit = int(os.getenv('OUTBOX_MAX_PENDING', 5000))
+        if not limit or self.pending_count() < limit:
+            return
+        self._stats['backpressure_waits'] += 1
+        deadline = time.time() + _env_float('OUTBOX_BACKPRESSURE_SECONDS', 10)
+        self.notify()
+        while time.time() < deadline:
+            time.sleep(0.2)
+            if self.pending_count() < limit:
+                return
+        print(f"⚠️ [Outbox] Backlog over {limit} entries - Firestore is not keeping up "
+              f"(last error: {self._stats['last_error']})")
+
+    # -------------------------------------------------------------------------
+    # Drain
+    # -------------------------------------------------------------------------
+
+    def _drain_loop(self):
+        interval = _env_float('OUTBOX_DRAIN_INTERVAL', 1.0)
+        while not self._stopping:
+            retry_wait = self._retry_at - time.time()
+            woke = self._wake.wait(min(IDLE_POLL_SECONDS, retry_wait) if retry_wait > 0 else IDLE_POLL_SECONDS)
+            self._wake.clear()
+            if self._stopping:
+                break
+            if self._retry_at > time.time():
+                continue  # 백오프 중 (새 항목은 재시도 때 함께 반영)
+            if woke:
+                # 짧게 모아서 한 배치로 반영
+                time.sleep(interval)
+            try:
+                while not self._stopping and self._drain_once() > 0:
+                    pass
+            except Exception as e:
+                print(f"⚠️ [Outbox] Drain loop error: {e}")
+
+    def _drain_on_exit(self):
+        """종료 시 남은 항목 반영 시도 (실패분은 다음 실행/다른 프로세스가 반영)"""
+        if not self.is_attached() or not self.pending_count():
+            return
+        self._retry_at = 0.0
+        deadline = time.time() + EXIT_DRAIN_SECONDS
+        try:
+            while time.time() < deadline and self._drain_once() > 0:
+                pass
+        except Exception as e:
+            print(f"⚠️ [Outbox] Exit drain failed: {e}")
+        remaining = self.pending_count()
+        if remaining:
+            print(f"📮 [Outbox] {remaining} Firestore writes left queued for the next run")
+
+    def _acquire_lease(self, conn: sqlite3.Connection) -> bool:
+        now = time.time()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT owner, until FROM firestore_outbox_lease WHERE id = 1').fetchone()
+            if row and row[0] != self._owner and row[1] > now:
+                conn.execute('ROLLBACK')
+                return False
+            conn.execute('INSERT INTO firestore_outbox_lease (id, owner, until) VALUES (1, ?, ?) '
+                         'ON CONFLICT(id) DO UPDATE SET owner = excluded.owner, until = excluded.until',
+                         (self._owner, now + LEASE_SECONDS))
+            conn.execute('COMMIT')
+            return True
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def _release_lease(self, conn: sqlite3.Connection):
+        conn.execute('UPDATE firestore_outbox_lease SET until = 0 WHERE id = 1 AND owner = ?', (self._owner,))
+
+    def _drain_once(self) -> int:
+        """
+        한 배치 반영
+
+        Returns:
+            처리(반영/대체/보류)한 항목 수 (0이면 더 할 일 없음 / 전체 백오프 / 다른 프로세스가 반영 중)
+        """
+        if not self.is_attached():
+            return 0
+        with self._drain_lock:
+            conn = self._conn()
+            if not self._acquire_lease(conn):
+                return 0
+            try:
+                return self._push_batch(conn)
+            finally:
+                self._release_lease(conn)
+
+    def _push_batch(self, conn: sqlite3.Connection) -> int:
+        now = time.time()
+        parked = [key for key, (retry_at, _) in self._parked.items() if retry_at > now]
+        sql = 'SELECT id, key, kind, payload FROM firestore_outbox WHERE dead = 0'
+        if parked:
+            sql += f" AND key NOT IN ({','.join('?' * len(parked))})"
+        rows = conn.execute(sql + ' ORDER BY id LIMIT ?',
+                            parked + [int(os.getenv('OUTBOX_BATCH_SIZE', 200))]).fetchall()
+        if rows and self._probe_until_id and rows[0][0] <= self._probe_until_id:
+            rows = rows[:1]
+        else:
+            self._probe_until_id = 0  # 실패한 배치를 다 시험했으면 배치 모드로
+        probing = bool(self._probe_until_id)
+        if not rows:
+            return 0
+
+        # 같은 키는 한 항목으로 합침 (ORDER BY id → 뒤가 최신)
+        rows_by_key: Dict[str, List[tuple]] = {}
+        for row in rows:
+            rows_by_key.setdefault(row[1], []).append(row)
+        ids_by_key = {key: [row[0] for row in key_rows] for key, key_rows in rows_by_key.items()}
+        dead_keys = self._keys_with_dead(conn, list(rows_by_key))
+
+        groups: Dict[str, List[tuple]] = {}
+        for key, key_rows in rows_by_key.items():
+            kind, payload = self._coalesce(key_rows, full=key in dead_keys)
+            groups.setdefault(kind, []).append((key, payload))
+
+        done_keys: List[str] = []
+        error = None
+        isolated = False
+        for kind, group in groups.items():
+            try:
+                self._push(kind, [payload for _, payload in group])
+                done_keys.extend(key for key, _ in group)
+            except Exception as e:
+                error = f"{kind}: {e}"
+                failed_keys = [key for key, _ in group]
+                isolated = self._record_failure(conn, failed_keys, [i for key in failed_keys for i in ids_by_key[key]],
+                                                error, probing)
+
+        if done_keys:
+            done_ids = [i for key in done_keys for i in ids_by_key[key]]
+            marks = ','.join('?' * len(done_ids))
+            conn.execute(f'DELETE FROM firestore_outbox WHERE id IN ({marks})', done_ids)
+            # 더 최신 값이 반영된 키의 dead 항목은 의미 없음
+            for key in done_keys:
+                conn.execute('DELETE FROM firestore_outbox WHERE key = ? AND dead = 1 AND id < ?',
+                             (key, max(ids_by_key[key])))
+            self._stats['drained'] += len(done_keys)
+            self._stats['superseded'] += len(done_ids) - len(done_keys)
+            self._stats['batches'] += 1
+            self._stats['last_drain_at'] = time.time()
+            self._last_success_at = time.time()
+            self._failures_in_row = 0
+            for key in done_keys:
+                self._parked.pop(key, None)
+
+        if error is None:
+            self._retry_at = 0.0
+            return len(rows)
+
+        if isolated:
+            self._failures_in_row = 0  # 항목 문제 (Firestore는 정상) - 장애 백오프 대상 아님
+            return len(rows)
+        self._failures_in_row += 1
+        if not probing:
+            # 배치 안의 어느 항목이 문제인지 1건씩 확인
+            self._probe_until_id = rows[-1][0]
+            print(f"⚠️ [Outbox] Firestore batch failed ({error}) - retrying entries one by one")
+            return len(rows)
+        if self._failures_in_row < OUTBOX_OUTAGE_FAILURES:
+            return len(rows)  # 실패한 키는 보류, 다음 항목 계속
+
+        backoff = min(_env_float('OUTBOX_MAX_BACKOFF_SECONDS', 300), 2 ** min(self._failures_in_row, 16))
+        self._retry_at = time.time() + backoff
+        print(f"⚠️ [Outbox] Firestore push failed ({error}) - retry in {backoff:.0f}s")
+        return 0
+
+    @staticmethod
+    def _keys_with_dead(conn: sqlite3.Connection, keys: List[str]) -> set:
+        """dead 항목이 남은 키 (그 변경분이 빠졌으므로 다음 반영은 전체 저장)"""
+        marks = ','.join('?' * len(keys))
+        rows = conn.execute(f'SELECT DISTINCT key FROM firestore_outbox WHERE dead = 1 AND key IN ({marks})',
+                            keys).fetchall()
+        return {row[0] for row in rows}
+
+    @staticmethod
+    def _coalesce(rows: List[tuple], full: bool = False) -> tuple:
+        """같은 키의 대기 항목들 → (kind, payload) 한 건"""
+        kinds = [row[2] for row in rows]
+        last = decode_article(rows[-1][3])
+        if kinds[-1] in ('update_history', 'archive_history'):
+            return kinds[-1], last
+        if not full and all(kind == 'update_article' for kind in kinds):
+            diffs = [decode_article(row[3])['diff'] for row in rows[:-1]] + [last['diff']]
+            merged = merge_diffs(diffs, last['data'])
+            if merged is not None:
+                return 'update_article', {'article_id': last['article_id'], 'diff': merged, 'data': last['data']}
+        return 'save_article', {'article_id': last['article_id'], 'data': last['data']}
+
+    def _push(self, kind: str, payloads: List[Dict[str, Any]]):
+        if kind == 'save_article':
+            self._db.batch_save_articles({p['article_id']: p['data'] for p in payloads})
+        elif kind == 'update_article':
+            self._db.batch_update_articles({p['article_id']: (p['diff'], p['data']) for p in payloads})
+        elif kind == 'update_history':
+            self._db.batch_update_history([(p['url'], p['article_id'], p['status']) for p in payloads])
+        elif kind == 'archive_history':
+            self._db.batch_save_history_archives([(p['article_id'], p['chunk']) for p in payloads])
+        else:
+            raise ValueError(f"Unknown outbox kind: {kind}")
+
+    def _record_failure(self, conn: sqlite3.Connection, keys: List[str], ids: List[int], error: str,
+                        probing: bool) -> bool:
+        """
+        실패 기록 - 1건 시험 반영에서 실패한 항목만 시도 횟수를 올리고 키를 보류 (배치 실패는 특정 항목 탓이 아님)
+
+        처음 실패한 뒤 다른 항목이 반영됐으면 항목 문제로 보고 OUTBOX_POISON_ATTEMPTS에서 dead 처리
+
+        Returns:
+            항목 문제로 판단했는지 (True면 장애 백오프 없이 나머지 항목 계속 반영)
+        """
+        self._stats['failures'] += 1
+        self._stats['last_error'] = error
+        marks = ','.join('?' * len(ids))
+        if not probing:
+            conn.execute(f'UPDATE firestore_outbox SET last_error = ? WHERE id IN ({marks})', [error] + ids)
+            return False
+        now = time.time()
+        first_failed = min((self._parked[key][1] for key in keys if key in self._parked), default=now)
+        isolated = self._last_success_at > first_failed
+        max_attempts = int(os.getenv('OUTBOX_POISON_ATTEMPTS' if isolated else 'OUTBOX_MAX_ATTEMPTS',
+                                      3 if isolated else 20))
+        conn.execute(f'UPDATE firestore_outbox SET attempts = attempts + 1, last_error = ?, '
+                     f'dead = CASE WHEN attempts + 1 >= ? THEN 1 ELSE 0 END WHERE id IN ({marks})',
+                     [error, max_attempts] + ids)
+        attempts, dead = conn.execute(f'SELECT MAX(attempts), SUM(dead) FROM firestore_outbox WHERE id IN ({marks})',
+                                      ids).fetchone()
+        if dead:
+            for key in keys:
+                self._parked.pop(key, None)
+            self._stats['dead'] += dead
+            print(f"🪦 [Outbox] {dead} entries exceeded {max_attempts} attempts - kept as dead ({error})")
+            return isolated
+        backoff = min(_env_float('OUTBOX_MAX_BACKOFF_SECONDS', 300), 2 ** min(attempts or 1, 16))
+        for key in keys:
+            self._parked[key] = (now + backoff, first_failed)
+        print(f"⏸️ [Outbox] {', '.join(keys)} parked for {backoff:.0f}s - draining the rest")
+        return isolated
+
+    def drain(self, retry_dead: bool = False, timeout: float = 30.0) -> Dict[str, Any]:
+        """
+        즉시 반영 (백오프 무시, drain-now API)
+
+        Args:
+            retry_dead: dead 항목도 다시 대기열로
+            timeout: 최대 소요 시간 (초)
+        """
+        if not self.is_attached():
+            return {'drained': 0, 'pending': 0, 'error': 'outbox is not attached'}
+        if retry_dead:
+            self._conn().execute('UPDATE firestore_outbox SET dead = 0, attempts = 0 WHERE dead = 1')
+        self._retry_at = 0.0
+        before = self._stats['drained']
+        deadline = time.time() + timeout
+        while time.time() < deadline and self._drain_once() > 0:
+            pass
+        return {'drained': self._stats['drained'] - before, 'pending': self.pending_count(),
+                'error': self._stats['last_error'] if self._retry_at else None}
+
+    # -------------------------------------------------------------------------
+    # Status
+    # -------------------------------------------------------------------------
+
+    def pending_count(self) -> int:
+        if self.db_path is None:
+            return 0
+        return self._conn().execute('SELECT COUNT(*) FROM firestore_outbox WHERE dead = 0').fetchone()[0]
+
+    def get_status(self) -> Dict[str, Any]:
+        status = {'enabled': is_outbox_enabled(), 'attached': self.is_attached(), 'db_path': self.db_path,
+                  'pending': 0, 'dead': 0, 'oldest_age_seconds': None,
+                  'retry_in_seconds': max(0, round(self._retry_at - time.time(), 1)),
+                  'parked': sum(1 for retry_at, _ in self._parked.values() if retry_at > time.time()),
+                  'stats': dict(self._stats)}
+        if self.db_path is None:
+            return status
+        pending, dead, oldest = self._conn().execute(
+            'SELECT SUM(dead = 0), SUM(dead = 1), MIN(CASE WHEN dead = 0 THEN created_at END) FROM firestore_outbox'
+        ).fetchone()
+        status['pending'] = pending or 0
+        status['dead'] = dead or 0
+        if oldest:
+            status['oldest_age_seconds'] = round(time.time() - oldest, 1)
+        return status
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+def get_outbox() -> FirestoreOutbox:
+    """Firestore outbox 인스턴스 반환"""
+    return FirestoreOutbox()
@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+"""
+Firestore Usage - 읽기/쓰기/삭제 비용의 출처별 집계 + 일일 무료 한도 예측
+
+FirestoreClient._track_read / _track_write / _track_delete 호출마다
+현재 출처(요청 라우트, 파이프라인 단계, 백그라운드 작업)와 컬렉션으로 태그해 집계합니다.
+
+- 출처: usage_scope('pipeline:ANALYZE') 컨텍스트 (contextvars, 스레드/요청별)
+        Flask 요청은 before_request에서 'GET /api/board/overview' 형태로 지정
+        지정이 없으면 스레드 이름 (thread:registry-warmup 등)
+- 집계: 10분 슬롯 × 출처 × 컬렉션을 cache/<env>/_firestore_usage.db (SQLite)에 누적
+        desk / 스케줄러 등 여러 프로세스가 같은 파일에 더하고, 재시작 후에도 유지
+- 할당량 일자: 무료 한도는 태평양 시간 자정에 초기화 (America/Los_Angeles)
+- 예측: 오늘 사용량 + 최근 1시간 속도 × 남은 시간
+- 소프트 예산: 예측이 한도 × FIRESTORE_SOFT_BUDGET을 넘으면 allow_optional()이 False
+              → 주기 새로고침, 캐시 워밍업 같은 선택 작업을 건너뜀
+
+환경 변수:
+    FIRESTORE_DAILY_READS (50000) / FIRESTORE_DAILY_WRITES (20000) / FIRESTORE_DAILY_DELETES (20000)
+    FIRESTORE_SOFT_BUDGET (0.8, 0이면 제한 없음)
+    FIRESTORE_USAGE_RETENTION_DAYS (14)
+"""
+import os
+import sys
+import time
+import atexit
+import sqlite3
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+
+KINDS = ('reads', 'writes', 'deletes')
+SLOT_SECONDS = 600
+FLUSH_SECONDS = 15
+PROJECTION_CACHE_SECONDS = 30
+THROTTLE_LOG_SECONDS = 600
+
+USAGE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage (
+    slot INTEGER NOT NULL,          -- 10분 슬롯 시작 (epoch 초)
+    quota_day TEXT NOT NULL,        -- 태평양 시간 기준 날짜
+    source TEXT NOT NULL,
+    collection TEXT NOT NULL,
+    reads INTEGER NOT NULL DEFAULT 0,
+    writes INTEGER NOT NULL DEFAULT 0,
+    deletes INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (slot, source, collection)
+);
+CREATE INDEX IF NOT EXISTS idx_usage_day ON usage (quota_day);
+"""
+
+_source: contextvars.ContextVar = contextvars.ContextVar('firestore_usage_source', default=None)
+
+
+def get_daily_limits() -> Dict[str, int]:
+    return {
+        'reads': int(os.getenv('FIRESTORE_DAILY_READS', 50000)),
+        'writes': int(os.getenv('FIRESTORE_DAILY_WRITES', 20000)),
+        'deletes': int(os.getenv('FIRESTORE_DAILY_DELETES', 20000)),
+    }
+
+
+def get_soft_budget() -> float:
+    return float(os.getenv('FIRESTORE_SOFT_BUDGET', 0.8))
+
+
+def _quota_tz():
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo('America/Los_Angeles')
+    except Exception:  # tzdata 없음 (Windows 등) → PST 고정
+        return timezone(timedelta(hours=-8))
+
+
+_QUOTA_TZ = _quota_tz()
+
+
+def _quota_day_bounds(now: float) -> Tuple[str, float, float]:
+    """(할당량 날짜, 시작 epoch, 끝 epoch)"""
+    local = datetime.fromtimestamp(now, _QUOTA_TZ)
+    start = local.replace(hour=0, minute=0, second=0, microsecond=0)
+    end = start + timedelta(days=1)
+    return start.strftime('%Y-%m-%d'), start.timestamp(), end.timestamp()
+
+
+# =============================================================================
+# Source Tagging
+# =============================================================================
+
+def set_source(source: str):
+    """현재 컨텍스트의 출처 지정 (reset_source(token)으로 되돌림)"""
+    return _source.set(source)
+
+
+def reset_source(token):
+    try:
+        _source.reset(token)
+    except ValueError:  # 다른 컨텍스트에서 만든 token
+        _source.set(None)
+
+
+@contextmanager
+def usage_scope(source: str):
+    """with usage_scope('pipeline:ANALYZE'): ... 안의 Firestore 비용을 해당 출처로 집계"""
+    token = _source.set(source)
+    try:
+        yield
+    finally:
+        _source.reset(token)
+
+
+def current_source() -> str:
+    source = _source.get()
+    if source:
+        return source
+    thread = threading.current_thread()
+    if thread is threading.main_thread():
+        return f"main:{os.path.basename(sys.argv[0] or 'python')}"
+    return f"thread:{thread.name}"
+
+
+# =============================================================================
+# Ledger
+# =============================================================================
+
+class UsageLedger:
+    """
+    Firestore 비용 장부 (싱글톤)
+
+    record()는 메모리에만 더하고, 백그라운드 스레드가 FLUSH_SECONDS마다 SQLite에 합산합니다.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        from .local_store import get_default_cache_root
+        self.db_path = os.getenv('FIRESTORE_USAGE_DB') or os.path.join(get_default_cache_root(), '_firestore_usage.db')
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[int, str, str, str], List[int]] = {}
+        self._flusher: Optional[threading.Thread] = None
+        self._disabled = False
+        self._projection: Optional[Dict[str, Any]] = None
+        self._projection_at = 0.0
+        self._throttle_logged: Dict[str, float] = {}
+        self._initialized = True
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
+
+    def record(self, kind: str, count: int, collection: str = 'articles', source: str = None):
+        if count <= 0:
+            return
+        now = time.time()
+        slot = int(now // SLOT_SECONDS * SLOT_SECONDS)
+        quota_day = _quota_day_bounds(now)[0]
+        key = (slot, quota_day, source or current_source(), collection or 'unknown')
+        with self._lock:
+            counts = self._pending.setdefault(key, [0, 0, 0])
+            counts[KINDS.index(kind)] += count
+            if self._flusher is None and not self._disabled:
+                self._flusher = threading.Thread(target=self._flush_loop, daemon=True, name='firestore-usage')
+                self._flusher.start()
+                atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(FLUSH_SECONDS)
+            self.flush()
+
+    def _connect(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(USAGE_SCHEMA)
+        return conn
+
+    def flush(self):
+        """메모리 집계를 SQLite에 합산 (실패 시 다음 기회에 다시 시도)"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending or self._disabled:
+            return
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executemany(
+                        """INSERT INTO usage (slot, quota_day, source, collection, reads, writes, deletes)
+                           VALUES (?, ?, ?, ?, ?, ?, ?)
+                           ON CONFLICT (slot, source, collection) DO UPDATE SET
+                               reads = reads + excluded.reads,
+                               writes = writes + excluded.writes,
+                               deletes = deletes + excluded.deletes""",
+                        [key + tuple(counts) for key, counts in pending.items()])
+                    retention = int(os.getenv('FIRESTORE_USAGE_RETENTION_DAYS', 14))
+                    conn.execute('DELETE FROM usage WHERE slot < ?', (int(time.time()) - retention * 86400,))
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"⚠️ [Usage] Flush failed: {e}")
+            with self._lock:
+                for key, counts in pending.items():
+                    merged = self._pending.setdefault(key, [0, 0, 0])
+                    for i, value in enumerate(counts):
+                        merged[i] += value
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        self.flush()
+        if not os.path.exists(self.db_path):
+            return []
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def _window(self, seconds: int, group_by_source: bool = False) -> Any:
+        since = int(time.time() - seconds) // SLOT_SECONDS * SLOT_SECONDS
+        if group_by_source:
+            rows = self._query(
+                """SELECT source, SUM(reads), SUM(writes), SUM(deletes) FROM usage
+                   WHERE slot >= ? GROUP BY source ORDER BY SUM(reads) DESC""", (since,))
+            return [{'source': r[0], 'reads': r[1], 'writes': r[2], 'deletes': r[3]} for r in rows]
+        row = self._query('SELECT SUM(reads), SUM(writes), SUM(deletes) FROM usage WHERE slot >= ?', (since,))
+        return dict(zip(KINDS, [v or 0 for v in (row[0] if row else (0, 0, 0))]))
+
+    def projection(self, refresh: bool = False) -> Dict[str, Any]:
+        """오늘(할당량 일자) 사용량과 일일 한도 대비 예측"""
+        now = time.time()
+        if not refresh and self._projection and now - self._projection_at < PROJECTION_CACHE_SECONDS:
+            return self._projection
+
+        quota_day, day_start, day_end = _quota_day_bounds(now)
+        row = self._query('SELECT SUM(reads), SUM(writes), SUM(deletes) FROM usage WHERE quota_day = ?',
+                          (quota_day,))
+        used = dict(zip(KINDS, [v or 0 for v in (row[0] if row else (0, 0, 0))]))
+        last_hour = self._window(3600)
+        rate_seconds = max(60.0, min(3600.0, now - day_start))
+        remaining = max(0.0, day_end - now)
+        limits = get_daily_limits()
+        soft = get_soft_budget()
+
+        kinds = {}
+        for kind in KINDS:
+            rate = min(last_hour[kind], used[kind]) / rate_seconds
+            projected = int(used[kind] + rate * remaining)
+            kinds[kind] = {
+                'used': used[kind],
+                'limit': limits[kind],
+                'rate_per_hour': round(rate * 3600, 1),
+                'projected': projected,
+                'projected_ratio': round(projected / limits[kind], 3) if limits[kind] else None,
+                'over_soft_budget': bool(soft and limits[kind] and projected > limits[kind] * soft),
+            }
+        self._projection = {
+            'quota_day': quota_day,
+            'resets_in_minutes': round(remaining / 60),
+            'soft_budget': soft,
+            'throttled': any(k['over_soft_budget'] for k in kinds.values()),
+            'kinds': kinds,
+        }
+        self._projection_at = now
+        return self._projection
+
+    def report(self, top: int = 15) -> Dict[str, Any]:
+        """출처/컬렉션별 집계 + 구간별 합계 + 예측 (settings API용)"""
+        projection = self.projection(refresh=True)
+        rows = self._query(
+            """SELECT source, collection, SUM(reads), SUM(writes), SUM(deletes) FROM usage
+               WHERE quota_day = ? GROUP BY source, collection ORDER BY SUM(reads) DESC""",
+            (projection['quota_day'],))
+        by_source: Dict[str, Dict[str, Any]] = {}
+        for source, collection, reads, writes, deletes in rows:
+            entry = by_source.setdefault(source, {'source': source, 'reads': 0, 'writes': 0,
+                                                  'deletes': 0, 'collections': {}})
+            entry['reads'] += reads
+            entry['writes'] += writes
+            entry['deletes'] += deletes
+            entry['collections'][collection] = {'reads': reads, 'writes': writes, 'deletes': deletes}
+        sources = sorted(by_source.values(), key=lambda e: (e['reads'], e['writes']), reverse=True)
+
+        days = self._query(
+            """SELECT quota_day, SUM(reads), SUM(writes), SUM(deletes) FROM usage
+               GROUP BY quota_day ORDER BY quota_day DESC LIMIT 7""")
+        return {
+            'projection': projection,
+            'today_by_source': sources[:top],
+            'windows': {
+                '10m': self._window(600),
+                '1h': self._window(3600),
+                '24h': self._window(86400),
+                '1h_by_source': self._window(3600, group_by_source=True)[:top],
+            },
+            'daily': [{'quota_day': d[0], 'reads': d[1], 'writes': d[2], 'deletes': d[3]} for d in days],
+        }
+
+    # -------------------------------------------------------------------------
+    # Soft Budget
+    # -------------------------------------------------------------------------
+
+    def allow_optional(self, work: str) -> bool:
+        """
+        선택 작업 실행 여부 (예측이 소프트 예산을 넘으면 False)
+        장부를 읽지 못하면 작업을 막지 않습니다.
+        """
+        if not get_soft_budget():
+            return True
+        try:
+            projection = self.projection()
+        except Exception as e:
+            print(f"⚠️ [Usage] Projection failed: {e}")
+            return True
+        if not projection['throttled']:
+            return True
+
+        now = time.time()
+        if now - self._throttle_logged.get(work, 0) > THROTTLE_LOG_SECONDS:
+            self._throttle_logged[work] = now
+            over = ', '.join(f"{kind} {v['projected']}/{v['limit']}"
+                             for kind, v in projection['kinds'].items() if v['over_soft_budget'])
+            print(f"⏸️ [Usage] Skipping {work}: projected {over} exceeds soft budget "
+                  f"{projection['soft_budget']:.0%}")
+        return False
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+def get_usage_ledger() -> UsageLedger:
+    """비용 장부 인스턴스 반환"""
+    return UsageLedger()
+
+
+def record_usage(kind: str, count: int, collection: str = 'articles'):
+    get_usage_ledger().record(kind, count, collection)
+
+
+def allow_optional(work: str) -> bool:
+    return get_usage_ledger().allow_optional(work)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+History Index - URL 히스토리 인덱스 샤딩 + 변경분 새로고침
+
+history/_index 한 문서에 수집한 URL마다 urls.<hash> 필드가 늘어나 1 MiB 문서 한도에 다가가고,
+refresh_remote_hashes()는 /api/board/overview마다 문서 전체를 다시 읽었습니다.
+URL 해시 앞 HISTORY_INDEX_SHARD_CHARS글자(16진수)로 문서를 나누고 샤드마다 버전을 둡니다.
+
+    history/_shard_<prefix>  {'urls': {<hash>: {'article_id', 'status', 'updated_at'}},
+                              'version': n, 'updated_at': ...}
+    history/_shards          {'shard_chars': 2, 'versions': {<prefix>: n}, 'legacy_migrated': bool}
+
+- 쓰기: 샤드 set(merge) + 목록 문서 versions.<prefix> Increment를 같은 배치로 (FirestoreClient)
+- 새로고침: 목록 문서 1회 읽기 → 버전이 바뀐 샤드만 get_all
+- 로컬 사본: cache/<env>/_history_index.json (샤드별 버전 + 항목)
+             재시작 후 바뀐 샤드가 없으면 목록 문서 읽기 1회로 끝남
+- 이전 형식 history/_index: 목록 문서가 없으면 예전처럼 매번 읽고, 있으면 한 번만 읽어 로컬 사본에 보관
+  (legacy_migrated이면 읽지 않음, 이전: scripts/migrate_history_index.py)
+
+환경 변수:
+    HISTORY_INDEX_SHARD_CHARS (2) - 목록 문서가 없을 때만 사용 (16^n개 샤드, 이후에는 목록 문서 값을 따름)
+                                    2: 256개 샤드, 샤드 문서 1 MiB 한도 기준 약 250만 URL
+"""
+import os
+import json
+import threading
+from typing import Dict, Any, List, Optional
+
+MANIFEST_DOC = '_shards'
+LEGACY_DOC = '_index'
+SHARD_DOC_PREFIX = '_shard_'
+
+
+def get_shard_chars() -> int:
+    return min(3, max(1, int(os.getenv('HISTORY_INDEX_SHARD_CHARS', 2))))
+
+
+def shard_of(url_hash: str, shard_chars: int) -> str:
+    return url_hash[:shard_chars]
+
+
+def shard_doc_id(prefix: str) -> str:
+    return f'{SHARD_DOC_PREFIX}{prefix}'
+
+
+def parse_legacy_index(data: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """history/_index 문서 → {hash: 항목}"""
+    if not data:
+        return {}
+    # Case 1: 중첩 객체 형태 {'urls': {'hash1': {...}, 'hash2': {...}}}
+    entries = dict(data.get('urls') or {})
+    # Case 2: 플랫 키 형태 {'urls.hash1': {...}} (set(merge=True)에 점 표기 키로 쓴 문서)
+    for key, value in data.items():
+        if key.startswith('urls.'):
+            entries[key[5:]] = value
+    return entries
+
+
+class HistoryIndexCache:
+    """
+    샤드 인덱스의 로컬 사본 (JSON 파일, 스레드 안전)
+    versions에 없는 샤드는 다음 새로고침에서 다시 읽음
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.shard_chars: Optional[int] = None  # 목록 문서 값 (없으면 None)
+        self.versions: Dict[str, int] = {}
+        self.shards: Dict[str, Dict[str, Any]] = {}
+        self.legacy: Optional[Dict[str, Any]] = None  # None: 이전 형식 문서를 아직 읽지 않음
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.shard_chars = state.get('shard_chars')
+            self.versions = state.get('versions') or {}
+            self.shards = state.get('shards') or {}
+            self.legacy = state.get('legacy')
+        except Exception as e:
+            print(f"⚠️ [History] Local index copy unreadable, reloading from Firestore: {e}")
+
+    def save(self):
+        with self._lock:
+            state = {'shard_chars': self.shard_chars, 'versions': self.versions,
+                     'shards': self.shards, 'legacy': self.legacy}
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+
+    def reset(self, shard_chars: Optional[int]):
+        """샤드 폭이 바뀌면 (재샤딩) 샤드 사본 전체 폐기"""
+        with self._lock:
+            self.shard_chars = shard_chars
+            self.versions = {}
+            self.shards = {}
+
+    def stale_shards(self, versions: Dict[str, int]) -> List[str]:
+        """목록 문서 버전과 다른 샤드"""
+        with self._lock:
+            return sorted(prefix for prefix, version in versions.items() if self.versions.get(prefix) != version)
+
+    def put_shard(self, prefix: str, urls: Dict[str, Any], version: int):
+        with self._lock:
+            self.shards[prefix] = urls
+            self.versions[prefix] = version
+
+    def add_entries(self, entries: Dict[str, Dict[str, Any]]):
+        """
+        직접 쓴 항목 반영 - 버전은 그대로 두어 다음 새로고침에서 샤드를 다시 읽음
+        (다른 프로세스가 같은 샤드에 쓴 항목까지 맞추기 위함)
+        """
+        with self._lock:
+            for url_hash, entry in entries.items():
+                prefix = shard_of(url_hash, self.shard_chars or get_shard_chars())
+                self.shards.setdefault(prefix, {})[url_hash] = entry
+                self.versions.pop(prefix, None)
+
+    # 읽기도 잠금 안에서 (다른 요청 스레드의 put_shard/add_entries와 겹치면 순회 중 크기 변경 오류)
+
+    def get(self, url_hash: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if self.shard_chars:
+                entry = (self.shards.get(shard_of(url_hash, self.shard_chars)) or {}).get(url_hash)
+                if entry is not None:
+                    return entry
+            return (self.legacy or {}).get(url_hash)
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """이전 형식 + 샤드 항목 (같은 해시는 샤드 우선)"""
+        with self._lock:
+            merged = dict(self.legacy or {})
+            for urls in self.shards.values():
+                merged.update(urls)
+            return merged
+
+    def hashes(self) -> set:
+        with self._lock:
+            result = set(self.legacy or ())
+            for urls in self.shards.values():
+                result.update(urls)
+            return result
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+"""
+Job Runner - 오래 걸리는 데스크 작업의 백그라운드 실행
+
+컬럼 전체 작업(전체 폐기/복원, 휴지통 비우기, 점수 재계산)처럼
+기사 수백 개를 하나씩 저장하는 작업을 HTTP 요청 밖에서 실행합니다.
+
+- 작업마다 job_id 발급, 상태/처리 수/오류를 SQLite(cache/<env>/_jobs.db)에 기록
+- 상태: queued → running → done | failed | cancelled
+- 같은 잠금 키(예: 컬럼 상태)의 작업은 동시에 하나만 (DB 기준 → 프로세스 간에도 적용)
+- 취소는 항목 사이에서 확인 (이미 처리한 항목은 되돌리지 않음)
+- 데스크 재시작 시 끝나지 않은 작업은 resume()으로 다시 실행
+  → 핸들러는 처음부터 다시 실행해도 안전해야 함 (현재 상태 기준으로 대상 조회)
+
+환경 변수:
+    JOB_WORKERS: 동시 실행 작업 수 (기본 2)
+    JOB_DB_PATH: 작업 기록 DB 경로
+"""
+import os
+import copy
+import json
+import time
+import uuid
+import sqlite3
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Tuple
+
+from src.core_logic import get_kst_now
+from .firestore_usage import usage_scope
+
+
+JOB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id            TEXT PRIMARY KEY,
+    kind              TEXT NOT NULL,
+    lock_key          TEXT,
+    status            TEXT NOT NULL,
+    cancel_requested  INTEGER NOT NULL DEFAULT 0,
+    owner             TEXT,
+    owner_pid         INTEGER,
+    heartbeat         REAL,
+    created_at        TEXT NOT NULL,
+    data              TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_active ON jobs(status, lock_key);
+"""
+
+ACTIVE_STATUSES = ('queued', 'running')
+MAX_ERRORS = 20              # 작업당 보관하는 오류 수
+CHECKPOINT_SECONDS = 1.0     # 진행률 DB 기록 주기
+STALE_SECONDS = 120          # Windows: 이 시간 동안 기록이 없으면 소유 프로세스 종료로 간주
+HISTORY_LIMIT = 200          # 보관하는 완료 작업 수
+
+
+# 프로세스 식별자 (컨테이너 재시작 시 PID가 재사용될 수 있어 PID와 함께 기록)
+_OWNER = uuid.uuid4().hex
+
+
+def _owner_alive(owner: Optional[str], pid: Optional[int], heartbeat: Optional[float]) -> bool:
+    """작업을 소유한 프로세스가 살아 있는지"""
+    if owner == _OWNER:
+        return True
+    if not pid or pid == os.getpid():
+        return False  # 같은 PID의 이전 프로세스
+    if os.name == 'nt':
+        # Windows의 os.kill은 프로세스를 종료시키므로 heartbeat로 판단
+        return heartbeat is not None and time.time() - heartbeat < STALE_SECONDS
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass  # 권한 없음 → 존재함
+    return True
+
+
+class JobContext:
+    """핸들러에 전달되는 실행 컨텍스트 (진행률 기록 / 취소 확인)"""
+
+    def __init__(self, runner: 'JobRunner', job: Dict[str, Any]):
+        self._runner = runner
+        self.job = job
+        self.params = job['params']
+        self._last_checkpoint = 0.0
+
+    def set_total(self, total: int):
+        self.job['total'] = total
+        self._checkpoint(force=True)
+
+    def step(self, item: str = None, error: str = None, count: int = 1):
+        """항목 처리 결과 기록 (error가 있으면 실패로 집계)"""
+        job = self.job
+        job['processed'] += count
+        if error:
+            job['failed'] += count
+            if len(job['errors']) < MAX_ERRORS:
+                job['errors'].append({'item': item, 'error': error})
+        else:
+            job['succeeded'] += count
+        self._checkpoint()
+
+    def cancelled(self) -> bool:
+        """취소 요청 여부 (다른 프로세스의 요청은 기록 주기마다 반영)"""
+        self._checkpoint()
+        return self.job['cancel_requested']
+
+    def _checkpoint(self, force: bool = False):
+        now = time.monotonic()
+        if force or now - self._last_checkpoint >= CHECKPOINT_SECONDS:
+            self._last_checkpoint = now
+            self._runner._checkpoint(self.job)
+
+
+class JobRunner:
+    """
+    백그라운드 작업 실행기 (싱글톤)
+
+    핸들러는 register(kind, handler)로 등록하고, handler(ctx: JobContext)는
+    완료 메시지(str)를 반환합니다. 예외는 작업 실패로 기록됩니다.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = os.getenv('ZND_ENV', 'dev')
+        self.db_path = os.getenv('JOB_DB_PATH') or os.path.join(base_dir, 'cache', env, '_jobs.db')
+        self.max_workers = max(1, int(os.getenv('JOB_WORKERS', 2)))
+        self._handlers: Dict[str, Callable[[JobContext], str]] = {}
+        self._jobs: Dict[str, Dict[str, Any]] = {}  # 이 프로세스에서 대기/실행 중인 작업
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._schema_ready = False
+        self._initialized = True
+
+    # =========================================================================
+    # Storage
+    # =========================================================================
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            if not self._schema_ready:
+                conn.executescript(JOB_SCHEMA)
+                self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def _write(self, conn: sqlite3.Connection, job: Dict[str, Any]):
+        conn.execute(
+            'INSERT OR REPLACE INTO jobs (job_id, kind, lock_key, status, cancel_requested, '
+            'owner, owner_pid, heartbeat, created_at, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (job['job_id'], job['kind'], job['lock_key'], job['status'], int(job['cancel_requested']),
+             _OWNER, os.getpid(), time.time(), job['created_at'], json.dumps(job, ensure_ascii=False))
+        )
+
+    @staticmethod
+    def _from_row(data: str, status: str, cancel_requested: int) -> Dict[str, Any]:
+        job = json.loads(data)
+        job['status'] = status
+        job['cancel_requested'] = bool(cancel_requested)
+        return job
+
+    def _checkpoint(self, job: Dict[str, Any]):
+        """진행률 기록 + 다른 프로세스의 취소 요청 반영"""
+        with self._lock:
+            conn = self._conn()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = conn.execute('SELECT status, cancel_requested FROM jobs WHERE job_id = ?',
+                                   (job['job_id'],)).fetchone()
+                if row and row[1]:
+                    job['cancel_requested'] = True
+                    if row[0] == 'cancelled' and job['status'] == 'queued':
+                        job['status'] = 'cancelled'
+                self._write(conn, job)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+    # =========================================================================
+    # Submit / Execute
+    # =========================================================================
+
+    def register(self, kind: str, handler: Callable[[JobContext], str]):
+        """작업 종류별 핸들러 등록"""
+        self._handlers[kind] = handler
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='desk-job')
+        return self._executor
+
+    @staticmethod
+    def _new_job(kind: str, params: Dict[str, Any], lock_key: Optional[str]) -> Dict[str, Any]:
+        return {
+            'job_id': uuid.uuid4().hex[:12],
+            'kind': kind,
+            'lock_key': lock_key,
+            'params': params,
+            'status': 'queued',
+            'cancel_requested': False,
+            'total': 0,
+            'processed': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'errors': [],
+            'message': '',
+            'error': None,
+            'attempts': 0,
+            'created_at': get_kst_now(),
+            'started_at': None,
+            'finished_at': None,
+        }
+
+    def submit(self, kind: str, params: Dict[str, Any], lock_key: str = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        작업 등록
+
+        Returns:
+            (작업, 새로 등록 여부)
+            같은 lock_key의 작업이 대기/실행 중이면 (그 작업, False)
+        """
+        if kind not in self._handlers:
+            raise ValueError(f'Unknown job kind: {kind}')
+
+        with self._lock:
+            conn = self._conn()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                if lock_key:
+                    row = conn.execute(
+                        'SELECT data, status, cancel_requested FROM jobs '
+                        'WHERE lock_key = ? AND status IN (?, ?) LIMIT 1',
+                        (lock_key, *ACTIVE_STATUSES)
+                    ).fetchone()
+                    if row:
+                        conn.execute('COMMIT')
+                        active = self._jobs.get(json.loads(row[0])['job_id'])
+                        return (copy.deepcopy(active) if active else self._from_row(*row)), False
+                job = self._new_job(kind, params, lock_key)
+                self._write(conn, job)
+                self._prune(conn)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            self._jobs[job['job_id']] = job
+            snapshot = copy.deepcopy(job)
+
+        self._pool().submit(self._run, job)
+        print(f"📋 [Jobs] Queued {job['job_id']} ({kind}, {lock_key})")
+        return snapshot, True
+
+    def _prune(self, conn: sqlite3.Connection):
+        """오래된 완료 작업 정리"""
+        conn.execute(
+            'DELETE FROM jobs WHERE status NOT IN (?, ?) AND job_id NOT IN '
+            '(SELECT job_id FROM jobs ORDER BY created_at DESC LIMIT ?)',
+            (*ACTIVE_STATUSES, HISTORY_LIMIT)
+        )
+
+    def _run(self, job: Dict[str, Any]):
+        job_id = job['job_id']
+        try:
+            self._checkpoint(job)
+            if job['status'] == 'cancelled' or job['cancel_requested']:
+                job['status'] = 'cancelled'
+                return
+
+            handler = self._handlers.get(job['kind'])
+            if handler is None:
+                raise ValueError(f"No handler for job kind: {job['kind']}")
+
+            job['status'] = 'running'
+            job['attempts'] += 1
+            job['started_at'] = get_kst_now()
+            print(f"▶️ [Jobs] Running {job_id} ({job['kind']}, attempt {job['attempts']})")
+            with usage_scope(f"job:{job['kind']}"):
+                job['message'] = handler(JobContext(self, job)) or ''
+            job['status'] = 'cancelled' if job['cancel_requested'] else 'done'
+        except Exception as e:
+            traceback.print_exc()
+            job['status'] = 'failed'
+            job['error'] = str(e)
+        finally:
+            job['finished_at'] = get_kst_now()
+            try:
+                self._checkpoint(job)
+            except Exception as e:
+                print(f"⚠️ [Jobs] Failed to record {job_id}: {e}")
+            with self._lock:
+                self._jobs.pop(job_id, None)
+            print(f"🏁 [Jobs] {job_id} {job['status']}: {job['succeeded']} ok, {job['failed']} failed"
+                  f"{' - ' + job['error'] if job['error'] else ''}")
+
+    # =========================================================================
+    # Query / Control
+    # =========================================================================
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (이 프로세스에서 실행 중이면 최신 진행률)"""
+        with self._lock:
+            active = self._jobs.get(job_id)
+            if active is not None:
+                return copy.deepcopy(active)
+        row = self._conn().execute('SELECT data, status, cancel_requested FROM jobs WHERE job_id = ?',
+                                   (job_id,)).fetchone()
+        return self._from_row(*row) if row else None
+
+    def list_jobs(self, limit: int = 20, lock_key: str = None) -> List[Dict[str, Any]]:
+        """최근 작업 목록 (최신순)"""
+        sql = 'SELECT data, status, cancel_requested FROM jobs'
+        params: tuple = ()
+        if lock_key:
+            sql += ' WHERE lock_key = ?'
+            params = (lock_key,)
+        sql += ' ORDER BY created_at DESC LIMIT ?'
+        rows = self._conn().execute(sql, params + (limit,)).fetchall()
+        jobs = [self._from_row(*row) for row in rows]
+        with self._lock:
+            return [copy.deepcopy(self._jobs[j['job_id']]) if j['job_id'] in self._jobs else j for j in jobs]
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 취소 요청
+        - 대기 중: 즉시 cancelled
+        - 실행 중: 다음 항목 처리 전에 중단
+        Returns:
+            작업 (없으면 None, 이미 끝난 작업은 그대로 반환)
+        """
+        with self._lock:
+            conn = self._conn()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.execute(
+                    "UPDATE jobs SET cancel_requested = 1, "
+                    "status = CASE WHEN status = 'queued' THEN 'cancelled' ELSE status END "
+                    "WHERE job_id = ? AND status IN (?, ?)",
+                    (job_id, *ACTIVE_STATUSES)
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            active = self._jobs.get(job_id)
+            if active is not None:
+                active['cancel_requested'] = True
+                if active['status'] == 'queued':
+                    active['status'] = 'cancelled'
+        job = self.get(job_id)
+        if job and job['cancel_requested']:
+            print(f"⏹️ [Jobs] Cancel requested: {job_id}")
+        return job
+
+    def resume(self) -> int:
+        """
+        재시작 전에 끝나지 않은 작업(소유 프로세스 종료)을 다시 실행
+        데스크 시작 시 레지스트리 준비 후 호출
+        """
+        resumed = []
+        with self._lock:
+            conn = self._conn()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                rows = conn.execute(
+                    'SELECT data, status, cancel_requested, owner, owner_pid, heartbeat FROM jobs '
+                    'WHERE status IN (?, ?) ORDER BY created_at', ACTIVE_STATUSES
+                ).fetchall()
+                for data, status, cancel_requested, owner, owner_pid, heartbeat in rows:
+                    job = self._from_row(data, status, cancel_requested)
+                    if _owner_alive(owner, owner_pid, heartbeat):
+                        continue
+                    if job['kind'] not in self._handlers:
+                        job['status'] = 'failed'
+                        job['error'] = f"No handler for job kind: {job['kind']}"
+                        job['finished_at'] = get_kst_now()
+                    elif job['cancel_requested']:
+                        job['status'] = 'cancelled'
+                        job['finished_at'] = get_kst_now()
+                    else:
+                        # 처음부터 다시 실행 (진행률 초기화, 오류 기록은 유지)
+                        job.update({'status': 'queued', 'total': 0, 'processed': 0,
+                                    'succeeded': 0, 'failed': 0})
+                        resumed.append(job)
+                    self._write(conn, job)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            for job in resumed:
+                self._jobs[job['job_id']] = job
+
+        for job in resumed:
+            self._pool().submit(self._run, job)
+        if resumed:
+            print(f"🔁 [Jobs] Resumed {len(resumed)} unfinished jobs")
+        return len(resumed)
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+def get_job_runner() -> JobRunner:
+    """작업 실행기 인스턴스 반환"""
+    return JobRunner()
@@ -0,0 +1,750 @@
+# -*- coding: utf-8 -*-
+"""
+Local Article Store - 로컬 기사 저장소 (교체 가능한 백엔드)
+
+FirestoreClient의 로컬 조회/갱신, core_logic.save_to_cache/load_from_cache,
+ArticleRegistry의 로컬 로드/저장이 모두 이 인터페이스를 거칩니다.
+
+백엔드 (LOCAL_STORE_BACKEND 환경변수):
+    json   : cache/<env>/<YYYY-MM-DD>/<article_id>.json (기본, 기존 구조)
+    sqlite : cache/<env>/articles.db (WAL 모드, 색인 컬럼 + JSON 본문 BLOB)
+
+SQLite 백엔드에서는 상태 조회, URL 중복 검사, 부분 갱신이
+디렉토리 스캔 없이 색인된 단일 행 연산으로 처리됩니다.
+
+디스크 인코딩은 cache_codec (LOCAL_STORE_ENCODING: pretty | compact)을 따르며,
+읽기는 두 형식을 자동 판별합니다. JSON 트리의 오래된 날짜는 cache_segments로
+압축(segment + offset 색인)될 수 있으며, 모든 조회는 두 레이아웃을 함께 읽습니다.
+"""
+import os
+import re
+import json
+import glob
+import sqlite3
+import threading
+from collections import namedtuple
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
+
+from src.core_logic import get_kst_now
+from .cache_codec import encode_article, decode_article, get_default_encoding
+from .cache_segments import DaySegment, SEGMENT_INDEX, remove_from_segment
+from .url_filter import get_url_filter, article_keys
+from .url_canonical import canonical_key
+
+DATE_FOLDER_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# 저장소에서 꺼낸 기사 한 건 (location: 파일 경로 또는 db 경로#article_id)
+StoredArticle = namedtuple('StoredArticle', ['article_id', 'date_folder', 'location', 'data'])
+
+# 변경 감지용 지연 읽기 항목 (stamp가 같으면 내용도 같음, read()로 본문 로드)
+CacheEntry = namedtuple('CacheEntry', ['article_id', 'date_folder', 'location', 'stamp', 'read'])
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def apply_dot_updates(data: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    """dot-notation 업데이트를 중첩 dict에 적용 (in-place, 비-dict 경로는 무시)"""
+    for key, value in updates.items():
+        parts = key.split('.')
+        target = data
+        for part in parts[:-1]:
+            if not isinstance(target.get(part), dict):
+                target[part] = {}
+            target = target[part]
+        target[parts[-1]] = value
+    return data
+
+
+def article_url(data: Dict[str, Any]) -> str:
+    header = data.get('_header') or {}
+    original = data.get('_original') or {}
+    return header.get('url') or original.get('url') or data.get('url') or ''
+
+
+def article_url_hash(data: Dict[str, Any]) -> str:
+    """core_logic.get_url_hash와 동일한 12자리 URL 해시 (정규 URL 키)"""
+    url = article_url(data)
+    return canonical_key(url) if url else ''
+
+
+def article_date_folder(data: Dict[str, Any]) -> str:
+    """날짜 폴더 결정 (published_at 우선, 없으면 created_at, 최후에 오늘)"""
+    published_at = str((data.get('_original') or {}).get('published_at') or '')
+    created_at = str((data.get('_header') or {}).get('created_at') or '')
+    date_source = published_at or created_at
+    date_str = date_source.split('T')[0][:10]
+    if DATE_FOLDER_RE.match(date_str):
+        return date_str
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def article_edition(data: Dict[str, Any]) -> str:
+    header = data.get('_header') or {}
+    publication = data.get('_publication') or {}
+    classification = data.get('_classification') or {}
+    return (
+        header.get('edition_code') or publication.get('edition_code')
+        or classification.get('edition_code') or data.get('edition_code') or ''
+    )
+
+
+# =============================================================================
+# Base
+# =============================================================================
+
+class LocalArticleStore:
+    """로컬 기사 저장소 인터페이스"""
+
+    backend = 'base'
+
+    def __init__(self, cache_root: str):
+        self.cache_root = cache_root
+
+    def get(self, article_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def get_by_url_hash(self, url_hash: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def locate(self, article_id: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def save(self, article_id: str, data: Dict[str, Any], date_str: str = None) -> Optional[str]:
+        """
+        기사 저장 (전체 덮어쓰기)
+
+        Args:
+            date_str: 날짜 폴더 지정 (None이면 기존 위치 또는 기사 날짜)
+
+        Returns:
+            저장 위치 (실패 시 None)
+        """
+        raise NotImplementedError
+
+    def _remember(self, articles: Iterable[Tuple[str, Dict[str, Any]]]):
+        """저장한 기사를 URL 필터에 추가 [(article_id, data)] (url_filter - collect_links의 "확실히 새 URL" 판정)"""
+        try:
+            get_url_filter(self.cache_root).add_keys(
+                [key for article_id, data in articles for key in article_keys(article_id, data)])
+        except Exception as e:
+            print(f"⚠️ [LocalStore] URL filter update failed: {e}")
+
+    def save_many(self, items: Iterable[Tuple[str, Dict[str, Any], Optional[str]]]) -> int:
+        """여러 기사 저장 [(article_id, data, date_str)]"""
+        saved = 0
+        for article_id, data, date_str in items:
+            if self.save(article_id, data, date_str):
+                saved += 1
+        return saved
+
+    def save_with_outbox(self, article_id: str, data: Dict[str, Any], outbox, ops,
+                         date_str: str = None, wait: bool = True) -> Optional[str]:
+        """
+        기사 저장 + Firestore outbox 기록 (firestore_outbox 참고)
+        기본 구현: outbox를 먼저 기록하고 로컬 저장이 실패하면 취소
+        wait=False면 outbox 백프레셔 대기 생략 (잠금 밖에서 이미 대기한 호출자)
+
+        Returns:
+            저장 위치 (실패 시 None, outbox에도 남지 않음)
+        """
+        ids = outbox.enqueue(ops, wait=wait)
+        location = self.save(article_id, data, date_str)
+        if not location:
+            outbox.cancel(ids)
+        return location
+
+    def update_fields(self, article_id: str, updates: Dict[str, Any], touch: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        dot-notation 부분 갱신
+
+        Args:
+            touch: True면 _header.updated_at 갱신
+
+        Returns:
+            갱신된 전체 데이터 (기사 없으면 None)
+        """
+        raise NotImplementedError
+
+    def delete(self, article_id: str) -> bool:
+        raise NotImplementedError
+
+    def iter_articles(self, since_date: str = None, exclude_ids: set = None) -> Iterator[StoredArticle]:
+        raise NotImplementedError
+
+    def list_by_state(self, state: str, limit: int = None, since_date: str = None,
+                      exclude_ids: set = None) -> List[StoredArticle]:
+        """상태별 기사 목록 (최근 갱신순)"""
+        raise NotImplementedError
+
+    def date_folders(self, since_date: str = None) -> List[str]:
+        """기사가 있는 날짜 목록 (최신순)"""
+        return sorted({entry.date_folder for entry in self.iter_entries(since_date)}, reverse=True)
+
+    def iter_entries(self, since_date: str = None) -> Iterator[CacheEntry]:
+        """본문을 읽지 않고 항목 순회 (증분 색인용)"""
+        for stored in self.iter_articles(since_date):
+            stamp = (stored.data.get('_header') or {}).get('updated_at', '')
+            yield CacheEntry(stored.article_id, stored.date_folder, stored.location, stamp,
+                             lambda data=stored.data: data)
+
+    def count(self) -> int:
+        return sum(1 for _ in self.iter_articles())
+
+
+# =============================================================================
+# JSON Tree Backend (기존 구조)
+# =============================================================================
+
+class JsonFileStore(LocalArticleStore):
+    """
+    cache/<env>/<YYYY-MM-DD>/<article_id>.json 파일 트리
+
+    오래된 날짜는 cache_segments로 압축되어 segment 파일에 들어 있을 수 있으며,
+    같은 날짜에 개별 파일이 있으면 개별 파일이 우선합니다 (압축 이후 수정분).
+    """
+
+    backend = 'json'
+
+    def __init__(self, cache_root: str, encoding: str = None):
+        super().__init__(cache_root)
+        self.encoding = encoding or get_default_encoding()
+        self._segments: Dict[str, DaySegment] = {}   # date_folder -> DaySegment
+        self._segment_ids: Dict[str, str] = {}       # article_id -> date_folder
+        self._segments_lock = threading.Lock()
+
+    def _date_folders(self, since_date: str = None, reverse: bool = True) -> List[str]:
+        if not os.path.isdir(self.cache_root):
+            return []
+        folders = [
+            name for name in os.listdir(self.cache_root)
+            if DATE_FOLDER_RE.match(name) and (not since_date or name >= since_date)
+            and os.path.isdir(os.path.join(self.cache_root, name))
+        ]
+        return sorted(folders, reverse=reverse)
+
+    def _read(self, path: str) -> Optional[Dict[str, Any]]:
+        with open(path, 'rb') as f:
+            return decode_article(f.read())
+
+    def _write(self, path: str, data: Dict[str, Any]):
+        """임시 파일에 쓴 뒤 교체 (쓰기 도중 중단되어도 기존 파일 유지)"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(encode_article(data, self.encoding))
+        os.replace(tmp_path, path)
+
+    # -------------------------------------------------------------------------
+    # Segments (압축된 날짜)
+    # -------------------------------------------------------------------------
+
+    def _segment(self, folder: str) -> Optional[DaySegment]:
+        """날짜 폴더의 segment (없으면 None)"""
+        folder_path = os.path.join(self.cache_root, folder)
+        segment = self._segments.get(folder)
+        if segment is None:
+            if not os.path.exists(os.path.join(folder_path, SEGMENT_INDEX)):
+                return None
+            segment = self._segments.setdefault(folder, DaySegment(folder_path))
+        return segment if segment.refresh() else None
+
+    def _refresh_segments(self):
+        """전체 segment 색인 갱신 (변경된 날짜만 다시 읽음) + article_id 맵 재구성"""
+        with self._segments_lock:
+            changed = False
+            seen = set()
+            for folder in self._date_folders():
+                segment = self._segments.get(folder)
+                stamp = segment.stamp if segment else None
+                segment = self._segment(folder)
+                if segment is None:
+                    continue
+                seen.add(folder)
+                changed = changed or segment.stamp != stamp
+            for folder in set(self._segments) - seen:
+                self._segments.pop(folder).close()
+                changed = True
+            if changed:
+                self._segment_ids = {
+                    article_id: folder
+                    for folder in sorted(seen)          # 최신 날짜가 나중에 덮어씀
+                    for article_id in self._segments[folder].entries
+                }
+
+    def _find_in_segments(self, article_id: str) -> Optional[Tuple[str, DaySegment]]:
+        self._refresh_segments()
+        folder = self._segment_ids.get(article_id)
+        if folder is None:
+            return None
+        segment = self._segments.get(folder)
+        if segment is None or article_id not in segment:
+            return None
+        return folder, segment
+
+    def _load(self, article_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(location, data) - 개별 파일 우선, 없으면 segment"""
+        path = self._locate_file(article_id)
+        if path:
+            return path, self._read(path)
+        found = self._find_in_segments(article_id)
+        if found:
+            _, segment = found
+            return segment.location(article_id), segment.read(article_id)
+        return None
+
+    # -------------------------------------------------------------------------
+    # LocalArticleStore
+    # -------------------------------------------------------------------------
+
+    def _locate_file(self, article_id: str) -> Optional[str]:
+        found = glob.glob(os.path.join(self.cache_root, '*', f'{article_id}.json'))
+        if not found:
+            return None
+        found.sort(key=os.path.getmtime, reverse=True)
+        return found[0]
+
+    def locate(self, article_id: str) -> Optional[str]:
+        path = self._locate_file(article_id)
+        if path:
+            return path
+        found = self._find_in_segments(article_id)
+        return found[1].location(article_id) if found else None
+
+    def get(self, article_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            loaded = self._load(article_id)
+            return loaded[1] if loaded else None
+        except Exception as e:
+            print(f"⚠️ [LocalStore] Read failed {article_id}: {e}")
+            return None
+
+    def get_by_url_hash(self, url_hash: str) -> Optional[Dict[str, Any]]:
+        """날짜 폴더 최신순 탐색 (손상된 JSON 파일은 자동 삭제)"""
+        filename = f'{url_hash}.json'
+        for folder in self._date_folders():
+            path = os.path.join(self.cache_root, folder, filename)
+            if os.path.exists(path):
+                try:
+                    return self._read(path)
+                except json.JSONDecodeError:
+                    print(f"🗑️ [Cache] Corrupted JSON detected, auto-deleting: {path}")
+                    try:
+                        os.remove(path)
+                    except Exception:
+                        pass
+                except Exception as e:
+                    print(f"⚠️ [Cache] Error reading cache: {e}")
+            segment = self._segment(folder)
+            if segment is not None and url_hash in segment:
+                try:
+                    return segment.read(url_hash)
+                except Exception as e:
+                    print(f"⚠️ [Cache] Error reading segment: {e}")
+        return None
+
+    def _target_path(self, article_id: str, data: Dict[str, Any], date_str: str = None) -> str:
+        """쓰기 경로 (압축된 기사는 같은 날짜 폴더의 개별 파일로 기록 → segment보다 우선)"""
+        if date_str:
+            return os.path.join(self.cache_root, date_str, f'{article_id}.json')
+        path = self._locate_file(article_id)
+        if path:
+            return path
+        found = self._find_in_segments(article_id)
+        folder = found[0] if found else article_date_folder(data)
+        return os.path.join(self.cache_root, folder, f'{article_id}.json')
+
+    def save(self, article_id: str, data: Dict[str, Any], date_str: str = None) -> Optional[str]:
+        path = self._target_path(article_id, data, date_str)
+        try:
+            self._write(path, data)
+            self._remember([(article_id, data)])
+            return path
+        except Exception as e:
+            print(f"⚠️ [LocalStore] Write failed {path}: {e}")
+            return None
+
+    def update_fields(self, article_id: str, updates: Dict[str, Any], touch: bool = False) -> Optional[Dict[str, Any]]:
+        loaded = self._load(article_id)
+        if not loaded:
+            return None
+        content = loaded[1]
+        apply_dot_updates(content, updates)
+        if touch and isinstance(content.get('_header'), dict):
+            content['_header']['updated_at'] = get_kst_now()
+        self._write(self._target_path(article_id, content), content)
+        return content
+
+    def delete(self, article_id: str) -> bool:
+        removed = False
+        for path in glob.glob(os.path.join(self.cache_root, '*', f'{article_id}.json')):
+            os.remove(path)
+            removed = True
+        self._refresh_segments()
+        for folder, segment in list(self._segments.items()):
+            if article_id in segment and remove_from_segment(segment.folder, article_id):
+                removed = True
+        return removed
+
+    def _folder_entries(self, folder: str, exclude_ids: set = None) -> List[CacheEntry]:
+        """
+        날짜 폴더의 항목 목록 (stamp = 파일/색인 수정 시각)
+        - 개별 파일 + segment 항목 (개별 파일과 겹치는 항목 제외)
+        """
+        folder_path = os.path.join(self.cache_root, folder)
+        entries = []
+        file_ids = set()
+        for entry in os.scandir(folder_path):
+            if not entry.name.endswith('.json'):
+                continue
+            article_id = entry.name[:-5]
+            file_ids.add(article_id)
+            if exclude_ids and article_id in exclude_ids:
+                continue
+            entries.append(CacheEntry(article_id, folder, entry.path, entry.stat().st_mtime,
+                                      lambda path=entry.path: self._read(path)))
+
+        segment = self._segment(folder)
+        if segment is not None:
+            for article_id in segment.entries:
+                if article_id in file_ids or (exclude_ids and article_id in exclude_ids):
+                    continue
+                entries.append(CacheEntry(article_id, folder, segment.location(article_id), segment.mtime,
+                                          lambda aid=article_id, seg=segment: seg.read(aid)))
+        return entries
+
+    def date_folders(self, since_date: str = None) -> List[str]:
+        return self._date_folders(since_date)
+
+    def iter_entries(self, since_date: str = None) -> Iterator[CacheEntry]:
+        for folder in self._date_folders(since_date):
+            yield from self._folder_entries(folder)
+
+    def iter_articles(self, since_date: str = None, exclude_ids: set = None) -> Iterator[StoredArticle]:
+        for folder in self._date_folders(since_date):
+            for entry in self._folder_entries(folder, exclude_ids):
+                try:
+                    data = entry.read()
+                except Exception as e:
+                    print(f"⚠️ [LocalStore] Error loading {entry.location}: {e}")
+                    continue
+                if isinstance(data, dict):
+                    yield StoredArticle(entry.article_id, folder, entry.location, data)
+
+    def list_by_state(self, state: str, limit: int = None, since_date: str = None,
+                      exclude_ids: set = None) -> List[StoredArticle]:
+        """수정 시각 최신순으로 읽어 limit개가 모이면 중단"""
+        candidates = []
+        for folder in self._date_folders(since_date):
+            candidates.extend(self._folder_entries(folder, exclude_ids))
+        candidates.sort(key=lambda entry: entry.stamp, reverse=True)
+
+        results = []
+        for entry in candidates:
+            try:
+                data = entry.read()
+            except Exception:
+                continue
+            if not isinstance(data, dict) or (data.get('_header') or {}).get('state') != state:
+                continue
+            results.append(StoredArticle(entry.article_id, entry.date_folder, entry.location, data))
+            if limit and len(results) >= limit:
+                break
+        results.sort(key=lambda s: s.data['_header'].get('updated_at', ''), reverse=True)
+        return results
+
+
+# =============================================================================
+# SQLite Backend (WAL)
+# =============================================================================
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    article_id  TEXT PRIMARY KEY,
+    url_hash    TEXT NOT NULL DEFAULT '',
+    state       TEXT NOT NULL DEFAULT '',
+    updated_at  TEXT NOT NULL DEFAULT '',
+    edition     TEXT NOT NULL DEFAULT '',
+    date_folder TEXT NOT NULL DEFAULT '',
+    body        BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_url_hash ON articles(url_hash);
+CREATE INDEX IF NOT EXISTS idx_articles_state_updated ON articles(state, updated_at);
+CREATE INDEX IF NOT EXISTS idx_articles_updated ON articles(updated_at);
+CREATE INDEX IF NOT EXISTS idx_articles_edition ON articles(edition);
+CREATE INDEX IF NOT EXISTS idx_articles_date ON articles(date_folder);
+"""
+
+
+class SqliteStore(LocalArticleStore):
+    """
+    cache/<env>/articles.db 단일 파일 저장소
+
+    - WAL 모드: 읽기는 쓰기를 막지 않음 (Flask 요청 스레드 + 스케줄러 동시 접근)
+    - 스레드별 연결, 갱신은 BEGIN IMMEDIATE 트랜잭션으로 단일 행 read-modify-write
+    """
+
+    backend = 'sqlite'
+
+    def __init__(self, cache_root: str, db_path: str = None):
+        super().__init__(cache_root)
+        self.db_path = db_path or os.getenv('LOCAL_STORE_PATH') or os.path.join(cache_root, 'articles.db')
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn().executescript(SQLITE_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _encode(data: Dict[str, Any]) -> bytes:
+        # 본문은 항상 compact (pretty 들여쓰기는 BLOB에서 의미 없음)
+        return encode_article(data, 'compact')
+
+    @staticmethod
+    def _decode(body: bytes) -> Dict[str, Any]:
+        return decode_article(body)
+
+    def _row(self, article_id: str, data: Dict[str, Any], date_str: Optional[str]) -> tuple:
+        header = data.get('_header') or {}
+        return (
+            article_id,
+            article_url_hash(data) or article_id,
+            header.get('state') or data.get('state') or '',
+            str(header.get('updated_at') or ''),
+            article_edition(data),
+            date_str or article_date_folder(data),
+            self._encode(data),
+        )
+
+    def _location(self, article_id: str) -> str:
+        return f'{self.db_path}#{article_id}'
+
+    def locate(self, article_id: str) -> Optional[str]:
+        row = self._conn().execute(
+            'SELECT 1 FROM articles WHERE article_id = ?', (article_id,)
+        ).fetchone()
+        return self._location(article_id) if row else None
+
+    def get(self, article_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            'SELECT body FROM articles WHERE article_id = ?', (article_id,)
+        ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def get_by_url_hash(self, url_hash: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            'SELECT body FROM articles WHERE url_hash = ? ORDER BY updated_at DESC LIMIT 1', (url_hash,)
+        ).fetchone()
+        if not row:
+            # 파일명(=url_hash)으로 저장된 경우
+            return self.get(url_hash)
+        return self._decode(row[0])
+
+    _UPSERT = (
+        'INSERT INTO articles (article_id, url_hash, state, updated_at, edition, date_folder, body) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?) '
+        'ON CONFLICT(article_id) DO UPDATE SET url_hash = excluded.url_hash, state = excluded.state, '
+        'updated_at = excluded.updated_at, edition = excluded.edition, body = excluded.body, '
+        'date_folder = CASE WHEN ? IS NULL THEN articles.date_folder ELSE excluded.date_folder END'
+    )
+
+    def save(self, article_id: str, data: Dict[str, Any], date_str: str = None) -> Optional[str]:
+        try:
+            self._conn().execute(self._UPSERT, self._row(article_id, data, date_str) + (date_str,))
+            self._remember([(article_id, data)])
+            return self._location(article_id)
+        except Exception as e:
+            print(f"⚠️ [LocalStore] SQLite write failed {article_id}: {e}")
+            return None
+
+    def save_with_outbox(self, article_id: str, data: Dict[str, Any], outbox, ops,
+                         date_str: str = None, wait: bool = True) -> Optional[str]:
+        """기사 행과 outbox 항목을 한 트랜잭션으로 커밋 (outbox가 같은 articles.db를 쓸 때)"""
+        if outbox.db_path != self.db_path:
+            return super().save_with_outbox(article_id, data, outbox, ops, date_str, wait=wait)
+        if wait:
+            outbox.wait_for_capacity()
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.execute(self._UPSERT, self._row(article_id, data, date_str) + (date_str,))
+            outbox.enqueue(ops, conn=conn)
+            conn.execute('COMMIT')
+        except Exception as e:
+            conn.execute('ROLLBACK')
+            print(f"⚠️ [LocalStore] SQLite write failed {article_id}: {e}")
+            return None
+        self._remember([(article_id, data)])
+        outbox.notify()
+        return self._location(article_id)
+
+    def save_many(self, items: Iterable[Tuple[str, Dict[str, Any], Optional[str]]]) -> int:
+        conn = self._conn()
+        items = list(items)
+        rows = [self._row(aid, data, date_str) + (date_str,) for aid, data, date_str in items]
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(self._UPSERT, rows)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        self._remember((article_id, data) for article_id, data, _ in items)
+        return len(rows)
+
+    def update_fields(self, article_id: str, updates: Dict[str, Any], touch: bool = False) -> Optional[Dict[str, Any]]:
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute(
+                'SELECT body, date_folder FROM articles WHERE article_id = ?', (article_id,)
+            ).fetchone()
+            if not row:
+                conn.execute('ROLLBACK')
+                return None
+            content = self._decode(row[0])
+            apply_dot_updates(content, updates)
+            if touch and isinstance(content.get('_header'), dict):
+                content['_header']['updated_at'] = get_kst_now()
+            conn.execute(self._UPSERT, self._row(article_id, content, row[1]) + (row[1],))
+            conn.execute('COMMIT')
+            return content
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def delete(self, article_id: str) -> bool:
+        cur = self._conn().execute('DELETE FROM articles WHERE article_id = ?', (article_id,))
+        return cur.rowcount > 0
+
+    def iter_articles(self, since_date: str = None, exclude_ids: set = None) -> Iterator[StoredArticle]:
+        sql = 'SELECT article_id, date_folder, body FROM articles'
+        params = ()
+        if since_date:
+            sql += ' WHERE date_folder >= ?'
+            params = (since_date,)
+        sql += ' ORDER BY date_folder DESC'
+        for article_id, date_folder, body in self._conn().execute(sql, params):
+            if exclude_ids and article_id in exclude_ids:
+                continue
+            yield StoredArticle(article_id, date_folder, self._location(article_id), self._decode(body))
+
+    def list_by_state(self, state: str, limit: int = None, since_date: str = None,
+                      exclude_ids: set = None) -> List[StoredArticle]:
+        sql = 'SELECT article_id, date_folder, body FROM articles WHERE state = ?'
+        params = [state]
+        if since_date:
+            sql += ' AND date_folder >= ?'
+            params.append(since_date)
+        sql += ' ORDER BY updated_at DESC'
+        if limit and not exclude_ids:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        results = []
+        for article_id, date_folder, body in self._conn().execute(sql, params):
+            if exclude_ids and article_id in exclude_ids:
+                continue
+            results.append(StoredArticle(article_id, date_folder, self._location(article_id), self._decode(body)))
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def date_folders(self, since_date: str = None) -> List[str]:
+        sql = 'SELECT DISTINCT date_folder FROM articles'
+        params = ()
+        if since_date:
+            sql += ' WHERE date_folder >= ?'
+            params = (since_date,)
+        sql += ' ORDER BY date_folder DESC'
+        return [row[0] for row in self._conn().execute(sql, params)]
+
+    def iter_entries(self, since_date: str = None) -> Iterator[CacheEntry]:
+        sql = "SELECT article_id, date_folder, updated_at || ':' || length(body) FROM articles"
+        params = ()
+        if since_date:
+            sql += ' WHERE date_folder >= ?'
+            params = (since_date,)
+        for article_id, date_folder, stamp in self._conn().execute(sql, params).fetchall():
+            yield CacheEntry(article_id, date_folder, self._location(article_id), stamp,
+                             lambda aid=article_id: self.get(aid))
+
+    def count(self) -> int:
+        return self._conn().execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+    # =========================================================================
+    # Import / Export (JSON 트리 <-> SQLite)
+    # =========================================================================
+
+    def import_json_tree(self, cache_root: str = None, batch_size: int = 500) -> int:
+        """기존 JSON 트리를 일괄 적재 (파일명 = article_id, 날짜 폴더 유지)"""
+        source = JsonFileStore(cache_root or self.cache_root)
+        imported = 0
+        batch = []
+        for stored in source.iter_articles():
+            if '_header' not in stored.data and '_original' not in stored.data:
+                continue
+            batch.append((stored.article_id, stored.data, stored.date_folder))
+            if len(batch) >= batch_size:
+                imported += self.save_many(batch)
+                batch = []
+        if batch:
+            imported += self.save_many(batch)
+        print(f"📥 [LocalStore] Imported {imported} articles into {self.db_path}")
+        return imported
+
+    def export_json_tree(self, cache_root: str = None) -> int:
+        """SQLite 내용을 JSON 트리로 내보내기 (<date_folder>/<article_id>.json)"""
+        target = JsonFileStore(cache_root or self.cache_root)
+        exported = 0
+        for stored in self.iter_articles():
+            if target.save(stored.article_id, stored.data, stored.date_folder):
+                exported += 1
+        print(f"📤 [LocalStore] Exported {exported} articles to {target.cache_root}")
+        return exported
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+_stores: Dict[Tuple[str, str], LocalArticleStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_default_cache_root() -> str:
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(base_dir, 'cache', os.getenv('ZND_ENV', 'dev'))
+
+
+def get_local_store(cache_root: str = None, backend: str = None) -> LocalArticleStore:
+    """
+    로컬 저장소 인스턴스 반환 (cache_root/backend별 1개)
+
+    Args:
+        cache_root: 캐시 루트 (기본: cache/<ZND_ENV>)
+        backend: 'json' | 'sqlite' (기본: LOCAL_STORE_BACKEND 환경변수, 없으면 json)
+    """
+    cache_root = os.path.abspath(cache_root or get_default_cache_root())
+    backend = (backend or os.getenv('LOCAL_STORE_BACKEND', 'json')).lower()
+    key = (backend, cache_root)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            if backend == 'sqlite':
+                store = SqliteStore(cache_root)
+            elif backend == 'json':
+                store = JsonFileStore(cache_root)
+            else:
+                raise ValueError(f"Unknown LOCAL_STORE_BACKEND: {backend}")
+            _stores[key] = store
+    return store
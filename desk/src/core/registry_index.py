@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""
+Shared Registry Index - 여러 프로세스가 공유하는 레지스트리 색인
+
+gunicorn 워커 N개 + 스케줄러가 각자 캐시 전체를 콜드 로드하지 않도록
+기사 메타데이터(ArticleInfo) 색인과 변경 로그를 SQLite(WAL) 파일 하나에 둡니다.
+
+    cache/<env>/registry.db
+        articles : article_id -> ArticleInfo(JSON), state, updated_at
+        changes  : 변경 로그 (seq 증가, pid) - 다른 프로세스에 변경 알림
+        workers  : 연결된 프로세스 heartbeat
+        meta     : 로더 선점 / 적재 완료 표시
+
+알림: 각 프로세스의 감시 스레드가 PRAGMA data_version을 짧은 주기로 확인하고
+(다른 연결의 커밋이 있을 때만 값이 바뀜), 바뀌었을 때만 changes를 읽습니다.
+Unix 소켓이 없는 Windows에서도 동일하게 동작합니다.
+
+전체 기사 본문은 공유 색인에 넣지 않습니다 (로컬 저장소 = OS 페이지 캐시 공유).
+"""
+import os
+import json
+import time
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Any, Tuple
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    article_id  TEXT PRIMARY KEY,
+    state       TEXT NOT NULL DEFAULT '',
+    updated_at  TEXT NOT NULL DEFAULT '',
+    info        TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_registry_state ON articles(state);
+CREATE TABLE IF NOT EXISTS changes (
+    seq         INTEGER PRIMARY KEY AUTOINCREMENT,
+    article_id  TEXT NOT NULL,
+    pid         INTEGER NOT NULL,
+    at          REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS workers (
+    pid         INTEGER PRIMARY KEY,
+    seen_at     REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key         TEXT PRIMARY KEY,
+    value       TEXT NOT NULL
+);
+"""
+
+HEARTBEAT_SECONDS = 5
+WORKER_TIMEOUT_SECONDS = 20
+LOADER_TIMEOUT_SECONDS = 600
+CHANGE_RETENTION_SECONDS = 600
+
+
+def get_poll_interval() -> float:
+    """변경 감시 주기 (초)"""
+    return int(os.getenv('REGISTRY_SHARED_POLL_MS', 20)) / 1000.0
+
+
+class SharedRegistryIndex:
+    """
+    cache/<env>/registry.db 공유 색인
+
+    - 스레드별 연결 (WAL: 읽기는 쓰기를 막지 않음)
+    - 쓰기는 BEGIN IMMEDIATE 트랜잭션 (articles + changes 원자적 기록)
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.pid = os.getpid()
+        self._local = threading.local()
+        self._loading: Optional[threading.Event] = None
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn().executescript(INDEX_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    # =========================================================================
+    # Load Coordination
+    # =========================================================================
+
+    def _get_meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def has_live_workers(self) -> bool:
+        """heartbeat가 살아 있는 다른 프로세스가 있는지 (있으면 색인이 최신)"""
+        row = self._conn().execute(
+            'SELECT COUNT(*) FROM workers WHERE pid != ? AND seen_at > ?',
+            (self.pid, time.time() - WORKER_TIMEOUT_SECONDS)
+        ).fetchone()
+        return row[0] > 0
+
+    def is_populated(self) -> bool:
+        return self._get_meta(self._conn(), 'populated_at') is not None
+
+    def claim_loader(self) -> bool:
+        """
+        콜드 로드 담당 선점
+
+        Returns:
+            True면 이 프로세스가 전체 초기화 후 publish_all() 해야 함
+            False면 다른 프로세스가 적재했거나 적재 중 → wait_populated()
+        """
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            if self.has_live_workers() and self._get_meta(conn, 'populated_at'):
+                conn.execute('COMMIT')
+                return False
+            loader = self._get_meta(conn, 'loader')
+            if loader:
+                pid, claimed_at = loader.split(':')
+                if int(pid) != self.pid and time.time() - float(claimed_at) < LOADER_TIMEOUT_SECONDS \
+                        and self.has_live_workers():
+                    conn.execute('COMMIT')
+                    return False
+            # 새 적재: 이전 실행의 색인은 비움
+            conn.execute('DELETE FROM articles')
+            conn.execute('DELETE FROM changes')
+            conn.execute("DELETE FROM meta WHERE key = 'populated_at'")
+            conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                         ('loader', f'{self.pid}:{time.time()}'))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        self._start_loading_heartbeat()
+        return True
+
+    def _start_loading_heartbeat(self):
+        """적재 중에도 heartbeat 유지 (대기 중인 프로세스가 로더를 죽은 것으로 보지 않도록)"""
+        if self._loading is not None:
+            return
+        self._loading = threading.Event()
+        self.heartbeat()
+
+        def _beat(done: threading.Event):
+            while not done.wait(HEARTBEAT_SECONDS):
+                try:
+                    self.heartbeat()
+                except Exception:
+                    pass
+
+        threading.Thread(target=_beat, args=(self._loading,), daemon=True,
+                         name='registry-index-loader').start()
+
+    def wait_populated(self, timeout: float = LOADER_TIMEOUT_SECONDS) -> bool:
+        """다른 프로세스의 적재 완료 대기"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.is_populated():
+                return True
+            if not self.has_live_workers():
+                return False  # 로더가 죽음 → 호출자가 직접 적재
+            time.sleep(0.2)
+        return False
+
+    def heartbeat(self):
+        now = time.time()
+        conn = self._conn()
+        conn.execute('INSERT OR REPLACE INTO workers (pid, seen_at) VALUES (?, ?)', (self.pid, now))
+        conn.execute('DELETE FROM workers WHERE seen_at < ?', (now - WORKER_TIMEOUT_SECONDS * 3,))
+        conn.execute('DELETE FROM changes WHERE at < ?', (now - CHANGE_RETENTION_SECONDS,))
+
+    def detach(self):
+        self._conn().execute('DELETE FROM workers WHERE pid = ?', (self.pid,))
+
+    # =========================================================================
+    # Read / Write
+    # =========================================================================
+
+    def publish(self, infos: List[Dict[str, Any]], removed: List[str] = None) -> int:
+        """
+        변경된 기사 메타데이터 기록 + 변경 로그 (한 트랜잭션)
+        removed: 영구 삭제된 기사 ID (행 삭제, 변경 로그에는 남김 → 다른 프로세스도 제거)
+        """
+        removed = removed or []
+        if not infos and not removed:
+            return 0
+        now = time.time()
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(
+                'INSERT OR REPLACE INTO articles (article_id, state, updated_at, info) VALUES (?, ?, ?, ?)',
+                [(i['article_id'], i['state'], i['updated_at'] or '', json.dumps(i, ensure_ascii=False))
+                 for i in infos]
+            )
+            conn.executemany('DELETE FROM articles WHERE article_id = ?', [(aid,) for aid in removed])
+            conn.executemany(
+                'INSERT INTO changes (article_id, pid, at) VALUES (?, ?, ?)',
+                [(i['article_id'], self.pid, now) for i in infos] + [(aid, self.pid, now) for aid in removed]
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return len(infos) + len(removed)
+
+    def publish_all(self, infos: List[Dict[str, Any]]):
+        """콜드 로드 결과 일괄 기록 후 적재 완료 표시"""
+        conn = self._conn()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            conn.executemany(
+                'INSERT OR REPLACE INTO articles (article_id, state, updated_at, info) VALUES (?, ?, ?, ?)',
+                [(i['article_id'], i['state'], i['updated_at'] or '', json.dumps(i, ensure_ascii=False))
+                 for i in infos]
+            )
+            conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                         ('populated_at', str(time.time())))
+            conn.execute("DELETE FROM meta WHERE key = 'loader'")
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        if self._loading is not None:
+            self._loading.set()
+            self._loading = None
+
+    def last_seq(self) -> int:
+        row = self._conn().execute('SELECT COALESCE(MAX(seq), 0) FROM changes').fetchone()
+        return row[0]
+
+    def load_all(self) -> Tuple[List[Dict[str, Any]], int]:
+        """전체 색인 + 현재 변경 seq (같은 읽기 트랜잭션)"""
+        conn = self._conn()
+        conn.execute('BEGIN')
+        try:
+            seq = conn.execute('SELECT COALESCE(MAX(seq), 0) FROM changes').fetchone()[0]
+            infos = [json.loads(row[0]) for row in conn.execute('SELECT info FROM articles')]
+        finally:
+            conn.execute('COMMIT')
+        return infos, seq
+
+    def load_by_state(self, state: str) -> List[Dict[str, Any]]:
+        """상태별 기사 메타데이터 (부분 적재용, state 색인 사용)"""
+        rows = self._conn().execute('SELECT info FROM articles WHERE state = ?', (state,))
+        return [json.loads(row[0]) for row in rows]
+
+    def changes_since(self, seq: int) -> Tuple[Optional[List[Dict[str, Any]]], int]:
+        """
+        seq 이후 다른 프로세스의 변경
+
+        Returns:
+            (변경된 기사 메타데이터 목록, 마지막 seq)
+            변경 로그가 정리되어 이어 읽을 수 없으면 목록 대신 None (전체 재적재 필요)
+        """
+        conn = self._conn()
+        conn.execute('BEGIN')
+        try:
+            oldest = conn.execute('SELECT MIN(seq) FROM changes').fetchone()[0]
+            if seq and oldest is not None and oldest > seq + 1:
+                last = conn.execute('SELECT MAX(seq) FROM changes').fetchone()[0]
+                return None, last
+            rows = conn.execute(
+                'SELECT c.seq, c.article_id, a.info FROM changes c LEFT JOIN articles a ON a.article_id = c.article_id '
+                'WHERE c.seq > ? AND c.pid != ? ORDER BY c.seq', (seq, self.pid)
+            ).fetchall()
+            last = conn.execute('SELECT COALESCE(MAX(seq), ?) FROM changes', (seq,)).fetchone()[0]
+        finally:
+            conn.execute('COMMIT')
+        # 같은 기사 여러 번 변경 시 최신 값만 (articles 행은 이미 최신)
+        # 행이 없는 변경은 삭제 → {'article_id', 'deleted': True}
+        latest = {}
+        for _, article_id, info in rows:
+            latest[article_id] = json.loads(info) if info else {'article_id': article_id, 'deleted': True}
+        return list(latest.values()), last
+
+    def data_version(self) -> int:
+        """다른 연결의 커밋 감지용 카운터 (같은 연결에서만 비교 가능)"""
+        return self._conn().execute('PRAGMA data_version').fetchone()[0]
+
+    def count(self) -> int:
+        return self._conn().execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+
+class IndexWatcher:
+    """공유 색인 변경 감시 스레드 (data_version 폴링 + heartbeat)"""
+
+    def __init__(self, index: SharedRegistryIndex, start_seq: int, on_changes, on_reload):
+        self.index = index
+        self.seq = start_seq
+        self.on_changes = on_changes    # callable(List[dict])
+        self.on_reload = on_reload      # callable() - 변경 로그를 놓쳤을 때
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, daemon=True, name='registry-index-watcher')
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def poll(self) -> int:
+        """변경 확인 1회 (적용한 기사 수)"""
+        infos, last = self.index.changes_since(self.seq)
+        if infos is None:
+            print(f"⚠️ [RegistryIndex] Change log gap (seq {self.seq} → {last}), reloading index")
+            self.on_reload()
+            self.seq = last
+            return 0
+        self.seq = last
+        if infos:
+            self.on_changes(infos)
+        return len(infos)
+
+    def _loop(self):
+        interval = get_poll_interval()
+        version = None
+        next_heartbeat = 0.0
+        while not self._stop.is_set():
+            try:
+                current = self.index.data_version()
+                if current != version:
+                    version = current
+                    self.poll()
+                now = time.time()
+                if now >= next_heartbeat:
+                    self.index.heartbeat()
+                    next_heartbeat = now + HEARTBEAT_SECONDS
+            except Exception as e:
+                print(f"⚠️ [RegistryIndex] Watch error: {e}")
+                self._stop.wait(1.0)
+            self._stop.wait(interval)
+        try:
+            self.index.detach()
+        except Exception:
+            pass
+
+
+def get_shared_index_path(cache_root: str) -> str:
+    return os.getenv('REGISTRY_SHARED_PATH') or os.path.join(cache_root, 'registry.db')
+
+
+def is_shared_enabled() -> bool:
+    """REGISTRY_SHARED=true 이면 프로세스 간 공유 색인 사용"""
+    return os.getenv('REGISTRY_SHARED', 'false').lower() == 'true'
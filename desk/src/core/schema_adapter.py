@@ -5,7 +5,8 @@ Schema Adapter - 버전별 스키마 해석기
 각 버전의 데이터 구조를 통일된 인터페이스로 접근할 수 있게 해줍니다.
 """
 from typing import Dict, Any, Optional
-import hashlib
+
+from .url_canonical import legacy_key
 
 
 class SchemaAdapter:
@@ -25,7 +26,7 @@ class SchemaAdapter:
     
     LATEST_VERSION = '3.1'
     
-    def __init__(self, data: Dict[str, Any], auto_upgrade: bool = False):
+    def __init__(self, data: Dict[str, Any], auto_upgrade: bool = False, persist_upgrade: bool = True):
         self._data = data
         self._header = data.get('_header', {})
         self._original = data.get('_original', {})
@@ -37,15 +38,32 @@ class SchemaAdapter:
         # 버전 자동 감지
         self._version = self._detect_version()
         
-        # 자동 업그레이드 (옵션) - 모든 내부 참조 갱신
+        # 자동 업그레이드 (옵션)
+        # - 최신 버전이면 원본을 그대로 참조 (zero-copy)
+        # - 구버전이면 _header만 새로 만들고 나머지 섹션은 원본 공유
+        # - 업그레이드 결과는 Registry를 통해 1회 저장 (다음 조회부터 zero-copy)
         if auto_upgrade and self.needs_upgrade:
+            header_updates = self.get_header_upgrade()
             self._data = self.upgrade_to_latest()
-            self._header = self._data.get('_header', {})
-            self._original = self._data.get('_original', {})
+            self._header = self._data['_header']
             self._version = self.LATEST_VERSION
+            
+            if persist_upgrade:
+                self._persist_upgrade(header_updates)
 
+    def _persist_upgrade(self, header_updates: Dict[str, Any]):
+        """업그레이드된 _header를 Registry에 저장 요청 (Lazy Write-back)"""
+        article_id = self._header.get('article_id')
+        if not article_id:
+            return
+        try:
+            from .article_registry import get_registry
+            registry = get_registry()
+            if registry.is_initialized():
+                registry.persist_schema_upgrade(article_id, header_updates)
+        except Exception as e:
+            print(f"⚠️ [SchemaAdapter] Upgrade write-back failed for {article_id}: {e}")
 
-    
     def _detect_version(self) -> str:
         """스키마 버전 자동 감지"""
         explicit_version = self._header.get('version', '')
@@ -74,42 +92,56 @@ class SchemaAdapter:
         """최신 버전으로 업그레이드가 필요한지 확인"""
         return self._version < self.LATEST_VERSION
     
-    def upgrade_to_latest(self) -> Dict[str, Any]:
+    def get_header_upgrade(self) -> Dict[str, Any]:
         """
-        데이터를 최신 버전 스키마로 업그레이드
+        최신 버전으로 올리기 위해 _header에 추가/변경할 필드만 계산 (데이터 복사 없음)
         
         Returns:
-            업그레이드된 데이터 딕셔너리
+            {'url': ..., 'source_id': ..., 'article_id': ..., 'version': LATEST_VERSION}
         """
-        import copy
-        upgraded = copy.deepcopy(self._data)
-        header = upgraded.setdefault('_header', {})
-        original = upgraded.get('_original', {})
+        header = self._header
+        original = self._original
+        updates = {}
         
         # url을 _header로 이동/복사
+        url = header.get('url')
         if 'url' not in header:
             url = original.get('url') or self._data.get('url')
             if url:
-                header['url'] = url
+                updates['url'] = url
         
         # source_id를 _header로 이동/복사
         if 'source_id' not in header:
             sid = original.get('source_id') or self._data.get('source_id')
             if sid and sid != 'unknown':
-                header['source_id'] = sid
-            elif header.get('url'):
+                updates['source_id'] = sid
+            elif url:
                 # URL에서 추출
-                header['source_id'] = self._extract_source_from_url(header['url'])
+                updates['source_id'] = self._extract_source_from_url(url)
         
-        # article_id가 없으면 URL에서 생성
+        # article_id가 없으면 URL에서 생성 (ID 없이 저장된 이전 문서 - 당시 규칙의 키)
         if 'article_id' not in header:
-            url = header.get('url') or original.get('url')
+            url = url or original.get('url')
             if url:
-                header['article_id'] = hashlib.md5(url.encode()).hexdigest()[:12]
+                updates['article_id'] = legacy_key(url)
         
         # 버전 업데이트
-        header['version'] = self.LATEST_VERSION
+        updates['version'] = self.LATEST_VERSION
         
+        return updates
+    
+    def upgrade_to_latest(self) -> Dict[str, Any]:
+        """
+        데이터를 최신 버전 스키마로 업그레이드
+        
+        _header만 새 dict로 만들고 나머지 섹션은 원본과 공유합니다 (deepcopy 없음).
+        반환값의 _header 외 섹션은 읽기 전용으로 취급해야 합니다.
+        
+        Returns:
+            업그레이드된 데이터 딕셔너리
+        """
+        upgraded = dict(self._data)
+        upgraded['_header'] = {**self._header, **self.get_header_upgrade()}
         return upgraded
     
     def get_upgraded_data(self) -> Dict[str, Any]:
@@ -129,11 +161,11 @@ class SchemaAdapter:
             self._data.get('id')
         )
         
-        # 없으면 URL에서 생성
+        # 없으면 URL에서 생성 (ID 없이 저장된 이전 문서 - 당시 규칙의 키)
         if not aid:
             url = self.url
             if url:
-                aid = hashlib.md5(url.encode()).hexdigest()[:12]
+                aid = legacy_key(url)
         
         return aid
     
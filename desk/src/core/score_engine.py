@@ -7,12 +7,24 @@ Supports:
 - Legacy fallback for backwards compatibility
 """
 
-from typing import Union
+import json
+import hashlib
+from typing import Union, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 환경 → 스칼라 경로로 폴백
+    np = None
 
 # Schema Constants
 SCHEMA_V1_0 = 'V1.0'
 SCHEMA_LEGACY = 'Legacy'
 
+# Formula Versions (공식 변경 시 반드시 갱신 → 저장된 점수 재계산 대상이 됨)
+ZES_FORMULA_VERSION = 'v1.2.1'
+IS_FORMULA_VERSION = 'V1.0'
+ENGINE_VERSION = f"ZES-{ZES_FORMULA_VERSION}/IS-{IS_FORMULA_VERSION}"
+
 
 def safe_float(value: Union[str, int, float, None], default: float = 0.0) -> float:
     """Safe float conversion."""
@@ -30,7 +42,7 @@ def safe_float(value: Union[str, int, float, None], default: float = 0.0) -> flo
     return default
 
 
-def detect_schema_version(data: dict) -> str:
+def detect_schema_version(data: dict, verbose: bool = True) -> str:
     """
     Detect schema version from 'version' field.
     
@@ -51,10 +63,12 @@ def detect_schema_version(data: dict) -> str:
     )
     
     if version and '1.0' in str(version):
-        print(f"✅ [ScoreEngine] Detected V1.0: {version}")
+        if verbose:
+            print(f"✅ [ScoreEngine] Detected V1.0: {version}")
         return SCHEMA_V1_0
     
-    print(f"⚠️ [ScoreEngine] Version not found: '{version}' → Legacy")
+    if verbose:
+        print(f"⚠️ [ScoreEngine] Version not found: '{version}' → Legacy")
     return SCHEMA_LEGACY
 
 
@@ -112,7 +126,7 @@ def calculate_is_v1(is_analysis: dict) -> tuple[float, dict]:
     return impact_score, breakdown
 
 
-def calculate_zes_v1(zes_raw_metrics: dict) -> tuple[float, dict]:
+def calculate_zes_v1(zes_raw_metrics: dict, verbose: bool = True) -> tuple[float, dict]:
     """
     Calculate ZeroEcho Score using V1.2.1 formula.
     
@@ -177,7 +191,8 @@ def calculate_zes_v1(zes_raw_metrics: dict) -> tuple[float, dict]:
         zero_echo_score = 10.0  # 최악의 점수 (낮을수록 좋음이므로 10이 최악)
         purity = 0.0
         quality_score = 0.0
-        print(f"⚠️ [ZES v1.2.1] Hard Cutoff: S={s:.2f} < 4.0 → ZES=10 (worst)")
+        if verbose:
+            print(f"⚠️ [ZES v1.2.1] Hard Cutoff: S={s:.2f} < 4.0 → ZES=10 (worst)")
     else:
         # 2. Purity = S × (1 - N/10)  [v1.2.1: 항목 레벨에서 이미 ≤1 필터링됨]
         noise_penalty = n / 10.0
@@ -204,10 +219,11 @@ def calculate_zes_v1(zes_raw_metrics: dict) -> tuple[float, dict]:
         'Fine_Adjustment': fine_adjustment,
         'Quality_Score': round(quality_score, 2) if s >= 4.0 else 0.0,
         'ZES_Final': zero_echo_score,
-        'Formula': 'v1.2.1'
+        'Formula': ZES_FORMULA_VERSION
     }
     
-    print(f"✅ [ZES v1.2.1] S={s:.2f}, N={n:.2f}, U={u:.2f} → Purity={purity:.2f} → Quality={quality_score:.2f} → ZES={zero_echo_score} (lower=better)")
+    if verbose:
+        print(f"✅ [ZES v1.2.1] S={s:.2f}, N={n:.2f}, U={u:.2f} → Purity={purity:.2f} → Quality={quality_score:.2f} → ZES={zero_echo_score} (lower=better)")
     
     return zero_echo_score, breakdown
 
@@ -341,3 +357,308 @@ def process_raw_analysis(raw: dict, force_schema_version: str = None) -> dict:
             result['category'] = meta['Category']
         
         return result
+
+
+# =============================================================================
+# Batch Scoring (Vectorized)
+# =============================================================================
+
+SIGNAL_KEYS = ('T1', 'T2', 'T3', 'T4')
+NOISE_KEYS = ('P1', 'P2', 'P3', 'P4')
+UTILITY_KEYS = ('V1', 'V2', 'V3', 'V4')
+
+
+def _item_score(items: dict, key: str) -> float:
+    """Items 항목 점수 추출 (dict의 Score 또는 스칼라) - calculate_zes_v1과 동일 규칙"""
+    value = items.get(key)
+    return safe_float(value.get('Score') if isinstance(value, dict) else value)
+
+
+def _unwrap_raw(raw: dict) -> Optional[dict]:
+    """raw_analysis / articles[0] 래퍼 제거 (process_raw_analysis와 동일 규칙)"""
+    if not raw or not isinstance(raw, dict):
+        return None
+    data = raw.get('raw_analysis', raw)
+    if not isinstance(data, dict):
+        return None
+    if 'articles' in data and isinstance(data['articles'], list) and len(data['articles']) > 0:
+        data = data['articles'][0]
+    return data if isinstance(data, dict) else None
+
+
+def extract_score_matrices(raws: List[dict], force_schema_version: str = None) -> dict:
+    """
+    mll_raw 목록에서 점수 계산 입력을 한 번만 추출하여 행렬로 구성
+
+    Returns:
+        {
+            'n': 기사 수,
+            'valid': [bool] (파싱 불가 입력은 False),
+            'schema': [SCHEMA_V1_0 | SCHEMA_LEGACY],
+            'T', 'P_raw', 'V': n×4 행렬, 'fine': n 벡터,
+            'tier', 'gap', 'scope', 'crit': n 벡터,
+            'has_is', 'has_zes': [bool],
+            'data': [unwrapped dict]
+        }
+    """
+    n = len(raws)
+    T = [[0.0] * 4 for _ in range(n)]
+    P_raw = [[0.0] * 4 for _ in range(n)]
+    V = [[0.0] * 4 for _ in range(n)]
+    fine = [0.0] * n
+    tier = [0.0] * n
+    gap = [0.0] * n
+    scope = [0.0] * n
+    crit = [0.0] * n
+    valid = [False] * n
+    schema = [SCHEMA_LEGACY] * n
+    has_is = [False] * n
+    has_zes = [False] * n
+    datas = [None] * n
+
+    for i, raw in enumerate(raws):
+        data = _unwrap_raw(raw)
+        if data is None:
+            continue
+        valid[i] = True
+        datas[i] = data
+        schema[i] = force_schema_version or detect_schema_version(data, verbose=False)
+        if schema[i] != SCHEMA_V1_0:
+            continue
+
+        is_analysis = data.get('IS_Analysis', {})
+        if is_analysis:
+            has_is[i] = True
+            calculations = is_analysis.get('Calculations', {})
+            iw_analysis = calculations.get('IW_Analysis', {})
+            ie_analysis = is_analysis.get('IE_Analysis') or calculations.get('IE_Analysis', {})
+            tier_val = iw_analysis.get('Tier_Score')
+            if tier_val is None:
+                tier_val = calculations.get('Tier_Score')
+            gap_val = iw_analysis.get('Gap_Score')
+            if gap_val is None:
+                gap_val = calculations.get('Gap_Score')
+            tier[i] = safe_float(tier_val)
+            gap[i] = safe_float(gap_val)
+            ie_inputs = ie_analysis.get('Inputs', {})
+            scope[i] = safe_float(ie_inputs.get('Scope_Matrix_Score'))
+            crit[i] = safe_float(ie_inputs.get('Criticality_Total'))
+
+        zes_raw_metrics = data.get('ZES_Raw_Metrics', {})
+        if zes_raw_metrics:
+            has_zes[i] = True
+            signal = zes_raw_metrics.get('Signal', {})
+            noise = zes_raw_metrics.get('Noise', {})
+            utility = zes_raw_metrics.get('Utility', {})
+            signal_items = signal.get('Items', signal)
+            noise_items = noise.get('Items', noise)
+            utility_items = utility.get('Items', utility)
+            T[i] = [_item_score(signal_items, k) for k in SIGNAL_KEYS]
+            P_raw[i] = [_item_score(noise_items, k) for k in NOISE_KEYS]
+            V[i] = [_item_score(utility_items, k) for k in UTILITY_KEYS]
+            fine[i] = safe_float(zes_raw_metrics.get('Fine_Adjustment', {}).get('Score'))
+
+    matrices = {
+        'T': T, 'P_raw': P_raw, 'V': V, 'fine': fine,
+        'tier': tier, 'gap': gap, 'scope': scope, 'crit': crit
+    }
+    if np is not None and n:
+        matrices = {key: np.array(value, dtype=float) for key, value in matrices.items()}
+
+    return {
+        'n': n,
+        'valid': valid,
+        'schema': schema,
+        'has_is': has_is,
+        'has_zes': has_zes,
+        'data': datas,
+        **matrices
+    }
+
+
+def _aggregate(M):
+    """MAX + AVG * 0.25, cap 10 (항목 합산 순서는 스칼라 경로와 동일하게 유지)"""
+    total = M[:, 0] + M[:, 1] + M[:, 2] + M[:, 3]
+    return np.minimum(10.0, M.max(axis=1) + (total / 4.0) * 0.25)
+
+
+def process_raw_analysis_batch(raws: List[dict], force_schema_version: str = None) -> List[Optional[dict]]:
+    """
+    여러 기사의 mll_raw를 한 번에 점수화 (ZES v1.2.1 / IS V1.0)
+
+    T/P/V 행렬을 한 번만 추출한 뒤 IS/ZES를 벡터 연산으로 계산합니다.
+    반환 항목의 점수 필드(version, impact_score, zero_echo_score,
+    impact_evidence, evidence)는 process_raw_analysis()와 동일합니다.
+    (최종 반올림은 파이썬 round()로 수행하여 스칼라 경로와 비트 단위로 일치)
+
+    Returns:
+        입력 순서대로 결과 dict 목록 (파싱 불가 입력은 None)
+    """
+    if np is None:
+        return [_process_scores_scalar(raw, force_schema_version) for raw in raws]
+
+    m = extract_score_matrices(raws, force_schema_version)
+    n = m['n']
+    if n == 0:
+        return []
+
+    # --- ZES v1.2.1 ---
+    T, V = m['T'], m['V']
+    P = np.where(m['P_raw'] <= 1.0, 0.0, m['P_raw'])
+    s = _aggregate(T)
+    nz = _aggregate(P)
+    u = _aggregate(V)
+    cutoff = s < 4.0
+    purity = np.where(cutoff, 0.0, s * (1.0 - nz / 10.0))
+    quality = np.where(cutoff, 0.0, (purity * 0.7) + (u * 0.3) + m['fine'])
+    zes_raw = (10.0 - quality).tolist()
+
+    # --- IS V1.0 ---
+    iw_total = m['tier'] + m['gap']
+    ie_total = m['scope'] + m['crit']
+    is_raw = (iw_total + ie_total).tolist()
+
+    T_l, P_raw_l, P_l, V_l = T.tolist(), m['P_raw'].tolist(), P.tolist(), V.tolist()
+    s_l, n_l, u_l = s.tolist(), nz.tolist(), u.tolist()
+    purity_l, quality_l, fine_l = purity.tolist(), quality.tolist(), m['fine'].tolist()
+    tier_l, gap_l = m['tier'].tolist(), m['gap'].tolist()
+    scope_l, crit_l = m['scope'].tolist(), m['crit'].tolist()
+    iw_l, ie_l = iw_total.tolist(), ie_total.tolist()
+
+    results = []
+    for i in range(n):
+        if not m['valid'][i]:
+            results.append(None)
+            continue
+        data = m['data'][i]
+        if m['schema'][i] != SCHEMA_V1_0:
+            results.append(_legacy_scores(data))
+            continue
+
+        result = {'version': 'V1.0'}
+
+        if m['has_is'][i]:
+            is_analysis = data.get('IS_Analysis', {})
+            impact_score = max(0.0, min(10.0, round(is_raw[i], 1)))
+            result['impact_score'] = impact_score
+            result['impact_evidence'] = {
+                'calculations': {
+                    'IW_Analysis': {'Tier_Score': tier_l[i], 'Gap_Score': gap_l[i], 'IW_Total': iw_l[i]},
+                    'IE_Analysis': {'Scope_Total': scope_l[i], 'Criticality_Total': crit_l[i], 'IE_Total': ie_l[i]},
+                    'IS_Raw': is_raw[i],
+                    'IS_Final': impact_score,
+                    'Score_Commentary': is_analysis.get('Score_Commentary', '')
+                },
+                'raw_inputs': is_analysis.get('Calculations', {}).get('IW_Analysis', {}).get('Inputs', {}),
+                'raw_ie_inputs': is_analysis.get('Calculations', {}).get('IE_Analysis', {}).get('Inputs', {})
+            }
+        else:
+            result['impact_score'] = 0.0
+            result['impact_evidence'] = {}
+
+        if m['has_zes'][i]:
+            passed = not cutoff[i]
+            zero_echo_score = max(0.0, min(10.0, round(zes_raw[i], 2))) if passed else 10.0
+            t, pr, p, v = T_l[i], P_raw_l[i], P_l[i], V_l[i]
+            result['zero_echo_score'] = zero_echo_score
+            result['evidence'] = {
+                'breakdown': {
+                    'Signal': {'T1': t[0], 'T2': t[1], 'T3': t[2], 'T4': t[3], 'S_Agg': round(s_l[i], 2)},
+                    'Noise': {
+                        'P1_Raw': pr[0], 'P2_Raw': pr[1], 'P3_Raw': pr[2], 'P4_Raw': pr[3],
+                        'P1': p[0], 'P2': p[1], 'P3': p[2], 'P4': p[3],
+                        'N_Agg': round(n_l[i], 2)
+                    },
+                    'Utility': {'V1': v[0], 'V2': v[1], 'V3': v[2], 'V4': v[3], 'U_Agg': round(u_l[i], 2)},
+                    'Purity': round(purity_l[i], 2),
+                    'Fine_Adjustment': fine_l[i],
+                    'Quality_Score': round(quality_l[i], 2) if passed else 0.0,
+                    'ZES_Final': zero_echo_score,
+                    'Formula': ZES_FORMULA_VERSION
+                },
+                'raw_metrics': data.get('ZES_Raw_Metrics', {})
+            }
+        else:
+            result['zero_echo_score'] = 5.0
+            result['evidence'] = {}
+
+        results.append(result)
+
+    return results
+
+
+def _legacy_scores(data: dict) -> dict:
+    """Legacy 스키마 점수 필드 (process_raw_analysis Legacy 분기와 동일)"""
+    return {
+        'version': 'Legacy',
+        'impact_score': safe_float(data.get('impact_score')),
+        'zero_echo_score': safe_float(data.get('zero_echo_score', 5.0)),
+        'evidence': data.get('evidence', {}),
+        'impact_evidence': data.get('impact_evidence', {})
+    }
+
+
+def _process_scores_scalar(raw: dict, force_schema_version: str = None) -> Optional[dict]:
+    """numpy 미설치 시 배치 API 폴백 (로그 없는 스칼라 계산)"""
+    data = _unwrap_raw(raw)
+    if data is None:
+        return None
+    schema_version = force_schema_version or detect_schema_version(data, verbose=False)
+    if schema_version != SCHEMA_V1_0:
+        return _legacy_scores(data)
+
+    result = {'version': 'V1.0'}
+    is_analysis = data.get('IS_Analysis', {})
+    if is_analysis:
+        impact_score, is_breakdown = calculate_is_v1(is_analysis)
+        result['impact_score'] = impact_score
+        result['impact_evidence'] = {
+            'calculations': is_breakdown,
+            'raw_inputs': is_analysis.get('Calculations', {}).get('IW_Analysis', {}).get('Inputs', {}),
+            'raw_ie_inputs': is_analysis.get('Calculations', {}).get('IE_Analysis', {}).get('Inputs', {})
+        }
+    else:
+        result['impact_score'] = 0.0
+        result['impact_evidence'] = {}
+
+    zes_raw_metrics = data.get('ZES_Raw_Metrics', {})
+    if zes_raw_metrics:
+        zero_echo_score, zes_breakdown = calculate_zes_v1(zes_raw_metrics, verbose=False)
+        result['zero_echo_score'] = zero_echo_score
+        result['evidence'] = {'breakdown': zes_breakdown, 'raw_metrics': zes_raw_metrics}
+    else:
+        result['zero_echo_score'] = 5.0
+        result['evidence'] = {}
+    return result
+
+
+# =============================================================================
+# Score Memoization (엔진 버전 + mll_raw 해시)
+# =============================================================================
+
+def hash_mll_raw(raw) -> str:
+    """mll_raw 내용 해시 (키 순서 무관)"""
+    payload = json.dumps(raw, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def score_fingerprint(raw) -> dict:
+    """_analysis에 함께 저장할 점수 계산 지문"""
+    return {
+        'score_engine_version': ENGINE_VERSION,
+        'mll_raw_hash': hash_mll_raw(raw)
+    }
+
+
+def needs_rescore(analysis: dict, raw=None) -> bool:
+    """
+    저장된 점수가 현재 엔진/입력 기준으로 낡았는지 확인
+
+    - 엔진 버전이 다르거나 지문이 없으면 재계산 필요
+    - mll_raw가 바뀌었으면(해시 불일치) 재계산 필요
+    """
+    analysis = analysis or {}
+    if analysis.get('score_engine_version') != ENGINE_VERSION:
+        return True
+    raw = raw if raw is not None else analysis.get('mll_raw')
+    return analysis.get('mll_raw_hash') != hash_mll_raw(raw)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Score Rescorer - 점수 재계산 (메모이제이션)
+
+기사 _analysis에 저장된 지문(score_engine_version, mll_raw_hash)을 기준으로
+엔진 버전과 mll_raw가 그대로인 기사는 재계산하지 않습니다 (score_engine.needs_rescore).
+공식이 바뀐 경우(ENGINE_VERSION 변경) 전체 재계산은 컬럼별 백그라운드 작업으로 실행합니다
+(POST /api/board/rescore → job_runner 'rescore', lock_key column:<STATE>).
+"""
+from typing import Dict, List, Any
+
+from .score_engine import (
+    ENGINE_VERSION, process_raw_analysis_batch, hash_mll_raw, needs_rescore
+)
+
+RESCORE_STATES = ['ANALYZED', 'CLASSIFIED']
+RESCORE_LIMIT = 100000  # 전체 재계산 시 컬럼당 최대 기사 수
+CHUNK_SIZE = 200
+
+
+def rescore_articles(articles: List[Dict[str, Any]], manager, force: bool = False) -> Dict[str, int]:
+    """
+    기사 목록 점수 재계산 (변경분만 일괄 저장)
+
+    Args:
+        articles: 전체 기사 데이터 목록 (v3.1 또는 flatten)
+        manager: ArticleManager
+        force: True면 지문이 같아도 다시 계산
+
+    Returns:
+        {'scanned', 'skipped', 'computed', 'updated', 'stamped', 'restored'}
+    """
+    from .article_state import get_best_restorable_state
+
+    stats = {'scanned': 0, 'skipped': 0, 'computed': 0, 'updated': 0, 'stamped': 0, 'restored': 0}
+
+    # 1. 재계산 대상 수집 (지문 일치 기사는 스킵)
+    targets = []
+    for art in articles:
+        # article_id는 여러 위치에 있을 수 있음
+        aid = art.get('_header', {}).get('article_id') or art.get('article_id')
+
+        # mll_raw는 _analysis 안에 있거나 flatten되어 최상위에 있을 수 있음
+        analysis = art.get('_analysis') or art
+        mll_raw = analysis.get('mll_raw') or art.get('mll_raw')
+        if not (aid and mll_raw):
+            continue
+
+        stats['scanned'] += 1
+        if not force and not needs_rescore(analysis, mll_raw):
+            stats['skipped'] += 1
+            continue
+        targets.append((aid, art, analysis, mll_raw, hash_mll_raw(mll_raw)))
+
+    if not targets:
+        return stats
+
+    # 2. 일괄 점수 계산 (벡터 연산 1회)
+    results = process_raw_analysis_batch([t[3] for t in targets])
+    stats['computed'] = len(targets)
+
+    # 3. 점수 변동 기사 + 지문만 갱신할 기사 구분
+    changed = {}
+    score_changed = set()
+    for (aid, art, analysis, _, raw_hash), recalc in zip(targets, results):
+        if not recalc:
+            continue
+        fingerprint = {'score_engine_version': ENGINE_VERSION, 'mll_raw_hash': raw_hash}
+        new_score = recalc.get('impact_score')
+        new_zes = recalc.get('zero_echo_score', 5.0)
+        old_score = analysis.get('impact_score')
+        old_zes = analysis.get('zero_echo_score') or 0
+
+        if new_score is not None and (old_score != new_score or abs(old_zes - new_zes) > 0.01):
+            print(f"   📊 [{aid}] IS: {old_score} → {new_score}, ZES: {old_zes} → {new_zes}")
+            changed[aid] = {
+                'impact_score': new_score,
+                'zero_echo_score': new_zes,
+                'impact_evidence': recalc.get('impact_evidence', {}),
+                'evidence': recalc.get('evidence', {}),
+                **fingerprint
+            }
+            score_changed.add(aid)
+        elif (analysis.get('score_engine_version'), analysis.get('mll_raw_hash')) != (ENGINE_VERSION, raw_hash):
+            # 점수 불변 → 지문만 기록 (다음 재계산부터 스킵)
+            changed[aid] = fingerprint
+
+    # 4. 변경분만 일괄 저장 (Firestore 배치 커밋)
+    saved_ids = manager.update_analysis_batch(changed) if changed else []
+    stats['updated'] = sum(1 for aid in saved_ids if aid in score_changed)
+    stats['stamped'] = len(saved_ids) - stats['updated']
+
+    # 5. 자동 상태 복원: 데이터 기반으로 최적 상태 결정
+    art_by_id = {t[0]: t[1] for t in targets}
+    for aid in saved_ids:
+        if aid not in score_changed:
+            continue
+        art = art_by_id[aid]
+        current_state = art.get('_header', {}).get('state') or art.get('state')
+        best_state = get_best_restorable_state(art)
+        if current_state != best_state.value:
+            manager.update_state(aid, best_state, by='auto-restore')
+            stats['restored'] += 1
+            print(f"      🔄 [{aid}] {best_state.value}로 자동 복원됨")
+
+    return stats
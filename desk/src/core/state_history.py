@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+State History - _header.state_history 보존 정책 + 오래된 전이 보관
+
+reject-all / restore-all로 상태를 오가는 기사는 전이 기록이 수백 건까지 쌓여
+저장할 때마다 다시 쓰이고 _flatten_article마다 복사됩니다.
+기사 문서에는 최근 기록만 두고 오래된 기록은 묶음(chunk)으로 따로 보관합니다.
+
+- 인라인: 목록이 STATE_HISTORY_MAX건을 넘으면 최근 STATE_HISTORY_INLINE건만 남기고 자름
+          (매 전이마다 자르지 않으므로 대부분의 저장은 추가분만 ArrayUnion)
+- 요약: _header.state_history_archived = {'count', 'chunks', 'first_at', 'last_at'}
+- 보관 묶음: {'seq', 'entries', 'archived_at'} (seq는 기사별 0부터)
+    로컬 append-only 감사 로그 cache/<env>/_state_history.db (항상)
+    Firestore articles/{id}/state_history/{seq:06d} 서브컬렉션 (Firestore 연결 시, outbox 경유)
+- 전체 타임라인: build_timeline(header, chunks) - ArticleRegistry.get_state_timeline()
+
+환경 변수:
+    STATE_HISTORY_INLINE (20) / STATE_HISTORY_MAX (50)
+"""
+import os
+import sqlite3
+import threading
+from typing import Dict, Any, List, Optional
+
+from src.core_logic import get_kst_now
+from .cache_codec import encode_article, decode_article
+
+
+ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state_history_archive (
+    article_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    payload BLOB NOT NULL,          -- {'seq', 'entries', 'archived_at'}
+    archived_at TEXT NOT NULL,
+    PRIMARY KEY (article_id, seq)
+);
+"""
+
+
+def get_history_limits() -> tuple:
+    """(인라인 유지 건수, 자르기 시작 건수)"""
+    inline = max(1, int(os.getenv('STATE_HISTORY_INLINE', 20)))
+    maximum = max(inline, int(os.getenv('STATE_HISTORY_MAX', 50)))
+    return inline, maximum
+
+
+def append_transition(header: Dict[str, Any], entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    header(이미 복사된 _header)에 전이 기록 추가 + 보존 정책 적용
+    목록/요약은 새 객체로 교체 (이전 세대와 공유하지 않음)
+
+    Returns:
+        잘려 나간 기록의 보관 묶음 (자르지 않았으면 None)
+    """
+    history = list(header.get('state_history') or []) + [entry]
+    inline, maximum = get_history_limits()
+    if len(history) <= maximum:
+        header['state_history'] = history
+        return None
+
+    archived, header['state_history'] = history[:-inline], history[-inline:]
+    summary = dict(header.get('state_history_archived') or {})
+    chunk = {'seq': summary.get('chunks', 0), 'entries': archived, 'archived_at': get_kst_now()}
+    summary['count'] = summary.get('count', 0) + len(archived)
+    summary['chunks'] = chunk['seq'] + 1
+    summary.setdefault('first_at', archived[0].get('at'))
+    summary['last_at'] = archived[-1].get('at')
+    header['state_history_archived'] = summary
+    return chunk
+
+
+def build_timeline(header: Dict[str, Any], chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """보관 묶음 + 인라인 기록 → 전체 타임라인 (찾지 못한 묶음 번호는 missing_chunks)"""
+    summary = header.get('state_history_archived') or {}
+    by_seq = {chunk['seq']: chunk for chunk in chunks}
+    entries = []
+    for seq in sorted(by_seq):
+        entries.extend(by_seq[seq].get('entries') or [])
+    inline = header.get('state_history') or []
+    entries.extend(inline)
+    return {
+        'entries': entries,
+        'inline': len(inline),
+        'archived': summary.get('count', 0),
+        'missing_chunks': [seq for seq in range(summary.get('chunks', 0)) if seq not in by_seq],
+    }
+
+
+class StateHistoryArchive:
+    """
+    보관된 전이 기록의 로컬 감사 로그 (싱글톤, SQLite, 추가만 함)
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self.db_path: Optional[str] = None
+        self._local = threading.local()
+        self._initialized = True
+
+    def attach(self, cache_root: str) -> 'StateHistoryArchive':
+        db_path = os.path.join(cache_root, '_state_history.db')
+        if db_path != self.db_path:
+            self.db_path = db_path
+            self._local = threading.local()
+            os.makedirs(cache_root, exist_ok=True)
+            self._conn().executescript(ARCHIVE_SCHEMA)
+        return self
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def append(self, article_id: str, chunk: Dict[str, Any]):
+        """묶음 기록 (같은 seq가 이미 있으면 그대로 둠)"""
+        self._conn().execute(
+            'INSERT OR IGNORE INTO state_history_archive (article_id, seq, payload, archived_at) VALUES (?, ?, ?, ?)',
+            (article_id, chunk['seq'], encode_article(chunk, 'compact'), chunk['archived_at']))
+
+    def get_chunks(self, article_id: str) -> List[Dict[str, Any]]:
+        if self.db_path is None:
+            return []
+        rows = self._conn().execute(
+            'SELECT payload FROM state_history_archive WHERE article_id = ? ORDER BY seq', (article_id,)
+        ).fetchall()
+        return [decode_article(row[0]) for row in rows]
+
+    def delete(self, article_id: str) -> int:
+        if self.db_path is None:
+            return 0
+        return self._conn().execute('DELETE FROM state_history_archive WHERE article_id = ?',
+                                    (article_id,)).rowcount
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+def get_history_archive() -> StateHistoryArchive:
+    """StateHistoryArchive 싱글톤 반환"""
+    return StateHistoryArchive()
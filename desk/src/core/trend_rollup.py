@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""
+Trend Rollup - 일자별 트렌드 집계 (사전 계산)
+
+회차 발행/정식 발행 시점에 일자별 집계(태그 빈도, 카테고리 빈도, 기사 목록)를
+증분 갱신해 두고, 트렌드 리포트는 기사를 다시 읽지 않고 집계만 병합합니다.
+
+저장 위치:
+    로컬: cache/{env}/_rollups/{YYYY-MM-DD}.json
+    Firestore (옵션, TREND_ROLLUP_FIRESTORE=true): {env}/data/trend_rollups/{YYYY-MM-DD}
+"""
+import os
+import json
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import combinations
+from typing import Dict, List, Optional, Any, Iterable
+
+from src.core_logic import get_kst_now
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 환경 → 순수 Python 폴백
+    np = None
+
+
+ROLLUP_VERSION = 1
+SUMMARY_LIMIT = 200  # 프롬프트에 들어가는 요약 길이와 동일
+
+
+def _empty_rollup(date_str: str) -> Dict[str, Any]:
+    return {
+        'version': ROLLUP_VERSION,
+        'date': date_str,
+        'article_count': 0,
+        'tag_counts': {},
+        'category_counts': {},
+        'editions': {},     # edition_code -> {'status', 'article_ids'}
+        'articles': {},     # article_id -> 프롬프트용 경량 엔트리
+        'updated_at': None
+    }
+
+
+def _to_date_str(value) -> str:
+    """published_at(ISO 문자열/datetime) → YYYY-MM-DD"""
+    if not value:
+        return ''
+    if hasattr(value, 'isoformat'):
+        value = value.isoformat()
+    return str(value)[:10]
+
+
+class TrendRollupStore:
+    """
+    일자별 트렌드 집계 저장소 (싱글톤)
+
+    모든 갱신은 article_id 기준으로 멱등(idempotent)합니다.
+    같은 기사를 여러 번 반영해도 카운트가 중복되지 않습니다.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = os.getenv('ZND_ENV', 'dev')
+        self.rollup_dir = os.path.join(base_dir, 'cache', env, '_rollups')
+        self.use_firestore = os.getenv('TREND_ROLLUP_FIRESTORE', 'false').lower() == 'true'
+        self._memory: Dict[str, Dict[str, Any]] = {}
+        self._initialized = True
+
+    # =========================================================================
+    # Storage
+    # =========================================================================
+
+    def _path(self, date_str: str) -> str:
+        return os.path.join(self.rollup_dir, f"{date_str}.json")
+
+    def _db(self):
+        from src.core.firestore_client import FirestoreClient
+        return FirestoreClient()
+
+    def load_day(self, date_str: str) -> Optional[Dict[str, Any]]:
+        """일자 집계 로드 (메모리 → 로컬 → Firestore)"""
+        if date_str in self._memory:
+            return self._memory[date_str]
+
+        path = self._path(date_str)
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    rollup = json.load(f)
+                self._memory[date_str] = rollup
+                return rollup
+            except Exception as e:
+                print(f"⚠️ [Rollup] Failed to read {path}: {e}")
+
+        if self.use_firestore:
+            try:
+                rollup = self._db().get_trend_rollup(date_str)
+                if rollup:
+                    self._write_local(date_str, rollup)
+                    self._memory[date_str] = rollup
+                    return rollup
+            except Exception as e:
+                print(f"⚠️ [Rollup] Firestore read failed for {date_str}: {e}")
+
+        return None
+
+    def _write_local(self, date_str: str, rollup: Dict[str, Any]):
+        os.makedirs(self.rollup_dir, exist_ok=True)
+        path = self._path(date_str)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(rollup, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def save_day(self, rollup: Dict[str, Any]):
+        """일자 집계 저장 (로컬 + 옵션 Firestore)"""
+        date_str = rollup['date']
+        rollup['updated_at'] = get_kst_now()
+        self._memory[date_str] = rollup
+        self._write_local(date_str, rollup)
+
+        if self.use_firestore:
+            try:
+                self._db().save_trend_rollup(date_str, rollup)
+            except Exception as e:
+                print(f"⚠️ [Rollup] Firestore save failed for {date_str}: {e}")
+
+    # =========================================================================
+    # Incremental Updates
+    # =========================================================================
+
+    @staticmethod
+    def _entry_from_snapshot(article: Dict[str, Any], edition_code: str) -> Dict[str, Any]:
+        """발행 스냅샷(또는 v3.1 기사) → 집계용 경량 엔트리"""
+        analysis = article.get('_analysis', {}) or {}
+        classification = article.get('_classification', {}) or {}
+        tags = article.get('tags') or analysis.get('tags') or []
+        if not isinstance(tags, list):
+            tags = [str(tags)]
+        summary = article.get('summary') or analysis.get('summary') or ''
+        return {
+            'title_ko': article.get('title_ko') or analysis.get('title_ko') or article.get('title', ''),
+            'summary': summary[:SUMMARY_LIMIT + 1],
+            'tags': [t for t in dict.fromkeys(tags) if t],
+            'category': article.get('category') or classification.get('category') or '',
+            'date': article.get('date') or _to_date_str(article.get('published_at')),
+            'edition_code': edition_code
+        }
+
+    def _apply_add(self, rollup: Dict[str, Any], article_id: str, entry: Dict[str, Any]) -> bool:
+        if article_id in rollup['articles']:
+            return False
+        rollup['articles'][article_id] = entry
+        tag_counts = rollup['tag_counts']
+        for tag in entry['tags']:
+            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        category = entry.get('category')
+        if category:
+            cat_counts = rollup['category_counts']
+            cat_counts[category] = cat_counts.get(category, 0) + 1
+        rollup['article_count'] = len(rollup['articles'])
+        return True
+
+    def _apply_remove(self, rollup: Dict[str, Any], article_id: str) -> bool:
+        entry = rollup['articles'].pop(article_id, None)
+        if entry is None:
+            return False
+        tag_counts = rollup['tag_counts']
+        for tag in entry.get('tags', []):
+            tag_counts[tag] = tag_counts.get(tag, 0) - 1
+            if tag_counts[tag] <= 0:
+                tag_counts.pop(tag, None)
+        category = entry.get('category')
+        if category and category in rollup['category_counts']:
+            rollup['category_counts'][category] -= 1
+            if rollup['category_counts'][category] <= 0:
+                rollup['category_counts'].pop(category, None)
+        rollup['article_count'] = len(rollup['articles'])
+        return True
+
+    def record_edition(self, edition_code: str, published_at, articles: Iterable[Dict[str, Any]],
+                       status: str = 'preview') -> int:
+        """
+        회차 기사들을 발행일 집계에 반영 (발행/정식 발행 시 호출)
+
+        Returns:
+            새로 반영된 기사 수
+        """
+        date_str = _to_date_str(published_at)
+        if not date_str:
+            return 0
+
+        rollup = self.load_day(date_str) or _empty_rollup(date_str)
+        edition = rollup['editions'].setdefault(edition_code, {'status': status, 'article_ids': []})
+        edition['status'] = status
+
+        added = 0
+        for art in articles:
+            art_id = art.get('id') or art.get('article_id') or art.get('_header', {}).get('article_id')
+            if not art_id:
+                continue
+            if self._apply_add(rollup, art_id, self._entry_from_snapshot(art, edition_code)):
+                added += 1
+            if art_id not in edition['article_ids']:
+                edition['article_ids'].append(art_id)
+
+        self.save_day(rollup)
+        if added:
+            print(f"📈 [Rollup] {date_str}: +{added} articles ({edition_code})")
+        return added
+
+    def remove_edition(self, edition_code: str, published_at=None) -> int:
+        """회차 파기 시 집계에서 제거"""
+        dates = [_to_date_str(published_at)] if published_at else self._list_dates()
+        removed = 0
+        for date_str in dates:
+            rollup = self.load_day(date_str) if date_str else None
+            if not rollup or edition_code not in rollup['editions']:
+                continue
+            edition = rollup['editions'].pop(edition_code)
+            for art_id in edition.get('article_ids', []):
+                if self._apply_remove(rollup, art_id):
+                    removed += 1
+            self.save_day(rollup)
+        if removed:
+            print(f"📉 [Rollup] -{removed} articles ({edition_code})")
+        return removed
+
+    def _list_dates(self) -> List[str]:
+        if not os.path.isdir(self.rollup_dir):
+            return []
+        return sorted(
+            f[:-5] for f in os.listdir(self.rollup_dir)
+            if f.endswith('.json') and not f.startswith('_')
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def merge_range(self, start_date: str, end_date: str, include_preview: bool = True) -> Dict[str, Any]:
+        """
+        기간 내 일자 집계 병합 (양 끝 포함, YYYY-MM-DD)
+
+        Returns:
+            {'articles': [...], 'tag_counts': Counter, 'category_counts': Counter,
+             'edition_codes': [...], 'days': int}
+        """
+        articles = []
+        tag_counts = Counter()
+        category_counts = Counter()
+        edition_codes = []
+        days = 0
+
+        for date_str in _date_range(start_date, end_date):
+            rollup = self.load_day(date_str)
+            if not rollup:
+                continue
+            days += 1
+            for code, edition in rollup['editions'].items():
+                if not include_preview and edition.get('status') != 'released':
+                    continue
+                edition_codes.append(code)
+                for art_id in edition.get('article_ids', []):
+                    entry = rollup['articles'].get(art_id)
+                    if entry:
+                        articles.append(entry)
+            if include_preview:
+                tag_counts.update(rollup['tag_counts'])
+                category_counts.update(rollup['category_counts'])
+
+        if not include_preview:
+            for entry in articles:
+                tag_counts.update(entry['tags'])
+                if entry.get('category'):
+                    category_counts[entry['category']] += 1
+
+        return {
+            'articles': articles,
+            'tag_counts': tag_counts,
+            'category_counts': category_counts,
+            'edition_codes': edition_codes,
+            'days': days
+        }
+
+    def ensure_backfill(self, manager, limit: int = 50) -> bool:
+        """집계 도입 이전 회차를 1회만 백필 (완료 마커: _rollups/_backfill.json)"""
+        marker = os.path.join(self.rollup_dir, '_backfill.json')
+        if os.path.exists(marker):
+            return False
+        total = self.rebuild(manager, limit=limit)
+        os.makedirs(self.rollup_dir, exist_ok=True)
+        with open(marker, 'w', encoding='utf-8') as f:
+            json.dump({'completed_at': get_kst_now(), 'articles': total}, f)
+        return True
+
+    def rebuild(self, manager, limit: int = 50) -> int:
+        """
+        기존 회차에서 집계 재구성 (집계 도입 이전 데이터 백필용)
+
+        Returns:
+            반영된 기사 수
+        """
+        total = 0
+        for ed in manager.get_editions(limit=limit):
+            code = ed.get('edition_code') or ed.get('code')
+            if not code:
+                continue
+            articles = manager.get_edition_articles(code)
+            total += self.record_edition(code, ed.get('published_at'), articles,
+                                         status=ed.get('status', 'preview'))
+        print(f"📈 [Rollup] Rebuilt from editions: {total} articles")
+        return total
+
+
+# =============================================================================
+# Analytics (Tag Co-occurrence / Growth)
+# =============================================================================
+
+def _date_range(start_date: str, end_date: str) -> List[str]:
+    start = datetime.strptime(start_date, '%Y-%m-%d')
+    end = datetime.strptime(end_date, '%Y-%m-%d')
+    return [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range((end - start).days + 1)]
+
+
+def tag_cooccurrence(articles: List[Dict[str, Any]], top_n: int = 30, pair_limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    상위 태그 간 동시 출현 빈도
+
+    기사×태그 0/1 행렬 X를 만들고 C = XᵀX 로 한 번에 계산합니다.
+    (numpy가 없으면 조합 카운트로 폴백)
+    """
+    tag_counter = Counter()
+    for art in articles:
+        tag_counter.update(art.get('tags', []))
+    vocab = [t for t, _ in tag_counter.most_common(top_n)]
+    if len(vocab) < 2:
+        return []
+    index = {t: i for i, t in enumerate(vocab)}
+
+    if np is not None:
+        X = np.zeros((len(articles), len(vocab)), dtype=np.float32)
+        for row, art in enumerate(articles):
+            cols = [index[t] for t in art.get('tags', []) if t in index]
+            X[row, cols] = 1.0
+        C = X.T @ X
+        iu, ju = np.triu_indices(len(vocab), k=1)
+        counts = C[iu, ju]
+        order = np.argsort(-counts, kind='stable')[:pair_limit]
+        return [
+            {'tags': [vocab[iu[k]], vocab[ju[k]]], 'count': int(counts[k])}
+            for k in order if counts[k] > 0
+        ]
+
+    pair_counter = Counter()
+    for art in articles:
+        tags = sorted((t for t in set(art.get('tags', [])) if t in index), key=index.get)
+        pair_counter.update(combinations(tags, 2))
+    return [{'tags': list(pair), 'count': count} for pair, count in pair_counter.most_common(pair_limit)]
+
+
+def tag_growth(current: Counter, previous: Counter, top_n: int = 10) -> List[Dict[str, Any]]:
+    """
+    직전 동일 길이 기간 대비 태그 증감 (기본 7일 → 주간 증감)
+
+    growth = (현재 - 이전) / 이전, 이전 기간에 없던 태그는 None(신규)
+    """
+    tags = list(current.keys())
+    if not tags:
+        return []
+
+    if np is not None:
+        cur = np.array([current[t] for t in tags], dtype=np.float64)
+        prev = np.array([previous.get(t, 0) for t in tags], dtype=np.float64)
+        delta = cur - prev
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = np.where(prev > 0, delta / np.maximum(prev, 1), np.nan)
+        order = np.lexsort((-cur, -delta))[:top_n]
+        return [
+            {
+                'tag': tags[i],
+                'count': int(cur[i]),
+                'previous': int(prev[i]),
+                'growth': None if np.isnan(growth[i]) else round(float(growth[i]), 2)
+            }
+            for i in order
+        ]
+
+    rows = []
+    for t in tags:
+        prev = previous.get(t, 0)
+        rows.append({
+            'tag': t,
+            'count': current[t],
+            'previous': prev,
+            'growth': round((current[t] - prev) / prev, 2) if prev else None
+        })
+    rows.sort(key=lambda r: (-(r['count'] - r['previous']), -r['count']))
+    return rows[:top_n]
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+def get_trend_rollup_store() -> TrendRollupStore:
+    """트렌드 집계 저장소 인스턴스 반환"""
+    return TrendRollupStore()
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+URL Canonical - 정규 URL과 URL 키(article_id, 캐시 파일명, 히스토리 키)의 단일 규칙
+
+이전에는 같은 기사라도 색인마다 키가 달랐습니다.
+    core_logic.get_url_hash / save_crawled_article / ArticleRegistry._url_hash : md5(url)[:12]
+    ArticleManager.generate_article_id / FirestoreClient._url_to_key           : md5(url.rstrip('/'))[:12]
+    core_logic.normalize_url_for_dedupe                                         : 스킴, 끝 슬래시만 무시
+    crawler collector.normalize_url                                             : 추적 파라미터 제거
+모든 키는 이제 canonical_key(url) = md5(canonicalize_url(url))[:12] 하나를 씁니다.
+
+canonicalize_url 규칙:
+    - http/https → https, 호스트 소문자, 기본 포트(80/443)/사용자 정보/프래그먼트 제거 (다른 포트는 유지)
+    - Google AMP 캐시 (*.cdn.ampproject.org/c/s/..., google.com/amp/s/...) → 원본 URL
+    - 호스트 접두어 www. / m. / mobile. / amp. 접기
+    - AMP 경로 (앞의 /amp/..., 끝의 /amp, .amp, .amp.html) 와 AMP 파라미터 (amp, outputType=amp, ...) 제거
+    - 추적 파라미터 (utm_*, fbclid, gclid, ...) 제거, 나머지 파라미터는 정렬
+    - 끝 슬래시 제거
+
+본문 HTML의 <link rel="canonical"> (없으면 og:url)는 리다이렉트가 끝난 문서의 정규 주소이므로
+resolve_canonical로 기사 ID의 기준 URL로 씁니다 (_original.canonical_url에 저장).
+
+이전 키로 저장된 기사/히스토리/캐시는 lookup_keys(url)로 함께 찾고,
+scripts/rekey_urls.py로 전체를 정규 키로 옮깁니다 (병합/충돌 보고서 포함).
+
+외부 의존성 없음 - crawler가 desk/src/core를 sys.path에 두고 바로 임포트합니다.
+"""
+import re
+import hashlib
+from html.parser import HTMLParser
+from typing import Optional, Tuple
+from urllib.parse import urlsplit, urljoin, parse_qsl, urlencode
+
+KEY_LENGTH = 12
+
+# 정확히 일치하면 제거할 파라미터 (소문자)
+TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'twclid', 'ttclid',
+    'mc_cid', 'mc_eid', '_ga', '_gl', 'ref', 'ref_src', 'ref_url', 'source',
+    'cmpid', 'ocid', 'ncid', 'sr_share', 'spm',
+})
+# 이 접두어로 시작하면 제거할 파라미터 (소문자)
+TRACKING_PREFIXES = ('utm_', 'pk_', 'hsa_', 'oly_')
+# AMP 전용 파라미터 (소문자) - 값이 무엇이든 제거
+AMP_PARAMS = frozenset({'amp', 'amp_js_v', 'amp_gsa', 'usqp', 'aoh', 'amp_tf'})
+# 호스트 앞에서 접을 레이블
+FOLDED_HOST_LABELS = ('www', 'm', 'mobile', 'amp')
+
+AMP_CACHE_SUFFIX = '.cdn.ampproject.org'
+AMP_PATH_RE = re.compile(r'(?:/amp)+/?$|\.amp(?=\.html?$)|\.amp$', re.IGNORECASE)
+AMP_PATH_PREFIX_RE = re.compile(r'^/amp(?=/.)', re.IGNORECASE)  # /amp/news/1 → /news/1
+DEFAULT_PORTS = (80, 443)
+# 기사가 아닌 목록형 정규 주소 (태그/분류/작성자/페이지 번호/index 파일)
+LISTING_PATH_RE = re.compile(
+    r'(?:^|/)(?:tags?|category|categories|sections?|topics?|authors?)(?:/[^/]*)?$'
+    r'|/page/\d+$|/index\.\w+$',
+    re.IGNORECASE)
+
+
+def _is_tracking_param(key: str) -> bool:
+    lowered = key.lower()
+    return lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES)
+
+
+def _is_amp_param(key: str, value: str) -> bool:
+    lowered = key.lower()
+    return lowered in AMP_PARAMS or (lowered == 'outputtype' and value.lower() == 'amp')
+
+
+def strip_tracking_params(url: str) -> str:
+    """
+    추적 파라미터만 제거 (스킴/호스트/경로는 그대로 - 실제로 가져올 URL용, crawler collector.normalize_url)
+    """
+    if not url:
+        return ''
+    url = url.strip()
+    if '?' not in url:
+        return url
+    parts = urlsplit(url)
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(k)]
+    base = f'{parts.scheme}://{parts.netloc}{parts.path}' if parts.scheme else parts.path
+    return f'{base}?{urlencode(params)}' if params else base
+
+
+def _unwrap_amp_cache(host: str, path: str) -> Optional[Tuple[str, str]]:
+    """Google AMP 캐시 URL → (원본 호스트, 경로)"""
+    if host.endswith(AMP_CACHE_SUFFIX) and re.match(r'^/[cv]/', path):
+        rest = path[3:]
+    elif host in ('google.com', 'www.google.com') and path.startswith('/amp/'):
+        rest = path[5:]
+    else:
+        return None
+    if rest.startswith('s/'):
+        rest = rest[2:]
+    origin, _, origin_path = rest.partition('/')
+    if '.' not in origin:
+        return None
+    return origin.lower(), '/' + origin_path
+
+
+def _fold_host(host: str) -> str:
+    labels = host.split('.')
+    while len(labels) > 2 and labels[0] in FOLDED_HOST_LABELS:
+        labels = labels[1:]
+    return '.'.join(labels)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    정규 URL (같은 기사의 변형 URL은 같은 문자열)
+
+    http/https가 아닌 URL과 호스트 없는 문자열은 공백만 제거해 반환합니다.
+    """
+    if not url:
+        return ''
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    if parts.scheme.lower() not in ('http', 'https') or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip('.')
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    path = parts.path or '/'
+    unwrapped = _unwrap_amp_cache(host, path)
+    if unwrapped:
+        host, path = unwrapped
+        port = None
+    host = _fold_host(host)
+    if port and port not in DEFAULT_PORTS:
+        host = f'{host}:{port}'
+
+    path = re.sub(r'/{2,}', '/', path)
+    path = AMP_PATH_PREFIX_RE.sub('', path)
+    path = AMP_PATH_RE.sub('', path)
+    path = path.rstrip('/')
+
+    params = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                    if not _is_tracking_param(k) and not _is_amp_param(k, v))
+    query = f'?{urlencode(params)}' if params else ''
+    return f'https://{host}{path}{query}'
+
+
+def _md5_key(value: str, length: int = KEY_LENGTH) -> str:
+    return hashlib.md5(value.encode()).hexdigest()[:length]
+
+
+def canonical_key(url: str, length: int = KEY_LENGTH) -> str:
+    """정규 URL 키 (article_id, 캐시 파일명, 히스토리/레지스트리 URL 색인)"""
+    return _md5_key(canonicalize_url(url), length)
+
+
+def article_id_for(url: str, canonical_url: str = None) -> str:
+    """기사 ID (본문의 정규 주소가 있으면 그것 기준)"""
+    return canonical_key(canonical_url or url)
+
+
+def legacy_key(url: str) -> str:
+    """이전 규칙 md5(url)[:12] - 정규 키 이전에 저장된 기사/캐시 파일명"""
+    return _md5_key(url)
+
+
+def legacy_keys(url: str) -> Tuple[str, ...]:
+    """이전 규칙 키 (md5(url), md5(url.rstrip('/')) - 같으면 하나)"""
+    raw = _md5_key(url)
+    stripped = _md5_key(url.rstrip('/'))
+    return (raw,) if raw == stripped else (raw, stripped)
+
+
+def lookup_keys(url: str) -> Tuple[str, ...]:
+    """URL로 찾을 때 확인할 키 (정규 키 우선, 이전 규칙 키 - 중복 제거)"""
+    keys = [canonical_key(url)]
+    for key in legacy_keys(url):
+        if key not in keys:
+            keys.append(key)
+    return tuple(keys)
+
+
+# =============================================================================
+# <link rel="canonical">
+# =============================================================================
+
+class _CanonicalLinkParser(HTMLParser):
+    """<head>의 rel=canonical / og:url 추출 (</head> 또는 <body>에서 중단)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.canonical = None
+        self.og_url = None
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        attrs = {k.lower(): (v or '') for k, v in attrs}
+        if tag == 'link' and 'canonical' in attrs.get('rel', '').lower().split() and not self.canonical:
+            self.canonical = attrs.get('href', '').strip() or None
+        elif tag == 'meta' and attrs.get('property', '').lower() == 'og:url' and not self.og_url:
+            self.og_url = attrs.get('content', '').strip() or None
+        elif tag == 'body':
+            self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == 'head':
+            self.done = True
+
+
+def extract_canonical_link(html: str, base_url: str) -> Optional[str]:
+    """본문 HTML의 정규 주소 (rel=canonical, 없으면 og:url, base_url 기준 절대 URL)"""
+    if not html:
+        return None
+    head_end = re.search(r'</head\s*>|<body[\s>]', html, re.IGNORECASE)
+    parser = _CanonicalLinkParser()
+    try:
+        parser.feed(html[:head_end.end()] if head_end else html[:200000])
+    except Exception:
+        return None
+    href = parser.canonical or parser.og_url
+    if not href:
+        return None
+    absolute = urljoin(base_url, href)
+    return absolute if urlsplit(absolute).scheme in ('http', 'https') else None
+
+
+def _is_article_specific(candidate_path: str, request_path: str) -> bool:
+    """
+    정규 주소가 이 기사만 가리키는지
+    - 사이트 첫 페이지, 요청 경로의 상위/접두 경로 (/news ← /news/1), 목록형 경로 (tag/category/page/N, index.*)는 아님
+    """
+    if not request_path or candidate_path == request_path:
+        return True
+    if not candidate_path or request_path.startswith(candidate_path):
+        return False
+    return not LISTING_PATH_RE.search(candidate_path)
+
+
+def resolve_canonical(url: str, html: str = None) -> str:
+    """
+    기사의 정규 URL (본문 정규 주소 → 없거나 의심스러우면 요청 URL)
+
+    사이트 첫 페이지, 섹션 루트 (요청 경로의 상위 경로), 목록 페이지를 가리키는 정규 주소
+    (잘못 설정된 템플릿 - 섹션의 모든 기사가 같은 ID가 됨)는 무시합니다.
+    """
+    candidate = extract_canonical_link(html, url) if html else None
+    if candidate:
+        candidate_path = urlsplit(canonicalize_url(candidate)).path
+        request_path = urlsplit(canonicalize_url(url)).path
+        if not _is_article_specific(candidate_path, request_path):
+            candidate = None
+    return canonicalize_url(candidate or url)
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+"""
+URL Filter - 수집 이력 Bloom 필터 (히스토리 + 로컬 캐시)
+
+collector.collect_links는 발견한 링크마다 check_history → load_from_cache 순으로 확인하고,
+JSON 트리에서 캐시 조회가 빗나가면 날짜 폴더와 segment를 모두 훑습니다.
+지금까지 본 모든 URL 해시를 Bloom 필터에 담아 "확실히 새 URL"이면 O(1)에 답하고,
+필터가 "있을 수도 있음"이라고 할 때만 정확한 색인(히스토리 + 로컬 저장소)을 확인합니다.
+
+    cache/<env>/_url_filter.bin   헤더 JSON 한 줄 + 비트 배열 (log_offset까지 반영된 상태)
+    cache/<env>/_url_filter.log   '#<gen>' 헤더 + 추가된 키 한 줄씩 (append-only)
+
+- 키: URL 해시 12자리 (url_canonical.lookup_keys - 정규 키 + 정규화 이전 규칙의 키), 로컬 기사의 article_id
+- 추가: 로컬 저장소 save*, 히스토리 기록/샤드 새로고침마다 로그에 덧붙임 (다른 프로세스는 로그 끝을 이어 읽음)
+- 압축: 반영되지 않은 로그가 COMPACT_LOG_BYTES를 넘으면 비트 배열을 다시 씀
+- 재구성: scripts/rebuild_url_filter.py (로그를 새 세대로 교체한 뒤 전체 재적재, 용량 재계산)
+- 필터 파일이 없거나 세대가 맞지 않으면 준비 전 상태 → 항상 "있을 수도 있음" (정확한 검사로 진행)
+
+Bloom 필터는 삭제를 지원하지 않으므로 히스토리/캐시에서 지운 URL은 오탐으로 남습니다 (정확한 검사로 걸러짐).
+
+환경 변수:
+    URL_FILTER          (true)   - false면 필터를 쓰지 않음 (항상 정확한 검사)
+    URL_FILTER_CAPACITY (200000) - 예상 URL 수 (재구성 시 max(용량, 현재 키 수 x 2))
+    URL_FILTER_FP_RATE  (0.01)   - 목표 오탐률
+"""
+import os
+import json
+import math
+import uuid
+import hashlib
+import threading
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+from .url_canonical import lookup_keys
+
+FILTER_FILE = '_url_filter.bin'
+LOG_FILE = '_url_filter.log'
+MAGIC = 'znd-url-bloom'
+COMPACT_LOG_BYTES = 256 * 1024
+
+
+def is_url_filter_enabled() -> bool:
+    return os.getenv('URL_FILTER', 'true').lower() == 'true'
+
+
+def get_filter_params() -> Tuple[int, float]:
+    """(용량, 목표 오탐률)"""
+    capacity = max(1000, int(os.getenv('URL_FILTER_CAPACITY', 200000)))
+    fp_rate = min(0.5, max(1e-6, float(os.getenv('URL_FILTER_FP_RATE', 0.01))))
+    return capacity, fp_rate
+
+
+def bloom_size(capacity: int, fp_rate: float) -> Tuple[int, int]:
+    """(비트 수 m, 해시 수 k) - m = -n ln p / (ln 2)^2, k = m/n ln 2"""
+    bits = int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+    bits = (bits + 7) // 8 * 8
+    hashes = max(1, int(round(bits / capacity * math.log(2))))
+    return bits, hashes
+
+
+def expected_fp_rate(bits: int, hashes: int, count: int) -> float:
+    """키 count개를 넣은 필터의 이론 오탐률 (1 - e^(-kn/m))^k"""
+    if not count:
+        return 0.0
+    return (1 - math.exp(-hashes * count / bits)) ** hashes
+
+
+def url_keys(url: str) -> Tuple[str, ...]:
+    """URL의 필터 키 (정규 키 + 정규화 이전 규칙의 키, url_canonical.lookup_keys)"""
+    return lookup_keys(url)
+
+
+def article_keys(article_id: str, data: Dict[str, Any]) -> Tuple[str, ...]:
+    """로컬 기사의 필터 키 (article_id + URL 해시, 파일명이 url_hash인 캐시도 포함)"""
+    from .local_store import article_url
+    url = article_url(data)
+    keys = url_keys(url) if url else ()
+    return keys + (article_id,) if article_id and article_id not in keys else keys
+
+
+class UrlFilter:
+    """
+    영속 Bloom 필터 (스레드 안전, 같은 cache_root를 쓰는 프로세스끼리 로그로 공유)
+    """
+
+    def __init__(self, cache_root: str):
+        self.cache_root = cache_root
+        self.path = os.path.join(cache_root, FILTER_FILE)
+        self.log_path = os.path.join(cache_root, LOG_FILE)
+        self._lock = threading.Lock()
+        self._file_stamp = None
+        self._reset(None)
+        self._load()
+
+    def _reset(self, header: Optional[Dict[str, Any]]):
+        self.bits = (header or {}).get('m', 0)
+        self.hashes = (header or {}).get('k', 0)
+        self.capacity = (header or {}).get('capacity', 0)
+        self.count = (header or {}).get('count', 0)
+        self.gen = (header or {}).get('gen')
+        self._array = bytearray(self.bits // 8)
+        self._log_pos = 0
+        self._log_id = None
+        self._saved_offset = 0
+        self._full_warned = False
+
+    @property
+    def ready(self) -> bool:
+        return self.gen is not None
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def _load(self):
+        """비트 배열 로드 + 로그 재생 (세대가 다르면 준비 전 상태)"""
+        self._reset(None)
+        self._file_stamp = self._stamp()
+        if self._file_stamp is None:
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                header = json.loads(f.readline().decode('utf-8'))
+                array = f.read()
+            if header.get('magic') != MAGIC or len(array) * 8 != header.get('m'):
+                raise ValueError('unknown format')
+            if self._read_log_gen() != header.get('gen'):
+                print("⚠️ [UrlFilter] Filter and log generations differ - rebuild required")
+                return
+            self._reset(header)
+            self._array = bytearray(array)
+            self._log_pos = self._saved_offset = header.get('log_offset', 0)
+            self._replay_log()
+        except Exception as e:
+            self._reset(None)
+            print(f"⚠️ [UrlFilter] Filter file unreadable, rebuild required: {e}")
+
+    def _read_log_gen(self) -> Optional[str]:
+        try:
+            with open(self.log_path, 'rb') as f:
+                line = f.readline().decode('utf-8').strip()
+            return line[1:] if line.startswith('#') else None
+        except FileNotFoundError:
+            return None
+
+    def _replay_log(self):
+        """다른 프로세스(또는 이전 실행)가 덧붙인 로그 끝 반영"""
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            self._reset(None)
+            return
+        log_id = (stat.st_ino, stat.st_dev)
+        if self._log_id is not None and (log_id != self._log_id or stat.st_size < self._log_pos):
+            self._load()  # 재구성으로 로그가 교체됨
+            return
+        self._log_id = log_id
+        if stat.st_size <= self._log_pos:
+            return
+        with open(self.log_path, 'rb') as f:
+            f.seek(self._log_pos)
+            tail = f.read(stat.st_size - self._log_pos)
+        end = tail.rfind(b'\n') + 1  # 쓰는 중인 마지막 줄은 다음에
+        for line in tail[:end].split(b'\n'):
+            if line and not line.startswith(b'#'):
+                self._set(line.decode('utf-8'))
+        self._log_pos += end
+
+    def _stamp(self):
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _sync(self):
+        if self.ready:
+            self._replay_log()
+        elif self._stamp() != self._file_stamp:
+            self._load()  # 다른 프로세스가 재구성을 마침
+
+    def save(self):
+        """비트 배열 기록 (로그는 _log_pos까지 반영된 것으로 표시)"""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        if not self.ready or self._read_log_gen() != self.gen:
+            return  # 다른 프로세스가 재구성함
+        header = {'magic': MAGIC, 'm': self.bits, 'k': self.hashes, 'capacity': self.capacity,
+                  'count': self.count, 'gen': self.gen, 'log_offset': self._log_pos}
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+            f.write(self._array)
+        os.replace(tmp_path, self.path)
+        self._saved_offset = self._log_pos
+        self._file_stamp = self._stamp()
+
+    # =========================================================================
+    # Bloom
+    # =========================================================================
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.bits
+
+    def _test(self, key: str) -> bool:
+        array = self._array
+        return all(array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def _set(self, key: str) -> bool:
+        """키 추가 (새로 켜진 비트가 있으면 True)"""
+        added = False
+        array = self._array
+        for pos in self._positions(key):
+            mask = 1 << (pos & 7)
+            if not array[pos >> 3] & mask:
+                array[pos >> 3] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def might_contain(self, key: str) -> bool:
+        """False면 확실히 처음 보는 키 (준비 전/비활성이면 항상 True)"""
+        if not is_url_filter_enabled():
+            return True
+        with self._lock:
+            self._sync()
+            return not self.ready or self._test(key)
+
+    def might_contain_url(self, url: str) -> bool:
+        return any(self.might_contain(key) for key in url_keys(url))
+
+    def add_keys(self, keys: Iterable[str]) -> int:
+        """키 추가 + 로그 기록 (이미 있는 키는 건너뜀)"""
+        if not is_url_filter_enabled():
+            return 0
+        with self._lock:
+            self._sync()
+            if not self.ready:
+                # 재구성 중인 프로세스가 있으면 그 로그에 남겨 빠지지 않게 함
+                if os.path.exists(self.log_path):
+                    self._append(list(keys))
+                return 0
+            new_keys = [key for key in keys if key and self._set(key)]
+            if not new_keys:
+                return 0
+            self._append(new_keys)  # _log_pos는 그대로 (다른 프로세스가 덧붙인 줄과 함께 다시 읽음, 중복은 무시)
+            if self.count > self.capacity and not self._full_warned:
+                self._full_warned = True
+                print(f"⚠️ [UrlFilter] {self.count} keys exceed capacity {self.capacity} "
+                      f"(false positives {expected_fp_rate(self.bits, self.hashes, self.count):.1%}) "
+                      f"- run scripts/rebuild_url_filter.py")
+            if self._log_pos - self._saved_offset > COMPACT_LOG_BYTES:
+                self._compact()
+            return len(new_keys)
+
+    def add_url(self, url: str) -> int:
+        return self.add_keys(url_keys(url)) if url else 0
+
+    def _append(self, keys):
+        if not keys:
+            return
+        payload = ''.join(f'{key}\n' for key in keys).encode('utf-8')
+        # O_APPEND: 여러 프로세스가 동시에 덧붙여도 줄이 섞이지 않음
+        fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+
+    def _compact(self):
+        """로그 끝까지 반영한 비트 배열을 다시 기록 (로그 자체는 재구성 때 비움)"""
+        self._replay_log()
+        self._save()
+
+    # =========================================================================
+    # Rebuild
+    # =========================================================================
+
+    def rebuild(self, sources: Iterable[str], capacity: int = None, fp_rate: float = None) -> Dict[str, Any]:
+        """
+        새 세대로 전체 재구성
+
+        로그를 먼저 새 세대로 교체해 재구성 중 다른 프로세스가 추가한 키도 다음 로드에서 재생되게 함
+
+        Args:
+            sources: 필터 키 (URL 해시, article_id)
+            capacity/fp_rate: None이면 URL_FILTER_CAPACITY/URL_FILTER_FP_RATE
+
+        Returns:
+            stats()
+        """
+        keys = set(sources)
+        default_capacity, default_fp = get_filter_params()
+        capacity = max(capacity or default_capacity, len(keys) * 2)
+        bits, hashes = bloom_size(capacity, fp_rate or default_fp)
+        gen = uuid.uuid4().hex[:12]
+
+        with self._lock:
+            os.makedirs(self.cache_root, exist_ok=True)
+            tmp_log = f'{self.log_path}.{os.getpid()}.tmp'
+            with open(tmp_log, 'wb') as f:
+                f.write(f'#{gen}\n'.encode('utf-8'))
+            os.replace(tmp_log, self.log_path)
+
+            self._reset({'m': bits, 'k': hashes, 'capacity': capacity, 'count': 0, 'gen': gen})
+            for key in keys:
+                if key:
+                    self._set(key)
+            self._log_pos = len(gen) + 2  # 헤더 줄 다음부터 재생
+            self._replay_log()
+            self._save()
+        return self.stats()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'ready': self.ready, 'keys': self.count, 'capacity': self.capacity,
+            'bits': self.bits, 'hashes': self.hashes, 'bytes': self.bits // 8,
+            'expected_fp_rate': expected_fp_rate(self.bits, self.hashes, self.count) if self.bits else None,
+        }
+
+
+def collect_store_keys(cache_root: str) -> Iterable[str]:
+    """로컬 저장소의 모든 기사 키 (재구성용)"""
+    from .local_store import get_local_store
+    for stored in get_local_store(cache_root).iter_articles():
+        yield from article_keys(stored.article_id, stored.data)
+
+
+# =============================================================================
+# Module-level Convenience Functions
+# =============================================================================
+
+_filters: Dict[str, UrlFilter] = {}
+_filters_lock = threading.Lock()
+
+
+def get_url_filter(cache_root: str) -> UrlFilter:
+    """cache_root별 필터 인스턴스"""
+    cache_root = os.path.abspath(cache_root)
+    with _filters_lock:
+        url_filter = _filters.get(cache_root)
+        if url_filter is None:
+            url_filter = UrlFilter(cache_root)
+            _filters[cache_root] = url_filter
+    return url_filter
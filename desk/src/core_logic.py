@@ -8,7 +8,6 @@ All crawler components should import from this module to ensure consistency.
 import os
 import json
 import glob
-import hashlib
 from datetime import datetime, timezone, timedelta
 
 # ==============================================================================
@@ -123,6 +122,8 @@ def get_config(section: str, key: str, default=None):
 def get_url_hash(url: str, length: int = 12) -> str:
     """
     Generate a hash from URL for cache/data filename.
+    Hashes the canonical URL (src/core/url_canonical), so tracking params,
+    scheme, www/m/amp hosts and trailing slashes map to the same key.
     
     Args:
         url: The URL to hash
@@ -131,7 +132,8 @@ def get_url_hash(url: str, length: int = 12) -> str:
     Returns:
         MD5 hash string truncated to specified length
     """
-    return hashlib.md5(url.encode()).hexdigest()[:length]
+    from src.core.url_canonical import canonical_key
+    return canonical_key(url, length)
 
 
 def get_article_id(url: str) -> str:
@@ -170,62 +172,57 @@ def get_cache_path(url: str, date_str: str = None) -> str:
     return os.path.join(cache_dir, f'{url_hash}.json')
 
 
-def load_from_cache(url: str) -> dict | None:
+def load_from_cache(url: str, article_id: str = None) -> dict | None:
     """
     Load cached content for URL.
-    Searches ALL date folders, not just today.
-    Auto-deletes corrupted (invalid JSON) cache files.
+    Looks up the local article store (LOCAL_STORE_BACKEND: json tree or sqlite).
+    JSON tree: searches ALL date folders, auto-deletes corrupted cache files.
+    
+    캐시는 article_id로 저장됩니다 (본문 rel=canonical이 있으면 요청 URL과 키가 다름).
+    article_id를 알면 그것부터, 그다음 요청 URL 키 (sqlite는 url_hash 색인으로 canonical 기사도 찾음).
     
     [MODIFIED] Supports V2.0 5-section schema.
     If V2.0 schema is detected, it FLATTENS the structure for backward compatibility
     with aggregators and legacy logic.
     """
-    url_hash = get_url_hash(url)
-    filename = f'{url_hash}.json'
+    from src.core.local_store import get_local_store
+    from src.core.url_canonical import lookup_keys
+    
+    # 정규 키 우선, 정규화 이전 규칙으로 저장된 캐시도 확인
+    store = get_local_store(CACHE_DIR)
+    data = store.get(article_id) if article_id else None
+    for url_hash in ([] if data is not None else lookup_keys(url)):
+        data = store.get_by_url_hash(url_hash)
+        if data is not None:
+            break
+    if data is None:
+        # JSON 트리는 URL 색인이 없음 → 레지스트리 URL 색인 (요청 URL → canonical 기사 ID)
+        from src.core.article_registry import get_registry
+        registry = get_registry()
+        info = registry.get_by_url(url) if registry.is_initialized() else None
+        if info and info.article_id != article_id:
+            data = store.get(info.article_id)
+    if data is None:
+        return None
     
-    # Search all date folders for this URL's cache (Newest first)
-    if os.path.exists(CACHE_DIR):
-        # [FIX] Sort folders by date descending to ensure we load the latest cache
-        date_folders = sorted(os.listdir(CACHE_DIR), reverse=True)
+    # [NEW] V2.0 Schema Logic: Flatten for legacy code
+    # If _header and _original exist, this is V2 data.
+    if '_header' in data and '_original' in data:
+        flattened = {}
+        # Copy from _original (content)
+        flattened.update(data['_original'])
+        # Copy from _analysis (enriched) - overwrite original
+        if '_analysis' in data:
+            flattened.update(data['_analysis'])
+        # Copy _header metadata
+        flattened['article_id'] = data['_header'].get('article_id')
+        flattened['schema_version'] = data['_header'].get('version')
         
-        for date_folder in date_folders:
-            date_path = os.path.join(CACHE_DIR, date_folder)
-            if not os.path.isdir(date_path):
-                continue
-            cache_path = os.path.join(date_path, filename)
-            if os.path.exists(cache_path):
-                try:
-                    with open(cache_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        
-                        # [NEW] V2.0 Schema Logic: Flatten for legacy code
-                        # If _header and _original exist, this is V2 data.
-                        if '_header' in data and '_original' in data:
-                            flattened = {}
-                            # Copy from _original (content)
-                            flattened.update(data['_original'])
-                            # Copy from _analysis (enriched) - overwrite original
-                            if '_analysis' in data:
-                                flattened.update(data['_analysis'])
-                            # Copy _header metadata
-                            flattened['article_id'] = data['_header'].get('article_id')
-                            flattened['schema_version'] = data['_header'].get('version')
-                            
-                            print(f"📦 [Cache] Loaded V2.0 data (Flattened): {url[:50]}...")
-                            return flattened
-                        
-                        print(f"📦 [Cache] Loaded legacy data: {url[:50]}...")
-                        return data
-                except json.JSONDecodeError as e:
-                    # Auto-delete corrupted cache file
-                    print(f"🗑️ [Cache] Corrupted JSON detected, auto-deleting: {cache_path}")
-                    try:
-                        os.remove(cache_path)
-                    except Exception:
-                        pass
-                except Exception as e:
-                    print(f"⚠️ [Cache] Error reading cache: {e}")
-    return None
+        print(f"📦 [Cache] Loaded V2.0 data (Flattened): {url[:50]}...")
+        return flattened
+    
+    print(f"📦 [Cache] Loaded legacy data: {url[:50]}...")
+    return data
 
 
 def save_to_cache(url: str, content: dict, date_str: str = None) -> str:
@@ -235,24 +232,12 @@ def save_to_cache(url: str, content: dict, date_str: str = None) -> str:
     [MODIFIED] Enforces V2.0 5-section schema defined in implementation_plan.md.
     Wraps raw content into '_original' and creates '_header'.
     """
+    from src.core.local_store import get_local_store
+    
     if date_str is None:
         date_str = datetime.now().strftime('%Y-%m-%d')
     
     url_hash = get_url_hash(url)
-    cache_dir = os.path.join(CACHE_DIR, date_str)
-    
-    # 기존 파일 확인 (업데이트인 경우)
-    existing_path = None
-    if date_str is None:
-        # 날짜 미지정 시 전체 검색
-        search_pattern = os.path.join(CACHE_DIR, '*', f'{url_hash}.json')
-        found_paths = glob.glob(search_pattern)
-        if found_paths:
-            found_paths.sort(key=os.path.getmtime, reverse=True)
-            existing_path = found_paths[0]
-            cache_dir = os.path.dirname(existing_path) # 기존 디렉토리 사용
-    
-    cache_path = existing_path if existing_path else os.path.join(cache_dir, f'{url_hash}.json')
     
     # --- V2.0 Schema Transformation ---
     # content가 이미 섹션 구조인지 확인
@@ -261,7 +246,7 @@ def save_to_cache(url: str, content: dict, date_str: str = None) -> str:
         final_data = content
     else:
         # Flat data -> V2.0 구조로 변환
-        article_id = content.get('article_id') or get_article_id(url)
+        article_id = content.get('article_id') or get_article_id(content.get('canonical_url') or url)
         now_iso = get_kst_now() # [FIX] Use KST
         
         # 1. Header
@@ -305,16 +290,14 @@ def save_to_cache(url: str, content: dict, date_str: str = None) -> str:
     
     final_data = _serialize_datetimes(final_data)
     
-    try:
-        os.makedirs(cache_dir, exist_ok=True)
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(final_data, f, ensure_ascii=False, indent=2)
-            
+    # 저장 키 = _header.article_id (manager.create와 같은 ID - 본문 canonical URL 기준일 수 있음)
+    storage_id = (final_data.get('_header') or {}).get('article_id') or url_hash
+    cache_path = get_local_store(CACHE_DIR).save(storage_id, final_data, date_str)
+    if cache_path:
         print(f"💾 [Cache] Saved V2.0 schema: {cache_path}")
-        return cache_path
-    except Exception as e:
-        print(f"⚠️ [Cache] Error saving cache: {e}")
-        return None
+    else:
+        print(f"⚠️ [Cache] Error saving cache: {url[:50]}...")
+    return cache_path
 
 
 # ==============================================================================
@@ -682,7 +665,8 @@ def update_manifest(date_str: str) -> bool:
 def normalize_url_for_dedupe(url: str) -> str:
     """
     Normalize URL for deduplication check.
-    Ignores scheme (http/https) and trailing slash.
+    Uses the canonical URL (src/core/url_canonical): ignores scheme, trailing slash,
+    tracking params, www/m/amp hosts and AMP paths.
     
     Args:
         url: URL to normalize
@@ -690,25 +674,8 @@ def normalize_url_for_dedupe(url: str) -> str:
     Returns:
         Normalized URL string
     """
-    if not url:
-        return ""
-    
-    try:
-        norm = url.strip()
-        
-        # Remove scheme
-        if norm.startswith('https://'):
-            norm = norm[8:]
-        elif norm.startswith('http://'):
-            norm = norm[7:]
-            
-        # Remove trailing slash
-        if norm.endswith('/'):
-            norm = norm[:-1]
-            
-        return norm
-    except:
-        return url
+    from src.core.url_canonical import canonicalize_url
+    return canonicalize_url(url)
 
 
 
@@ -8,6 +8,7 @@ from .extractor import CompositeExtractor
 from .utils import RobotsChecker
 from .middleware import RetryMiddleware
 from .processor import CompositeProcessor
+from ..core.url_canonical import resolve_canonical
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,8 @@ class AsyncCrawler:
                 logger.info(f"Extracting: {url}")
                 data = self.extractor.extract(html, url)
                 data['url'] = url
+                # 기사 ID 기준 URL (<link rel="canonical">, 리다이렉트 후 문서의 정규 주소)
+                data['canonical_url'] = resolve_canonical(url, html)
                 
                 # Process data (clean/normalize)
                 data = self.processor.process(data)
@@ -24,13 +24,16 @@ if DESK_DIR not in sys.path:
 # Desk Core Imports (직접 호출, 복사 금지!)
 # ============================================================================
 from src.core.article_manager import ArticleManager
+from src.core.article_registry import get_registry
 from src.core.article_state import ArticleState
 from src.core.firestore_client import FirestoreClient
+from src.core.firestore_usage import usage_scope
 from src.core_logic import (
     save_to_cache,
     load_from_cache,
     get_article_id,
     get_kst_now,
+    get_config,
 )
 from src.pipeline import extract_article
 
@@ -51,6 +54,15 @@ class PipelinePhase(Enum):
     RELEASE = "release"      # 릴리즈
 
 
+# 단계별로 레지스트리에 적재할 상태 (부분 적재 레지스트리, 필요한 상태만)
+PHASE_STATES = {
+    PipelinePhase.ANALYZE: [ArticleState.COLLECTED.value],
+    PipelinePhase.CLASSIFY: [ArticleState.ANALYZED.value],
+    PipelinePhase.REJECT: [ArticleState.ANALYZED.value],
+    PipelinePhase.PUBLISH: [ArticleState.CLASSIFIED.value],
+}
+
+
 @dataclass
 class PipelineResult:
     """파이프라인 실행 결과"""
@@ -96,6 +108,7 @@ class SchedulerPipeline:
     def __init__(self):
         self.manager = ArticleManager()
         self.db = FirestoreClient()
+        self.registry = get_registry()
         self.result = PipelineResult()
         
     def run(
@@ -124,35 +137,39 @@ class SchedulerPipeline:
         self._progress_callback = progress_callback  # 저장하여 하위 메서드에서도 사용
         self._log(f"🚀 Pipeline starting: {schedule_name}")
         self._log(f"   Phases: {[p.value for p in phases]}")
+        owns_registry = self._attach_registry()
         
         try:
             for phase in phases:
                 self.result.phase = phase
+                # Firestore 비용을 단계별로 집계 (firestore_usage)
+                with usage_scope(f'pipeline:{phase.value}'):
+                    self._load_phase_states(phase)
                 
-                if progress_callback:
-                    progress_callback({
-                        'status': 'running',
-                        'phase': phase.value,
-                        'message': f'Processing {phase.value}...'
-                    })
+                    if progress_callback:
+                        progress_callback({
+                            'status': 'running',
+                            'phase': phase.value,
+                            'message': f'Processing {phase.value}...'
+                        })
                 
-                # 단계별 실행
-                if phase == PipelinePhase.COLLECT:
-                    self._phase_collect()
-                elif phase == PipelinePhase.EXTRACT:
-                    self._phase_extract()
-                elif phase == PipelinePhase.ANALYZE:
-                    self._phase_analyze()
-                elif phase == PipelinePhase.SCORE:
-                    self._phase_score()
-                elif phase == PipelinePhase.CLASSIFY:
-                    self._phase_classify()
-                elif phase == PipelinePhase.REJECT:
-                    self._phase_reject()
-                elif phase == PipelinePhase.PUBLISH:
-                    self._phase_publish(dry_run)
-                elif phase == PipelinePhase.RELEASE:
-                    self._phase_release(dry_run)
+                    # 단계별 실행
+                    if phase == PipelinePhase.COLLECT:
+                        self._phase_collect()
+                    elif phase == PipelinePhase.EXTRACT:
+                        self._phase_extract()
+                    elif phase == PipelinePhase.ANALYZE:
+                        self._phase_analyze()
+                    elif phase == PipelinePhase.SCORE:
+                        self._phase_score()
+                    elif phase == PipelinePhase.CLASSIFY:
+                        self._phase_classify()
+                    elif phase == PipelinePhase.REJECT:
+                        self._phase_reject()
+                    elif phase == PipelinePhase.PUBLISH:
+                        self._phase_publish(dry_run)
+                    elif phase == PipelinePhase.RELEASE:
+                        self._phase_release(dry_run)
                     
         except Exception as e:
             self.result.success = False
@@ -160,6 +177,9 @@ class SchedulerPipeline:
             self._log(f"❌ Pipeline error: {e}")
             import traceback
             traceback.print_exc()
+        finally:
+            if owns_registry:
+                self.registry.reset()
             
         # 최종 메시지 생성
         self.result.message = self._generate_summary()
@@ -346,8 +366,9 @@ class SchedulerPipeline:
         articles = self.manager.find_analyzed(limit=100)
         
         rejected_count = 0
-        # [v1.2.0] ZES 낮을수록 좋음! 6.0 초과면 노이즈 과다
-        max_acceptable_zes = 6.0
+        # [v1.2.0] ZES 낮을수록 좋음! 커트라인 초과면 노이즈 과다 (scoring.max_acceptable_zes)
+        max_acceptable_zes = float(get_config('scoring', 'max_acceptable_zes', 6.0))
+        min_impact_score = float(get_config('scoring', 'min_impact_score', 0.0))
         
         for article in articles:
             article_id = article.get('_header', {}).get('article_id') or article.get('article_id')
@@ -360,7 +381,9 @@ class SchedulerPipeline:
             if not score:
                 score = article.get('zero_echo_score', 10)
             
-            if float(score) > max_acceptable_zes:
+            impact = float(analysis.get('impact_score') or article.get('impact_score') or 0)
+            
+            if float(score) > max_acceptable_zes or impact < min_impact_score:
                 # desk 코어의 reject 직접 호출!
                 if self.manager.reject(article_id, reason='cutline'):
                     rejected_count += 1
@@ -421,6 +444,33 @@ class SchedulerPipeline:
         self.result.released = False
         self._log("   Release pending (manual trigger required)")
     
+    # ========================================================================
+    # Registry
+    # ========================================================================
+    
+    def _attach_registry(self) -> bool:
+        """
+        desk 밖(스케줄러 프로세스)에서 실행 시 이번 실행 전용 부분 적재 레지스트리 사용
+        - desk 프로세스 안에서는 이미 초기화된 전체 레지스트리를 그대로 사용
+        - PIPELINE_REGISTRY=false 이면 사용하지 않음 (Firestore 직접 조회)
+        
+        Returns:
+            이번 실행이 레지스트리를 소유하는지 (종료 시 해제)
+        """
+        if os.getenv('PIPELINE_REGISTRY', 'true').lower() != 'true':
+            return False
+        if self.registry.is_initialized():
+            return False
+        self.registry.initialize_partial(db_client=self.db)
+        return True
+    
+    def _load_phase_states(self, phase: PipelinePhase):
+        """단계에 필요한 상태만 레지스트리에 적재 (이미 적재된 상태는 건너뜀)"""
+        states = PHASE_STATES.get(phase)
+        if states and self.registry.is_partial():
+            loaded = self.registry.load_states(states)
+            self._log(f"   🧩 Registry: +{loaded} articles ({', '.join(states)})")
+    
     # ========================================================================
     # Helper Methods
     # ========================================================================
@@ -15,6 +15,31 @@ function toggleColumnMenu(state) {
     menu.classList.toggle('hidden');
 }
 
+// 백그라운드 작업 진행률 폴링 (완료/실패/취소될 때까지)
+async function waitForJob(jobId, onProgress) {
+    while (true) {
+        const result = await fetchAPI(`/api/board/jobs/${jobId}`);
+        if (!result.success) {
+            throw new Error(result.error || '작업 조회 실패');
+        }
+        const job = result.job;
+        if (onProgress) onProgress(job);
+        if (!['queued', 'running'].includes(job.status)) {
+            return job;
+        }
+        await new Promise(resolve => setTimeout(resolve, 1000));
+    }
+}
+
+function formatJobResult(job) {
+    const labels = { done: '완료', failed: '실패', cancelled: '취소됨' };
+    let text = `${labels[job.status] || job.status}: ${job.message || job.error || ''}`;
+    if (job.failed > 0) {
+        text += `\n(실패 ${job.failed}개: ${job.errors.map(e => e.item).filter(Boolean).slice(0, 5).join(', ')})`;
+    }
+    return text;
+}
+
 async function columnAction(state, action) {
     // Close menu
     document.getElementById(`menu-${state}`)?.classList.add('hidden');
@@ -42,7 +67,19 @@ async function columnAction(state, action) {
             body: JSON.stringify({ state, action })
         });
 
-        if (result.success) {
+        if (result.job) {
+            // 백그라운드 작업 (진행 중인 작업이 있으면 그 작업을 기다림)
+            if (!result.success) {
+                alert(`${result.error}\n진행 중인 작업이 끝날 때까지 기다립니다.`);
+            }
+            const job = await waitForJob(result.job.job_id);
+            alert(formatJobResult(job));
+            if (typeof loadBoardData === 'function') {
+                await loadBoardData();
+            } else {
+                window.location.reload();
+            }
+        } else if (result.success) {
             alert(`완료: ${result.message || action}`);
             if (typeof loadBoardData === 'function') {
                 await loadBoardData();
@@ -85,7 +122,10 @@ async function recalculateAllScores() {
                     body: JSON.stringify(payload)
                 });
 
-                if (result.success) {
+                if (result.job) {
+                    const job = await waitForJob(result.job.job_id);
+                    details.push(`[${state.toUpperCase()}] ${formatJobResult(job)}`);
+                } else if (result.success) {
                     details.push(`[${state.toUpperCase()}] ${result.message}`);
                 } else {
                     details.push(`[${state.toUpperCase()}] ${result.error || '오류'}`);
@@ -108,4 +148,5 @@ async function recalculateAllScores() {
 // Export to Global Scope
 window.toggleColumnMenu = toggleColumnMenu;
 window.columnAction = columnAction;
+window.waitForJob = waitForJob;
 window.recalculateAllScores = recalculateAllScores;
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+ZND Desk - WSGI Entry Point (운영 서버)
+
+gunicorn 워커마다 이 모듈을 import 하면서 레지스트리를 초기화합니다.
+- 모든 워커: init_registry(background=True) (REGISTRY_SHARED=true 이면 공유 색인에 붙음)
+- 리더 워커 하나만: 중단된 작업 재실행 / Firestore 실시간 구독 / 캐시 압축
+  리더는 cache/<env>/desk_services.lock 파일 잠금으로 정하고, 워커가 종료되면 잠금이 풀려
+  다음에 뜨는 워커가 이어받습니다.
+
+preload_app=True 이면 마스터에서 한 번만 초기화된 뒤 fork 되므로 (스레드/SQLite 연결 공유)
+반드시 gunicorn.conf.py의 preload_app=False 설정으로 실행하세요.
+
+Usage:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import os
+import fcntl
+
+from app import app, init_services
+
+_leader_lock = None  # 프로세스가 살아 있는 동안 잠금 fd 유지
+
+
+def acquire_service_lock() -> bool:
+    """백그라운드 작업을 실행할 리더 워커인지 (비차단 파일 잠금)"""
+    global _leader_lock
+    if _leader_lock is not None:
+        return True
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    lock_dir = os.path.join(base_dir, 'cache', os.getenv('ZND_ENV', 'dev'))
+    os.makedirs(lock_dir, exist_ok=True)
+    fd = open(os.path.join(lock_dir, 'desk_services.lock'), 'a')
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        fd.close()
+        return False
+    _leader_lock = fd
+    return True
+
+
+_is_leader = acquire_service_lock()
+print(f"🧩 [WSGI] worker pid={os.getpid()} ({'leader: resume/listener/compactor' if _is_leader else 'follower'})")
+init_services(run_singletons=_is_leader)
+
+application = app